@@ -22,6 +22,7 @@ EXPORT_BINS = \
     smith.pyre \
     pyre \
     python.pyre \
+    replay.pyre \
     walk \
 
 # add these to the clean pile
@@ -105,6 +105,90 @@ disconnect(PyObject *, PyObject * args) {
 }
 
 
+// access the socket of a connection
+const char * const
+pyre::extensions::postgres::
+socket__name__ = "socket";
+
+const char * const
+pyre::extensions::postgres::
+socket__doc__ = "retrieve the file descriptor of the socket of a connection to the server";
+
+PyObject *
+pyre::extensions::postgres::
+socket(PyObject *, PyObject * args) {
+    // the connection capsule
+    PyObject * py_connection;
+    // extract it from the arguments
+    if (!PyArg_ParseTuple(args, "O!:socket", &PyCapsule_Type, &py_connection)) {
+        return 0;
+    }
+    // check that we were handed the correct kind of capsule
+    if (!PyCapsule_IsValid(py_connection, connectionCapsuleName)) {
+        PyErr_SetString(PyExc_TypeError, "the first argument must be a valid database connection");
+        return 0;
+    }
+    // get the connection object
+    PGconn * connection =
+        static_cast<PGconn *>(PyCapsule_GetPointer(py_connection, connectionCapsuleName));
+
+    // and return its socket
+    return PyLong_FromLong(PQsocket(connection));
+}
+
+
+// retrieve the transaction status of a connection
+const char * const
+pyre::extensions::postgres::
+transaction__name__ = "transaction";
+
+const char * const
+pyre::extensions::postgres::
+transaction__doc__ =
+    "retrieve the transaction status of a connection to the server: one of 'idle', 'active', "
+    "'transaction', 'error' or 'unknown'";
+
+PyObject *
+pyre::extensions::postgres::
+transaction(PyObject *, PyObject * args) {
+    // the connection capsule
+    PyObject * py_connection;
+    // extract it from the arguments
+    if (!PyArg_ParseTuple(args, "O!:transaction", &PyCapsule_Type, &py_connection)) {
+        return 0;
+    }
+    // check that we were handed the correct kind of capsule
+    if (!PyCapsule_IsValid(py_connection, connectionCapsuleName)) {
+        PyErr_SetString(PyExc_TypeError, "the first argument must be a valid database connection");
+        return 0;
+    }
+    // get the connection object
+    PGconn * connection =
+        static_cast<PGconn *>(PyCapsule_GetPointer(py_connection, connectionCapsuleName));
+
+    // ask the server
+    switch (PQtransactionStatus(connection)) {
+    // no transaction block is open
+    case PQTRANS_IDLE:
+        return PyUnicode_FromString("idle");
+    // a command is in progress
+    case PQTRANS_ACTIVE:
+        return PyUnicode_FromString("active");
+    // within a valid transaction block
+    case PQTRANS_INTRANS:
+        return PyUnicode_FromString("transaction");
+    // within a failed transaction block
+    case PQTRANS_INERROR:
+        return PyUnicode_FromString("error");
+    // the connection is bad
+    default:
+        break;
+    }
+    // anything else
+    return PyUnicode_FromString("unknown");
+}
+
+
 // shutdown an existing connection
 void
 pyre::extensions::postgres::
@@ -22,6 +22,16 @@ namespace pyre {
             extern const char * const disconnect__doc__;
             PyObject * disconnect(PyObject *, PyObject *);
 
+            // access the socket of a connection
+            extern const char * const socket__name__;
+            extern const char * const socket__doc__;
+            PyObject * socket(PyObject *, PyObject *);
+
+            // retrieve the transaction status of a connection
+            extern const char * const transaction__name__;
+            extern const char * const transaction__doc__;
+            PyObject * transaction(PyObject *, PyObject *);
+
         } // of namespace postgres
     } // of namespace extensions
 } // of namespace pyre
@@ -9,6 +9,7 @@
 
 #include <Python.h>
 #include <libpq-fe.h>
+#include <vector>
 #include <pyre/journal.h>
 
 #include "execute.h"
@@ -67,6 +68,472 @@ execute(PyObject *, PyObject * args) {
 }
 
 
+// execute a query synchronously and retrieve its results in binary form, if possible
+const char * const
+pyre::extensions::postgres::
+query__name__ = "query";
+
+const char * const
+pyre::extensions::postgres::
+query__doc__ =
+    "execute a single query and convert the results into native python objects; the optional "
+    "flag selects the binary or the text transfer format for the results, and when it is "
+    "missing the query is described first, and binary is used only if every field can be "
+    "decoded";
+
+PyObject *
+pyre::extensions::postgres::
+query(PyObject *, PyObject * args) {
+    // the connection specification
+    const char * command;
+    PyObject * py_connection;
+    // the format of the results
+    PyObject * binary = Py_None;
+    // extract the arguments
+    if (!PyArg_ParseTuple(
+            args, "O!s|O:query", &PyCapsule_Type, &py_connection, &command, &binary)) {
+        return 0;
+    }
+    // check that we were handed the correct kind of capsule
+    if (!PyCapsule_IsValid(py_connection, connectionCapsuleName)) {
+        PyErr_SetString(PyExc_TypeError, "the first argument must be a valid database connection");
+        return 0;
+    }
+    // get the connection object
+    PGconn * connection =
+        static_cast<PGconn *>(PyCapsule_GetPointer(py_connection, connectionCapsuleName));
+
+    // in case someone is listening...
+    pyre::journal::debug_t debug("postgres.execution");
+    debug
+        << pyre::journal::at(__HERE__)
+        << "querying '" << command << "'"
+        << pyre::journal::endl;
+
+    // the result set
+    PGresult * result;
+    // if the caller picked the format
+    if (binary != Py_None) {
+        // execute the command; there are no parameters
+        result = PQexecParams(connection, command, 0, 0, 0, 0, 0, PyObject_IsTrue(binary));
+    } else {
+        // otherwise, parse the command into the unnamed statement
+        result = PQprepare(connection, "", command, 0, 0);
+        // if that worked
+        if (result && PQresultStatus(result) == PGRES_COMMAND_OK) {
+            // describe it
+            PQclear(result);
+            result = PQdescribePrepared(connection, "");
+        }
+        // if that worked
+        if (result && PQresultStatus(result) == PGRES_COMMAND_OK) {
+            // use binary only if i can decode every field
+            int format = isDecodable(result) ? 1 : 0;
+            // execute it
+            PQclear(result);
+            result = PQexecPrepared(connection, "", 0, 0, 0, 0, format);
+        }
+    }
+    // error check
+    // null result indicates we have run out of memory
+    if (!result) {
+        // convert the error to human readable form
+        const char * description = PQerrorMessage(connection);
+        // and return an error indicator
+        return raiseOperationalError(description);
+    }
+
+    // delegate
+    return processResult(command, result, buildResultTuple);
+}
+
+
+// check whether the results of a cursor can be transmitted in binary form
+const char * const
+pyre::extensions::postgres::
+decodable__name__ = "decodable";
+
+const char * const
+pyre::extensions::postgres::
+decodable__doc__ =
+    "check whether every field of the named cursor has a type whose binary representation "
+    "can be converted into a python object";
+
+PyObject *
+pyre::extensions::postgres::
+decodable(PyObject *, PyObject * args) {
+    // the connection specification
+    PyObject * py_connection;
+    // the name of the cursor
+    const char * cursor;
+    // extract the arguments
+    if (!PyArg_ParseTuple(args, "O!s:decodable", &PyCapsule_Type, &py_connection, &cursor)) {
+        return 0;
+    }
+    // check that we were handed the correct kind of capsule
+    if (!PyCapsule_IsValid(py_connection, connectionCapsuleName)) {
+        PyErr_SetString(PyExc_TypeError, "the first argument must be a valid database connection");
+        return 0;
+    }
+    // get the connection object
+    PGconn * connection =
+        static_cast<PGconn *>(PyCapsule_GetPointer(py_connection, connectionCapsuleName));
+
+    // describe the cursor
+    PGresult * result = PQdescribePortal(connection, cursor);
+    // null result indicates we have run out of memory
+    if (!result) {
+        // convert the error to human readable form
+        const char * description = PQerrorMessage(connection);
+        // and return an error indicator
+        return raiseOperationalError(description);
+    }
+    // if the server didn't like it
+    if (PQresultStatus(result) != PGRES_COMMAND_OK) {
+        // build the exception
+        raiseProgrammingError(PQresultErrorMessage(result), cursor);
+        // clean up
+        PQclear(result);
+        // and bail
+        return 0;
+    }
+    // check the fields
+    PyObject * value = PyBool_FromLong(isDecodable(result));
+    // clean up
+    PQclear(result);
+    // and return the answer
+    return value;
+}
+
+
+// build a prepared statement
+const char * const
+pyre::extensions::postgres::
+prepare__name__ = "prepare";
+
+const char * const
+pyre::extensions::postgres::
+prepare__doc__ =
+    "create a named prepared statement; the optional sequence of type oids specifies the types "
+    "of its parameters, with zero leaving the choice to the server";
+
+PyObject *
+pyre::extensions::postgres::
+prepare(PyObject *, PyObject * args) {
+    // the connection specification
+    PyObject * py_connection;
+    // the name of the statement
+    const char * name;
+    // its text
+    const char * command;
+    // and the types of its parameters
+    PyObject * py_types = 0;
+    // extract the arguments
+    if (!PyArg_ParseTuple(args, "O!ss|O:prepare",
+                          &PyCapsule_Type, &py_connection, &name, &command, &py_types)) {
+        return 0;
+    }
+    // check that we were handed the correct kind of capsule
+    if (!PyCapsule_IsValid(py_connection, connectionCapsuleName)) {
+        PyErr_SetString(PyExc_TypeError, "the first argument must be a valid database connection");
+        return 0;
+    }
+    // get the connection object
+    PGconn * connection =
+        static_cast<PGconn *>(PyCapsule_GetPointer(py_connection, connectionCapsuleName));
+
+    // in case someone is listening...
+    pyre::journal::debug_t debug("postgres.execution");
+    debug
+        << pyre::journal::at(__HERE__)
+        << "preparing '" << name << "' as '" << command << "'"
+        << pyre::journal::endl;
+
+    // storage for the parameter types
+    std::vector<Oid> types;
+    // if the caller specified them
+    if (py_types) {
+        // get a fast view of the types
+        PyObject * fast = PySequence_Fast(py_types, "the parameter types must be a sequence");
+        // bail on failure
+        if (!fast) {
+            return 0;
+        }
+        // go through them
+        for (Py_ssize_t index = 0; index < PySequence_Fast_GET_SIZE(fast); ++index) {
+            // convert each one
+            unsigned long type = PyLong_AsUnsignedLong(PySequence_Fast_GET_ITEM(fast, index));
+            // if the conversion failed
+            if (PyErr_Occurred()) {
+                // clean up
+                Py_DECREF(fast);
+                // and bail
+                return 0;
+            }
+            // otherwise, store it
+            types.push_back(static_cast<Oid>(type));
+        }
+        // done with the view
+        Py_DECREF(fast);
+    }
+
+    // prepare the statement; the server infers the types that were left unspecified
+    PGresult * result = PQprepare(
+        connection, name, command, types.size(), types.empty() ? 0 : types.data());
+    // error check
+    // null result indicates we have run out of memory
+    if (!result) {
+        // convert the error to human readable form
+        const char * description = PQerrorMessage(connection);
+        // and return an error indicator
+        return raiseOperationalError(description);
+    }
+
+    // delegate
+    return processResult(command, result, buildResultTuple);
+}
+
+
+// execute a prepared statement once for each set of parameters
+const char * const
+pyre::extensions::postgres::
+executePrepared__name__ = "executePrepared";
+
+const char * const
+pyre::extensions::postgres::
+executePrepared__doc__ =
+    "execute a prepared statement once for each entry in a sequence of parameter values; "
+    "the values must be strings, or None for NULL";
+
+PyObject *
+pyre::extensions::postgres::
+executePrepared(PyObject *, PyObject * args) {
+    // the connection specification
+    PyObject * py_connection;
+    // the name of the statement
+    const char * name;
+    // and the parameter sets
+    PyObject * rows;
+    // extract the arguments
+    if (!PyArg_ParseTuple(args, "O!sO:executePrepared",
+                          &PyCapsule_Type, &py_connection, &name, &rows)) {
+        return 0;
+    }
+    // check that we were handed the correct kind of capsule
+    if (!PyCapsule_IsValid(py_connection, connectionCapsuleName)) {
+        PyErr_SetString(PyExc_TypeError, "the first argument must be a valid database connection");
+        return 0;
+    }
+    // get the connection object
+    PGconn * connection =
+        static_cast<PGconn *>(PyCapsule_GetPointer(py_connection, connectionCapsuleName));
+
+    // in case someone is listening...
+    pyre::journal::debug_t debug("postgres.execution");
+    debug
+        << pyre::journal::at(__HERE__)
+        << "executing the prepared statement '" << name << "'"
+        << pyre::journal::endl;
+
+    // get an iterator over the parameter sets
+    PyObject * iterator = PyObject_GetIter(rows);
+    // bail on failure
+    if (!iterator) {
+        return 0;
+    }
+
+    // storage for the parameter values
+    std::vector<const char *> values;
+    // the number of executions
+    long count = 0;
+    // go through the parameter sets
+    while (PyObject * row = PyIter_Next(iterator)) {
+        // get a fast view of the values
+        PyObject * fast = PySequence_Fast(row, "each parameter set must be a sequence");
+        // done with the row
+        Py_DECREF(row);
+        // bail on failure
+        if (!fast) {
+            Py_DECREF(iterator);
+            return 0;
+        }
+        // get the number of values
+        Py_ssize_t size = PySequence_Fast_GET_SIZE(fast);
+        // make room
+        values.resize(size);
+        // go through them
+        for (Py_ssize_t index = 0; index < size; ++index) {
+            // get the value
+            PyObject * item = PySequence_Fast_GET_ITEM(fast, index);
+            // {None} is NULL; everything else must be a string
+            values[index] = (item == Py_None) ? 0 : PyUnicode_AsUTF8(item);
+            // if the conversion failed
+            if (item != Py_None && !values[index]) {
+                // clean up
+                Py_DECREF(fast);
+                Py_DECREF(iterator);
+                // and bail
+                return 0;
+            }
+        }
+        // execute the statement; the values are in text form
+        PGresult * result = PQexecPrepared(connection, name, size, values.data(), 0, 0, 0);
+        // done with the values
+        Py_DECREF(fast);
+        // null result indicates we have run out of memory
+        if (!result) {
+            // clean up
+            Py_DECREF(iterator);
+            // convert the error to human readable form
+            const char * description = PQerrorMessage(connection);
+            // and return an error indicator
+            return raiseOperationalError(description);
+        }
+        // if the execution failed
+        if (PQresultStatus(result) != PGRES_COMMAND_OK) {
+            // clean up
+            Py_DECREF(iterator);
+            // raise a ProgrammingError
+            raiseProgrammingError(PQresultErrorMessage(result), name);
+            // free the result
+            PQclear(result);
+            // and bail
+            return 0;
+        }
+        // free the result
+        PQclear(result);
+        // and count the execution
+        count += 1;
+    }
+    // done with the iterator
+    Py_DECREF(iterator);
+    // if the iteration ended because of an error, bail
+    if (PyErr_Occurred()) {
+        return 0;
+    }
+
+    // return the number of executions
+    return PyLong_FromLong(count);
+}
+
+
+// stream data to the server
+const char * const
+pyre::extensions::postgres::
+copy__name__ = "copy";
+
+const char * const
+pyre::extensions::postgres::
+copy__doc__ =
+    "execute a COPY FROM STDIN command and stream the strings in a sequence to the server";
+
+PyObject *
+pyre::extensions::postgres::
+copy(PyObject *, PyObject * args) {
+    // the connection specification
+    PyObject * py_connection;
+    // the command
+    const char * command;
+    // and the data
+    PyObject * data;
+    // extract the arguments
+    if (!PyArg_ParseTuple(args, "O!sO:copy", &PyCapsule_Type, &py_connection, &command, &data)) {
+        return 0;
+    }
+    // check that we were handed the correct kind of capsule
+    if (!PyCapsule_IsValid(py_connection, connectionCapsuleName)) {
+        PyErr_SetString(PyExc_TypeError, "the first argument must be a valid database connection");
+        return 0;
+    }
+    // get the connection object
+    PGconn * connection =
+        static_cast<PGconn *>(PyCapsule_GetPointer(py_connection, connectionCapsuleName));
+
+    // in case someone is listening...
+    pyre::journal::debug_t debug("postgres.execution");
+    debug
+        << pyre::journal::at(__HERE__)
+        << "copying with '" << command << "'"
+        << pyre::journal::endl;
+
+    // get an iterator over the data
+    PyObject * iterator = PyObject_GetIter(data);
+    // bail on failure
+    if (!iterator) {
+        return 0;
+    }
+
+    // execute the command
+    PGresult * result = PQexec(connection, command);
+    // null result indicates we have run out of memory
+    if (!result) {
+        // clean up
+        Py_DECREF(iterator);
+        // convert the error to human readable form
+        const char * description = PQerrorMessage(connection);
+        // and return an error indicator
+        return raiseOperationalError(description);
+    }
+    // if the server is not waiting for data
+    if (PQresultStatus(result) != PGRES_COPY_IN) {
+        // clean up
+        Py_DECREF(iterator);
+        // raise a ProgrammingError
+        raiseProgrammingError(PQresultErrorMessage(result), command);
+        // free the result
+        PQclear(result);
+        // and bail
+        return 0;
+    }
+    // done with this one
+    PQclear(result);
+
+    // go through the data
+    while (PyObject * chunk = PyIter_Next(iterator)) {
+        // get the contents
+        Py_ssize_t size;
+        const char * buffer = PyUnicode_AsUTF8AndSize(chunk, &size);
+        // send them if all went well
+        int status = buffer ? PQputCopyData(connection, buffer, size) : -1;
+        // done with the chunk
+        Py_DECREF(chunk);
+        // if something went wrong
+        if (status != 1) {
+            // and there is no python error to report
+            if (!PyErr_Occurred()) {
+                // convert the error to human readable form
+                raiseOperationalError(PQerrorMessage(connection));
+            }
+            // stop iterating
+            break;
+        }
+    }
+    // done with the iterator
+    Py_DECREF(iterator);
+
+    // if anything went wrong, abort the transfer; otherwise, mark its end
+    PQputCopyEnd(connection, PyErr_Occurred() ? "the transfer was aborted by the client" : 0);
+    // collect the outcome
+    while ((result = PQgetResult(connection))) {
+        // if this is an error and there is no other error pending
+        if (PQresultStatus(result) != PGRES_COMMAND_OK && !PyErr_Occurred()) {
+            // raise a ProgrammingError
+            raiseProgrammingError(PQresultErrorMessage(result), command);
+        }
+        // free the result
+        PQclear(result);
+    }
+    // if there was an error, bail
+    if (PyErr_Occurred()) {
+        return 0;
+    }
+
+    // return None
+    Py_INCREF(Py_None);
+    return Py_None;
+}
+
+
 // submit a query for asynchronous execution
 const char * const
 pyre::extensions::postgres::
@@ -170,15 +637,19 @@ retrieve__name__ = "retrieve";
 
 const char * const
 pyre::extensions::postgres::
-retrieve__doc__ = "retrieve a result set from a previously submitted asynchronous query";
+retrieve__doc__ =
+    "retrieve a result set from a previously submitted asynchronous query; the optional "
+    "second argument is returned when there are no more results";
 
 PyObject *
 pyre::extensions::postgres::
 retrieve(PyObject *, PyObject * args) {
     // the connection specification
     PyObject * py_connection;
+    // the value that marks the end of the results
+    PyObject * done = Py_None;
     // extract the arguments
-    if (!PyArg_ParseTuple(args, "O!:retrieve", &PyCapsule_Type, &py_connection)) {
+    if (!PyArg_ParseTuple(args, "O!|O:retrieve", &PyCapsule_Type, &py_connection, &done)) {
         return 0;
     }
     // check that we were handed the correct kind of capsule
@@ -192,6 +663,12 @@ retrieve(PyObject *, PyObject * args) {
 
     // retrieve the result
     PGresult * result = PQgetResult(connection);
+    // if there are no more results
+    if (!result) {
+        // say so
+        Py_INCREF(done);
+        return done;
+    }
 
     // and delegate the processing
     return processResult("<unknown>", result, buildResultTuple);
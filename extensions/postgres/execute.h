@@ -17,6 +17,31 @@ namespace pyre {
             extern const char * const execute__doc__;
             PyObject * execute(PyObject *, PyObject *);
 
+            // execute a query and retrieve its results in binary form, if possible
+            extern const char * const query__name__;
+            extern const char * const query__doc__;
+            PyObject * query(PyObject *, PyObject *);
+
+            // check whether the results of a cursor can be transmitted in binary form
+            extern const char * const decodable__name__;
+            extern const char * const decodable__doc__;
+            PyObject * decodable(PyObject *, PyObject *);
+
+            // create a named prepared statement
+            extern const char * const prepare__name__;
+            extern const char * const prepare__doc__;
+            PyObject * prepare(PyObject *, PyObject *);
+
+            // execute a prepared statement with a sequence of parameter sets
+            extern const char * const executePrepared__name__;
+            extern const char * const executePrepared__doc__;
+            PyObject * executePrepared(PyObject *, PyObject *);
+
+            // stream data to the server with COPY FROM STDIN
+            extern const char * const copy__name__;
+            extern const char * const copy__doc__;
+            PyObject * copy(PyObject *, PyObject *);
+
             // submit a query for asynchronous processing
             extern const char * const submit__name__;
             extern const char * const submit__doc__;
@@ -8,7 +8,14 @@
 #include <portinfo>
 
 #include <Python.h>
+#include <datetime.h>
 #include <libpq-fe.h>
+#include <arpa/inet.h>
+#include <cstdint>
+#include <cstdio>
+#include <cstring>
+#include <string>
+#include <vector>
 #include <pyre/journal.h>
 
 #include "exceptions.h"
@@ -17,11 +24,107 @@
 
 
 // types
-typedef PyObject * (*pythonizer_t)(const char *);
+typedef PyObject * (*pythonizer_t)(const char *, int);
 
 // declarations of the converters; definitions at the bottom
-PyObject * asNone(const char *);
-PyObject * asString(const char *);
+PyObject * asNone(const char *, int);
+PyObject * asString(const char *, int);
+PyObject * asBytes(const char *, int);
+PyObject * asBool(const char *, int);
+PyObject * asInt2(const char *, int);
+PyObject * asInt4(const char *, int);
+PyObject * asInt8(const char *, int);
+PyObject * asFloat4(const char *, int);
+PyObject * asFloat8(const char *, int);
+PyObject * asDate(const char *, int);
+PyObject * asTime(const char *, int);
+PyObject * asTimestamp(const char *, int);
+PyObject * asTimestampTZ(const char *, int);
+PyObject * asDecimal(const char *, int);
+PyObject * asOid(const char *, int);
+PyObject * asJSONB(const char *, int);
+PyObject * asUUID(const char *, int);
+
+// the object ids of the types whose binary representation we know how to decode; these
+// are fixed by the postgres system catalog
+namespace oids {
+    const Oid boolean = 16;
+    const Oid bytea = 17;
+    const Oid character = 18;
+    const Oid name = 19;
+    const Oid int8 = 20;
+    const Oid int2 = 21;
+    const Oid int4 = 23;
+    const Oid text = 25;
+    const Oid oid = 26;
+    const Oid json = 114;
+    const Oid xml = 142;
+    const Oid float4 = 700;
+    const Oid float8 = 701;
+    const Oid bpchar = 1042;
+    const Oid varchar = 1043;
+    const Oid date = 1082;
+    const Oid time = 1083;
+    const Oid timestamp = 1114;
+    const Oid timestamptz = 1184;
+    const Oid numeric = 1700;
+    const Oid uuid = 2950;
+    const Oid jsonb = 3802;
+}
+
+// look up the decoder for the binary representation of the given type; the values are built
+// to match what the text format would have produced, except for the types that have native
+// python counterparts
+static pythonizer_t binaryDecoder(Oid type)
+{
+    switch (type) {
+    case oids::boolean: return asBool;
+    case oids::int2: return asInt2;
+    case oids::int4: return asInt4;
+    case oids::int8: return asInt8;
+    case oids::float4: return asFloat4;
+    case oids::float8: return asFloat8;
+    case oids::date: return asDate;
+    case oids::time: return asTime;
+    case oids::timestamp: return asTimestamp;
+    case oids::timestamptz: return asTimestampTZ;
+    case oids::numeric: return asDecimal;
+    case oids::oid: return asOid;
+    case oids::bytea: return asBytes;
+    case oids::jsonb: return asJSONB;
+    case oids::uuid: return asUUID;
+    // the binary representation of these is their text
+    case oids::character:
+    case oids::name:
+    case oids::text:
+    case oids::json:
+    case oids::xml:
+    case oids::bpchar:
+    case oids::varchar:
+        return asString;
+    // everything else must be transmitted as text
+    default:
+        return 0;
+    }
+}
+
+
+// check whether all the fields described by {result} can be transmitted in binary form
+bool
+pyre::extensions::postgres::
+isDecodable(const PGresult * result)
+{
+    // go through the fields
+    for (int field = 0; field < PQnfields(result); field++) {
+        // if i don't know how to decode this one
+        if (!binaryDecoder(PQftype(result, field))) {
+            // the result set must be transmitted as text
+            return false;
+        }
+    }
+    // all good
+    return true;
+}
 
 
 // convert the tuples in PGresult into a python tuple
@@ -66,14 +169,27 @@ buildResultTuple(PGresult * result)
             converters.push_back(asString);
 
         } else if (PQfformat(result, field) == 1) {
-            pyre::journal::firewall_t firewall("postgress.conversions");
-            firewall
+            debug
                 << pyre::journal::at(__HERE__)
-                << "NYI: binary data for field '"
-                << PQfname(result, field)
-                << "'"
+                << "field '" << PQfname(result, field) << "' is formatted as binary, "
+                << "with type " << PQftype(result, field)
                 << pyre::journal::endl;
-            converters.push_back(asNone);
+            // look up the decoder
+            pythonizer_t decoder = binaryDecoder(PQftype(result, field));
+            // if there isn't one
+            if (!decoder) {
+                // clean up
+                Py_DECREF(data);
+                // complain; the caller should have asked for text
+                PyErr_Format(
+                    PyExc_TypeError,
+                    "field '%s' has type %u, whose binary representation is not supported",
+                    PQfname(result, field), PQftype(result, field));
+                // and bail
+                return 0;
+            }
+            // otherwise, save it
+            converters.push_back(decoder);
 
         } else {
             pyre::journal::firewall_t firewall("postgress.conversions");
@@ -100,7 +216,15 @@ buildResultTuple(PGresult * result)
             if (!PQgetisnull(result, tuple, field)) {
                 // extract it
                 const char * value = PQgetvalue(result, tuple, field);
-                item = converters[field](value);
+                item = converters[field](value, PQgetlength(result, tuple, field));
+                // if the conversion failed
+                if (!item) {
+                    // clean up
+                    Py_DECREF(row);
+                    Py_DECREF(data);
+                    // and bail; the converter has set the python exception
+                    return 0;
+                }
             } else {
                 // otherwise it is null, which we encode as None
                 Py_INCREF(null);
@@ -219,15 +343,362 @@ raiseProgrammingError(string_t description, string_t command)
 
 
 // data converter definitions
- PyObject * asNone(const char * value)
- {
-     Py_INCREF(Py_None);
-     return Py_None;
- }
-
- PyObject * asString(const char * value)
- {
-     return PyUnicode_FromString(value);
- }
+// helpers that extract integers in network byte order
+static inline std::uint16_t network16(const char * value)
+{
+    std::uint16_t result;
+    std::memcpy(&result, value, sizeof(result));
+    return ntohs(result);
+}
+
+static inline std::uint32_t network32(const char * value)
+{
+    std::uint32_t result;
+    std::memcpy(&result, value, sizeof(result));
+    return ntohl(result);
+}
+
+static inline std::uint64_t network64(const char * value)
+{
+    // assemble from the two halves
+    return (static_cast<std::uint64_t>(network32(value)) << 32) | network32(value + 4);
+}
+
+// the date and time types count from the postgres epoch, 2000-01-01, whose ordinal in the
+// proleptic gregorian calendar is
+static const long epochOrdinal = 730120;
+static const long long usecPerDay = 86400LL * 1000000LL;
+
+// access to the datetime capi
+static bool datetime()
+{
+    // import it the first time through
+    if (!PyDateTimeAPI) {
+        PyDateTime_IMPORT;
+    }
+    // and report whether it is available
+    return PyDateTimeAPI != 0;
+}
+
+// split the ordinal of a day in the proleptic gregorian calendar into its year, month and day;
+// works for any ordinal, including the ones outside the range of python dates
+static void civil(long long ordinal, long long & year, unsigned & month, unsigned & day)
+{
+    // count the days from 0000-03-01, so that leap days fall at the end of the year
+    long long days = ordinal + 305;
+    // the 400 year cycle
+    long long era = (days >= 0 ? days : days - 146096) / 146097;
+    // the day within the cycle
+    unsigned doe = static_cast<unsigned>(days - era * 146097);
+    // the year within the cycle
+    unsigned yoe = (doe - doe/1460 + doe/36524 - doe/146096) / 365;
+    // the day within the year
+    unsigned doy = doe - (365*yoe + yoe/4 - yoe/100);
+    // the month, counting from march
+    unsigned mp = (5*doy + 2) / 153;
+    // assemble
+    day = doy - (153*mp + 2)/5 + 1;
+    month = mp < 10 ? mp + 3 : mp - 9;
+    year = static_cast<long long>(yoe) + era * 400 + (month <= 2);
+    // all done
+    return;
+}
+
+// render a day the way the server does in text mode; this is what clients get for the days
+// python can't represent, just as if they had asked for text results
+static std::string dayText(long long year, unsigned month, unsigned day)
+{
+    char buffer[32];
+    // there is no year 0: the year before 1 is 1 BC, whose suffix goes at the very end
+    std::snprintf(buffer, sizeof(buffer), "%04lld-%02u-%02u", year > 0 ? year : 1 - year, month, day);
+    return buffer;
+}
+
+// build a date given the number of days since the postgres epoch
+static PyObject * dateFromDays(long long days)
+{
+    // make sure the datetime capi is available
+    if (!datetime()) return 0;
+    // split the day
+    long long year;
+    unsigned month, day;
+    civil(epochOrdinal + days, year, month, day);
+    // if it is outside the range of python dates
+    if (year < 1 || year > 9999) {
+        // render it as text
+        std::string text = dayText(year, month, day) + (year > 0 ? "" : " BC");
+        // and return it
+        return PyUnicode_FromString(text.c_str());
+    }
+    // otherwise, build the date
+    return PyDateTimeAPI->Date_FromDate(year, month, day, PyDateTimeAPI->DateType);
+}
+
+// build a timestamp given the number of microseconds since the postgres epoch
+static PyObject * timestamp(const char * value, PyObject * zone)
+{
+    // get the value
+    std::int64_t raw = static_cast<std::int64_t>(network64(value));
+    // postgres encodes {infinity} and {-infinity} as the extreme values of the type; map them
+    // to {datetime.max} and {datetime.min}
+    if (raw == INT64_MAX) {
+        return PyDateTimeAPI->DateTime_FromDateAndTime(
+            9999, 12, 31, 23, 59, 59, 999999, zone, PyDateTimeAPI->DateTimeType);
+    }
+    if (raw == INT64_MIN) {
+        return PyDateTimeAPI->DateTime_FromDateAndTime(
+            1, 1, 1, 0, 0, 0, 0, zone, PyDateTimeAPI->DateTimeType);
+    }
+    // split into days and microseconds within the day, rounding towards negative infinity
+    long long usec = raw;
+    long long days = usec / usecPerDay;
+    usec %= usecPerDay;
+    if (usec < 0) {
+        usec += usecPerDay;
+        days -= 1;
+    }
+    // split the day
+    long long year;
+    unsigned month, day;
+    civil(epochOrdinal + days, year, month, day);
+    // the time of day
+    int hour = usec / 3600000000LL;
+    int minute = (usec / 60000000LL) % 60;
+    int second = (usec / 1000000LL) % 60;
+    int micro = usec % 1000000LL;
+    // if the day is within the range of python dates
+    if (year >= 1 && year <= 9999) {
+        // build the timestamp
+        return PyDateTimeAPI->DateTime_FromDateAndTime(
+            year, month, day, hour, minute, second, micro, zone, PyDateTimeAPI->DateTimeType);
+    }
+    // otherwise, render it as text
+    char buffer[32];
+    std::snprintf(buffer, sizeof(buffer), " %02d:%02d:%02d", hour, minute, second);
+    std::string text = dayText(year, month, day) + buffer;
+    // the server only shows the significant digits of the microseconds
+    if (micro) {
+        std::snprintf(buffer, sizeof(buffer), ".%06d", micro);
+        std::string fraction = buffer;
+        text += fraction.substr(0, fraction.find_last_not_of('0') + 1);
+    }
+    // these are transmitted in UTC
+    if (zone != Py_None) {
+        text += "+00";
+    }
+    // and the era goes at the end
+    if (year < 1) {
+        text += " BC";
+    }
+    // all done
+    return PyUnicode_FromString(text.c_str());
+}
+
+PyObject * asNone(const char * value, int length)
+{
+    Py_INCREF(Py_None);
+    return Py_None;
+}
+
+PyObject * asString(const char * value, int length)
+{
+    return PyUnicode_FromStringAndSize(value, length);
+}
+
+PyObject * asBytes(const char * value, int length)
+{
+    return PyBytes_FromStringAndSize(value, length);
+}
+
+PyObject * asBool(const char * value, int length)
+{
+    return PyBool_FromLong(value[0]);
+}
+
+PyObject * asInt2(const char * value, int length)
+{
+    return PyLong_FromLong(static_cast<std::int16_t>(network16(value)));
+}
+
+PyObject * asInt4(const char * value, int length)
+{
+    return PyLong_FromLong(static_cast<std::int32_t>(network32(value)));
+}
+
+PyObject * asInt8(const char * value, int length)
+{
+    return PyLong_FromLongLong(static_cast<std::int64_t>(network64(value)));
+}
+
+PyObject * asFloat4(const char * value, int length)
+{
+    // reinterpret the bits
+    std::uint32_t bits = network32(value);
+    float result;
+    std::memcpy(&result, &bits, sizeof(result));
+    // and convert
+    return PyFloat_FromDouble(result);
+}
+
+PyObject * asFloat8(const char * value, int length)
+{
+    // reinterpret the bits
+    std::uint64_t bits = network64(value);
+    double result;
+    std::memcpy(&result, &bits, sizeof(result));
+    // and convert
+    return PyFloat_FromDouble(result);
+}
+
+PyObject * asDate(const char * value, int length)
+{
+    // make sure the datetime capi is available
+    if (!datetime()) return 0;
+    // get the number of days since the postgres epoch
+    std::int32_t days = static_cast<std::int32_t>(network32(value));
+    // postgres encodes {infinity} and {-infinity} as the extreme values of the type; map them
+    // to {date.max} and {date.min}
+    if (days == INT32_MAX) {
+        return PyDateTimeAPI->Date_FromDate(9999, 12, 31, PyDateTimeAPI->DateType);
+    }
+    if (days == INT32_MIN) {
+        return PyDateTimeAPI->Date_FromDate(1, 1, 1, PyDateTimeAPI->DateType);
+    }
+    // everything else
+    return dateFromDays(days);
+}
+
+PyObject * asTime(const char * value, int length)
+{
+    // make sure the datetime capi is available
+    if (!datetime()) return 0;
+    // get the number of microseconds since midnight
+    long long usec = static_cast<std::int64_t>(network64(value));
+    // build the time
+    return PyDateTimeAPI->Time_FromTime(
+        usec / 3600000000LL, (usec / 60000000LL) % 60, (usec / 1000000LL) % 60, usec % 1000000LL,
+        Py_None, PyDateTimeAPI->TimeType);
+}
+
+PyObject * asTimestamp(const char * value, int length)
+{
+    // make sure the datetime capi is available
+    if (!datetime()) return 0;
+    // build a naive timestamp
+    return timestamp(value, Py_None);
+}
+
+PyObject * asTimestampTZ(const char * value, int length)
+{
+    // make sure the datetime capi is available
+    if (!datetime()) return 0;
+    // these are transmitted in UTC
+    return timestamp(value, PyDateTime_TimeZone_UTC);
+}
+
+PyObject * asDecimal(const char * value, int length)
+{
+    // the decimal type
+    static PyObject * decimal = 0;
+    // the first time through
+    if (!decimal) {
+        // get the module
+        PyObject * module = PyImport_ImportModule("decimal");
+        // bail on failure
+        if (!module) return 0;
+        // get the type
+        decimal = PyObject_GetAttrString(module, "Decimal");
+        // done with the module
+        Py_DECREF(module);
+        // bail on failure
+        if (!decimal) return 0;
+    }
+
+    // unpack the header
+    int ndigits = static_cast<std::int16_t>(network16(value));
+    int weight = static_cast<std::int16_t>(network16(value + 2));
+    int sign = network16(value + 4);
+    int dscale = static_cast<std::int16_t>(network16(value + 6));
+    // special values
+    switch (sign) {
+    case 0xC000:
+        return PyObject_CallFunction(decimal, "s", "NaN");
+    case 0xD000:
+        return PyObject_CallFunction(decimal, "s", "Infinity");
+    case 0xF000:
+        return PyObject_CallFunction(decimal, "s", "-Infinity");
+    }
+    // the digits are in base 10000, and the first one is multiplied by 10000^weight
+    std::string whole, fraction;
+    for (int digit = 0; digit < ndigits; ++digit) {
+        // render the digit
+        char buffer[8];
+        std::snprintf(buffer, sizeof(buffer), "%04d", network16(value + 8 + 2*digit));
+        // and attach it to the correct part of the number
+        if (digit <= weight) {
+            whole += buffer;
+        } else {
+            fraction += buffer;
+        }
+    }
+    // pad the whole part with the zeros that are not transmitted
+    for (int digit = ndigits; digit <= weight; ++digit) {
+        whole += "0000";
+    }
+    // same for the leading zeros of the fractional part
+    if (weight < -1) {
+        fraction.insert(0, 4*(-1-weight), '0');
+    }
+    // trim the leading zeros of the whole part
+    std::string::size_type start = whole.find_first_not_of('0');
+    whole = (start == std::string::npos) ? "0" : whole.substr(start);
+    // and adjust the fractional part to the display scale
+    fraction.resize(dscale, '0');
+    // assemble the text representation
+    std::string text = (sign == 0x4000 ? "-" : "") + whole;
+    if (dscale > 0) {
+        text += "." + fraction;
+    }
+    // and hand it to the constructor
+    return PyObject_CallFunction(decimal, "s", text.c_str());
+}
+
+PyObject * asOid(const char * value, int length)
+{
+    return PyLong_FromUnsignedLong(network32(value));
+}
+
+PyObject * asJSONB(const char * value, int length)
+{
+    // the text is preceded by a version number; this is the only one there is so far
+    if (length < 1 || value[0] != 1) {
+        PyErr_SetString(PyExc_ValueError, "unsupported jsonb format version");
+        return 0;
+    }
+    // skip it
+    return PyUnicode_FromStringAndSize(value + 1, length - 1);
+}
+
+PyObject * asUUID(const char * value, int length)
+{
+    // the sixteen bytes are rendered in hex, in groups of 8-4-4-4-12 digits
+    const char * digits = "0123456789abcdef";
+    char text[36];
+    // the output cursor
+    int position = 0;
+    // go through the bytes
+    for (int byte = 0; byte < 16; byte++) {
+        // the groups are separated by dashes
+        if (byte == 4 || byte == 6 || byte == 8 || byte == 10) {
+            text[position++] = '-';
+        }
+        // render
+        unsigned char octet = static_cast<unsigned char>(value[byte]);
+        text[position++] = digits[octet >> 4];
+        text[position++] = digits[octet & 0xf];
+    }
+    // build the string
+    return PyUnicode_FromStringAndSize(text, sizeof(text));
+}
 
 // end of file
@@ -20,6 +20,8 @@ namespace pyre {
 
             // other utilities
             PyObject * buildResultTuple(PGresult *);
+            // check whether all the fields of a result can be transmitted in binary form
+            bool isDecodable(const PGresult *);
 
             PyObject * processResult(
                                      string_t command,
@@ -36,9 +36,17 @@ namespace pyre {
                 // connections
                 { connect__name__, connect, METH_VARARGS, connect__doc__ },
                 { disconnect__name__, disconnect, METH_VARARGS, disconnect__doc__ },
+                { socket__name__, socket, METH_VARARGS, socket__doc__ },
+                { transaction__name__, transaction, METH_VARARGS, transaction__doc__ },
 
                 // SQL command execution
                 { execute__name__, execute, METH_VARARGS, execute__doc__ },
+                { query__name__, query, METH_VARARGS, query__doc__ },
+                { decodable__name__, decodable, METH_VARARGS, decodable__doc__ },
+                { prepare__name__, prepare, METH_VARARGS, prepare__doc__ },
+                { executePrepared__name__,
+                  executePrepared, METH_VARARGS, executePrepared__doc__ },
+                { copy__name__, copy, METH_VARARGS, copy__doc__ },
                 { submit__name__, submit, METH_VARARGS, submit__doc__ },
                 { busy__name__, busy, METH_VARARGS, busy__doc__ },
                 { consume__name__, consume, METH_VARARGS, consume__doc__ },
@@ -0,0 +1,377 @@
+# -*- coding: utf-8 -*-
+#
+# michael a.g. aïvázis
+# orthologue
+# (c) 1998-2018 all rights reserved
+#
+
+
+# externals
+import os
+import mmap
+import time
+import atexit
+import socket
+import struct
+import weakref
+import threading
+# packages
+import pyre
+
+
+# the implemented interfaces
+from .Device import Device
+
+
+# declaration
+class Binary(pyre.component, family="journal.devices.binary", implements=Device):
+    """
+    A device that appends journal entries as compact binary records to a memory mapped file
+
+    Each process writes to its own file, whose name is {log} followed by the host name and the
+    process id. Recording an entry involves no rendering and no system calls: channel names and
+    call sites are assigned small integer ids the first time they are seen, and every entry is
+    stored as a timestamp, a severity, the channel and call site ids, and the raw text of the
+    message. Use {journal.reader} to read the records
+    back, and the {replay} application to render them, filter them, and merge the logs of many
+    processes by timestamp.
+
+    The file is a header followed by a sequence of records, each of which starts with its
+    length and its kind, so that readers can skip kinds they don't understand; a record of zero
+    length marks the end of the log. The file grows by {size} bytes whenever it fills up, and
+    it is trimmed to its contents when the process exits; entries recorded after that, e.g. by
+    exit handlers that run late, reopen the trimmed file and are appended to it. Entries written
+    before a crash survive it, since they live in the shared mapping of the file. The device is safe to use
+    from multiple threads: records are appended under a lock
+    """
+
+
+    # types
+    from .TextRenderer import TextRenderer
+
+
+    # public state
+    log = pyre.properties.str(default="journal")
+    log.doc = "the prefix of the log file names; the host and process id are added to it"
+
+    renderer = Device.Renderer(default=TextRenderer)
+    renderer.doc = "unused; entries are rendered offline"
+
+    size = pyre.properties.int(default=16*1024*1024)
+    size.doc = "the number of bytes by which the log file grows when it fills up"
+
+
+    # constants
+    magic = b"pyre.journal\0\0\0\1" # the file header, with the version of the format
+    # the record kinds
+    PROCESS, CHANNEL, LOCATOR, ENTRY = range(1, 5)
+    # the known severities, in the order of their codes
+    severities = ("debug", "firewall", "info", "warning", "error")
+    # the record layouts; the variable part of each record follows its fixed part
+    prefix = struct.Struct("<IB") # length, kind
+    process = struct.Struct("<Q") # pid; then the host name
+    channel = struct.Struct("<I") # id; then the channel name
+    locator = struct.Struct("<II") # id, line; then the filename, a NUL, and the function
+    entry = struct.Struct("<QBII") # ns timestamp, severity, channel and locator ids; the text
+    # the parts of entries, as they are assembled by {record}
+    stamp = struct.Struct("<BQ") # kind, timestamp
+    tag = struct.Struct("<BII") # severity, channel and locator ids
+
+
+    # public data
+    @property
+    def filename(self):
+        """
+        The name of my log file, if i have one open
+        """
+        # get my log file
+        log = self.stream
+        # and return its name
+        return None if log is None else log.name
+
+
+    # interface
+    @pyre.export
+    def record(self, page, metadata):
+        """
+        Record a journal entry
+        """
+        # get my log file
+        log = self.stream
+        # if this is my first entry
+        if log is None:
+            # open it, unless another thread beats me to it
+            with self.lock: log = self.stream or self.open()
+        # identify the origin of the entry; plain dictionary lookups are the cheapest
+        get = dict.get
+        origin = (
+            get(metadata, "channel"), get(metadata, "severity"),
+            get(metadata, "filename"), get(metadata, "line"), get(metadata, "function"))
+        # look up its encoding
+        tag = self.tags.get(origin)
+        # if this is the first time i see it
+        if tag is None:
+            # describe it, unless another thread beats me to it
+            with self.lock: tag = self.tags.get(origin) or self.describe(origin)
+        # assemble the text
+        try:
+            # assuming the page is all strings
+            text = "\n".join(page)
+        # if it isn't
+        except TypeError:
+            # convert
+            text = "\n".join(map(str, page))
+        # build the record and write it
+        log.append(self.stamp.pack(self.ENTRY, time.time_ns()) + tag + text.encode())
+        # all done
+        return self
+
+
+    def close(self):
+        """
+        Trim the log file to its contents and release it
+        """
+        # make sure no other thread is opening the log file or describing origins
+        with self.lock:
+            # if i have a log file
+            if self.stream is not None:
+                # close it
+                self.stream.close(trim=True)
+                # remember its name, so that later entries are appended to it
+                self.trimmed = self.stream.name
+                # and forget it; the ids of the channels and call sites remain valid
+                self.stream = None
+        # all done
+        return self
+
+
+    # meta-methods
+    def __init__(self, **kwds):
+        # chain up
+        super().__init__(**kwds)
+        # the severity codes
+        self.codes = { severity: code for code, severity in enumerate(self.severities) }
+        # the ids of the channels and the call sites in my log
+        self.channels = {}
+        self.locators = {}
+        # the encoded origins of the entries
+        self.tags = {}
+        # the lock that serializes opening the log file and describing new origins
+        self.lock = threading.Lock()
+        # make sure the log file is trimmed at exit
+        atexit.register(self.close)
+        # processes that inherit me from their parent must make their own log file
+        reference = weakref.ref(self)
+        os.register_at_fork(after_in_child=lambda: reference() and reference().abandon())
+        # all done
+        return
+
+
+    # implementation details
+    def open(self):
+        """
+        Create my log file
+        """
+        # get my process info
+        host, pid = socket.gethostname(), os.getpid()
+        # build the name of the log file
+        name = "{}-{}-{}.bin".format(self.log, host, pid)
+        # if i have closed it already
+        if name == self.trimmed:
+            # reopen it and pick up where i left off
+            log = self.stream = self.Log(name=name, size=self.size, resume=True)
+            # all done
+            return log
+        # otherwise, nothing i have told any other log file applies to this one
+        self.reset()
+        # create it
+        log = self.stream = self.Log(name=name, size=self.size)
+        # write the header
+        log.header(self.magic)
+        # identify the process
+        self.write(self.PROCESS, self.process.pack(pid) + host.encode())
+        # all done
+        return log
+
+
+    def describe(self, origin):
+        """
+        Build the tag of the entries from {origin}, writing out the descriptions of its channel
+        and its call site if they are new
+        """
+        # unpack
+        name, severity, filename, line, function = origin
+        # look up the channel id
+        channel = self.channels.get(name)
+        # if this is the first time i see this channel
+        if channel is None:
+            # assign it an id
+            channel = self.channels[name] = len(self.channels) + 1
+            # and describe it
+            self.write(self.CHANNEL, self.channel.pack(channel) + str(name).encode())
+        # look up the call site
+        site = (filename, line, function)
+        locator = self.locators.get(site)
+        # if this is the first time i see this call site
+        if locator is None:
+            # assign it an id
+            locator = self.locators[site] = len(self.locators) + 1
+            # and describe it
+            self.write(self.LOCATOR, self.locator.pack(locator, line or 0) +
+                       "{}\0{}".format(filename or "", function or "").encode())
+        # encode the severity; unknown severities get the code past the end of the known ones
+        code = self.codes.get(severity, len(self.severities))
+        # build the tag
+        tag = self.tags[origin] = self.tag.pack(code, channel, locator)
+        # and return it
+        return tag
+
+
+    def write(self, kind, payload):
+        """
+        Append a record of the given {kind} with the given {payload} to my log file
+        """
+        # prepend the kind and append
+        return self.stream.append(bytes((kind,)) + payload)
+
+
+    def abandon(self):
+        """
+        Release my log file without trimming it; after a fork, it belongs to the parent
+        """
+        # the threads that may have been holding my locks did not survive the fork
+        self.lock = threading.Lock()
+        # if i have a log file
+        if self.stream is not None:
+            # replace its lock as well
+            self.stream.lock = threading.Lock()
+            # close it
+            self.stream.close(trim=False)
+            # and forget it
+            self.reset()
+        # all done
+        return
+
+
+    def reset(self):
+        """
+        Forget my log file and everything i have told it
+        """
+        # easy enough
+        self.stream = None
+        self.trimmed = None
+        self.channels.clear()
+        self.locators.clear()
+        self.tags.clear()
+        # all done
+        return
+
+
+    # the log file; a plain object, since setting attributes of components is expensive
+    class Log:
+        """
+        A memory mapped file that grows as records are appended to it
+
+        Appending a record reads the current position, writes into the mapping, possibly
+        remaps it, and moves the position past the record; these steps are done under a lock so
+        that threads never overwrite each other's records
+        """
+
+        # the layout of the records
+        length = struct.Struct("<I") # the length of the record, including this field
+        marker = 5 # the room for the end of log marker, i.e. a zero length and kind
+
+        def header(self, magic):
+            """
+            Write the file header
+            """
+            # write it
+            self.map[:len(magic)] = magic
+            # and move past it
+            self.position = len(magic)
+            # all done
+            return
+
+        def append(self, body):
+            """
+            Append a record with the given {body}, i.e. everything but its length
+            """
+            # compute the length of the record
+            length = self.length.size + len(body)
+            # claim my spot
+            with self.lock:
+                # if the file is closed, there is nowhere to put the record
+                if self.map is None: return
+                # find where it starts and where it ends
+                start = self.position
+                end = start + length
+                # if it doesn't fit, along with the end of log marker
+                if end + self.marker > self.capacity:
+                    # make room
+                    self.grow(self.capacity + max(self.size, length + self.marker))
+                # write the body first, so that readers never see a length without its contents
+                self.map[start+self.length.size:end] = body
+                # then the length
+                self.length.pack_into(self.map, start, length)
+                # and update the position
+                self.position = end
+            # all done
+            return
+
+        def grow(self, size):
+            """
+            Resize the file to {size} bytes and map it; the caller must hold my lock, unless
+            nobody else can see me yet
+            """
+            # if there is a mapping, release it
+            if self.map is not None: self.map.close()
+            # resize the file; the new part is filled with zeros, which mark the end of the log
+            os.ftruncate(self.fd, size)
+            # and map it
+            self.map = mmap.mmap(self.fd, size)
+            self.capacity = size
+            # all done
+            return
+
+        def close(self, trim):
+            """
+            Release the file, trimming it to its contents if {trim} is set
+            """
+            # wait for the pending appends
+            with self.lock:
+                # release the mapping
+                self.map.close()
+                self.map = None
+                # if necessary, trim the file
+                if trim: os.ftruncate(self.fd, self.position)
+                # and close it
+                os.close(self.fd)
+            # all done
+            return
+
+        def __init__(self, name, size, resume=False):
+            # save the name and the growth increment
+            self.name = name
+            self.size = size
+            # open the file; unless i am resuming a trimmed log, start from scratch
+            flags = os.O_RDWR | os.O_CREAT | (0 if resume else os.O_TRUNC)
+            self.fd = os.open(name, flags, 0o644)
+            # the lock that serializes the appends
+            self.lock = threading.Lock()
+            # no mapping yet
+            self.map = None
+            # trimmed logs end with their last record, so that is where the next one goes
+            self.position = os.fstat(self.fd).st_size
+            self.capacity = 0
+            # make room
+            self.grow(self.position + size)
+            # all done
+            return
+
+
+    # private data
+    stream = None
+    trimmed = None # the name of the log file i closed, if any
+
+
+# end of file
@@ -0,0 +1,267 @@
+# -*- coding: utf-8 -*-
+#
+# michael a.g. aïvázis
+# orthologue
+# (c) 1998-2018 all rights reserved
+#
+
+
+# externals
+import os
+import atexit
+import weakref
+import threading
+import collections
+# packages
+import pyre
+
+
+# the implemented interfaces
+from .Device import Device
+
+
+# declaration
+class Buffered(pyre.component, family="journal.devices.buffered", implements=Device):
+    """
+    A device that records journal entries in batches, from a background thread
+
+    The entries are rendered by the caller and added to a pile that a writer thread drains, so
+    the cost of recording an entry does not include any system calls, and the writer is woken
+    up only when a batch starts, fills up, or someone is waiting for it. The writer accumulates
+    the text of the entries and writes it to {log} when the batch grows beyond {size} bytes,
+    or when the oldest entry in the batch has been waiting for {interval}. Entries with urgent
+    severities, i.e. errors and firewalls, are written out before {record} returns, along with
+    everything that was recorded before them, and so is everything pending when the process
+    exits.
+
+    The pile holds at most {capacity} entries. If it fills up, the {policy} determines what
+    happens: under {block}, the caller waits until the writer catches up; under {drop}, the
+    entry is discarded, and the writer notes the number of entries lost in the journal. Urgent
+    entries are never dropped; they wait for room regardless of the policy.
+    """
+
+
+    # types
+    from .TextRenderer import TextRenderer
+    from pyre.units.SI import second
+
+
+    # public state
+    log = pyre.properties.ostream()
+    log.doc = "the file in which to save the journal entries"
+
+    renderer = Device.Renderer(default=TextRenderer)
+    renderer.doc = "the formatting strategy for journal entries"
+
+    size = pyre.properties.int(default=64*1024)
+    size.doc = "the number of bytes that trigger a write"
+
+    interval = pyre.properties.dimensional(default=0.2*second)
+    interval.doc = "the longest an entry can wait before it is written"
+
+    capacity = pyre.properties.int(default=1024)
+    capacity.doc = "the largest number of entries waiting to be written"
+
+    policy = pyre.properties.str(default="block")
+    policy.doc = "what to do with new entries when the pile is full: 'block' or 'drop'"
+    policy.validators = pyre.constraints.isMember("block", "drop")
+
+
+    # constants
+    urgent = {"error", "firewall"} # the severities that are written out immediately
+
+
+    # interface
+    @pyre.export
+    def record(self, page, metadata):
+        """
+        Record a journal entry
+        """
+        # get the renderer to produce the text
+        text = "".join(line + "\n" for line in self.renderer.render(page, metadata))
+        # if the entry is urgent
+        if metadata.get("severity") in self.urgent:
+            # hand it to the writer, waiting for room if necessary
+            self.push(text, urgent=True)
+            # and wait until it has been written
+            self.flush()
+            # all done
+            return self
+        # otherwise, just hand it to the writer
+        self.push(text)
+        # all done
+        return self
+
+
+    def flush(self):
+        """
+        Wait until all entries recorded so far have been written
+        """
+        # if there is no writer, there is nothing to flush
+        if self._writer is None: return self
+        # make a marker
+        done = threading.Event()
+        # add it to the pile
+        self._pending.append(done)
+        # let the writer know that someone is waiting
+        self._hurry = True
+        # wake it up
+        self._wake.set()
+        # and wait for it to get to the marker
+        done.wait()
+        # all done
+        return self
+
+
+    # meta-methods
+    def __init__(self, **kwds):
+        # chain up
+        super().__init__(**kwds)
+        # the number of entries dropped because the pile was full
+        self.dropped = 0
+        # the writer synchronization
+        self._wake = threading.Event()
+        self._drained = threading.Event()
+        # the lock that makes sure only one writer gets started
+        self._starting = threading.Lock()
+        # make sure everything gets written out at exit
+        atexit.register(self.flush)
+        # processes that inherit me from their parent must build their own writer
+        reference = weakref.ref(self)
+        os.register_at_fork(after_in_child=lambda: reference() and reference().reset())
+        # all done
+        return
+
+
+    # implementation details
+    def push(self, text, urgent=False):
+        """
+        Add {text} to the pile of pending entries; {urgent} entries wait for room even when the
+        policy is to drop entries
+        """
+        # on first use
+        if self._writer is None:
+            # start the writer, unless another thread beats me to it
+            with self._starting:
+                if self._writer is None: self.start()
+        # get the pile
+        pending = self._pending
+        # while it is full
+        while len(pending) >= self.capacity:
+            # if i'm not allowed to wait for room
+            if self.policy == "drop" and not urgent:
+                # count the loss
+                self.dropped += 1
+                # and bail
+                return
+            # otherwise, ask the writer to make room
+            self._drained.clear()
+            self._hurry = True
+            self._wake.set()
+            # and wait for it, a little bit at a time, in case it finished before i cleared
+            self._drained.wait(timeout=self.interval/self.second)
+        # add the entry to the pile; appending to a deque is safe without a lock
+        pending.append(text)
+        # update the size of the batch; a race here only makes the estimate approximate
+        self._size += len(text)
+        # if this entry starts a new batch, or the batch is big enough, wake up the writer
+        if len(pending) == 1 or self._size >= self.size: self._wake.set()
+        # all done
+        return
+
+
+    def start(self):
+        """
+        Build and start the writer thread
+        """
+        # reset the pile
+        self._pending = collections.deque()
+        self._size = 0
+        self._hurry = False
+        # build the writer
+        self._writer = threading.Thread(target=self.write, name="journal", daemon=True)
+        # and start it
+        self._writer.start()
+        # all done
+        return
+
+
+    def reset(self):
+        """
+        Abandon the writer and the pending entries; threads do not survive a fork
+        """
+        # forget the writer; the pile belongs to the parent
+        self._writer = None
+        # and get fresh synchronization, since the old one may have been held at the fork
+        self._wake = threading.Event()
+        self._drained = threading.Event()
+        self._starting = threading.Lock()
+        # all done
+        return
+
+
+    def write(self):
+        """
+        Drain the pile of pending entries, writing them in batches
+        """
+        # get the pile and the synchronization
+        pending, wake, drained = self._pending, self._wake, self._drained
+        # the number of dropped entries i have reported
+        reported = 0
+        # forever
+        while True:
+            # wait for the first entry of a batch
+            wake.wait()
+            wake.clear()
+            # unless the batch is already big enough, or someone is waiting for it
+            if self._size < self.size and not self._hurry:
+                # give it some time to grow
+                wake.wait(timeout=self.interval/self.second)
+                wake.clear()
+            # the batch is about to be written
+            self._hurry = False
+            self._size = 0
+            # start a batch
+            batch = []
+            # the markers of the clients that are waiting for this batch
+            waiting = []
+            # drain the pile
+            while pending:
+                # get the oldest entry
+                entry = pending.popleft()
+                # if it's a flush request, remember it; otherwise, add it to the batch
+                (waiting if isinstance(entry, threading.Event) else batch).append(entry)
+            # let the clients that are waiting for room know
+            drained.set()
+            # if entries were dropped since the last report
+            dropped = self.dropped
+            if dropped > reported:
+                # make a note
+                batch.append("journal: dropped {} entries\n".format(dropped - reported))
+                # and update the count
+                reported = dropped
+            # if there is something to write
+            if batch:
+                # attempt to
+                try:
+                    # write it
+                    self.log.write("".join(batch))
+                    # and flush
+                    self.log.flush()
+                # if the stream is not usable, e.g. because it was closed during shutdown
+                except (OSError, ValueError):
+                    # there is nobody to complain to, so just count the loss and move on
+                    self.dropped += len(batch)
+                    reported = self.dropped
+            # let the clients know
+            for marker in waiting: marker.set()
+
+
+    # private data
+    _writer = None
+    _pending = ()
+    _size = 0
+    _hurry = False
+
+
+# end of file
@@ -6,9 +6,14 @@
 #
 
 
+# externals
+import sys
+import string
+import warnings
 # packages
 import pyre
-import traceback
+# my parts
+from .Metadata import Metadata
 
 
 # declaration
@@ -21,44 +26,55 @@ class Diagnostic:
     # per-instance public data
     meta = None
     text = None
-    locator = None
 
 
     # interface
-    def line(self, message=''):
+    def line(self, message='', *args, **kwds):
         """
         Add {message} to the diagnostic text
+
+        If there are any {args} or {kwds}, {message} is a template that gets formatted with
+        them; if {message} is callable, it gets invoked with them to produce the text. Either
+        way, the work is done only if i am active
         """
         # check whether i am an active diagnostic
         if self.active:
             # add {message} to my text
-            self.text.append(message)
+            self.text.append(self.expand(message, args, kwds))
         # and return
         return self
 
 
-    def log(self, message=None, stackdepth=0):
+    def log(self, message=None, *args, stackdepth=0, **kwds):
         """
         Add the optional {message} to my text and make a journal entry
+
+        The {message} is expanded using {args} and {kwds} the same way as by {line}. For
+        compatibility with the old signature, {log(message, depth)}, a lone integer that
+        {message} has no placeholder for is taken as the {stackdepth}; this is deprecated
         """
+        # if this looks like a call with the old signature
+        if len(args) == 1 and not kwds and type(args[0]) is int and self.literal(message):
+            # complain
+            warnings.warn(
+                "passing the stack depth to 'log' positionally is deprecated; "
+                "use 'stackdepth={}'".format(args[0]), DeprecationWarning, stacklevel=2)
+            # and convert
+            stackdepth, args = args[0], ()
         # bail if I am not active
         if not self.active: return self
         # if {message} is non-empty, add it to the pile
-        if message is not None: self.text.append(message)
+        if message is not None: self.text.append(self.expand(message, args, kwds))
 
-        # use the stack
-        trace = traceback.extract_stack(limit=self.stackdepth+stackdepth)
+        # find the frame of my client
+        frame = self.frame(depth=self.stackdepth+stackdepth-1)
         # to infer some more meta data
-        filename, line, function, source = trace[0]
-        # decorate
+        code = frame.f_code
+        # decorate; the source text is looked up only if someone asks for it
         meta = self.meta
-        meta["filename"] = filename
-        meta["line"] = line
-        meta["function"] = function
-        meta["source"] = source
-
-        # build my locator
-        self.locator = pyre.tracking.script(source=filename, line=line, function=function)
+        meta["filename"] = code.co_filename
+        meta["line"] = frame.f_lineno
+        meta["function"] = code.co_name
 
         # record
         self.device.record(page=self.text, metadata=meta)
@@ -77,19 +93,79 @@ class Diagnostic:
 
         # initialize the list of message lines
         self.text = []
-        # my locator
-        self.locator = None
         # prime the meta data
-        self.meta = {
-            "channel": name,
-            "severity": self.severity
-            }
+        self.meta = Metadata(channel=name, severity=self.severity)
 
         # all done
         return
 
 
     # implementation details
+    @staticmethod
+    def literal(message):
+        """
+        Check whether {message} is used as is, i.e. it is missing or it has no placeholders
+        """
+        # missing messages have nothing to format
+        if message is None: return True
+        # neither do strings without replacement fields
+        if isinstance(message, str):
+            return all(field is None for _, field, _, _ in string.Formatter().parse(message))
+        # everything else, e.g. functions, might have a use for the arguments
+        return False
+
+
+    @staticmethod
+    def expand(message, args, kwds):
+        """
+        Build the text of {message} using {args} and {kwds}
+        """
+        # if {message} is a template
+        if isinstance(message, str):
+            # format it, if there is anything to format it with
+            return message.format(*args, **kwds) if args or kwds else message
+        # if it is a function
+        if callable(message):
+            # invoke it
+            return message(*args, **kwds)
+        # otherwise, leave it alone
+        return message
+
+
+    @property
+    def locator(self):
+        """
+        The location of my most recent entry
+        """
+        # get my meta data
+        meta = self.meta
+        # if i haven't recorded anything yet, i don't have a location
+        if "filename" not in meta: return None
+        # otherwise, build a locator
+        return pyre.tracking.script(
+            source=meta["filename"], line=meta["line"], function=meta["function"])
+
+
+    @staticmethod
+    def frame(depth):
+        """
+        Get the frame {depth} levels above my caller, or the outermost one if the stack is not
+        that deep
+        """
+        # attempt to
+        try:
+            # get the frame directly; this skips the frame of this function
+            return sys._getframe(depth+1)
+        # if the stack is not deep enough
+        except ValueError:
+            # start at my caller
+            frame = sys._getframe(1)
+        # and climb as far as possible
+        while frame.f_back is not None: frame = frame.f_back
+        # all done
+        return frame
+
+
     # the stack depth of my clients
     stackdepth = pyre.computeCallerStackDepth()
 
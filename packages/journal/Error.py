@@ -32,12 +32,12 @@ class Error(Diagnostic, Channel):
 
 
     # interface
-    def log(self, message=None, stackdepth=0):
+    def log(self, message=None, *args, stackdepth=0, **kwds):
         """
         Make a journal entry and build an exception ready to be raised by the caller
         """
         # first, record the entry
-        super().log(message, stackdepth)
+        super().log(message, *args, stackdepth=stackdepth, **kwds)
         # build an instance of the error exception
         error = self.ApplicationError(error=self)
         # don't raise it; let the caller decide what to do with it
@@ -32,12 +32,12 @@ class Firewall(Diagnostic, Channel):
 
 
     # interface
-    def log(self, message=None, stackdepth=0):
+    def log(self, message=None, *args, stackdepth=0, **kwds):
         """
         Record my message to my device
         """
         # first, record the entry
-        super().log(message, stackdepth)
+        super().log(message, *args, stackdepth=stackdepth, **kwds)
         # build an instance of the firewall exception
         error = self.FirewallError(firewall=self)
         # if firewalls are not fatal, return the exception instance
@@ -12,6 +12,8 @@ PACKAGE = journal
 # the python modules
 EXPORT_PYTHON_MODULES = \
     ANSIRenderer.py \
+    Binary.py \
+    Buffered.py \
     Channel.py \
     Console.py \
     Debug.py \
@@ -22,6 +24,8 @@ EXPORT_PYTHON_MODULES = \
     Firewall.py \
     Info.py \
     Journal.py \
+    Metadata.py \
+    Reader.py \
     Renderer.py \
     TextRenderer.py \
     Warning.py \
@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+#
+# michael a.g. aïvázis
+# orthologue
+# (c) 1998-2018 all rights reserved
+#
+
+
+# externals
+import linecache
+
+
+# declaration
+class Metadata(dict):
+    """
+    The meta data of a journal entry
+
+    Diagnostics record the filename, line number and function of their call site with every
+    entry, but not the source text at that location: looking it up involves reading the file,
+    and most renderers never show it. Instead, the source text is retrieved from {linecache}
+    when it is asked for
+    """
+
+
+    # interface
+    def get(self, key, default=None):
+        """
+        Retrieve the value of {key}, or {default} if it is not present
+        """
+        # attempt to
+        try:
+            # look it up
+            return self[key]
+        # if it's not there
+        except KeyError:
+            # use the default
+            return default
+
+
+    # meta methods
+    def __missing__(self, key):
+        # if the source text is being requested
+        if key == "source" and "filename" in self and "line" in self:
+            # look it up; do not cache it, since the call site changes with every entry
+            return linecache.getline(self["filename"], self["line"]).strip() or None
+        # otherwise, it's just not there
+        raise KeyError(key)
+
+
+# end of file
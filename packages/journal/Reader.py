@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+#
+# michael a.g. aïvázis
+# orthologue
+# (c) 1998-2018 all rights reserved
+#
+
+
+# externals
+import heapq
+# my parts
+from .Binary import Binary
+from .Metadata import Metadata
+
+
+# declaration
+class Reader:
+    """
+    Iterate over the journal entries in a log file written by the {binary} device
+
+    Iteration produces pairs of pages and meta data, in the form that devices expect, so the
+    entries can be handed to any renderer. Besides the usual fields, the meta data include the
+    {host} and {pid} of the process that made the entry, and its {timestamp} in nanoseconds
+    since the epoch
+    """
+
+
+    # types
+    layout = Binary
+
+
+    # interface
+    @classmethod
+    def merge(cls, uris):
+        """
+        Iterate over the entries in all the log files in {uris}, in the order in which they
+        were made
+        """
+        # each log is already sorted, so merge them
+        return heapq.merge(*map(cls, uris), key=lambda entry: entry[1]["timestamp"])
+
+
+    # meta-methods
+    def __init__(self, uri, **kwds):
+        # chain up
+        super().__init__(**kwds)
+        # save the name of the log file
+        self.uri = uri
+        # all done
+        return
+
+
+    def __iter__(self):
+        # get the layout
+        layout = self.layout
+        prefix = layout.prefix
+        # read the log
+        with open(self.uri, "rb") as stream: data = memoryview(stream.read())
+        # check the header
+        if bytes(data[:len(layout.magic)]) != layout.magic:
+            # complain
+            raise ValueError("{!r}: not a binary journal log".format(self.uri))
+
+        # the process info
+        host, pid = None, None
+        # the channel names and call sites, by id
+        channels, locators = {}, {}
+        # start after the header
+        position = len(layout.magic)
+        # as long as there is room for another record
+        while position + prefix.size <= len(data):
+            # get its length and kind
+            length, kind = prefix.unpack_from(data, position)
+            # if it's the end of the log, or a record that was cut off
+            if length < prefix.size or position + length > len(data): break
+            # get the payload
+            payload = data[position+prefix.size:position+length]
+            # move on
+            position += length
+
+            # if it's an entry
+            if kind == layout.ENTRY:
+                # unpack it
+                timestamp, severity, channel, locator = layout.entry.unpack_from(payload)
+                # get the text
+                text = bytes(payload[layout.entry.size:]).decode()
+                # decode the severity
+                severities = layout.severities
+                severity = severities[severity] if severity < len(severities) else "unknown"
+                # build the meta data
+                meta = Metadata(
+                    channel=channels.get(channel), severity=severity,
+                    timestamp=timestamp, host=host, pid=pid)
+                # decorate with the call site, if known
+                filename, line, function = locators.get(locator, ("", 0, ""))
+                if filename: meta["filename"] = filename
+                if line: meta["line"] = line
+                if function: meta["function"] = function
+                # hand it to the caller
+                yield text.split("\n"), meta
+            # if it describes a call site
+            elif kind == layout.LOCATOR:
+                # unpack it
+                locator, line = layout.locator.unpack_from(payload)
+                filename, function = bytes(payload[layout.locator.size:]).decode().split("\0")
+                # and remember it
+                locators[locator] = (filename, line, function)
+            # if it describes a channel
+            elif kind == layout.CHANNEL:
+                # unpack it
+                channel, = layout.channel.unpack_from(payload)
+                # and remember it
+                channels[channel] = bytes(payload[layout.channel.size:]).decode()
+            # if it describes the process
+            elif kind == layout.PROCESS:
+                # unpack it
+                pid, = layout.process.unpack_from(payload)
+                host = bytes(payload[layout.process.size:]).decode()
+            # anything else is from a newer version of the format; skip it
+
+        # all done
+        return
+
+
+# end of file
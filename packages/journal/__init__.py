@@ -134,8 +134,12 @@ from .Warning import Warning as warning
 from .Error import Error as error
 
 # devices
+from .Binary import Binary as binary
+from .Buffered import Buffered as buffered
 from .Console import Console as console
 from .File import File as file
+# offline access to the logs of the binary device
+from .Reader import Reader as reader
 
 # the package exception
 from .exceptions import FirewallError
@@ -0,0 +1,198 @@
+# -*- coding: utf-8 -*-
+#
+# michael a.g. aïvázis
+# orthologue
+# (c) 1998-2018 all rights reserved
+#
+
+
+# declaration
+class Compiler:
+    """
+    A strategy for flattening the evaluation graph rooted at a node into a sequence of steps
+    that compute the values of the nodes in its span with their operands already bound
+
+    Each step is a tuple ({node}, {compute}, {operands}, {memo}): {compute} is a callable that
+    builds the value of {node} when invoked with the values of the steps whose positions are
+    listed in {operands}, and {memo} indicates whether {node} caches its value. The steps are
+    in dependency order, so the value of the root is computed by the last one.
+
+    Nodes of kinds the compiler does not know how to take apart are left opaque: their value
+    is computed by asking them for it, which lets them evaluate their own span.
+    """
+
+
+    # exceptions
+    from .exceptions import CircularReferenceError, EvaluationError, UnresolvedNodeError
+
+
+    # interface
+    def compile(self, root):
+        """
+        Build the sequence of steps that computes the value of {root}
+        """
+        # the steps
+        steps = []
+        # and the position of each node among them
+        positions = {}
+        # the nodes whose operands are being explored
+        active = set()
+        # use an explicit stack so that deep graphs don't exhaust the interpreter stack
+        stack = [(root, iter(self.operands(root)))]
+        # mark the root
+        active.add(root)
+        # as long as there are nodes whose operands have not been explored
+        while stack:
+            # get the node on the top of the stack and the iterator over its operands
+            node, operands = stack[-1]
+            # look for an operand without a step
+            for operand in operands:
+                # if it already has one, move on
+                if operand in positions: continue
+                # if we are in the process of building one, there is a cycle
+                if operand in active: raise self.CircularReferenceError(node=operand)
+                # otherwise, mark it
+                active.add(operand)
+                # explore it next
+                stack.append((operand, iter(self.operands(operand))))
+                # and get out of here
+                break
+            # if all its operands have steps
+            else:
+                # the node is done
+                stack.pop()
+                active.remove(node)
+                # ask it to identify itself so we can build its step
+                compute, memo = self.step(node)
+                # look up the positions of its operands
+                operands = tuple(positions[operand] for operand in self.operands(node))
+                # record the position of its step
+                positions[node] = len(steps)
+                # and add the step to the pile
+                steps.append((node, compute, operands, memo))
+        # all done
+        return steps
+
+
+    # implementation details
+    def operands(self, node):
+        """
+        Return the operands of {node} that must be computed before its step
+        """
+        # only nodes that identify themselves can be taken apart
+        if not hasattr(node, 'identify'): return ()
+        # the ones that can, have the usual operands
+        return node.operands
+
+
+    def step(self, node):
+        """
+        Build the computation of {node} and decide whether it caches its value
+        """
+        # nodes that don't identify themselves are opaque
+        if not hasattr(node, 'identify'): return node.getValue, hasattr(node, 'dirty')
+        # everybody else gets dispatched
+        return node.identify(authority=self)
+
+
+    # handlers
+    def onVariable(self, variable):
+        """
+        Handler for variables
+        """
+        # variables know how to compute their values
+        return variable.getValue, hasattr(variable, 'dirty')
+
+
+    def onLiteral(self, literal):
+        """
+        Handler for literals
+        """
+        # literal values don't change
+        value = literal.getValue()
+        # so bind it
+        return (lambda: value), False
+
+
+    def onUnresolved(self, unresolved):
+        """
+        Handler for unresolved nodes
+        """
+        # asking them for their value raises the correct exception
+        return unresolved.getValue, False
+
+
+    def onOperator(self, operator):
+        """
+        Handler for operators
+        """
+        # apply the operator to the values of the operands
+        return self.postprocess(node=operator, function=operator.evaluator), True
+
+
+    def onReference(self, reference):
+        """
+        Handler for references
+        """
+        # the value of a reference is the value of its referent
+        return self.postprocess(node=reference, function=lambda value: value), True
+
+
+    def onInterpolation(self, interpolation):
+        """
+        Handler for interpolations
+        """
+        # splice together the string representations of the values of the operands
+        function = lambda *values: ''.join(map(str, values))
+        # and post process the result
+        return self.postprocess(node=interpolation, function=function), True
+
+
+    def onExpression(self, expression):
+        """
+        Handler for expressions
+        """
+        # get the errors that pass through
+        unresolved = self.UnresolvedNodeError
+        # and the one that wraps the rest
+        evaluationError = self.EvaluationError
+        # build a function that evaluates the expression formula
+        functor = expression.functor()
+        # wrap it
+        def function(*values):
+            """
+            Evaluate the expression, translating errors the same way {getValue} does
+            """
+            # attempt to
+            try:
+                # evaluate the formula
+                return functor(*values)
+            # if i run into unresolved nodes
+            except unresolved:
+                # report it
+                raise
+            # other errors
+            except Exception as error:
+                # are reported as evaluation errors
+                raise evaluationError(node=expression, error=error) from None
+        # post process the result
+        return self.postprocess(node=expression, function=function), True
+
+
+    def postprocess(self, node, function):
+        """
+        Build a computation that walks the result of {function} through the postprocessor of
+        {node}
+        """
+        # build the computation
+        def compute(*values):
+            """
+            Compute the value of {node} given the values of its operands
+            """
+            # apply {function}; look up the postprocessor every time, since it may be replaced
+            return node.postprocessor(value=function(*values), node=node)
+        # and return it
+        return compute
+
+
+# end of file
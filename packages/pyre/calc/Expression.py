@@ -90,6 +90,35 @@ class Expression:
         return authority.onExpression(expression=self, **kwds)
 
 
+    def functor(self):
+        """
+        Build a function that evaluates my formula given the values of my operands, so that
+        clients can compute my value without resolving the node references through my model
+        """
+        # the names of the arguments of the function, one per operand
+        arguments = []
+        # define the {re.sub} callback as a local function so it has access to the arguments
+        def handler(match):
+            """
+            Callback for {re.sub} that converts node references into function arguments
+            """
+            # escaped braces are literals
+            if match.group("esc_open"): return "{"
+            if match.group("esc_close"): return "}"
+            # my formula compiled successfully, so all that's left are valid node references;
+            # they show up in the same order as my operands, so make up a name for this one
+            argument = "_pyre_{}".format(len(arguments))
+            # add it to the pile
+            arguments.append(argument)
+            # and use it in place of the node reference
+            return "({})".format(argument)
+
+        # convert node references into argument names
+        normalized = self._scanner.sub(handler, self.expression)
+        # build the function and return it
+        return eval("lambda {}: ({}\n)".format(", ".join(arguments), normalized), {})
+
+
     # meta-methods
     def __init__(self, model, expression, program, **kwds):
         # chain up
@@ -9,7 +9,7 @@
 # externals
 import re
 import operator
-import collections
+import collections.abc
 from .. import patterns
 # my base class
 from .SymbolTable import SymbolTable
@@ -117,6 +117,8 @@ class Hierarchical(SymbolTable):
         # ask the base to alias the two names and return the key under which the alias might
         # have been registered originally
         aliasKey = baseKey.alias(target=targetKey, alias=alias)
+        # names that used to hash through {aliasKey} don't any more
+        self.purgeKeys()
 
         # now that the two names are aliases of each other, we must resolve the potential node
         # conflict: only one of these is accessible by name any more
@@ -127,7 +129,22 @@ class Hierarchical(SymbolTable):
         """
         Split a multilevel {name} into its parts and return its hash
         """
-        # if we were not given a hashin context, use my root
+        # if we were not given a hashing context and {name} is a string
+        if context is None and isinstance(name, str):
+            # attempt to
+            try:
+                # look up its key in my cache
+                return self._keys[name]
+            # if it's not there
+            except KeyError:
+                # hash it
+                key = self._hash.hash(items=self.split(name=name))
+                # and remember it
+                self._keys[name] = key
+            # all done
+            return key
+
+        # if we were not given a hashing context, use my root
         context = self._hash if context is None else context
         # if {name} is already a hash key
         if isinstance(name, type(context)):
@@ -138,7 +155,7 @@ class Hierarchical(SymbolTable):
             # hash it
             return context.hash(items=self.split(name=name))
         # if it is an iterable
-        if isinstance(name, collections.Iterable):
+        if isinstance(name, collections.abc.Iterable):
             # skip the split, just hash
             return context.hash(items=name)
         # otherwise
@@ -253,6 +270,8 @@ class Hierarchical(SymbolTable):
         self.separator = separator
         # initialize my name hash
         self._hash = patterns.newPathHash()
+        # and the cache of the keys of the names hashed in global scope
+        self._keys = {}
         # and the node metadata
         self._metadata = {}
         # all done
@@ -281,6 +300,22 @@ class Hierarchical(SymbolTable):
     # private data
     _hash = None
     _info = None
+    _keys = None
+
+
+    # hashing
+    def purgeKeys(self):
+        """
+        Discard the cache of name keys
+
+        Aliases replace entries deep inside the name hash, which changes the keys of all names
+        that go through them, including names that go through other aliases of their ancestors;
+        it is much simpler to start over than to figure out which of the cached keys are stale
+        """
+        # easy enough
+        self._keys.clear()
+        # all done
+        return self
 
 
     # aliasing
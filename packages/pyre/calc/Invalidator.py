@@ -0,0 +1,211 @@
+# -*- coding: utf-8 -*-
+#
+# michael a.g. aïvázis
+# orthologue
+# (c) 1998-2018 all rights reserved
+#
+
+
+# class declaration
+class Invalidator:
+    """
+    The engine that propagates change notifications through evaluation graphs
+
+    When the value of an observable changes, its observers must be told so they can invalidate
+    their caches and pass the news along to their own observers. Doing this by having each
+    node invoke {flush} on its observers is simple, but it recurses as deep as the graph is
+    tall, and it visits nodes that are reachable through more than one path once for each path.
+
+    Instead, {Invalidator} collects the set of nodes downstream from the ones that changed in a
+    single traversal, sorts them topologically, and then visits them in order, invoking their
+    {flush} at most once per pass. Nodes are free to override {flush} as before; the ones that
+    chain up to {Observable.flush} are the ones whose observers get notified.
+
+    Clients that are about to make many changes to a graph can coalesce the notifications
+    into a single pass by making the changes within a {batch}. Note that nodes downstream from
+    the modified ones are not invalidated until the batch is over, so they should not be read
+    before then.
+
+    {Invalidator} also keeps track of the structural revisions of the graphs, so that clients
+    that cache information about their shape, such as evaluation plans, can tell when it has
+    become stale.
+    """
+
+
+    # public data
+    epoch = 0 # incremented every time an observer is added or removed
+
+
+    # interface
+    def notify(self, observable, observers):
+        """
+        Record that the value of {observable} has changed and its {observers} must be notified
+        """
+        # get the schedule of the current pass and my position in it
+        schedule = self._schedule
+        position = self._position
+        # go through the observers
+        for observer in observers:
+            # if {observer} is scheduled for a visit later in the current pass
+            if schedule.get(observer, -1) > position:
+                # record the notification there, unless someone else beat us to it
+                self._notified.setdefault(observer, observable)
+            # otherwise
+            else:
+                # it has to wait for the next pass
+                self._pending.setdefault(observer, observable)
+
+        # if there is a pass or a batch in progress, it will get to these eventually
+        if self._active or self._depth: return self
+        # otherwise, propagate
+        return self.propagate()
+
+
+    def propagate(self):
+        """
+        Deliver all pending notifications
+        """
+        # mark me as busy so that {notify} doesn't start another pass
+        self._active = True
+        # carefully
+        try:
+            # as long as there are notifications left undelivered
+            while self._pending:
+                # grab them; anything that shows up while we are working goes in a fresh pile
+                notified, self._pending = self._pending, {}
+                # sort the nodes that may be affected
+                order = self.sort(roots=notified)
+                # make them available to {notify}
+                self._notified = notified
+                self._schedule = { node: index for index, node in enumerate(order) }
+                # go through the affected nodes in order
+                for self._position, node in enumerate(order):
+                    # find out who told this node that things have changed
+                    observable = notified.pop(node, None)
+                    # if no one did, there is nothing to do
+                    if observable is None: continue
+                    # otherwise, pass the news along
+                    node.flush(observable=observable)
+        # if anything goes wrong
+        except:
+            # the remaining notifications are stale
+            self._pending = {}
+            # let the caller know
+            raise
+        # no matter what
+        finally:
+            # reset my state; make sure we hold no references to nodes
+            self._notified = {}
+            self._schedule = {}
+            self._position = -1
+            self._active = False
+        # all done
+        return self
+
+
+    def batch(self):
+        """
+        Build a context that coalesces the notifications of its body into a single pass
+        """
+        # i am my own context manager
+        return self
+
+
+    def sort(self, roots):
+        """
+        Build a topologically ordered list of the nodes reachable from {roots}
+        """
+        # the list of nodes in reverse topological order
+        order = []
+        # the nodes we have already seen
+        visited = set()
+        # go through the roots
+        for root in roots:
+            # skip the ones we have seen already
+            if root in visited: continue
+            # mark this one
+            visited.add(root)
+            # use an explicit stack so that deep graphs don't exhaust the interpreter stack
+            stack = [(root, self.downstream(root))]
+            # as long as there are nodes whose observers have not been explored
+            while stack:
+                # get the node on the top of the stack and the iterator over its observers
+                node, observers = stack[-1]
+                # look for an observer we haven't seen
+                for observer in observers:
+                    # if this is one
+                    if observer not in visited:
+                        # mark it
+                        visited.add(observer)
+                        # explore it next
+                        stack.append((observer, self.downstream(observer)))
+                        # and get out of here
+                        break
+                # if all its observers have been explored
+                else:
+                    # the node is done
+                    stack.pop()
+                    # and can be added to the pile
+                    order.append(node)
+        # flip the order so that every node shows up before its observers
+        order.reverse()
+        # and return it
+        return order
+
+
+    def downstream(self, node):
+        """
+        Build an iterator over the observers of {node} that might be affected by changes to it
+        """
+        # nodes whose cache is already invalid don't notify their observers; nodes that are not
+        # observable don't have any
+        if getattr(node, 'dirty', False) or not hasattr(node, 'observers'): return iter(())
+        # everybody else
+        return iter(node.observers)
+
+
+    # meta-methods
+    def __init__(self, **kwds):
+        # chain up
+        super().__init__(**kwds)
+        # the notifications that will be delivered by the next pass
+        self._pending = {}
+        # the notifications for the pass in progress
+        self._notified = {}
+        # the position of each node in the pass in progress
+        self._schedule = {}
+        # the position of the node being visited
+        self._position = -1
+        # indicator of whether a pass is in progress
+        self._active = False
+        # the number of open batches
+        self._depth = 0
+        # all done
+        return
+
+
+    def __enter__(self):
+        """
+        Open a batch
+        """
+        # increase the nesting level
+        self._depth += 1
+        # all done
+        return self
+
+
+    def __exit__(self, exc_type, exc_instance, exc_traceback):
+        """
+        Close a batch and deliver its notifications
+        """
+        # decrease the nesting level
+        self._depth -= 1
+        # if this was the outermost batch and there is no pass in progress
+        if not self._depth and not self._active:
+            # deliver the notifications; the values have changed even if the body raised
+            self.propagate()
+        # re-raise any exception that occurred while executing the body of the with statement
+        return False
+
+
+# end of file
@@ -13,6 +13,7 @@ PACKAGE = calc
 EXPORT_PYTHON_MODULES = \
     Average.py \
     Calculator.py \
+    Compiler.py \
     Composite.py \
     Const.py \
     Count.py \
@@ -24,6 +25,7 @@ EXPORT_PYTHON_MODULES = \
     Filter.py \
     Hierarchical.py \
     Interpolation.py \
+    Invalidator.py \
     Mapping.py \
     Maximum.py \
     Memo.py \
@@ -32,6 +34,7 @@ EXPORT_PYTHON_MODULES = \
     NodeInfo.py \
     Observable.py \
     Observer.py \
+    Plan.py \
     Preprocessor.py \
     Postprocessor.py \
     Probe.py \
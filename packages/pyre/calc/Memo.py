@@ -38,10 +38,9 @@ class Memo:
         """
         Override the value setter to refresh my cache and notify my observers
         """
-        # update the value
+        # update the value; this flushes my cache and notifies my observers, some of which may
+        # have already asked for my new value, so leave my cache alone
         super().setValue(value=value, **kwds)
-        # mark me as dirty
-        self.dirty = True
         # all done
         return self
 
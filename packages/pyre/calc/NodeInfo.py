@@ -20,8 +20,8 @@ class NodeInfo:
 
 
     # interface
-    @staticmethod
-    def fillNodeId(model, key=None, name=None, split=None):
+    @classmethod
+    def fillNodeId(cls, model, key=None, name=None, split=None):
         """
         Given one of the three representations of the key of a node in {model}, reconstruct all of
         them so clients can choose whichever representation fits their needs
@@ -29,16 +29,16 @@ class NodeInfo:
         # if I know the name but not the split version
         if name and not split:
             # set the split
-            split = tuple(model.split(name))
+            split = cls.splitName(model=model, name=name)
         # otherwise, if I know the split but not the name
         elif split and not name:
             # get the name
             name = model.join(*split)
 
-        # if I don't know the key but I know the split
-        if split and not key:
+        # if I don't know the key but I know the name
+        if name and not key:
             # look up the key
-            key = model._hash.hash(items=split)
+            key = model.hash(name)
 
         # done my best: if i know the key
         if key:
@@ -51,6 +51,15 @@ class NodeInfo:
         raise journal.firewall('pyre.calc').log('insufficient nodal metadata')
 
 
+    @staticmethod
+    def splitName(model, name):
+        """
+        Split {name} into its levels using the separator of {model}
+        """
+        # easy enough
+        return tuple(model.split(name))
+
+
     # meta-methods
     def __init__(self, key=None, name=None, split=None, **kwds):
         # chain up
@@ -10,6 +10,8 @@
 import weakref
 # the superclas
 from .Reactor import  Reactor
+# the change propagation engine
+from .Invalidator import Invalidator
 
 
 # class declaration
@@ -18,23 +20,35 @@ class Observable(Reactor):
     Mix-in class that notifies its clients when the value of a node changes
     """
 
+
+    # the engine that delivers change notifications; shared by all observables
+    invalidator = Invalidator()
+
     # public data
     @property
     def observers(self):
         """
         Return an iterable over my live observers
         """
+        # make a pile for the references to dead observers
+        dead = []
         # go through the references to my observers
         for ref in self._observers:
             # unwrap it
             observer = ref()
             # if it is dead
             if observer is None:
-                # skip it
+                # remember it
+                dead.append(ref)
+                # and skip it
                 continue
             # otherwise, send it along
             yield observer
-
+        # if there were any dead references
+        if dead:
+            # prune them; this is safe since dead references compare by identity and their
+            # hash was computed when they were added to the pile
+            self._observers.difference_update(dead)
         # all done
         return
 
@@ -46,6 +60,8 @@ class Observable(Reactor):
         """
         # build a weak reference to {observer} and add it to the pile
         self._observers.add(weakref.ref(observer))
+        # the structure of the graph has changed
+        self.invalidator.epoch += 1
         # all done
         return self
 
@@ -56,6 +72,8 @@ class Observable(Reactor):
         """
         # build a weak reference to {observer} and remove it from the pile
         self._observers.remove(weakref.ref(observer))
+        # the structure of the graph has changed
+        self.invalidator.epoch += 1
         # all done
         return self
 
@@ -87,14 +105,10 @@ class Observable(Reactor):
         """
         Handler of the notification event from one of my observables
        """
-        # take this opportunity to clean up my observers
-        observers = set(self.observers)
-        # go through the pile
-        for observer in observers:
-            # notify each one
-            observer.flush(observable=self)
-        # rebuild the set of references
-        self._observers = set(map(weakref.ref, observers))
+        # get my live observers; this also prunes the dead ones in place
+        observers = tuple(self.observers)
+        # ask the engine to notify them
+        self.invalidator.notify(observable=self, observers=observers)
         # chain up
         return super().flush(**kwds)
 
@@ -104,7 +118,10 @@ class Observable(Reactor):
         # chain up
         super().__init__(**kwds)
         # initialize the set of my observers
-        self._observers = set() # should have been a weak set, but I can do better...
+        # a {WeakSet} won't do: the references it builds carry a callback, so they are not
+        # shared, and comparing two of them invokes the {__eq__} of the nodes; plain
+        # references are canonical, and the dead ones get pruned whenever i'm traversed
+        self._observers = set()
         # all done
         return
 
@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+#
+# michael a.g. aïvázis
+# orthologue
+# (c) 1998-2018 all rights reserved
+#
+
+
+# my parts
+from .Compiler import Compiler
+from .Observable import Observable
+
+
+# declaration
+class Plan:
+    """
+    A straight-line evaluation plan for the graph rooted at a node
+
+    Asking a node for its value walks its span through the cooperative {getValue} methods of
+    its mix-ins, and expressions resolve their named references through their model every
+    time they are evaluated. A {Plan} does this work once: it flattens the span of its {root}
+    into a sequence of steps in dependency order, with the operands of each step bound to the
+    steps that compute them. Evaluating the plan visits each node once, reuses the values of
+    nodes whose caches are valid, and refreshes the caches of the ones it recomputes, so plans
+    and the nodes themselves can be used interchangeably.
+
+    The steps are rebuilt automatically the first time the plan is evaluated after a change to
+    the structure of any evaluation graph.
+    """
+
+
+    # types
+    compiler = Compiler
+
+
+    # public data
+    @property
+    def value(self):
+        """
+        Compute and return the value of my root
+        """
+        # easy enough
+        return self.getValue()
+
+
+    # interface
+    def getValue(self):
+        """
+        Compute and return the value of my root
+        """
+        # get my root
+        root = self.root
+        # if it caches its value and the cache is valid
+        if not getattr(root, 'dirty', True):
+            # there is nothing to compute
+            return root._value
+        # if the structure of the graph has changed since my steps were built
+        if self._epoch != Observable.invalidator.epoch:
+            # rebuild them
+            self.compile()
+
+        # make room for the values
+        values = [None] * len(self._steps)
+        # go through my steps
+        for index, (node, compute, operands, memo) in enumerate(self._steps):
+            # if the node caches its value and the cache is valid
+            if memo and not node.dirty:
+                # use it
+                value = node._value
+            # otherwise
+            else:
+                # compute the value
+                value = compute(*[values[operand] for operand in operands])
+                # if the node caches its value
+                if memo:
+                    # update the cache
+                    node._value = value
+                    node.dirty = False
+            # save the value
+            values[index] = value
+
+        # the last step is my root
+        return value
+
+
+    def compile(self):
+        """
+        Flatten the span of my root into a sequence of steps
+        """
+        # record the structural revision of the graph
+        self._epoch = Observable.invalidator.epoch
+        # build my steps
+        self._steps = self.compiler().compile(root=self.root)
+        # all done
+        return self
+
+
+    # meta-methods
+    def __init__(self, root, **kwds):
+        # chain up
+        super().__init__(**kwds)
+        # save my root
+        self.root = root
+        # my steps are built on first use
+        self._steps = ()
+        self._epoch = None
+        # all done
+        return
+
+
+# end of file
@@ -153,6 +153,29 @@ def sum(*operands):
     return Node.sum(operands=list(operands))
 
 
+# change propagation
+def batch():
+    """
+    Build a context manager that coalesces the change notifications generated by the
+    modifications of node values in its body into a single propagation pass
+    """
+    # access the observable mix-in
+    from .Observable import Observable
+    # and ask its change propagation engine for a batch
+    return Observable.invalidator.batch()
+
+
+# evaluation
+def plan(node):
+    """
+    Build a straight-line evaluation plan for the graph rooted at {node}
+    """
+    # access the constructor
+    from .Plan import Plan
+    # build the plan and return it
+    return Plan(root=node)
+
+
 def debug():
     """
     Support for debugging the calc package
@@ -29,11 +29,13 @@ class Protocol(Configurable, metaclass=Role, internal=True):
     from .Actor import Actor as actor
     from .Foundry import Foundry as foundry
     from .Component import Component as component
+    from ..filesystem.Folder import Folder as pyre_folder
 
 
     # framework data
     pyre_key = None
     pyre_isProtocol = True
+    pyre_shelfIndex = {} # the shelves in the folders derivable from the family of each protocol
 
 
     # override this in your protocols to provide the default implementation
@@ -225,10 +227,35 @@ class Protocol(Configurable, metaclass=Role, internal=True):
         """
         Retrieve all implementers that live in files and folders derivable from my family name
         """
+        # go through the relevant shelves
+        for shelf in cls.pyre_loadableShelves():
+            # and yield their contents
+            yield from cls.pyre_implementers(uri=shelf)
+        # all done
+        return
+
+
+    @classmethod
+    def pyre_loadableShelves(cls):
+        """
+        Build a list of the uris of the shelves in files and folders derivable from my family
+        name
+        """
+        # get the current structural revision of the virtual filesystem
+        revision = cls.pyre_folder.revision
+        # look for the outcome of an earlier walk
+        known = cls.pyre_shelfIndex.get(cls)
+        # if there is one and nothing has changed since
+        if known is not None and known[0] == revision:
+            # reuse it
+            return known[1]
+
+        # otherwise, make a pile
+        shelves = []
         # get my family fragments
         fragments = cls.pyre_familyFragments()
         # if i don't have a public name, there is nothing to do
-        if not fragments: return
+        if not fragments: return shelves
         # get the file server
         vfs = cls.pyre_fileserver
         # construct the base uri
@@ -258,9 +285,7 @@ class Protocol(Configurable, metaclass=Role, internal=True):
                     # otherwise
                     else:
                         # treat it as a shelf; assemble its address
-                        shelf = 'vfs:{}'.format(name)
-                        # and get its contents
-                        yield from cls.pyre_implementers(uri=shelf)
+                        shelves.append('vfs:{}'.format(name))
 
         # the last thing to try is a shelf named after my family
         uri = uri.withSuffix(suffix='.py')
@@ -274,11 +299,13 @@ class Protocol(Configurable, metaclass=Role, internal=True):
             pass
         # otherwise
         else:
-            # yield its contents
-            yield from cls.pyre_implementers(uri='vfs:'+str(uri))
+            # add it to the pile
+            shelves.append('vfs:'+str(uri))
 
+        # remember the outcome, along with the revision of the filesystem it depends on
+        cls.pyre_shelfIndex[cls] = (revision, shelves)
         # all done
-        return
+        return shelves
 
 
     @classmethod
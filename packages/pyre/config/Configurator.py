@@ -59,8 +59,13 @@ class Configurator:
             # and get out of here
             return errors
 
-        # convert the input source into a stream of events
-        events = reader.decode(uri, source, locator)
+        # get the store of boot time work
+        cache = self.executive.cache if self.executive is not None else None
+        # convert the input source into a stream of events; if there is a cache, let it check
+        # whether it has seen this source before
+        events = (
+            reader.decode(uri, source, locator) if cache is None else
+            cache.decode(codec=reader, uri=uri, source=source, locator=locator))
         # process it
         errors.extend(self.processEvents(events=events, priority=priority))
         # and return the errors
@@ -38,6 +38,8 @@ class Loader:
 
         # access the linker
         linker = executive.linker
+        # and the store of boot time work, if caching is on
+        cache = executive.cache
         # print(" -- priming the search for shelves")
         # use {protocol} to build a sequence of candidate locations
         candidates = cls.locateShelves(executive=executive, protocol=protocol,
@@ -48,6 +50,8 @@ class Loader:
         for candidate in candidates:
             # show me
             # print(" -- trying shelf={.uri!r}".format(candidate))
+            # count it
+            linker.probes += 1
             # does this uri correspond to a known shelf
             try:
                 # if yes, grab it
@@ -56,6 +60,11 @@ class Loader:
                 # print("    shelf {!r} previously loaded".format(candidate.uri))
             # otherwise
             except KeyError:
+                # find the folders that determine whether this shelf exists
+                folders = None if cache is None else cls.folders(executive=executive, uri=candidate)
+                # if we know already that it doesn't, move on to the next candidate
+                if folders is not None and cache.missing(uri=candidate.uri, folders=folders):
+                    continue
                 # show me
                 # print("    new shelf; loading")
                 # make an empty shelf and register it with the
@@ -72,6 +81,9 @@ class Loader:
                     # print(" ## skipping: {}".format(error))
                     # remove the bogus registration
                     del linker.shelves[candidate.uri]
+                    # if the shelf doesn't exist, remember this for the next time
+                    if folders is not None and cls.absent(uri=candidate, error=error):
+                        cache.recordMissing(uri=candidate.uri, folders=folders)
                     # move on to the next candidate
                     continue
                 # if the shelf was loaded correctly, replace the bogus registration
@@ -216,6 +228,26 @@ class Loader:
         return
 
 
+    @classmethod
+    def folders(cls, executive, uri):
+        """
+        Build a tuple with the folders whose contents determine whether the shelf at {uri}
+        exists; return {None} if the absence of the shelf cannot be remembered safely
+        """
+        # by default, it can't
+        return None
+
+
+    @classmethod
+    def absent(cls, uri, error):
+        """
+        Check whether the loading {error} indicates that the shelf at {uri} does not exist, as
+        opposed to a shelf that exists but failed to load
+        """
+        # by default, assume the worst
+        return False
+
+
     # initialization
     @classmethod
     def register(cls, index):
@@ -7,7 +7,7 @@
 
 
 # externals
-import sys
+import os, sys
 # support
 from ... import primitives, tracking
 # superclass
@@ -90,6 +90,44 @@ class Importer(Loader):
         return
 
 
+    @classmethod
+    def folders(cls, uri, **kwds):
+        """
+        Build a tuple with the folders whose contents determine whether the shelf at {uri}
+        exists
+        """
+        # get the module name
+        source = str(uri.address)
+        # split it into the name of its package and its own
+        package, _, _ = source.rpartition('.')
+        # top level modules
+        if not package:
+            # are looked up in the folders in the interpreter search path
+            return tuple(os.path.abspath(folder or os.curdir) for folder in sys.path)
+        # modules in packages that have not been imported yet can't be skipped, since
+        # attempting to import them would also import their packages
+        if package not in sys.modules: return None
+        # the rest are looked up in the search path of their package
+        path = getattr(sys.modules[package], '__path__', None)
+        # if there isn't one, we don't know where to look
+        if path is None: return None
+        # otherwise
+        return tuple(path)
+
+
+    @classmethod
+    def absent(cls, uri, error):
+        """
+        Check whether the loading {error} indicates that the module at {uri} does not exist
+        """
+        # get the reason the import failed
+        reason = error.__cause__
+        # only missing modules count
+        if not isinstance(reason, ModuleNotFoundError): return False
+        # and the missing module must be the one we were looking for, not one it imports
+        return reason.name == str(uri.address)
+
+
     # context handling
     @classmethod
     def interpret(cls, request):
@@ -21,6 +21,7 @@ EXPORT_PYTHON_MODULES = \
     Measure.py \
     Object.py \
     Persistent.py \
+    Pool.py \
     Postgres.py \
     Query.py \
     Reference.py \
@@ -29,6 +30,7 @@ EXPORT_PYTHON_MODULES = \
     Schemer.py \
     Selector.py \
     Server.py \
+    Statement.py \
     Table.py \
     actions.py \
     exceptions.py \
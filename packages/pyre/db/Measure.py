@@ -97,6 +97,11 @@ class Measure(records.measure):
             # for the rest, chain up...
             return super().coerce(value=value, **kwds)
 
+        def text(self, value):
+            """Text rendering of {value}, suitable for bound parameters and bulk transfers"""
+            # easy enough
+            return str(value)
+
 
 
     # mixins for the various supported types
@@ -112,6 +117,11 @@ class Measure(records.measure):
             # easy enough
             return 'true' if value else 'false'
 
+        def text(self, value):
+            """Text rendering of {value}"""
+            # same as the SQL rendering
+            return self.sql(value=value)
+
 
     class date(measure):
         """Mixin for dates"""
@@ -122,13 +132,17 @@ class Measure(records.measure):
         # interface
         def sql(self, value):
             """SQL rendering of {value}"""
+            # render the value and make sure the result is quoted in an SQL compliant way
+            return "'{}'".format(self.text(value=value))
+
+        def text(self, value):
+            """Text rendering of {value}"""
             # if {value} is a time struct
             if isinstance(value, time.struct_time):
                 # use my format to convert it a string
-                value = time.strftime(self.format, value)
+                return time.strftime(self.format, value)
             # other types of values just get passed along, for now; firewall this later
-            # make sure the result is quoted in an SQL compliant way
-            return "'{}'".format(value)
+            return str(value)
 
         # meta-methods
         def __init__(self, default=None, **kwds):
@@ -209,6 +223,11 @@ class Measure(records.measure):
             # easy enough, but must escape any embedded single quotes
             return "'{}'".format(value.replace("'", "''"))
 
+        def text(self, value):
+            """Text rendering of my value"""
+            # no quoting necessary
+            return value
+
         # meta-methods
         def __init__(self, maxlen=None, **kwds):
             # chain up
@@ -232,13 +251,17 @@ class Measure(records.measure):
         # interface
         def sql(self, value):
             """SQL rendering of {value}"""
+            # render the value and make sure the result is quoted in an SQL compliant way
+            return "'{}'".format(self.text(value=value))
+
+        def text(self, value):
+            """Text rendering of {value}"""
             # if {value} is a time struct
             if isinstance(value, time.struct_time):
                 # use my format to convert it a string
-                value = time.strftime(self.format, value)
+                return time.strftime(self.format, value)
             # other types of values just get passed along, for now; firewall this later
-            # make sure the result is quoted in an SQL compliant way
-            return "'{}'".format(value)
+            return str(value)
 
         # meta-methods
         def __init__(self, default=None, timezone=False, **kwds):
@@ -0,0 +1,407 @@
+# -*- coding: utf-8 -*-
+#
+# michael a.g. aïvázis
+# orthologue
+# (c) 1998-2018 all rights reserved
+#
+
+
+# externals
+import itertools
+import os
+import threading
+import time
+# packages
+import pyre
+# my protocol
+from .DataStore import DataStore as datastore
+# the default back end
+from .SQLite import SQLite
+
+
+# declaration
+class Pool(pyre.component, family="pyre.db.server.pool", implements=datastore):
+    """
+    A component that maintains a collection of connections to a database back end and leases
+    them to its clients
+
+    The connections are clones of the {server} prototype: instances of the same component
+    class with the same property values. Clients lease a connection for the duration of a
+    task, typically through a context manager
+
+        with pool.lease() as db:
+            db.select(...)
+
+    and the pool hands it to the next client when it is returned. The pool keeps at least
+    {minimum} connections alive, and never opens more than {maximum}; clients that ask for a
+    connection when all of them are leased wait until one is returned, for at most {timeout}.
+    Connections that are idle for longer than {idle} are closed, as long as there are more
+    than {minimum} of them. If {check} is not empty, it is executed on idle connections before
+    they are leased, and connections that fail it are discarded.
+
+    Pools are safe to use from multiple threads. Processes that inherit a pool from their
+    parent abandon the inherited connections and build their own.
+    """
+
+
+    # types
+    from . import exceptions
+    from pyre.units.SI import second
+
+
+    # traits
+    server = datastore(default=SQLite)
+    server.doc = "the prototype of the connections in the pool"
+
+    minimum = pyre.properties.int(default=1)
+    minimum.doc = "the number of connections to keep open"
+
+    maximum = pyre.properties.int(default=8)
+    maximum.doc = "the largest number of connections that can be open at any time"
+
+    idle = pyre.properties.dimensional(default=300*second)
+    idle.doc = "how long connections beyond the minimum can stay unused before they are closed"
+
+    timeout = pyre.properties.dimensional(default=30*second)
+    timeout.doc = "how long to wait for a connection when all of them are leased"
+
+    check = pyre.properties.str(default="SELECT 1;")
+    check.doc = "the statement that checks the health of idle connections before leasing them"
+
+
+    # required interface
+    @pyre.export
+    def attach(self):
+        """
+        Open the minimum number of connections
+        """
+        # make the connections
+        servers = [ self.acquire() for _ in range(self.minimum) ]
+        # and return them to the pool
+        for server in servers: self.release(server=server)
+        # all done
+        return self
+
+
+    @pyre.export
+    def detach(self):
+        """
+        Close all idle connections; leased ones are closed when they are returned
+        """
+        # with the lock held
+        with self.lock:
+            # grab the idle connections
+            servers = [ server for server, _ in self.available ]
+            # clear the pile
+            self.available = []
+            # adjust the population
+            self.population -= len(servers)
+            # make sure leased connections get closed when they are returned
+            self.generation += 1
+            # wake up anybody who is waiting
+            self.lock.notify_all()
+        # close the connections
+        for server in servers: server.detach()
+        # all done
+        return
+
+
+    @pyre.export
+    def execute(self, *sql):
+        """
+        Execute the sequence of SQL statements in {sql} as a single command on one of my
+        connections
+        """
+        # lease a connection
+        with self.lease() as server:
+            # execute the statements
+            result = server.execute(*sql)
+            # and harvest the results before returning the connection, in case they are still
+            # attached to it
+            return None if result is None else tuple(result)
+
+
+    # interface
+    def lease(self):
+        """
+        Build a context manager that acquires a connection on entry and returns it on exit
+        """
+        # easy enough
+        return self.Lease(pool=self)
+
+
+    def acquire(self):
+        """
+        Get a connection from the pool
+        """
+        # compute the deadline
+        deadline = time.monotonic() + self.timeout/self.second
+        # keep trying
+        while True:
+            # to get an idle connection, or permission to make a new one
+            server = self.reserve(deadline=deadline)
+            # if i got permission
+            if server is None:
+                # make a new one
+                return self.spawn()
+            # if the idle connection is healthy
+            if self.healthy(server=server):
+                # hand it out
+                return server
+            # otherwise, get rid of it
+            self.discard(server=server)
+
+
+    def release(self, server):
+        """
+        Return {server} to the pool
+        """
+        # the connections to close
+        expired = []
+        # with the lock held
+        with self.lock:
+            # connections that belong to an older generation
+            if self.generations.pop(server, self.generation) != self.generation:
+                # don't go back to the pile
+                expired.append(server)
+                # and no longer count
+                self.population -= 1
+            # the rest
+            else:
+                # get added to the pile, with a timestamp
+                self.available.append((server, time.monotonic()))
+                # collect the ones that have been idle for too long
+                expired.extend(self.expired())
+            # wake up a waiting client
+            self.lock.notify()
+        # close the expired connections
+        for server in expired: server.detach()
+        # all done
+        return
+
+
+    def evict(self):
+        """
+        Close the connections that have been idle for too long; useful for clients that would
+        rather not wait for the next {release} to reclaim resources, e.g. from a timer
+        """
+        # with the lock held
+        with self.lock:
+            # collect the connections that have been idle for too long
+            expired = self.expired()
+        # close them
+        for server in expired: server.detach()
+        # all done
+        return self
+
+
+    # meta-methods
+    def __init__(self, **kwds):
+        # chain up
+        super().__init__(**kwds)
+        # the lock that protects my state; clients wait on it for connections to be returned
+        self.lock = threading.Condition()
+        # the idle connections, along with the time they were returned; the most recently used
+        # are at the end
+        self.available = []
+        # the number of open connections, leased or not
+        self.population = 0
+        # the generation of the leased connections; incremented by {detach} so that the
+        # connections leased before are closed when they are returned
+        self.generation = 0
+        self.generations = {}
+        # the process that owns the connections
+        self.pid = os.getpid()
+        # a source of names for the connections
+        self.serial = itertools.count()
+        # the lock that serializes the making of new connections
+        self.spawning = threading.Lock()
+        # all done
+        return
+
+
+    # implementation details
+    def reserve(self, deadline):
+        """
+        Grab an idle connection, or return {None} if it is ok to make a new one; wait until
+        one of these is possible, or until {deadline}
+        """
+        # with the lock held
+        with self.lock:
+            # if i have been inherited from another process
+            if self.pid != os.getpid():
+                # abandon the connections of my parent; they are not mine to close
+                self.available = []
+                self.generations = {}
+                self.population = 0
+                # and take ownership
+                self.pid = os.getpid()
+            # until something happens
+            while True:
+                # if there are idle connections
+                if self.available:
+                    # grab the most recently used one
+                    server, _ = self.available.pop()
+                    # mark it as leased
+                    self.generations[server] = self.generation
+                    # and hand it out
+                    return server
+                # if there is room for another connection
+                if self.population < self.maximum:
+                    # count it
+                    self.population += 1
+                    # and let the caller make it
+                    return None
+                # otherwise, compute how long i can wait
+                remaining = deadline - time.monotonic()
+                # if i'm out of time
+                if remaining <= 0:
+                    # complain
+                    raise self.exceptions.OperationalError(
+                        description="timed out while waiting for a database connection")
+                # otherwise, wait
+                self.lock.wait(timeout=remaining)
+
+
+    def spawn(self):
+        """
+        Make a new connection, after the caller has reserved a slot for it
+        """
+        # get the prototype
+        prototype = self.server
+        # carefully
+        try:
+            # the component registrar is not thread safe, so
+            with self.spawning:
+                # build a name for the new connection
+                name = "{}-{}".format(self.pyre_name, next(self.serial))
+                # make a new instance of the same type
+                server = type(prototype)(name=name)
+                # with the same properties
+                for trait in prototype.pyre_properties():
+                    # by copying their values
+                    setattr(server, trait.name, getattr(prototype, trait.name))
+            # connect
+            server.attach()
+        # if anything goes wrong
+        except:
+            # release the slot
+            with self.lock:
+                # by adjusting the population
+                self.population -= 1
+                # and letting a waiting client know
+                self.lock.notify()
+            # and pass the error along
+            raise
+        # with the lock held
+        with self.lock:
+            # mark it as leased
+            self.generations[server] = self.generation
+        # and return it
+        return server
+
+
+    def healthy(self, server):
+        """
+        Check whether {server} can still talk to the database back end
+        """
+        # if there is no health check, assume all is well
+        if not self.check: return True
+        # otherwise, attempt to
+        try:
+            # execute the check
+            server.execute(self.check)
+        # if anything goes wrong
+        except Exception:
+            # the connection is bad
+            return False
+        # otherwise, it is fine
+        return True
+
+
+    def discard(self, server):
+        """
+        Close {server} and remove it from the pool
+        """
+        # with the lock held
+        with self.lock:
+            # forget it
+            self.generations.pop(server, None)
+            # adjust the population
+            self.population -= 1
+            # and let a waiting client know there is room for a new connection
+            self.lock.notify()
+        # attempt to
+        try:
+            # close it
+            server.detach()
+        # if this fails
+        except Exception:
+            # there is nothing else to do
+            pass
+        # all done
+        return
+
+
+    def expired(self):
+        """
+        Remove from my pile and return the connections that have been idle for too long; the
+        caller must hold the lock
+        """
+        # compute the cutoff
+        cutoff = time.monotonic() - self.idle/self.second
+        # the number of connections i can close
+        excess = self.population - self.minimum
+        # the idle connections are sorted by the time they were returned, so the oldest
+        # ones are at the front
+        count = 0
+        # go through them
+        for _, stamp in self.available:
+            # stop at the first one that is recent enough, or when i have closed enough
+            if count >= excess or stamp > cutoff: break
+            # otherwise, count it
+            count += 1
+        # grab the expired ones
+        expired = [ server for server, _ in self.available[:count] ]
+        # remove them from the pile
+        del self.available[:count]
+        # adjust the population
+        self.population -= count
+        # and return them
+        return expired
+
+
+    # helpers
+    class Lease:
+        """
+        A context manager that holds on to a connection
+        """
+
+        # meta-methods
+        def __init__(self, pool, **kwds):
+            # chain up
+            super().__init__(**kwds)
+            # save the pool
+            self.pool = pool
+            # no connection yet
+            self.server = None
+            # all done
+            return
+
+        def __enter__(self):
+            # get a connection
+            self.server = self.pool.acquire()
+            # and hand it to the caller
+            return self.server
+
+        def __exit__(self, exc_type, exc_instance, exc_traceback):
+            # return the connection
+            self.pool.release(server=self.server)
+            # forget it
+            self.server = None
+            # and re-raise any exception that occurred while executing the body of the
+            # with statement
+            return False
+
+
+# end of file
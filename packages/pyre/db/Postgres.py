@@ -7,6 +7,10 @@
 
 
 # externals
+import collections
+import datetime
+import decimal
+import itertools
 import pyre
 # superclass
 from .Server import Server
@@ -38,6 +42,12 @@ class Postgres(Server, family="pyre.db.server.postgres"):
     quiet = pyre.properties.bool(default=True)
     quiet.doc = "control whether certain postgres informationals are shown"
 
+    streaming = pyre.properties.int(default=2**10)
+    streaming.doc = "the smallest number of records that are loaded by streaming them with COPY"
+
+    preparations = pyre.properties.int(default=2**8)
+    preparations.doc = "the maximum number of prepared statements to keep on the server"
+
 
     # interface
     @pyre.export
@@ -62,6 +72,10 @@ class Postgres(Server, family="pyre.db.server.postgres"):
 
         # establish the connection
         self.connection = self.postgres.connect(spec)
+        # prepared statements live in the session
+        self.statements = {}
+        # and so do cursors
+        self.abandoned = []
 
         # if the user asked for {quiet} operation
         if self.quiet:
@@ -88,6 +102,10 @@ class Postgres(Server, family="pyre.db.server.postgres"):
         status = self.postgres.disconnect(self.connection)
         # invalidate the member
         self.connection = None
+        # and forget my prepared statements
+        self.statements = {}
+        # and my cursors
+        self.abandoned = []
 
         # and return the status
         return status
@@ -98,10 +116,458 @@ class Postgres(Server, family="pyre.db.server.postgres"):
         """
         Execute the sequence of SQL statements in {sql} as a single command
         """
+        # release whatever abandoned result sets left behind
+        self.settle()
         # assemble the command and pass it on to the connection
         return self.postgres.execute(self.connection, "\n".join(sql))
 
 
+    def select(self, query, batch=None):
+        """
+        Execute the given {query} and return the retrieved data
+
+        The result set is held by the server in a cursor, and the rows are retrieved {batch}
+        at a time and converted into records as they are requested. The rows are transmitted
+        in binary form and decoded into native python objects by the extension, so columns
+        whose values already have the type expected by their field are not coerced again;
+        result sets with types the extension can't decode are transmitted as text instead
+        """
+        # build a name for the cursor
+        cursor = "pyre_cursor_{}".format(next(self.cursors))
+        # build the sql statements that declare it
+        sql = self.sql.declare(cursor=cursor, query=query)
+        # the number of rows to retrieve at a time
+        batch = self.batch if batch is None else batch
+        # go through the result set one chunk at a time
+        for rows in self.fetch(*sql, batch=batch, cursor=cursor):
+            # convert them into records
+            yield from self.records(query=query, rows=rows)
+        # all done
+        return
+
+
+    def perform(self, statement, values):
+        """
+        Execute {statement}, a template built by the SQL generator, as a prepared statement
+        with the given parameter {values}
+        """
+        # the placeholders
+        markers = ("${}".format(index) for index in itertools.count(1))
+        # assemble the text
+        text = statement.text(markers=markers)
+        # literals have no context that lets the server infer their type, so declare the ones
+        # i know about; parameters bound to fields are left to the server
+        types = tuple(
+            self.oids.get(type(value), 0) if field is None else 0
+            for field, value in zip(statement.fields, values))
+        # convert the values to text
+        parameters = self.sql.bind(statement=statement, values=values)
+        # release whatever abandoned result sets left behind
+        self.settle()
+        # get the prepared statement; templates that were evicted from the cache of the SQL
+        # generator and rebuilt have the same text, so they reuse the same prepared statement
+        name = self.prepared(key=(text, types), build=lambda: (text, types))
+        # and execute
+        return self.postgres.executePrepared(self.connection, name, [parameters])
+
+
+    def prepared(self, key, build):
+        """
+        Look up the name of the prepared statement with the given {key}, or prepare the one
+        whose text and parameter types are returned by {build}
+
+        The statements are kept in order of use, and the least recently used ones are released
+        when there are more than {preparations} of them
+        """
+        # get the table of statements
+        statements = self.statements
+        # attempt to
+        try:
+            # pull the statement out of the table, so it can move to the back of the line
+            name = statements.pop(key)
+        # if it's not there
+        except KeyError:
+            # build a name for it
+            name = "pyre_statement_{}".format(next(self.names))
+            # get its text and the types of its parameters
+            text, types = build()
+            # prepare it
+            self.postgres.prepare(self.connection, name, text, types)
+            # if there are too many statements
+            while statements and len(statements) >= self.preparations:
+                # grab the least recently used one
+                obsolete = statements.pop(next(iter(statements)))
+                # and release it
+                self.postgres.execute(self.connection, "\n".join(self.sql.deallocate(obsolete)))
+        # put the statement at the back of the line
+        statements[key] = name
+        # and return its name
+        return name
+
+
+    def records(self, query, rows):
+        """
+        Convert the typed {rows} retrieved by {query} into records
+        """
+        # if there is nothing to do
+        if not rows: return []
+        # queries with derived fields
+        if query.pyre_derivations:
+            # go through the regular record constructor
+            return [ query.pyre_immutable(data=row) for row in rows ]
+
+        # split the rows into columns
+        columns = list(zip(*rows))
+        # go through the fields
+        for index, field in enumerate(query.pyre_measures):
+            # get the values
+            values = columns[index]
+            # and the native type of the field
+            native = self.native(field=field)
+            # if all the values already have this type
+            if native is not None and all(
+                    type(value) is native for value in values if value is not None):
+                # there is nothing to do
+                continue
+            # otherwise, walk them through the field processing
+            columns[index] = [ field.process(value=value) for value in values ]
+        # get the record type
+        record = query.pyre_immutableTuple
+        # assemble the rows and build the records
+        return [ tuple.__new__(record, row) for row in zip(*columns) ]
+
+
+    def native(self, field):
+        """
+        Determine the python type of the values of {field} that can bypass its processing
+        """
+        # fields with custom processing need the full treatment
+        if field.converters or field.normalizers or field.validators: return None
+        # query fields refer to table fields; the schema of the target determines the type
+        target = getattr(field, 'field', None) or field
+        # look up the native type of the schema
+        return self.natives.get(getattr(target, 'typename', None))
+
+
+    def fetch(self, *sql, batch, cursor=None):
+        """
+        Execute the sequence of SQL statements in {sql} and generate the rows of the result set
+        in chunks of at most {batch} rows
+
+        If {cursor} is {None}, the statements are executed and the result set is retrieved in
+        its entirety; otherwise, {sql} is expected to declare {cursor}, and the rows are fetched
+        from it incrementally
+        """
+        # if there is no cursor
+        if cursor is None:
+            # retrieve everything
+            yield from super().fetch(*sql, batch=batch)
+            # and bail
+            return
+
+        # release whatever abandoned result sets left behind
+        self.settle()
+        # cursors only live within transaction blocks; if the caller hasn't started one
+        local = self.postgres.transaction(self.connection) == "idle"
+        # start one
+        if local: self.execute(*self.sql.transaction())
+        # carefully
+        try:
+            # declare the cursor
+            self.execute(*sql)
+            # the rows are transmitted in binary form, unless some of the fields have types
+            # that the extension can't decode
+            binary = self.postgres.decodable(self.connection, cursor)
+            # build the statement that fetches the next chunk
+            fetch = "\n".join(self.sql.fetch(cursor=cursor, count=batch))
+            # pull the rows
+            while True:
+                # get the next chunk; skip the headers, since the order of the results matches
+                # exactly the field order, by construction
+                rows = self.postgres.query(self.connection, fetch, binary)[1:]
+                # if there aren't any left, we are done
+                if not rows: break
+                # otherwise, pass them on
+                yield rows
+        # if the client lost interest before the result set was exhausted
+        except GeneratorExit:
+            # this may be the garbage collector closing me at an arbitrary point, perhaps while
+            # another command is in flight, so it is not safe to talk to the server; leave
+            # the cursor and the transaction for the next command to release
+            self.abandoned.append((cursor, local))
+            # and pass the news along
+            raise
+        # if anything else went wrong, the transaction is aborted and takes the cursor with it
+        except:
+            # if the transaction is mine, roll it back
+            if local: self.execute(*self.sql.rollback())
+            # and pass the error along
+            raise
+        # release the cursor
+        self.execute(*self.sql.close(cursor=cursor))
+        # on success, close the transaction if it's mine
+        if local: self.execute(*self.sql.commit())
+        # all done
+        return
+
+
+    def settle(self):
+        """
+        Release the cursors of result sets whose clients lost interest before they were
+        exhausted, along with the transactions that were started on their behalf
+        """
+        # if there is nothing to do, bail
+        if not self.abandoned: return self
+        # grab the pile
+        abandoned = self.abandoned
+        # and reset it
+        self.abandoned = []
+        # get the transaction status
+        status = self.postgres.transaction(self.connection)
+        # if there is no open transaction, the cursors went away with the ones that held them
+        if status == "idle": return self
+        # otherwise, the statements to execute
+        sql = []
+        # if the transaction is still healthy
+        if status != "error":
+            # close the cursors
+            for cursor, _ in abandoned: sql.extend(self.sql.close(cursor=cursor))
+        # if any of the cursors started the transaction
+        if any(local for _, local in abandoned):
+            # end it as well
+            sql.extend(self.sql.commit())
+        # execute
+        self.postgres.execute(self.connection, "\n".join(sql))
+        # all done
+        return self
+
+
+    # bulk loading
+    def loadRecords(self, table, records):
+        """
+        Insert {records} into {table}; large batches are streamed to the server with COPY, and
+        the rest are bound to a prepared statement
+        """
+        # large batches
+        if len(records) >= self.streaming:
+            # get streamed
+            return self.copy(table=table, records=records)
+        # the rest go through a prepared statement
+        return self.bind(table=table, records=records)
+
+
+    def bind(self, table, records):
+        """
+        Insert {records} into {table} by binding their values to prepared statements
+
+        Each statement inserts a number of rows that is a power of two, so that the records
+        can be inserted with a few executions of the widest statement, followed by at most one
+        execution of each of the narrower ones; this keeps the number of round trips to the
+        server low, and the number of prepared statements per table small
+        """
+        # the number of fields
+        fields = len(table.pyre_fields)
+        # the widest statement must respect both my limit and the server's limit on the number
+        # of parameters of a statement
+        widest = min(self.stride, self.parameters // fields)
+        # round it down to a power of two
+        widest = 1 << (widest.bit_length() - 1)
+        # render the values
+        rows = list(self.render(table=table, records=records))
+        # release whatever abandoned result sets left behind
+        self.settle()
+        # the rows that have been inserted so far
+        done = 0
+        # starting with the widest statement
+        width = widest
+        # as long as there are rows left
+        while done < len(rows):
+            # the number of rows that can be handled by statements of this width
+            span = (len(rows) - done) // width * width
+            # if there are any
+            if span:
+                # get the statement
+                name = self.insertion(table=table, width=width)
+                # flatten the rows into parameter sets
+                parameters = (
+                    tuple(itertools.chain.from_iterable(rows[start:start+width]))
+                    for start in range(done, done+span, width))
+                # execute
+                self.postgres.executePrepared(self.connection, name, parameters)
+                # and update the count
+                done += span
+            # move on to the next narrower statement
+            width //= 2
+        # all done
+        return len(rows)
+
+
+    def insertion(self, table, width):
+        """
+        Build a prepared statement that inserts {width} rows into {table}
+        """
+        # the placeholders
+        markers = ("${}".format(index) for index in itertools.count(1))
+        # the statement text; the parameters are bound to fields, so the server can infer
+        # their types
+        build = lambda: (
+            "\n".join(self.sql.insertTemplate(table=table, markers=markers, rows=width)), ())
+        # look it up
+        return self.prepared(key=(table.pyre_name, width), build=build)
+
+
+    def copy(self, table, records):
+        """
+        Insert {records} into {table} by streaming them to the server with COPY
+        """
+        # build the statement
+        sql = self.sql.copyRecords(table=table)
+        # the escape sequences
+        escapes = self.escapes
+        # build the lines in text format
+        lines = (
+            "\t".join(r"\N" if value is None else value.translate(escapes) for value in row)
+            + "\n"
+            for row in self.render(table=table, records=records))
+        # group them, to keep the number of transfers down
+        chunk = lambda: "".join(itertools.islice(lines, 2**10))
+        # release whatever abandoned result sets left behind
+        self.settle()
+        # and stream them
+        return self.postgres.copy(self.connection, "\n".join(sql), iter(chunk, ""))
+
+
+    def render(self, table, records):
+        """
+        Build an iterable over the text representation of the values in {records}; {NULL}
+        values are represented by {None}
+        """
+        # get the fields
+        fields = table.pyre_fields
+        # and the special values
+        null = table.null
+        # convert the records
+        return (
+            tuple(
+                None if value is None or value is null else field.text(value=value)
+                for field, value in zip(fields, record))
+            for record in records)
+
+
+    # asynchronous execution
+    def submit(self, *sql, dispatcher, call):
+        """
+        Execute the sequence of SQL statements in {sql} as a single command, without waiting
+        for the server to finish
+
+        The connection socket is registered with {dispatcher}, and {call} is invoked as
+        {call(result=result, error=error)} when the server is done; {result} is the result of
+        the last statement, as returned by {execute}, and {error} is the exception raised by
+        the server, if any. The server processes one command at a time, so commands submitted
+        while another is in flight are queued and sent as soon as the connection is available
+        """
+        # add the command to my queue
+        self.requests.append(("\n".join(sql), call))
+        # if there is a command in flight, it will be sent when the connection is available
+        if self.request is not None: return self
+        # otherwise, send it
+        self.advance()
+        # and ask {dispatcher} to let me know when the server has something for me
+        dispatcher.whenReadReady(channel=self, call=self.harvest)
+        # all done
+        return self
+
+
+    def harvest(self, **kwds):
+        """
+        Handler invoked by the dispatcher when there is data for me on the connection socket;
+        returns {True} as long as there are commands in flight
+        """
+        # get the extension
+        postgres = self.postgres
+        # and my connection
+        connection = self.connection
+        # pull whatever data is available
+        postgres.consume(connection)
+        # as long as there are results to retrieve without blocking
+        while not postgres.busy(connection):
+            # attempt to
+            try:
+                # get the next result
+                result = postgres.retrieve(connection, self.done)
+            # if the server had a problem with the command
+            except self.exceptions.DatabaseError as error:
+                # hold on to the first error; the server keeps going until the end of the
+                # command, so there are more results to drain
+                if self.error is None: self.error = error
+                # and move on
+                continue
+            # if this is not the end of the command
+            if result is not self.done:
+                # hold on to the result
+                self.result = result
+                # and move on
+                continue
+            # otherwise, grab the client of the current command
+            _, call = self.request
+            # the result
+            result = self.result
+            # and the error
+            error = self.error
+            # move on to the next command
+            self.advance()
+            # deliver the outcome
+            call(result=result, error=error)
+            # if there is nothing else in flight, stop watching the connection
+            if self.request is None: return False
+        # there are more results in flight; keep watching
+        return True
+
+
+    def advance(self):
+        """
+        Send the next queued command to the server
+        """
+        # reset the outcome of the current command
+        self.result = None
+        self.error = None
+        # if there are no more commands in my queue
+        if not self.requests:
+            # mark me as idle
+            self.request = None
+            # and bail
+            return self
+        # otherwise, get the next one
+        self.request = self.requests.popleft()
+        # unpack it
+        command, _ = self.request
+        # the connection is idle, so release whatever abandoned result sets left behind
+        self.settle()
+        # and send it
+        self.postgres.submit(self.connection, command)
+        # all done
+        return self
+
+
+    # channel interface, so the dispatchers can monitor my connection
+    @property
+    def inbound(self):
+        """
+        The file descriptor of the connection socket
+        """
+        # ask the extension
+        return self.postgres.socket(self.connection)
+
+
+    @property
+    def outbound(self):
+        """
+        The file descriptor of the connection socket
+        """
+        # ask the extension
+        return self.postgres.socket(self.connection)
+
+
     # meta methods
     def __new__(cls, **kwds):
         # if necessary
@@ -112,6 +578,20 @@ class Postgres(Server, family="pyre.db.server.postgres"):
         return super().__new__(cls, **kwds)
 
 
+    def __init__(self, **kwds):
+        # chain up
+        super().__init__(**kwds)
+        # the queue of commands waiting to be submitted asynchronously
+        self.requests = collections.deque()
+        # the command in flight
+        self.request = None
+        # and its outcome, as it is being assembled
+        self.result = None
+        self.error = None
+        # all done
+        return
+
+
     # context manager interface
     def __enter__(self):
         """
@@ -142,8 +622,36 @@ class Postgres(Server, family="pyre.db.server.postgres"):
 
 
     # implementation details
+    # the python types the extension decodes binary values into, indexed by the name of the
+    # schema they satisfy
+    natives = {
+        'bool': bool,
+        'int': int,
+        'float': float,
+        'str': str,
+        'decimal': decimal.Decimal,
+        'date': datetime.date,
+        'time': datetime.time,
+        'timestamp': datetime.datetime,
+        }
+
     postgres = None # the handle to the extension module
     connection = None # the handle to the session with the back-end
+    cursors = itertools.count() # the source of unique cursor names
+    done = object() # the marker of the end of the results of asynchronous commands
+    stride = 2**7 # the largest number of rows inserted by a prepared statement
+    parameters = 2**16 - 1 # the largest number of parameters the server accepts in a statement
+    abandoned = () # the cursors of result sets that were not exhausted, and their transactions
+    names = itertools.count() # the source of unique prepared statement names
+    # the type oids of the values of literals that are bound as parameters
+    oids = {
+        bool: 16,
+        int: 20,
+        float: 701,
+        decimal.Decimal: 1700,
+        }
+    # the escape sequences of the COPY text format
+    escapes = str.maketrans({ '\\': r'\\', '\t': r'\t', '\n': r'\n', '\r': r'\r' })
 
 
     # helper routine to initialize the extension module
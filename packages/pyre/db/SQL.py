@@ -10,6 +10,8 @@
 import itertools
 # so i can check for sequences
 import collections
+# access to the framework
+import pyre
 # my base class
 from pyre.weaver.SQL import SQL as Mill
 
@@ -23,6 +25,7 @@ class SQL(Mill, family="pyre.db.sql"):
 
     # constants
     INDENTER = " "*2
+    PLACEHOLDER = "\x00" # marks the spots in statement templates where parameters go
 
 
     # types
@@ -32,6 +35,13 @@ class SQL(Mill, family="pyre.db.sql"):
     # the base classes for tables and queries
     from .Table import Table as table
     from .Query import Query as query
+    # statement templates
+    from .Statement import Statement as statement
+
+
+    # traits
+    cache = pyre.properties.int(default=2**10)
+    cache.doc = "the maximum number of statement templates to keep around"
 
 
     # queries
@@ -39,112 +49,180 @@ class SQL(Mill, family="pyre.db.sql"):
         """
         Generate the SELECT statement described by {query}
         """
-        # start
-        yield "SELECT"
-        # prepare to render the field projection
-        self.indent(increment=2)
-        # if the query is a table specification
-        if isinstance(query, self.schemer):
-            # no projection
-            yield self.place("*")
-            # push out
-            self.outdent()
-            # render the table name
-            yield self.place("FROM {};".format(query.pyre_name))
-            # push out
-            self.outdent()
-            # all done
-            return
+        # build the statement and render it with its parameters in place
+        yield from self.inline(*self.selectStatement(query=query))
+        # all done
+        return
 
-        # native queries
-        if isinstance(query, self.selector) or isinstance(query, self.query):
-            # figure out how many field references there are
-            fields = len(query.pyre_fields)
-            # build the projection
-            for index, entry in enumerate(query.pyre_fields):
-                # do we need a comma?
-                comma = ',' if index+1 < fields else ''
-                # render this field
-                yield self.place("{} AS {}{}".format(self.expression(entry), entry.name, comma))
-            # push out
-            self.outdent()
 
-            # render the {FROM} section
-            yield self.place("FROM")
-            # do we have other clauses following the {FROM} section
-            otherClauses = query.where or query.order or query.group
-            # push in
-            self.indent()
-            # figure out how many table references there are
-            tables = len(query.pyre_tables)
-            # render the tables
-            for index, tableName in enumerate(sorted(query.pyre_tables.keys())):
-                # get the table
-                table = query.pyre_tables[tableName]
-                # do we need a terminator?
-                # if we have more tables
-                if index + 1 < tables:
-                    # make it a comma
-                    terminator = ','
-                # if there are no other clauses in the query
-                elif not otherClauses:
-                    # wrap up
-                    terminator = ';'
-                # otherwise
-                else:
-                    # leave blank
-                    terminator = ''
-                # do we need to rename the table?
-                if tableName == table.pyre_name:
-                    # no
-                    yield self.place("{}{}".format(table.pyre_name, terminator))
-                # otherwise
-                else:
-                    # build a local alias for the table name
-                    yield self.place("{} AS {}{}".format(
-                            table.pyre_name, tableName, terminator))
+    # statement templates
+    def selectStatement(self, query):
+        """
+        Build the template of the SELECT statement described by {query}, along with the values
+        of its parameters
+        """
+        # the values of the parameters
+        values = []
+        # attempt to
+        try:
+            # if the query is a table specification
+            if isinstance(query, self.schemer):
+                # there are no expressions
+                key = (query, self.leader)
+            # otherwise
+            else:
+                # build a key out of the shape of the expressions
+                key = (
+                    query, self.leader,
+                    self._shape(query.where, values), self._shape(query.order, values))
+        # if the query contains expressions whose shape i don't know how to capture
+        except LookupError:
+            # render it without caching
+            return self._compile(key=None, values=(), generator=self._select, query=query)
+        # otherwise, look it up
+        return self._compile(key=key, values=values, generator=self._select, query=query)
+
+
+    def updateStatement(self, template, condition):
+        """
+        Build the template of the UPDATE statement that applies {template} to the rows that
+        match {condition}, along with the values of its parameters
+        """
+        # get the table
+        table = template.pyre_layout
+        # the values of the parameters
+        values = []
+        # the affected fields
+        assignments = []
+        # go through the fields
+        for field in table.pyre_fields:
+            # get the value
+            value = getattr(template, field.name)
+            # skip values set to {None}
+            if value is None: continue
+            # the special values are rendered in place
+            if value is table.null or value is table.default:
+                # so they are part of the shape of the statement
+                assignments.append((field.name, value.value))
+                # and move on
+                continue
+            # the rest are parameters
+            assignments.append((field.name, None))
+            values.append(value)
+        # attempt to
+        try:
+            # build a key out of the shape of the statement
+            key = (table, self.leader, tuple(assignments), self._shape(condition, values))
+        # if the condition contains expressions whose shape i don't know how to capture
+        except LookupError:
+            # render it without caching
+            return self._compile(
+                key=None, values=(), generator=self._updateRecords,
+                template=template, condition=condition)
+        # otherwise, look it up
+        return self._compile(
+            key=key, values=values, generator=self._updateRecords,
+            template=template, condition=condition)
+
+
+    def deleteStatement(self, table, condition):
+        """
+        Build the template of the DELETE statement that removes the rows of {table} that match
+        {condition}, along with the values of its parameters
+        """
+        # the values of the parameters
+        values = []
+        # attempt to
+        try:
+            # build a key out of the shape of the condition
+            key = (table, self.leader, self._shape(condition, values))
+        # if the condition contains expressions whose shape i don't know how to capture
+        except LookupError:
+            # render it without caching
+            return self._compile(
+                key=None, values=(), generator=self._deleteRecords,
+                table=table, condition=condition)
+        # otherwise, look it up
+        return self._compile(
+            key=key, values=values, generator=self._deleteRecords,
+            table=table, condition=condition)
+
+
+    def inline(self, statement, values):
+        """
+        Generate the lines of {statement} with the SQL rendering of {values} in place of its
+        parameters
+        """
+        # easy enough
+        return statement.render(values=values, renderer=self._inline)
 
-            # render the {WHERE} clause
-            if query.where is not None:
-                # do we have other clauses following the {FROM} section
-                otherClauses = query.order or query.group
-                # build a terminator
-                terminator = '' if otherClauses else ';'
-                # push out
-                self.outdent()
-                # build the filtering expression
-                predicate = self.expression(root=query.where, context=query)
-                # render the {WHERE} marker
-                yield self.place("WHERE")
-                # push in
-                self.indent()
-                # and render the expression
-                yield self.place("({}){}".format(predicate, terminator))
 
-            # render the {ORDER BY} clause
-            order = query.order
-            # if it exists
-            if order is not None:
-                # if it is not an iterable
-                if not isinstance(order, collections.Iterable):
-                    # make it one
-                    order = order,
-                # push out
-                self.outdent()
-                # render the {ORDER BY} marker
-                yield self.place("ORDER BY")
-                # push in
-                self.indent()
-                # build the collation expression
-                collation = (self.expression(root=spec, context=query) for spec in order)
-                # and render it
-                yield self.place("{};".format(", ".join(collation)))
+    def bind(self, statement, values, natives=()):
+        """
+        Convert {values} into parameters for {statement} that can be bound by a back end;
+        values whose type is in {natives} are passed through, {None} stands for {NULL}, and the
+        rest are converted to text
+        """
+        # easy enough
+        return tuple(
+            None if value is None
+            else value if type(value) in natives
+            else self.text(value=value) if field is None
+            else field.text(value=value)
+            for field, value in zip(statement.fields, values))
 
-            # push out
-            self.outdent(decrement=2)
-            # all done
-            return
 
+    def text(self, value):
+        """
+        Text rendering of the value of a literal, suitable for bound parameters
+        """
+        # booleans get the SQL spelling
+        if isinstance(value, bool): return 'true' if value else 'false'
+        # everything else is converted to a string
+        return str(value)
+
+
+    # cursor support
+    def declare(self, cursor, query):
+        """
+        Generate the SQL statement that binds the server side {cursor} to the result set of
+        {query}
+        """
+        # declare the cursor
+        yield self.place("DECLARE {} NO SCROLL CURSOR FOR".format(cursor))
+        # and bind it to the query
+        yield from self.select(query=query)
+        # all done
+        return
+
+
+    def fetch(self, cursor, count):
+        """
+        Generate the SQL statement that retrieves the next {count} rows from {cursor}
+        """
+        # simple enough
+        yield self.place("FETCH FORWARD {} FROM {};".format(count, cursor))
+        # all done
+        return
+
+
+    def close(self, cursor):
+        """
+        Generate the SQL statement that releases {cursor}
+        """
+        # simple enough
+        yield self.place("CLOSE {};".format(cursor))
+        # all done
+        return
+
+
+    # prepared statement support
+    def deallocate(self, statement):
+        """
+        Generate the SQL statement that releases the prepared {statement}
+        """
+        # simple enough
+        yield self.place("DEALLOCATE {};".format(statement))
         # all done
         return
 
@@ -366,12 +444,323 @@ class SQL(Mill, family="pyre.db.sql"):
         return
 
 
+    def insertTemplate(self, table, markers, rows=1):
+        """
+        Generate a parameterized statement that inserts {rows} records in {table}, using
+        {markers} as the placeholders for the values of their fields
+        """
+        # initiate the statement
+        yield self.place("INSERT INTO {}".format(table.pyre_name))
+        # indent
+        self.indent(increment=2)
+        # the field names in declaration order
+        yield self.place("({})".format(", ".join(field.name for field in table.pyre_fields)))
+        # start the section with the record values
+        self.outdent()
+        yield self.place("VALUES")
+        # further in
+        self.indent()
+        # the number of fields
+        fields = len(table.pyre_fields)
+        # get an iterator over the markers
+        markers = iter(markers)
+        # go through the rows
+        for row in range(rows):
+            # render their placeholders
+            placeholders = ", ".join(itertools.islice(markers, fields))
+            # and terminate them properly
+            yield self.place("({}){}".format(placeholders, "," if row < rows-1 else ";"))
+        # bounce out to top level
+        self.outdent(decrement=2)
+        # all done
+        return
+
+
+    def copyRecords(self, table):
+        """
+        Generate the statement that streams records into {table}
+        """
+        # simple enough
+        yield self.place("COPY {} ({}) FROM STDIN;".format(
+            table.pyre_name, ", ".join(field.name for field in table.pyre_fields)))
+        # all done
+        return
+
+
     def deleteRecords(self, table, condition):
         """
         Remove all {table} records that match {condition}
 
         If condition is {None}, this routine will remove all records from the given {table}
         """
+        # build the statement and render it with its parameters in place
+        yield from self.inline(*self.deleteStatement(table=table, condition=condition))
+        # all done
+        return
+
+
+    def updateRecords(self, template, condition):
+        """
+        Update all table rows that match {condition} using information from {template}, a
+        prototype row of a table. The update operation sets the fields in these rows to their
+        corresponding values in {template}; fields set to {None} in {template} are not
+        affected.
+        """
+        # build the statement and render it with its parameters in place
+        yield from self.inline(*self.updateStatement(template=template, condition=condition))
+        # all done
+        return
+
+
+    # meta-methods
+    def __init__(self, **kwds):
+        # get the field definition
+        from . import field
+        # chain up
+        super().__init__(nodeType=field, **kwds)
+
+        # local expressions
+        from .Collation import Collation as collation
+        from .FieldReference import FieldReference as fieldReference
+        # add them to the rendering strategy
+        self._renderers[collation] = self._collationRenderer
+        self._renderers[fieldReference] = self._fieldReferenceRenderer
+
+        # SQl primitives
+        from .expressions import (
+            IsNull as isNull,
+            IsNotNull as isNotNull,
+            Cast as cast,
+            Like as like,
+            )
+
+        # add them to the rendering strategy
+        self._renderers[isNull] = self._primitiveSQLExpressionRenderer
+        self._renderers[isNotNull] = self._primitiveSQLExpressionRenderer
+        self._renderers[cast] = self._primitiveSQLExpressionRenderer
+        self._renderers[like] = self._primitiveSQLExpressionRenderer
+
+        # the strategies that capture the shape of expressions
+        self._shapers = {
+            # nodes
+            field.literal: self._literalShaper,
+            field.variable: self._literalShaper,
+            field.operator: self._operatorShaper,
+            # local expressions
+            collation: self._collationShaper,
+            fieldReference: self._fieldReferenceShaper,
+            # SQL primitives
+            isNull: self._postfixShaper,
+            isNotNull: self._postfixShaper,
+            cast: self._castShaper,
+            like: self._likeShaper,
+            }
+
+        # the statement templates, indexed by the shape of their descriptions
+        self.statements = {}
+        # the pile of parameters of the template being generated
+        self._parameters = None
+
+        # all done
+        return
+
+
+    # implementation details
+    def _compile(self, key, values, generator, **kwds):
+        """
+        Look up the statement template with the given {key}, or build it using {generator}
+        """
+        # if the statement can be cached
+        if key is not None:
+            # attempt to
+            try:
+                # look it up
+                return self.statements[key], values
+            # if it's not there
+            except KeyError:
+                # no worries
+                pass
+        # if the statement is cacheable, collect its parameters; otherwise render them in place
+        self._parameters = [] if key is not None else None
+        # carefully
+        try:
+            # generate the text
+            lines = tuple(generator(**kwds))
+            # and grab the parameters
+            fields = tuple(self._parameters or ())
+        # no matter what happens
+        finally:
+            # reset the pile
+            self._parameters = None
+        # if the parameters don't match the values
+        if len(fields) != len(values):
+            # it's a bug
+            import journal
+            # so complain
+            raise journal.firewall('pyre.db').log(
+                "statement template mismatch: {} parameters, {} values".format(
+                    len(fields), len(values)))
+        # build the template
+        statement = self.statement(
+            lines=tuple(tuple(line.split(self.PLACEHOLDER)) for line in lines), fields=fields)
+        # if it is cacheable
+        if key is not None:
+            # and the cache is full
+            if len(self.statements) >= self.cache:
+                # make room by evicting the oldest entry
+                del self.statements[next(iter(self.statements))]
+            # store it
+            self.statements[key] = statement
+        # and return it
+        return statement, values
+
+
+    def _parameter(self, field, value):
+        """
+        Render a parameter of the statement being generated
+        """
+        # if the statement is not being cached
+        if self._parameters is None:
+            # render the value in place
+            return self._inline(field=field, value=value)
+        # otherwise, record the field that renders the value
+        self._parameters.append(field)
+        # and leave a placeholder
+        return self.PLACEHOLDER
+
+
+    def _inline(self, field, value):
+        """
+        Render the value of a parameter as an SQL literal
+        """
+        # literals from expressions are rendered according to their type
+        if field is None: return self.literal(value=value)
+        # the rest by their field
+        return field.sql(value=value)
+
+
+    def _select(self, query):
+        """
+        Generate the SELECT statement described by {query}
+        """
+        # start
+        yield "SELECT"
+        # prepare to render the field projection
+        self.indent(increment=2)
+        # if the query is a table specification
+        if isinstance(query, self.schemer):
+            # no projection
+            yield self.place("*")
+            # push out
+            self.outdent()
+            # render the table name
+            yield self.place("FROM {};".format(query.pyre_name))
+            # push out
+            self.outdent()
+            # all done
+            return
+
+        # native queries
+        if isinstance(query, self.selector) or isinstance(query, self.query):
+            # figure out how many field references there are
+            fields = len(query.pyre_fields)
+            # the projection is part of the query declaration, so it is rendered in place
+            parameters, self._parameters = self._parameters, None
+            # build the projection
+            for index, entry in enumerate(query.pyre_fields):
+                # do we need a comma?
+                comma = ',' if index+1 < fields else ''
+                # render this field
+                yield self.place("{} AS {}{}".format(self.expression(entry), entry.name, comma))
+            # restore the parameter pile
+            self._parameters = parameters
+            # push out
+            self.outdent()
+
+            # render the {FROM} section
+            yield self.place("FROM")
+            # do we have other clauses following the {FROM} section
+            otherClauses = query.where or query.order or query.group
+            # push in
+            self.indent()
+            # figure out how many table references there are
+            tables = len(query.pyre_tables)
+            # render the tables
+            for index, tableName in enumerate(sorted(query.pyre_tables.keys())):
+                # get the table
+                table = query.pyre_tables[tableName]
+                # do we need a terminator?
+                # if we have more tables
+                if index + 1 < tables:
+                    # make it a comma
+                    terminator = ','
+                # if there are no other clauses in the query
+                elif not otherClauses:
+                    # wrap up
+                    terminator = ';'
+                # otherwise
+                else:
+                    # leave blank
+                    terminator = ''
+                # do we need to rename the table?
+                if tableName == table.pyre_name:
+                    # no
+                    yield self.place("{}{}".format(table.pyre_name, terminator))
+                # otherwise
+                else:
+                    # build a local alias for the table name
+                    yield self.place("{} AS {}{}".format(
+                            table.pyre_name, tableName, terminator))
+
+            # render the {WHERE} clause
+            if query.where is not None:
+                # do we have other clauses following the {FROM} section
+                otherClauses = query.order or query.group
+                # build a terminator
+                terminator = '' if otherClauses else ';'
+                # push out
+                self.outdent()
+                # build the filtering expression
+                predicate = self.expression(root=query.where, context=query)
+                # render the {WHERE} marker
+                yield self.place("WHERE")
+                # push in
+                self.indent()
+                # and render the expression
+                yield self.place("({}){}".format(predicate, terminator))
+
+            # render the {ORDER BY} clause
+            order = query.order
+            # if it exists
+            if order is not None:
+                # if it is not an iterable
+                if not isinstance(order, collections.Iterable):
+                    # make it one
+                    order = order,
+                # push out
+                self.outdent()
+                # render the {ORDER BY} marker
+                yield self.place("ORDER BY")
+                # push in
+                self.indent()
+                # build the collation expression
+                collation = (self.expression(root=spec, context=query) for spec in order)
+                # and render it
+                yield self.place("{};".format(", ".join(collation)))
+
+            # push out
+            self.outdent(decrement=2)
+            # all done
+            return
+
+        # all done
+        return
+
+
+    def _deleteRecords(self, table, condition):
+        """
+        Generate the statement that removes all {table} records that match {condition}
+        """
         # if no condition was specified
         if condition is None:
             # delete all records
@@ -393,12 +782,10 @@ class SQL(Mill, family="pyre.db.sql"):
         return
 
 
-    def updateRecords(self, template, condition):
+    def _updateRecords(self, template, condition):
         """
-        Update all table rows that match {condition} using information from {template}, a
-        prototype row of a table. The update operation sets the fields in these rows to their
-        corresponding values in {template}; fields set to {None} in {template} are not
-        affected.
+        Generate the statement that updates all table rows that match {condition} using
+        information from {template}
         """
         # get the table
         table = template.pyre_layout
@@ -414,13 +801,14 @@ class SQL(Mill, family="pyre.db.sql"):
             # skip values set to {None}
             if value is None: continue
 
-            # handle 'NULL'
-            if value is table.null: value = 'NULL'
-            # handle 'DEFAULT'
-            elif value is table.default: value = 'DEFAULT'
             # this pair needs an update
             names.append(name)
-            values.append(field.sql(value))
+            # handle 'NULL'
+            if value is table.null: values.append(field.sql('NULL'))
+            # handle 'DEFAULT'
+            elif value is table.default: values.append(field.sql('DEFAULT'))
+            # and the rest
+            else: values.append(self._parameter(field=field, value=value))
 
         # render the names
         names = "(" + ", ".join(names) + ")"
@@ -448,39 +836,19 @@ class SQL(Mill, family="pyre.db.sql"):
         return
 
 
-    # meta-methods
-    def __init__(self, **kwds):
-        # get the field definition
-        from . import field
-        # chain up
-        super().__init__(nodeType=field, **kwds)
-
-        # local expressions
-        from .Collation import Collation as collation
-        from .FieldReference import FieldReference as fieldReference
-        # add them to the rendering strategy
-        self._renderers[collation] = self._collationRenderer
-        self._renderers[fieldReference] = self._fieldReferenceRenderer
-
-        # SQl primitives
-        from .expressions import (
-            IsNull as isNull,
-            IsNotNull as isNotNull,
-            Cast as cast,
-            Like as like,
-            )
-
-        # add them to the rendering strategy
-        self._renderers[isNull] = self._primitiveSQLExpressionRenderer
-        self._renderers[isNotNull] = self._primitiveSQLExpressionRenderer
-        self._renderers[cast] = self._primitiveSQLExpressionRenderer
-        self._renderers[like] = self._primitiveSQLExpressionRenderer
-
-        # all done
-        return
+    def _literalRenderer(self, node, **kwds):
+        """
+        Render {node} as a literal; while generating statement templates, literals become
+        parameters
+        """
+        # if the statement is not being cached
+        if self._parameters is None:
+            # render the literal in place
+            return super()._literalRenderer(node, **kwds)
+        # otherwise, leave a placeholder
+        return self._parameter(field=None, value=node._value)
 
 
-    # implementation details
     def _collationRenderer(self, order, context=None, **kwds):
         """
         Render the collation order specification
@@ -504,6 +872,94 @@ class SQL(Mill, family="pyre.db.sql"):
         return node.sql(context=context, **kwds)
 
 
+    # shapes
+    def _shape(self, node, values):
+        """
+        Build a hashable representation of the structure of the expression {node}, and collect
+        the values of its literals in {values}, in the order they are rendered
+        """
+        # no expression
+        if node is None: return None
+        # look up the strategy for this node; unknown nodes raise a {LookupError}
+        shaper = self._shapers.get(type(node))
+        # if there is one
+        if shaper is not None:
+            # use it
+            return shaper(node, values)
+        # collation orders may be iterables of specifications
+        if isinstance(node, (tuple, list)):
+            # capture each one
+            return tuple(self._shape(entry, values) for entry in node)
+        # anything else is beyond me
+        raise LookupError(node)
+
+
+    def _literalShaper(self, node, values):
+        """
+        Literals are parameters
+        """
+        # get the value
+        value = node._value
+        # values that know how to render themselves are not parameters
+        if hasattr(value, "sql"): raise LookupError(node)
+        # save it
+        values.append(value)
+        # all literals have the same shape
+        return type(node)
+
+
+    def _operatorShaper(self, node, values):
+        """
+        Operations are characterized by their evaluator and the shape of their operands
+        """
+        # capture the operands
+        operands = tuple(self._shape(operand, values) for operand in node.operands)
+        # and combine them with the evaluator
+        return (node.evaluator,) + operands
+
+
+    def _collationShaper(self, node, values):
+        """
+        Collation orders are characterized by their field reference and their direction
+        """
+        # easy enough
+        return (type(node), node.collation, self._shape(node.fieldref, values))
+
+
+    def _fieldReferenceShaper(self, node, values):
+        """
+        Field references are characterized by their table and field
+        """
+        # get the field
+        field = node.field
+        # easy enough
+        return (type(node), node.table, None if field is None else field.name)
+
+
+    def _postfixShaper(self, node, values):
+        """
+        Postfix operators are characterized by their type and their operand
+        """
+        # easy enough
+        return (type(node), self._shape(node.operand, values))
+
+
+    def _castShaper(self, node, values):
+        """
+        Casts are characterized by their field and their target type
+        """
+        # easy enough
+        return (type(node), self._shape(node.field, values), node.targetType.decl)
+
+
+    def _likeShaper(self, node, values):
+        """
+        Pattern matches are characterized by their field and their pattern
+        """
+        # the pattern is rendered in place, so it is part of the shape
+        return (type(node), self._shape(node.field, values), node.regex)
+
+
     # declarations
     def _fieldDeclaration(self, field, comma):
         """
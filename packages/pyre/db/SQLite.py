@@ -7,6 +7,7 @@
 
 
 # externals
+import itertools
 import pyre
 import sqlite3
 # superclass
@@ -28,6 +29,9 @@ class SQLite(Server, family="pyre.db.server.sqlite"):
     database = pyre.properties.str(default=":memory:")
     database.doc = "the path to the sqlite database"
 
+    shared = pyre.properties.bool(default=False)
+    shared.doc = "allow threads other than the one that made the connection to use it"
+
 
     # interface
     @pyre.export
@@ -38,7 +42,7 @@ class SQLite(Server, family="pyre.db.server.sqlite"):
         # if i have an existing connection to the database, do nothing
         if self.connection is not None: return
         # otherwise, make a connection
-        self.connection = sqlite3.connect(self.database)
+        self.connection = sqlite3.connect(self.database, check_same_thread=not self.shared)
         # and a cursor
         self.cursor = self.connection.cursor()
         # and return
@@ -74,7 +78,127 @@ class SQLite(Server, family="pyre.db.server.sqlite"):
         return self.cursor
 
 
+    def perform(self, statement, values):
+        """
+        Execute {statement}, a template built by the SQL generator, with the given parameter
+        {values} bound to its placeholders
+        """
+        # convert the values into parameters
+        parameters = self.sql.bind(statement=statement, values=values, natives=self.natives)
+        # hand them to my cursor, along with the text of the statement; {sqlite3} keeps the
+        # compiled form of recently used statements, so templates are only prepared once
+        self.cursor.execute(statement.text(markers=itertools.repeat("?")), parameters)
+        # return the cursor
+        return self.cursor
+
+
+    def stream(self, statement, values, batch):
+        """
+        Execute {statement}, a template built by the SQL generator, with the given parameter
+        {values} bound to its placeholders, and generate the rows of the result set in chunks
+        of at most {batch} rows
+        """
+        # convert the values into parameters
+        parameters = self.sql.bind(statement=statement, values=values, natives=self.natives)
+        # get the text
+        sql = statement.text(markers=itertools.repeat("?"))
+        # make a cursor for this result set
+        cursor = self.connection.cursor()
+        # carefully
+        try:
+            # execute the statement
+            cursor.execute(sql, parameters)
+            # and pull the rows
+            while True:
+                # one chunk at a time
+                rows = cursor.fetchmany(batch)
+                # if there aren't any left, we are done
+                if not rows: break
+                # otherwise, pass them on
+                yield rows
+        # no matter what happens
+        finally:
+            # release the cursor
+            cursor.close()
+        # all done
+        return
+
+
+    def fetch(self, *sql, batch):
+        """
+        Execute the sequence of SQL statements in {sql} and generate the rows of the result set
+        in chunks of at most {batch} rows
+        """
+        # make a cursor for this result set, so that other statements may be executed while
+        # it is being traversed
+        cursor = self.connection.cursor()
+        # carefully
+        try:
+            # execute the statements
+            cursor.execute('\n'.join(sql))
+            # and pull the rows
+            while True:
+                # one chunk at a time
+                rows = cursor.fetchmany(batch)
+                # if there aren't any left, we are done
+                if not rows: break
+                # otherwise, pass them on
+                yield rows
+        # no matter what happens
+        finally:
+            # release the cursor
+            cursor.close()
+        # all done
+        return
+
+
+    # context manager interface
+    def __exit__(self, exc_type, exc_instance, exc_traceback):
+        """
+        Hook invoked when the context manager's block exits
+        """
+        # if there were no errors detected
+        if exc_type is None:
+            # commit any pending changes
+            self.connection.commit()
+        # otherwise
+        else:
+            # roll back
+            self.connection.rollback()
+
+        # indicate that we want to re-raise any exceptions that occurred while executing the
+        # body of the {with} statement
+        return False
+
+
     # implementation details
+    def loadRecords(self, table, records):
+        """
+        Insert {records} into {table} by binding their values to a parameterized statement
+        """
+        # build the statement
+        sql = self.sql.insertTemplate(table=table, markers=("?",)*len(table.pyre_fields))
+        # get the fields
+        fields = table.pyre_fields
+        # and the special values
+        null = table.null
+        # convert the records into parameter sets
+        rows = (
+            tuple(
+                None if value is None or value is null
+                else value if type(value) in self.natives
+                else field.text(value=value)
+                for field, value in zip(fields, record))
+            for record in records)
+        # hand everything to my cursor
+        self.cursor.executemany('\n'.join(sql), rows)
+        # all done
+        return self
+
+
+    # the types that {sqlite3} can bind without help
+    natives = { int, float, str, bytes, bool }
+    # state
     cursor = None
     connection = None
 
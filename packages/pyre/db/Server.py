@@ -6,6 +6,8 @@
 #
 
 
+# externals
+import itertools
 # packages
 import pyre
 import pyre.weaver
@@ -36,6 +38,9 @@ class Server(pyre.component, implements=datastore):
     sql = pyre.weaver.language(default=sql)
     sql.doc = "the generator of the SQL statements"
 
+    batch = pyre.properties.int(default=2**10)
+    batch.doc = "the number of rows to retrieve at a time when streaming the results of queries"
+
 
     # required interface
     @pyre.export
@@ -117,6 +122,39 @@ class Server(pyre.component, implements=datastore):
         return self.execute(*sql)
 
 
+    def load(self, *records):
+        """
+        Insert {records} into the database using the fastest mechanism supported by the server
+
+        The records are grouped by table and handed to {loadRecords}, except for the ones that
+        ask for the default value of any of their fields; these are rendered by the SQL
+        generator, just like {insert} does
+        """
+        # group the records by table, in the order the tables show up
+        groups = {}
+        # go through the records
+        for record in records:
+            # and place each one in the pile of its table
+            groups.setdefault(record.pyre_layout, []).append(record)
+        # go through the groups
+        for table, group in groups.items():
+            # separate the records that need the server to compute default values
+            regular = []
+            special = []
+            # go through the records in this group
+            for record in group:
+                # check whether any of the values is the {default} marker
+                marked = any(value is table.default for value in record)
+                # and place the record in the right pile
+                (special if marked else regular).append(record)
+            # load the regular ones
+            if regular: self.loadRecords(table=table, records=regular)
+            # and insert the rest
+            if special: self.insert(*special)
+        # all done
+        return
+
+
     def update(self, *specifications):
         """
         Use {specifications} to update the database
@@ -128,10 +166,10 @@ class Server(pyre.component, implements=datastore):
         """
         # go through the {specifications}
         for template, condition in specifications:
-            # build the sql statement for this update
-            sql = self.sql.updateRecords(template=template, condition=condition)
+            # build the statement for this update
+            statement, values = self.sql.updateStatement(template=template, condition=condition)
             # and execute it
-            self.execute(*sql)
+            self.perform(statement=statement, values=values)
         # all done
         return
 
@@ -140,33 +178,96 @@ class Server(pyre.component, implements=datastore):
         """
         Delete all {table} records that match {condition}
         """
-        # build the sql statements
-        sql = self.sql.deleteRecords(table=table, condition=condition)
+        # build the statement
+        statement, values = self.sql.deleteStatement(table=table, condition=condition)
         # and execute
-        return self.execute(*sql)
+        return self.perform(statement=statement, values=values)
 
 
-    def select(self, query):
+    def select(self, query, batch=None):
         """
         Execute the given {query} and return the retrieved data
+
+        The rows are retrieved from the server {batch} at a time, and converted into records
+        as they are requested, so that the entire result set need not fit in memory
         """
-        # build the sql statements
-        sql = self.sql.select(query=query)
-        # execute them
+        # build the statement
+        statement, values = self.sql.selectStatement(query=query)
+        # get the record factory
+        record = query.pyre_immutable
+        # the number of rows to retrieve at a time
+        batch = self.batch if batch is None else batch
+        # go through the result set one chunk at a time
+        for rows in self.stream(statement=statement, values=values, batch=batch):
+            # for each row with actual data
+            for row in rows:
+                # build a named tuple
+                yield record(data=row)
+        # all done
+        return
+
+
+    def perform(self, statement, values):
+        """
+        Execute {statement}, a template built by the SQL generator, with the given parameter
+        {values}
+
+        This implementation renders the values in place; servers that support bound parameters
+        should override it
+        """
+        # render the statement and execute it
+        return self.execute(*self.sql.inline(statement=statement, values=values))
+
+
+    def stream(self, statement, values, batch):
+        """
+        Execute {statement}, a template built by the SQL generator, with the given parameter
+        {values} and generate the rows of the result set in chunks of at most {batch} rows
+
+        This implementation renders the values in place; servers that support bound parameters
+        should override it
+        """
+        # render the statement and fetch the results
+        return self.fetch(*self.sql.inline(statement=statement, values=values), batch=batch)
+
+
+    def fetch(self, *sql, batch):
+        """
+        Execute the sequence of SQL statements in {sql} and generate the rows of the result set
+        in chunks of at most {batch} rows
+
+        This implementation retrieves the entire result set at once; servers that support
+        incremental retrieval should override it
+        """
+        # execute the statements
         results = iter(self.execute(*sql))
 
         # get the headers, if the server provides them; ignore them, for now, since the order
         # of the results matches exactly the field order, by construction
         if self.providesHeaders: headers = next(results)
 
-        # for each row with actual data
-        for row in results:
-            # build a named tuple
-            yield query.pyre_immutable(data=row)
+        # hand the rest over in chunks
+        while True:
+            # grab the next one
+            rows = tuple(itertools.islice(results, batch))
+            # if it's empty, we are done
+            if not rows: break
+            # otherwise, pass it on
+            yield rows
         # all done
         return
 
 
+    # implementation details
+    def loadRecords(self, table, records):
+        """
+        Insert {records} into {table}; this implementation renders the values in the body of an
+        INSERT statement, and servers that support better mechanisms should override it
+        """
+        # easy enough
+        return self.insert(*records)
+
+
     # meta methods
     # context manager support
     def __enter__(self):
@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+#
+# michael a.g. aïvázis
+# orthologue
+# (c) 1998-2018 all rights reserved
+#
+
+
+class Statement:
+    """
+    A rendered SQL statement with placeholders for the values of its parameters
+
+    Statements are built by the SQL generator and cached by the shape of the table, query and
+    expressions that describe them, so that repeated requests with the same shape skip the
+    generation step and can be executed as prepared statements by back ends that support them
+    """
+
+
+    # public data
+    lines = () # the text of the statement, as the tuple of fragments around the placeholders
+    fields = () # the field descriptors that render each parameter, or {None} for literals
+
+
+    # interface
+    def render(self, values, renderer):
+        """
+        Build the lines of the statement after replacing each placeholder with the rendering
+        of the corresponding entry in {values} by {renderer}
+        """
+        # render the parameters
+        text = map(renderer, self.fields, values)
+        # go through my lines
+        for fragments in self.lines:
+            # fill the gaps between the fragments and pass the line on
+            yield "".join(
+                fragment if index == 0 else next(text) + fragment
+                for index, fragment in enumerate(fragments))
+        # all done
+        return
+
+
+    def text(self, markers):
+        """
+        Assemble my text, using successive entries of {markers} as the placeholders
+        """
+        # make sure {markers} is an iterator
+        markers = iter(markers)
+        # assemble each line
+        lines = (
+            "".join(
+                fragment if index == 0 else next(markers) + fragment
+                for index, fragment in enumerate(fragments))
+            for fragments in self.lines)
+        # and splice them together
+        return "\n".join(lines)
+
+
+    # meta-methods
+    def __init__(self, lines, fields, **kwds):
+        # chain up
+        super().__init__(**kwds)
+        # save my parts
+        self.lines = lines
+        self.fields = fields
+        # all done
+        return
+
+
+# end of file
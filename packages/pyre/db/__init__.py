@@ -76,6 +76,8 @@ from .Client import Client as client
 from .Backup import Backup as backup
 from .SQLite import SQLite as sqlite
 from .Postgres import Postgres as postgres
+# connection management
+from .Pool import Pool as pool
 
 
 # templates: table rows with all fields set to None; used to update table entries
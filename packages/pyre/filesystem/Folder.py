@@ -28,6 +28,10 @@ class Folder(Node):
     isFolder = True
 
 
+    # public data
+    revision = 0 # incremented every time the structure of any filesystem changes
+
+
     # types
     # my metadata
     from .InfoFolder import InfoFolder as metadata
@@ -80,6 +84,8 @@ class Folder(Node):
         self.filesystem().unlink(node=node, **kwds)
         # remove it from my contents
         del self.contents[name]
+        # record the structural change
+        Folder.revision += 1
 
         # all done
         return
@@ -262,6 +268,8 @@ class Folder(Node):
                     folder = current.folder()
                     # attach it
                     current.contents[name] = folder
+                    # record the structural change
+                    Folder.revision += 1
                     # inform the filesystem
                     current.filesystem().attach(node=folder, uri=(current.uri / name))
                     # and advance the cursor
@@ -282,6 +290,8 @@ class Folder(Node):
         try:
             # insert it into the contents of the folder
             current.contents[name] = node
+            # record the structural change
+            Folder.revision += 1
         # if the {current} node doesn't have {contents}
         except AttributeError:
             # complain
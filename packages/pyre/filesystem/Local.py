@@ -10,6 +10,8 @@
 import hashlib, mmap, time
 # superclass
 from .Filesystem import Filesystem
+# the keeper of the structural revisions
+from .Folder import Folder
 
 
 # class declaration
@@ -91,6 +93,8 @@ class Local(Filesystem):
         node = parent.node()
         # insert the new node in its parent's contents
         parent.contents[str(name)] = node
+        # record the structural change
+        Folder.revision += 1
         # get the directory meta-data
         meta = self.recognizer.recognize(uri)
         # and update my {vnode} table
@@ -115,6 +119,8 @@ class Local(Filesystem):
         node = parent.node()
         # insert the new node in its parent's contents
         parent.contents[name] = node
+        # record the structural change
+        Folder.revision += 1
         # get the file meta-data
         meta = self.recognizer.recognize(uri)
         # and update my {vnode} table
@@ -267,6 +273,8 @@ class Local(Filesystem):
                 del self.vnodes[folder[entry]]
                 # and remove them from the folder contents
                 del folder.contents[entry]
+                # record the structural change
+                Folder.revision += 1
 
         # show me
         # print("    after uri: {!r}".format(self.vnodes[root].uri))
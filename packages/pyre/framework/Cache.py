@@ -0,0 +1,289 @@
+# -*- coding: utf-8 -*-
+#
+# michael a.g. aïvázis
+# orthologue
+# (c) 1998-2018 all rights reserved
+#
+
+
+# externals
+import os, sys, time, pickle
+
+
+# class declaration
+class Cache:
+    """
+    The persistent store of the results of the work done while booting the framework
+
+    Short lived processes spend most of their time discovering the runtime environment: every
+    one of them parses the same configuration files and probes the same locations for shelves
+    that do not exist. {Cache} remembers the configuration events harvested from each file it
+    sees, and the shelf candidates that failed to load, and saves them in a file in the user's
+    cache folder when the process shuts down, so that subsequent processes can skip the
+    parsers and the pointless probes.
+
+    Each entry carries a stamp with the modification time and size of the files and folders
+    it depends on; entries whose stamp no longer matches the filesystem are discarded and
+    rebuilt, so there is no need to manage the cache by hand. Entries also expire {lifetime}
+    seconds after they were recorded, and the store never holds more than {capacity} of them.
+
+    The cache is off by default; applications opt in by setting {pyre_cache} to {True} in their
+    {__main__} module, or by setting the {PYRE_CACHE} environment variable. Stores that are not
+    owned by the user, or that others can modify, are ignored.
+    """
+
+
+    # constants
+    version = 2 # bump whenever the layout of the entries changes
+    protocol = pickle.HIGHEST_PROTOCOL
+    capacity = 1024 # the maximum number of entries
+    lifetime = 7 * 24 * 3600 # the number of seconds an entry remains valid
+    # the location of the store; the python version is part of the name, since the entries
+    # may not be portable across interpreters
+    home = os.path.join(os.environ.get('XDG_CACHE_HOME', '~/.cache'), 'pyre')
+    filename = 'startup-{0.major}.{0.minor}.pickle'.format(sys.version_info)
+
+
+    # public data
+    uri = None # the location of my persistent store; {None} when caching is disabled
+    hits = 0 # the number of requests satisfied by valid entries
+    misses = 0 # the number of requests that had to be satisfied the hard way
+
+
+    # interface
+    def decode(self, codec, uri, source, locator):
+        """
+        Ask {codec} to convert {source} into a sequence of configuration events, unless the
+        events are known already
+        """
+        # the key is the physical location of the {source}
+        path = getattr(source, 'name', None)
+        # if i am disabled or the {source} is not a local file
+        if self.uri is None or not isinstance(path, str):
+            # there is nothing i can do
+            return codec.decode(uri, source, locator)
+        # otherwise, attempt to
+        try:
+            # get the file metadata; it is open already, so this doesn't touch the filesystem
+            meta = os.fstat(source.fileno())
+        # if anything goes wrong
+        except (AttributeError, OSError, ValueError):
+            # let the codec deal with it
+            return codec.decode(uri, source, locator)
+
+        # build the key
+        key = ('events', codec.encoding, path)
+        # and the stamp
+        stamp = (meta.st_mtime_ns, meta.st_size)
+        # look for an entry
+        entry = self.entries.get(key)
+        # if there is one and it is still valid
+        if entry is not None and entry[0] == stamp:
+            # we have a hit
+            self.hits += 1
+            # and the events are ready to go
+            return entry[1]
+
+        # otherwise, harvest the events; the codecs are free to produce them lazily, so
+        # convert them into a list so they can be saved
+        events = list(codec.decode(uri, source, locator))
+        # update the store
+        self.store(key=key, stamp=stamp, value=events)
+        # and return the events
+        return events
+
+
+    def missing(self, uri, folders):
+        """
+        Check whether {uri} is known to point to a shelf that doesn't exist in any of the given
+        {folders}
+        """
+        # if i am disabled, i know nothing
+        if self.uri is None: return False
+        # look for an entry
+        entry = self.entries.get(('missing', str(uri), folders))
+        # if there isn't one, or it is stale, the {uri} must be probed
+        if entry is None or entry[0] != self.stamp(folders=folders): return False
+        # otherwise, we have a hit
+        self.hits += 1
+        # and there is nothing to load
+        return True
+
+
+    def recordMissing(self, uri, folders):
+        """
+        Record that {uri} points to a shelf that doesn't exist; the absence of the shelf
+        remains valid for as long as the contents of {folders} don't change
+        """
+        # if i am disabled, there is nothing to do
+        if self.uri is None: return self
+        # build the key
+        key = ('missing', str(uri), folders)
+        # record the state of the folders
+        return self.store(key=key, stamp=self.stamp(folders=folders), value=None)
+
+
+    def store(self, key, stamp, value):
+        """
+        Record {value} under {key}; the entry is valid for as long as {stamp} doesn't change
+        """
+        # we have a miss
+        self.misses += 1
+        # get my entries
+        entries = self.entries
+        # remove any previous entry, so the new one goes to the back of the line
+        entries.pop(key, None)
+        # make the entry
+        entries[key] = (stamp, value, time.time())
+        # if i have too many entries
+        while len(entries) > self.capacity:
+            # evict the oldest one
+            del entries[next(iter(entries))]
+        # mark me as modified
+        self.modified = True
+        # all done
+        return self
+
+
+    def stamp(self, folders):
+        """
+        Build a stamp that records the state of the given {folders}
+        """
+        # the pile of modification times
+        stamp = []
+        # go through the folders
+        for folder in folders:
+            # attempt to
+            try:
+                # get the modification time
+                mtime = os.stat(folder).st_mtime_ns
+            # if the folder doesn't exist
+            except OSError:
+                # mark it
+                mtime = None
+            # add it to the pile
+            stamp.append(mtime)
+        # all done
+        return tuple(stamp)
+
+
+    def load(self):
+        """
+        Retrieve the contents of my persistent store
+        """
+        # if i am disabled, there is nothing to do
+        if self.uri is None: return self
+        # attempt to
+        try:
+            # open the store
+            with open(self.uri, 'rb') as stream:
+                # get its metadata
+                meta = os.fstat(stream.fileno())
+                # if it belongs to someone else or others can write to it
+                if meta.st_uid != os.getuid() or meta.st_mode & 0o022:
+                    # it can't be trusted
+                    raise ValueError('the store is not private to the user')
+                # otherwise, unpickle its contents
+                version, entries = pickle.load(stream)
+        # if the store doesn't exist
+        except FileNotFoundError:
+            # there is nothing to load
+            return self
+        # if anything else goes wrong, the store is damaged or untrustworthy
+        except Exception as error:
+            # grab the journal
+            import journal
+            # let the user know
+            journal.debug('pyre.framework.cache').log(f"{self.uri}: ignored: {error}")
+            # and start over by leaving my entries alone
+            return self
+        # if the store was written by an incompatible version of the cache
+        if version != self.version:
+            # ignore it
+            return self
+
+        # entries recorded before this point in time have expired
+        horizon = time.time() - self.lifetime
+        # keep the ones that are still fresh
+        fresh = {key: entry for key, entry in entries.items() if entry[2] > horizon}
+        # if some of them expired
+        if len(fresh) < len(entries):
+            # mark me as modified so my store gets rewritten without them
+            self.modified = True
+        # use the rest
+        self.entries = fresh
+        # all done
+        return self
+
+
+    def save(self):
+        """
+        Write my entries to my persistent store, if they have changed since i loaded them
+        """
+        # if i am disabled or there is nothing new to save
+        if self.uri is None or not self.modified: return self
+        # build the name of a scratch file, so that concurrent processes never see a store
+        # that is partially written
+        scratch = '{}.{}'.format(self.uri, os.getpid())
+        # attempt to
+        try:
+            # make sure the folder exists; keep it private
+            os.makedirs(os.path.dirname(self.uri), mode=0o700, exist_ok=True)
+            # write the store
+            with open(scratch, 'wb') as stream:
+                pickle.dump((self.version, self.entries), stream, protocol=self.protocol)
+            # and move it into place
+            os.replace(scratch, self.uri)
+        # if anything goes wrong, the cache is a convenience, not a necessity
+        except Exception as error:
+            # grab the journal
+            import journal
+            # but the user should know why it isn't working
+            journal.warning('pyre.framework.cache').log(f"{self.uri}: could not save: {error}")
+            # clean up
+            try:
+                os.remove(scratch)
+            # quietly
+            except OSError:
+                pass
+        # either way, i'm done
+        self.modified = False
+        # all done
+        return self
+
+
+    def clear(self):
+        """
+        Discard all my entries
+        """
+        # clear out the entries
+        self.entries = {}
+        # and mark me as modified so my store gets overwritten
+        self.modified = True
+        # all done
+        return self
+
+
+    # meta-methods
+    def __init__(self, uri=None, disabled=False, **kwds):
+        # chain up
+        super().__init__(**kwds)
+        # the cached work
+        self.entries = {}
+        # indicator of whether the entries must be saved
+        self.modified = False
+        # if i have been disabled
+        if disabled:
+            # leave my store unset
+            return
+        # if the user hasn't told me where my store is
+        if uri is None:
+            # use the default location
+            uri = os.path.join(os.path.expanduser(self.home), self.filename)
+        # record it
+        self.uri = uri
+        # all done
+        return
+
+
+# end of file
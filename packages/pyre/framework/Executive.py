@@ -7,7 +7,7 @@
 
 
 # externals
-import re, weakref, operator, itertools
+import os, re, weakref, operator, itertools
 # primitives, locators
 from .. import primitives, tracking
 
@@ -41,6 +41,7 @@ class Executive:
     configurator = None # configuration sources and events
     linker = None # the pyre plug-in manager
     timekeeper = None # the timer registry
+    cache = None # the persistent store of the work done while booting
 
     # the runtime environment; patched during discovery
     host = None
@@ -366,6 +367,28 @@ class Executive:
 
 
     # the default factories of all my parts
+    def newCache(self, **kwds):
+        """
+        Build a new store for the work done while booting, or return {None} if caching is off
+        """
+        # the cache is off unless the user asks for it, either in the environment
+        enabled = os.environ.get('PYRE_CACHE', '').lower() not in {'', '0', 'no', 'off', 'false'}
+        # or in the main script
+        try:
+            import __main__
+            enabled = bool(__main__.pyre_cache)
+        # if it's not there
+        except AttributeError:
+            # carry on
+            pass
+        # if it's off, there is nothing to build, and nobody pays for it
+        if not enabled: return None
+        # otherwise, access the factory
+        from .Cache import Cache
+        # build one, load its contents, and return it
+        return Cache(**kwds).load()
+
+
     def newNameServer(self, **kwds):
         """
         Build a new name server
@@ -569,6 +592,10 @@ class Executive:
         """
         # my error pile is probably full of circular references
         self.errors = []
+        # if i have a cache
+        if self.cache is not None:
+            # save its contents for the next process
+            self.cache.save()
         # all done
         return self
 
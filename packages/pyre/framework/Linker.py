@@ -7,7 +7,7 @@
 
 
 # externals
-import collections
+import sys, collections
 
 
 # declaration
@@ -20,11 +20,17 @@ class Linker:
     # types
     from .exceptions import FrameworkError, ComponentNotFoundError, BadResourceLocatorError
     from ..schemata import uri
+    from ..filesystem.Folder import Folder as folder
 
 
     # public data
     codecs = None
     shelves = None
+    resolutions = None # the outcomes of earlier resolution requests
+    # instrumentation
+    requests = 0 # the number of resolution requests
+    hits = 0 # the number of requests that replayed the outcome of an earlier one
+    probes = 0 # the number of candidate shelves examined while resolving requests
 
 
     # support for framework requests
@@ -44,6 +50,76 @@ class Linker:
         """
         Attempt to locate the component class specified by {uri}
         """
+        # count the request
+        self.requests += 1
+        # build the key of the request
+        key = (uri.uri, protocol)
+        # and the stamp that captures the state of the places we are about to search
+        stamp = self.stamp(executive=executive)
+        # look for the outcome of an earlier attempt
+        outcome = self.resolutions.get(key)
+        # if there isn't one, or it is stale
+        if outcome is None or outcome[0] != stamp:
+            # make a new one: the descriptors found so far, the symbols the codecs extracted
+            # from the {uri}, and whether the search of the shelves was completed
+            outcome = (stamp, [], set(), [False])
+            # and remember it
+            self.resolutions[key] = outcome
+        # otherwise
+        else:
+            # we have a hit
+            self.hits += 1
+        # unpack
+        _, descriptors, symbols, complete = outcome
+
+        # start out by replaying the descriptors we have found already; careful: our caller
+        # may ask for more while we are working on it
+        for descriptor in descriptors:
+            # let the client evaluate it further
+            yield descriptor
+        # if the shelves have not been searched exhaustively
+        if not complete[0]:
+            # do it; the search is deterministic as long as the stamp hasn't changed, so skip
+            # the descriptors we have already seen
+            for index, descriptor in enumerate(self.search(
+                    executive=executive, uri=uri, protocol=protocol, symbols=symbols, **kwds)):
+                # if this is a new one
+                if index >= len(descriptors):
+                    # add it to the pile
+                    descriptors.append(descriptor)
+                    # and let the client evaluate it further
+                    yield descriptor
+            # mark the outcome as complete
+            complete[0] = True
+
+        # ok, no dice. can we get some help from the protocol?
+        if not protocol:
+            # not there; giving up
+            return
+
+        # we have exhausted all supported cases of looking at external sources; there is one
+        # more thing to try: in the process of interpreting the user request, we formed guesses
+        # regarding the name the user is looking for. perhaps there is an implementer of our
+        # protocol whose package name is the symbol we are looking for
+
+        # look through the protocol implementers
+        for implementer in executive.registrar.implementers[protocol]:
+            # get their package names
+            package = implementer.pyre_package()
+            # and yield ones whose package name matches our symbol candidates
+            if package and package.name in symbols:
+                # let the user evaluate further
+                yield implementer
+
+        # out of ideas
+        return
+
+
+    def search(self, executive, uri, protocol, symbols, **kwds):
+        """
+        Search the shelves that are relevant for {uri} for the descriptors it refers to; add
+        the symbol names the codecs extract from {uri} to {symbols}
+        """
         # get the scheme
         scheme = uri.scheme
 
@@ -63,7 +139,6 @@ class Linker:
         # each codec will interpret the uri and provide a hint as to what the user is looking
         # for; let's remember these attempts so we can try some non-obvious things when all
         # else fails
-        symbols = set()
 
         # go through the relevant codecs
         for codec in codecs:
@@ -95,27 +170,28 @@ class Linker:
                 # let the client evaluate it further
                 yield descriptor
 
-        # ok, no dice. can we get some help from the protocol?
-        if not protocol:
-            # not there; giving up
-            return
+        # all done
+        return
 
-        # we have exhausted all supported cases of looking at external sources; there is one
-        # more thing to try: in the process of interpreting the user request, we formed guesses
-        # regarding the name the user is looking for. perhaps there is an implementer of our
-        # protocol whose package name is the symbol we are looking for
 
-        # look through the protocol implementers
-        for implementer in executive.registrar.implementers[protocol]:
-            # get their package names
-            package = implementer.pyre_package()
-            # and yield ones whose package name matches our symbol candidates
-            if package and package.name in symbols:
-                # let the user evaluate further
-                yield implementer
+    def stamp(self, executive):
+        """
+        Build a stamp that captures the state of the places searched by resolution requests
+        """
+        # the candidate shelves depend on the current application, the contents of the
+        # virtual filesystem and the interpreter search path
+        return (
+            id(executive.dashboard.pyre_application), self.folder.revision, tuple(sys.path))
 
-        # out of ideas
-        return
+
+    def flush(self):
+        """
+        Discard the outcomes of all earlier resolution requests
+        """
+        # easy enough
+        self.resolutions.clear()
+        # all done
+        return self
 
 
     # meta-methods
@@ -125,6 +201,8 @@ class Linker:
 
         # the map from uris to known shelves
         self.shelves = {}
+        # the map from (uri, protocol) pairs to the outcomes of resolution requests
+        self.resolutions = {}
         # setup my default codecs and initialize my scheme index
         codecs, schemes = self.indexDefaultCodecs()
         # save them
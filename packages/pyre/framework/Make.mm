@@ -11,6 +11,7 @@ include pyre.def
 PACKAGE = framework
 # the python modules
 EXPORT_PYTHON_MODULES = \
+    Cache.py \
     Dashboard.py \
     Environ.py \
     Executive.py \
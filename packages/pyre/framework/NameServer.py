@@ -327,6 +327,8 @@ class NameServer(Hierarchical):
             destination = key[symbol]
             # make an alias
             source = top.alias(alias=symbol, target=destination)
+            # which invalidates the keys of the names that go through {symbol}
+            self.purgeKeys()
             # construct the global name for the symbol
             canonical = self.join(scope, symbol)
             # and try to
@@ -349,6 +351,8 @@ class NameServer(Hierarchical):
         super().__init__(**kwds)
         # record my name
         self._modelName = name
+        # initialize the cache of split names, indexed by separator and name
+        self._splits = {}
         # all done
         return
 
@@ -79,6 +79,9 @@ class Pyre(Executive):
         # attach me
         dashboard.pyre_executive = weakref.proxy(self)
 
+        # the store of the work done while booting
+        self.cache = self.newCache()
+
         # build my nameserver
         self.nameserver = self.newNameServer()
         # attach
@@ -28,6 +28,30 @@ class SlotInfo(NodeInfo):
     factory = None # the type information
 
 
+    # interface
+    @classmethod
+    def splitName(cls, model, name):
+        """
+        Split {name} into its levels using the separator of {model}
+        """
+        # the cache of split names belongs to {model}
+        splits = model._splits
+        # and the split depends on its separator as well as the name
+        tag = (model.separator, name)
+        # attempt to
+        try:
+            # look up the split in the cache
+            return splits[tag]
+        # if it's not there
+        except KeyError:
+            # split it
+            split = super().splitName(model=model, name=name)
+            # and remember it
+            splits[tag] = split
+        # all done
+        return split
+
+
     # meta-methods
     def __init__(self, priority=None, locator=None, factory=None, **kwds):
         # chain up
@@ -69,14 +69,14 @@ class Server(pyre.nexus.server, family='pyre.nexus.servers.http'):
         # get the application context
         application = self.application
         # show me
-        application.debug.log('reading data from {}'.format(channel.peer))
+        application.debug.log('reading data from {}', channel.peer)
         # get whatever data is available at this point
         chunk = channel.read(maxlen=self.MAX_BYTES)
 
         # if there was nothing to read
         if len(chunk) == 0:
             # show me
-            application.debug.log('connection from {} was closed'.format(channel.peer))
+            application.debug.log('connection from {} was closed', channel.peer)
             # close the connection
             channel.close()
             # check whether we know this peer
@@ -6,6 +6,22 @@
 #
 
 
+# externals
+import os
+
+
+# the largest number of buffers the scatter/gather calls accept; ask the system, and fall back
+# to {_XOPEN_IOV_MAX}, the smallest value allowed by POSIX, if it doesn't know
+try:
+    _iovmax = os.sysconf("SC_IOV_MAX")
+# if the name is not supported
+except (AttributeError, ValueError, OSError):
+    # use the minimum
+    _iovmax = 16
+# indeterminate values are reported as -1
+if _iovmax < 1: _iovmax = 16
+
+
 # declaration
 class Channel:
     """
@@ -66,4 +82,63 @@ class Channel:
             "class {.__name__!r} must implement 'write'".format(type(self)))
 
 
+    # scatter/gather input/output
+    def readv(self, buffers):
+        """
+        Fill the writable {buffers} in order with bytes from my input channel, and return the
+        number of bytes read; this is less than the total size of {buffers} only if the
+        channel was closed
+        """
+        raise NotImplementedError(
+            "class {.__name__!r} must implement 'readv'".format(type(self)))
+
+
+    def writev(self, buffers):
+        """
+        Write the contents of {buffers} to my output channel, in order, and return the number
+        of bytes written
+        """
+        raise NotImplementedError(
+            "class {.__name__!r} must implement 'writev'".format(type(self)))
+
+
+    # implementation details
+    # the largest number of buffers the scatter/gather calls accept
+    iovmax = _iovmax
+
+
+    @staticmethod
+    def views(buffers):
+        """
+        Build a list of flat byte views of {buffers}, skipping the empty ones
+        """
+        # make the views
+        views = (memoryview(buffer).cast('B') for buffer in buffers)
+        # and drop the empty ones
+        return [ view for view in views if view ]
+
+
+    @staticmethod
+    def advance(views, count):
+        """
+        Drop the first {count} bytes from the list of {views}
+        """
+        # go through the views
+        for index, view in enumerate(views):
+            # if this one is not fully consumed
+            if count < len(view):
+                # trim it
+                views[index] = view[count:]
+                # and drop the ones before it
+                del views[:index]
+                # all done
+                return views
+            # otherwise, account for it
+            count -= len(view)
+        # if we get this far, all the views were consumed
+        views.clear()
+        # all done
+        return views
+
+
 # end of file
@@ -24,7 +24,8 @@ class Dispatcher(pyre.protocol, family="pyre.ipc.dispatchers"):
         """
         The suggested implementation of the {Dispatcher} protocol
         """
-        # {Selector} is the only choice currently
+        # {Selector} works everywhere; applications that watch large numbers of channels
+        # should switch to {Poller}
         from .Selector import Selector
         return Selector
 
@@ -48,7 +49,14 @@ class Dispatcher(pyre.protocol, family="pyre.ipc.dispatchers"):
     def alarm(self, interval, call):
         """
         Schedule {call} to be invoked after {interval} elapses. {interval} is expected to be
-        a dimensional quantity from {pyre.units} with units of time
+        a dimensional quantity from {pyre.units} with units of time; returns a handle that can
+        be passed to {cancel}
+        """
+
+    @pyre.provides
+    def cancel(self, alarm):
+        """
+        Prevent {alarm}, a handle returned by {alarm}, from going off
         """
 
     @pyre.export
@@ -0,0 +1,217 @@
+# -*- coding: utf-8 -*-
+#
+# michael a.g. aïvázis
+# orthologue
+# (c) 1998-2018 all rights reserved
+#
+
+
+# externals
+import io
+import pyre
+import pickle
+import struct
+# my protocol
+from . import marshaler
+
+
+# out of band buffers are new in python 3.8
+_PickleBuffer = getattr(pickle, "PickleBuffer", None)
+
+
+# class declaration
+class Framer(pyre.component, family="pyre.ipc.marshalers.framer", implements=marshaler):
+    """
+    A marshaler that uses pickle protocol 5 to ship large binary payloads without copying them
+
+    {send} pickles an object with protocol 5 and collects the contiguous buffers that are
+    larger than {threshold}, such as the data of {numpy} arrays or large {bytes} and
+    {bytearray} instances, out of band. Protocol 5 and {pickle.PickleBuffer} need python 3.8
+    or newer; older interpreters fall back to their highest protocol, and only large {bytes}
+    and {bytearray} instances travel out of band. The message is a frame that consists of a prefix with
+    the size of the pickle and the number of buffers, a table with the size of each buffer,
+    the pickle itself and the raw contents of the buffers. The entire frame is handed to the
+    channel in a single scatter/gather call, so the buffers are never copied in user space.
+
+    {recv} reads the frame prefix and the table of buffer sizes, preallocates the pickle and
+    the buffers, and has the channel read the rest of the frame directly into them. The
+    buffers are then handed to the unpickler as the storage of the objects they came from, so
+    each byte of the payload is copied exactly once, by the kernel; the only exception is
+    {bytes} instances, which are immutable and must be copied out of their buffer.
+    """
+
+
+    # user configurable state
+    threshold = pyre.properties.int(default=64*1024)
+    threshold.doc = "the size in bytes of the smallest buffer that is sent out of band"
+
+
+    # public data
+    protocol = min(5, pickle.HIGHEST_PROTOCOL) # protocol 5 supports out of band buffers
+    packing = "<QL" # the struct format for encoding the pickle size and the number of buffers
+    prefixSize = struct.calcsize(packing)
+    sizing = "<{}Q" # the struct format for encoding the table of buffer sizes
+
+
+    # interface
+    @pyre.export
+    def send(self, item, channel):
+        """
+        Pack and ship {item} over {channel}
+        """
+        # build the frame and send it off
+        return channel.writev(buffers=self.frame(item=item))
+
+
+    @pyre.export
+    def recv(self, channel):
+        """
+        Extract and return a single item from {channel}
+        """
+        # get the prefix
+        prefix = self.fill(channel=channel, buffers=[bytearray(self.prefixSize)])[0]
+        # unpack it
+        length, count = struct.unpack(self.packing, prefix)
+        # get the table of buffer sizes
+        table = self.fill(channel=channel, buffers=[bytearray(8*count)])[0]
+        # unpack it
+        sizes = struct.unpack(self.sizing.format(count), table)
+        # make room for the pickle and the buffers, and fill them
+        body, *buffers = self.fill(
+            channel=channel, buffers=[bytearray(length)] + [bytearray(size) for size in sizes])
+        # extract the object and return it
+        return self._unpickler(io.BytesIO(body), payload=buffers).load()
+
+
+    # implementation details
+    def frame(self, item):
+        """
+        Pickle {item} and build the list of buffers that make up its frame
+        """
+        # make a stream for the pickle
+        stream = io.BytesIO()
+        # make a pickler
+        pickler = self._pickler(stream, protocol=self.protocol, threshold=self.threshold)
+        # pickle the item
+        pickler.dump(item)
+        # get the pickle without copying it
+        body = stream.getbuffer()
+        # and the out of band buffers
+        buffers = pickler.payload
+        # build the prefix and the table of buffer sizes
+        header = struct.pack(self.packing, len(body), len(buffers)) + struct.pack(
+            self.sizing.format(len(buffers)), *(len(buffer) for buffer in buffers))
+        # put it all together
+        return [header, body] + buffers
+
+
+    @staticmethod
+    def fill(channel, buffers):
+        """
+        Fill {buffers} with bytes from {channel}
+        """
+        # compute the number of bytes we expect
+        expected = sum(len(buffer) for buffer in buffers)
+        # read, unless there is nothing to read: zero bytes also signal a closed channel
+        if expected and channel.readv(buffers=buffers) < expected:
+            # if we got short changed, the channel is closed
+            raise EOFError("the channel was closed before the entire message arrived")
+        # all done
+        return buffers
+
+
+    # private types
+    class _pickler(pickle.Pickler):
+        """
+        A pickler that sets aside large buffers for out of band transfer
+
+        The buffers are replaced in the pickle by persistent ids, since the pickler consults
+        {persistent_id} before its fast paths for {bytes} and {bytearray}
+        """
+
+        def persistent_id(self, obj):
+            """
+            Set aside {obj} if it is a large enough contiguous buffer
+            """
+            # get the type of {obj}
+            kind = type(obj)
+            # binary strings
+            if kind is bytes or kind is bytearray:
+                # are always contiguous
+                view = memoryview(obj)
+                # and get rebuilt with their own type
+                tag = kind.__name__
+            # the buffers exposed by objects that support out of band transfer, if any
+            elif kind is _PickleBuffer:
+                # attempt to
+                try:
+                    # get a flat view
+                    view = obj.raw()
+                # if the buffer is not contiguous
+                except BufferError:
+                    # leave it in the pickle
+                    return None
+                # they get rebuilt as buffers with the same access
+                tag = "readonly" if view.readonly else "writable"
+            # everything else
+            else:
+                # goes in the pickle
+                return None
+            # if it is too small to be worth the trouble
+            if len(view) < self.threshold:
+                # leave it in the pickle
+                return None
+            # if i have seen it before
+            pid = self.seen.get(id(obj))
+            # reuse its id
+            if pid is not None: return pid
+            # otherwise, build one
+            pid = self.seen[id(obj)] = (tag, len(self.payload))
+            # save the buffer
+            self.payload.append(view)
+            # and return the id
+            return pid
+
+        def __init__(self, stream, threshold, **kwds):
+            # chain up
+            super().__init__(stream, **kwds)
+            # the size of the smallest buffer worth sending out of band
+            self.threshold = threshold
+            # the buffers set aside, and their ids
+            self.payload = []
+            self.seen = {}
+            # all done
+            return
+
+
+    class _unpickler(pickle.Unpickler):
+        """
+        An unpickler that rebuilds the buffers that were sent out of band
+        """
+
+        def persistent_load(self, pid):
+            """
+            Rebuild an out of band buffer
+            """
+            # unpack
+            tag, index = pid
+            # get the buffer
+            buffer = self.payload[index]
+            # binary strings are immutable, so they must be copied out of the buffer
+            if tag == "bytes": return bytes(buffer)
+            # read-only buffers are exposed through read-only views; these can only come from
+            # {pickle.PickleBuffer}, so {toreadonly} is available
+            if tag == "readonly": return memoryview(buffer).toreadonly()
+            # everything else adopts the buffer as is
+            return buffer
+
+        def __init__(self, stream, payload, **kwds):
+            # chain up
+            super().__init__(stream, **kwds)
+            # save the out of band buffers
+            self.payload = payload
+            # all done
+            return
+
+
+# end of file
@@ -0,0 +1,525 @@
+# -*- coding: utf-8 -*-
+#
+# michael a.g. aïvázis
+# orthologue
+# (c) 1998-2018 all rights reserved
+#
+
+
+# externals
+import pyre
+import asyncio
+# my interface
+from . import dispatcher
+
+
+# declaration
+class Loop(pyre.component, family='pyre.ipc.dispatchers.loop', implements=dispatcher):
+    """
+    An event demultiplexer that runs on top of an {asyncio} event loop
+
+    {Loop} maps the {Dispatcher} interface onto the services of an {asyncio} event loop, so
+    that pyre channels, services and alarms can share the loop with {asyncio} based libraries.
+    Read and write notifications are mapped onto {add_reader} and {add_writer}, and alarms onto
+    {call_at}. In addition, {Loop} provides awaitable versions of the channel input and output
+    operations, and can run coroutines on behalf of its clients, so that event handlers can be
+    written as coroutines.
+
+    The event loop is built on first use, unless the client supplies one by setting {loop};
+    if {uvloop} is set and the package is available, the new loop comes from {uvloop}. If the
+    loop is already running, e.g. because the application is driven by {asyncio}, there is
+    no need to call {watch}: the handlers are invoked by the running loop.
+    """
+
+
+    # constants
+    from pyre.units.SI import second
+
+
+    # user configurable state
+    uvloop = pyre.properties.bool(default=False)
+    uvloop.doc = "build the event loop using {uvloop}, if it is available"
+
+
+    # public data
+    @property
+    def loop(self):
+        """
+        The {asyncio} event loop that runs my handlers
+        """
+        # if i don't have one yet
+        if self._loop is None:
+            # attempt to
+            try:
+                # use the one that is running, if any
+                self._loop = asyncio.get_running_loop()
+            # if there isn't one
+            except RuntimeError:
+                # make one
+                self._loop = self.newLoop()
+        # all done
+        return self._loop
+
+    @loop.setter
+    def loop(self, loop):
+        """
+        Attach me to the given {asyncio} event {loop}
+        """
+        # save it
+        self._loop = loop
+        # all done
+        return
+
+
+    # interface
+    @pyre.export
+    def whenReadReady(self, channel, call):
+        """
+        Add {call} to the list of routines to call when {channel} is ready to be read
+        """
+        # get the loop
+        loop = self.loop
+        # add it to the pile
+        self.register(
+            index=self._read, fd=channel.inbound, channel=channel, call=call,
+            add=loop.add_reader, remove=loop.remove_reader)
+        # and return
+        return
+
+
+    @pyre.export
+    def whenWriteReady(self, channel, call):
+        """
+        Add {call} to the list of routines to call when {channel} is ready to be written
+        """
+        # get the loop
+        loop = self.loop
+        # add it to the pile
+        self.register(
+            index=self._write, fd=channel.outbound, channel=channel, call=call,
+            add=loop.add_writer, remove=loop.remove_writer)
+        # and return
+        return
+
+
+    @pyre.export
+    def whenException(self, channel, call):
+        """
+        Add {call} to the list of routines to call when something exceptional has happened
+        to {channel}
+        """
+        # {asyncio} does not report exceptional conditions on file descriptors; errors and
+        # hangups make the descriptor ready for reading and writing, so they reach the handlers
+        # registered through {whenReadReady} and {whenWriteReady} instead. There is no way to
+        # deliver this registration, but it shouldn't keep clients from switching to me, so
+        # let the user know the first time around
+        if not self._ignoring:
+            # grab the journal
+            import journal
+            # complain
+            journal.warning('pyre.ipc.loop').log(
+                "asyncio does not report exceptional conditions; ignoring 'whenException'")
+            # and remember not to do it again
+            self._ignoring = True
+        # all done
+        return
+
+
+    @pyre.export
+    def alarm(self, interval, call):
+        """
+        Schedule {call} to be invoked after {interval} elapses.
+
+        parameters:
+           {call}: a function that takes the current time and returns a reschedule interval
+           {interval}: a dimensional quantity from {pyre.units} with units of time
+
+        The return value is a handle that can be passed to {cancel}
+        """
+        # make an alarm
+        alarm = self._alarm(handler=call)
+        # schedule it
+        self.schedule(alarm=alarm, interval=interval)
+        # and return it
+        return alarm
+
+
+    @pyre.export
+    def cancel(self, alarm):
+        """
+        Prevent {alarm}, a handle returned by {alarm}, from going off
+        """
+        # if the alarm is not pending
+        if alarm not in self._alarms:
+            # there is nothing to do
+            return
+        # otherwise, cancel the timer
+        alarm.timer.cancel()
+        # forget it
+        self._alarms.discard(alarm)
+        # and check whether there is anything left to do
+        self.check()
+        # all done
+        return
+
+
+    @pyre.export
+    def stop(self):
+        """
+        Request the dispatcher to stop watching for further events
+        """
+        # if i am watching
+        if self._done is not None and not self._done.done():
+            # let {watch} know
+            self._done.set_result(None)
+        # and return
+        return
+
+
+    @pyre.export
+    def watch(self):
+        """
+        Run the event loop until {stop} is called, or until there are no registered handlers,
+        alarms or coroutines left
+        """
+        # if there is nothing to do
+        if self.idle():
+            # bail
+            return
+        # get the loop
+        loop = self.loop
+        # make a future that gets resolved when it's time to stop
+        self._done = loop.create_future()
+        # carefully
+        try:
+            # run the loop until then
+            loop.run_until_complete(self._done)
+        # no matter what happens
+        finally:
+            # forget the future
+            self._done = None
+        # all done
+        return
+
+
+    # coroutine support
+    def spawn(self, coroutine):
+        """
+        Run {coroutine} in my event loop; {watch} keeps going until it is done, and any
+        exceptions it raises are propagated to the caller of {watch}
+        """
+        # make a task
+        task = self.loop.create_task(coroutine)
+        # add it to the pile
+        self._tasks.add(task)
+        # ask to be notified when it's done
+        task.add_done_callback(self.retire)
+        # and return it
+        return task
+
+
+    def readable(self, channel):
+        """
+        Build a future that is resolved when {channel} is ready to be read
+        """
+        # make a future
+        future = self.loop.create_future()
+        # register a handler that resolves it
+        self.whenReadReady(channel=channel, call=self.resolver(future=future))
+        # and return it
+        return future
+
+
+    def writable(self, channel):
+        """
+        Build a future that is resolved when {channel} is ready to be written
+        """
+        # make a future
+        future = self.loop.create_future()
+        # register a handler that resolves it
+        self.whenWriteReady(channel=channel, call=self.resolver(future=future))
+        # and return it
+        return future
+
+
+    async def read(self, channel, minlen=0, maxlen=4*1024):
+        """
+        Read at least {minlen} and at most {maxlen} bytes from {channel} without blocking the
+        event loop; fewer than {minlen} bytes are returned only if the channel is closed
+        """
+        # adjust the inputs
+        if maxlen < minlen: maxlen = minlen
+        # reset the byte count
+        total = 0
+        # initialize the packet pile
+        packets = []
+        # for as long as it takes
+        while True:
+            # wait until there is something to read
+            await self.readable(channel=channel)
+            # pull whatever is available from the channel
+            packet = channel.read(maxlen=maxlen-total)
+            # if we got nothing, the channel is closed; bail
+            if not packet: break
+            # otherwise, update the total
+            total += len(packet)
+            # and save the packet
+            packets.append(packet)
+            # if we have reached our goal, bail
+            if total >= minlen: break
+        # assemble the byte string and return it
+        return b''.join(packets)
+
+
+    async def write(self, channel, bstr):
+        """
+        Write the bytes in {bstr} to {channel} without blocking the event loop
+        """
+        # wait until the channel can take more data
+        await self.writable(channel=channel)
+        # and write
+        return channel.write(bstr)
+
+
+    # meta methods
+    def __init__(self, **kwds):
+        # chain up
+        super().__init__(**kwds)
+        # my file descriptor event indices
+        self._read = {}
+        self._write = {}
+        # the pending alarms
+        self._alarms = set()
+        # and the running coroutines
+        self._tasks = set()
+        # all done
+        return
+
+
+    # implementation details
+    def newLoop(self):
+        """
+        Build a new event loop
+        """
+        # if the user asked for {uvloop}
+        if self.uvloop:
+            # attempt to
+            try:
+                # get it
+                import uvloop
+            # if it's not available
+            except ImportError:
+                # complain
+                import journal
+                journal.warning('pyre.ipc.loop').log(
+                    "could not import the uvloop module; falling back to asyncio")
+            # if all went well
+            else:
+                # use it
+                return uvloop.new_event_loop()
+        # otherwise, make a regular one
+        return asyncio.new_event_loop()
+
+
+    def register(self, index, fd, channel, call, add, remove):
+        """
+        Add an event with {channel} and {call} to the pile for {fd} in {index}, and ask the
+        event loop to watch {fd} if this is the first event
+        """
+        # the event loop indexes its callbacks by descriptor number, so convert file objects
+        if not isinstance(fd, int): fd = fd.fileno()
+        # make the event
+        event = self._event(channel=channel, handler=call)
+        # look for the pile of events for this descriptor
+        events = index.get(fd)
+        # if it's there
+        if events is not None:
+            # add this one
+            events.append(event)
+            # and we are done
+            return
+        # otherwise, start a new pile
+        index[fd] = [event]
+        # and ask the loop to watch the descriptor
+        add(fd, self.dispatch, index, fd, add, remove)
+        # all done
+        return
+
+
+    def dispatch(self, index, fd, add, remove):
+        """
+        Invoke the handlers registered in {index} for {fd}
+        """
+        # grab the events; handlers may register new ones while they run, so take them out
+        # of the index before invoking them
+        events = index.pop(fd, [])
+        # invoke the event handlers and save the events whose handlers return {True}
+        try:
+            survivors = [ event for event in events if event.handler(channel=event.channel) ]
+        # if anything goes wrong
+        except BaseException as error:
+            # stop the loop and let the caller of {watch} deal with it
+            self.fail(error=error)
+            # and don't watch this descriptor any more
+            survivors = []
+        # get any new events registered by the handlers
+        newcomers = index.pop(fd, [])
+        # if everybody asked to be rescheduled and there is nobody new
+        if events and len(survivors) == len(events) and not newcomers:
+            # put them back; the registration with the event loop is still valid
+            index[fd] = survivors
+            # all done
+            return
+        # otherwise, the registration must be refreshed: handlers that declined to be
+        # rescheduled may have closed the descriptor, and its number may have been recycled
+        remove(fd)
+        # combine the survivors with the new events
+        survivors.extend(newcomers)
+        # if there is anybody left
+        if survivors:
+            # reschedule them
+            index[fd] = survivors
+            # and ask the loop to watch the descriptor again
+            add(fd, self.dispatch, index, fd, add, remove)
+        # check whether there is anything left to do
+        self.check()
+        # all done
+        return
+
+
+    def schedule(self, alarm, interval):
+        """
+        Arrange for {alarm} to go off after {interval}
+        """
+        # get the loop
+        loop = self.loop
+        # schedule the timer
+        alarm.timer = loop.call_at(loop.time() + interval/self.second, self.ring, alarm)
+        # and add the alarm to the pile
+        self._alarms.add(alarm)
+        # all done
+        return
+
+
+    def ring(self, alarm):
+        """
+        Invoke the handler of {alarm}, and reschedule it if necessary
+        """
+        # the alarm is no longer pending
+        self._alarms.discard(alarm)
+        # carefully
+        try:
+            # invoke the handler
+            delta = alarm.handler(timestamp=self.loop.time())
+        # if anything goes wrong
+        except BaseException as error:
+            # stop the loop and let the caller of {watch} deal with it
+            self.fail(error=error)
+            # and don't reschedule
+            delta = None
+        # if the handler indicated that it wants to reschedule this alarm
+        if delta:
+            # do it; reusing the alarm keeps the handle held by the client valid
+            self.schedule(alarm=alarm, interval=delta)
+        # check whether there is anything left to do
+        self.check()
+        # all done
+        return
+
+
+    def retire(self, task):
+        """
+        Clean up after a coroutine is done
+        """
+        # remove it from the pile
+        self._tasks.discard(task)
+        # if it raised an exception
+        if not task.cancelled() and task.exception() is not None:
+            # stop the loop and let the caller of {watch} deal with it
+            self.fail(error=task.exception())
+        # check whether there is anything left to do
+        self.check()
+        # all done
+        return
+
+
+    def resolver(self, future):
+        """
+        Build an event handler that resolves {future}
+        """
+        # the handler
+        def resolve(channel):
+            # unless the waiter gave up
+            if not future.done():
+                # let it know the channel is ready
+                future.set_result(channel)
+            # and don't reschedule
+            return False
+        # return the handler
+        return resolve
+
+
+    def idle(self):
+        """
+        Check whether there is nothing left for me to do
+        """
+        # easy enough
+        return not (self._read or self._write or self._alarms or self._tasks)
+
+
+    def check(self):
+        """
+        Stop watching if there is nothing left to do
+        """
+        # if there is nothing left
+        if self.idle():
+            # stop
+            self.stop()
+        # all done
+        return
+
+
+    def fail(self, error):
+        """
+        Stop watching and report {error} to the caller of {watch}
+        """
+        # if i am watching
+        if self._done is not None and not self._done.done():
+            # hand the error to {watch}
+            self._done.set_exception(error)
+            # all done
+            return
+        # otherwise, there is nobody to report the error to, so let the loop deal with it
+        raise error
+
+
+    # private types
+    class _event:
+        """Encapsulate a channel and the associated call-back"""
+
+        def __init__(self, channel, handler):
+            self.channel = channel
+            self.handler = handler
+            return
+
+        __slots__ = ('channel', 'handler')
+
+
+    class _alarm:
+        """Encapsulate the event handler of an alarm and its timer"""
+
+        def __init__(self, handler):
+            self.handler = handler
+            self.timer = None
+            return
+
+        __slots__ = ('handler', 'timer')
+
+
+    # private data
+    _loop = None # the event loop
+    _done = None # the future that {watch} waits on
+    _ignoring = False # whether i have warned that exception handlers are ignored
+
+
+# end of file
@@ -13,11 +13,15 @@ PACKAGE = ipc
 EXPORT_PYTHON_MODULES = \
     Channel.py \
     Dispatcher.py \
+    Framer.py \
+    Loop.py \
     Marshaler.py \
     Pickler.py \
     Pipe.py \
+    Poller.py \
     Port.py \
     PortTCP.py \
+    Ring.py \
     Scheduler.py \
     Selector.py \
     Socket.py \
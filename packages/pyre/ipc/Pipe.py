@@ -105,6 +105,48 @@ class Pipe(Channel):
         return os.write(self.outfd, bstr)
 
 
+    def readv(self, buffers):
+        """
+        Fill the writable {buffers} in order with bytes from my input channel
+        """
+        # get flat views of the buffers
+        views = self.views(buffers)
+        # reset the byte count
+        total = 0
+        # for as long as there is room
+        while views:
+            # pull something from the channel straight into the buffers
+            got = os.readv(self.infd, views[:self.iovmax])
+            # if we got nothing, the channel is closed; bail
+            if got == 0: break
+            # otherwise, update the total
+            total += got
+            # and skip past the filled part of the buffers
+            self.advance(views, got)
+        # return the number of bytes read
+        return total
+
+
+    def writev(self, buffers):
+        """
+        Write the contents of {buffers} to my output channel, in order
+        """
+        # get flat views of the buffers
+        views = self.views(buffers)
+        # reset the byte count
+        total = 0
+        # for as long as there is something to send
+        while views:
+            # send as much as the channel will take
+            sent = os.writev(self.outfd, views[:self.iovmax])
+            # update the total
+            total += sent
+            # and skip past the part that was sent
+            self.advance(views, sent)
+        # return the number of bytes written
+        return total
+
+
     # meta methods
     def __init__(self, infd, outfd, **kwds):
         # chain up
@@ -0,0 +1,358 @@
+# -*- coding: utf-8 -*-
+#
+# michael a.g. aïvázis
+# orthologue
+# (c) 1998-2018 all rights reserved
+#
+
+
+# externals
+import os
+import pyre
+import select
+import collections
+# my interface
+from . import dispatcher
+# my base class
+from .Scheduler import Scheduler
+
+
+# declaration
+class Poller(Scheduler, family='pyre.ipc.dispatchers.poller', implements=dispatcher):
+    """
+    An event demultiplexer implemented using {epoll}, or {poll} on platforms that don't have it
+
+    {Poller} is a drop in replacement for {Selector} that scales to large numbers of channels.
+    Channels are registered with the kernel once, and their registrations are updated only
+    when the set of events of interest changes, so the cost of each pass through the event
+    loop depends on the number of active channels rather than the number of registered ones.
+    There is also no limit on the value of the file descriptors it can watch.
+
+    If {edge} is set and {epoll} is available, channels are registered for edge triggered
+    notifications: the handlers are invoked only when new data arrive, so they must consume
+    everything that is available before returning. Handlers that leave data in their channel
+    will not hear about it again until more data arrive.
+    """
+
+
+    # user configurable state
+    edge = pyre.properties.bool(default=False)
+    edge.doc = "request edge triggered notifications, if the platform supports them"
+
+
+    # interface
+    @pyre.export
+    def whenReadReady(self, channel, call):
+        """
+        Add {call} to the list of routines to call when {channel} is ready to be read
+        """
+        # add it to the pile
+        self.register(index=self._read, fd=channel.inbound, channel=channel, call=call)
+        # and return
+        return
+
+
+    @pyre.export
+    def whenWriteReady(self, channel, call):
+        """
+        Add {call} to the list of routines to call when {channel} is ready to be written
+        """
+        # add it to the pile
+        self.register(index=self._write, fd=channel.outbound, channel=channel, call=call)
+        # and return
+        return
+
+
+    @pyre.export
+    def whenException(self, channel, call):
+        """
+        Add {call} to the list of routines to call when something exceptional has happened
+        to {channel}
+        """
+        # add both endpoints to the pile
+        self.register(index=self._exception, fd=channel.inbound, channel=channel, call=call)
+        self.register(index=self._exception, fd=channel.outbound, channel=channel, call=call)
+        # and return
+        return
+
+
+    @pyre.export
+    def stop(self):
+        """
+        Request the poller to stop watching for further events
+        """
+        # adjust my state
+        self._watching = False
+        # and return
+        return
+
+
+    @pyre.export
+    def watch(self):
+        """
+        Enter an indefinite loop of monitoring all registered event sources and invoking the
+        registered event handlers
+        """
+        # reset my state
+        self._watching = True
+        # cache my debug channel
+        debug = self._debug
+        # until someone says otherwise
+        while self._watching:
+            # bring the kernel up to date with the changes in the registrations
+            self.update()
+            # compute how long i am allowed to be asleep
+            timeout = self.poll()
+
+            # check for indefinite block
+            if not self._masks and timeout is None:
+                # show me
+                debug.log('** no registered handlers left; exiting')
+                # and bail
+                return
+
+            # show me; check first, so that a disabled channel costs nothing on every pass
+            if debug:
+                debug.log('polling {} descriptors; timeout={!r}', len(self._masks), timeout)
+            # wait for an event
+            try:
+                events = self.wait(timeout=timeout)
+            # when a signal is delivered to a handler registered by the application, the wait
+            # is interrupted and raises {InterruptedError}, a subclass of {OSError}
+            except InterruptedError as error:
+                # show me
+                debug.log('signal received: errno={}: {}', error.errno, error.strerror)
+                # keep going
+                continue
+
+            # show me
+            if debug: debug.log('activity detected on {} descriptors', len(events))
+            # dispatch to the handlers of file events
+            self.dispatch(events=events)
+            # raise the overdue alarms
+            self.awaken()
+
+        # all done
+        return
+
+
+    def dispatch(self, events):
+        """
+        Invoke the handlers associated with the descriptors in {events}, a list of pairs of
+        descriptors and event masks
+        """
+        # get the event bits
+        pri, out, inp, hup = self._PRI, self._OUT, self._IN, self._HUP
+        # go through the active descriptors
+        for fd, mask in events:
+            # if the descriptor was closed without being unregistered
+            if mask & self._NVAL:
+                # forget everything about it
+                self._read.pop(fd, None)
+                self._write.pop(fd, None)
+                self._exception.pop(fd, None)
+                # make sure it gets removed
+                self._dirty.add(fd)
+                # and move on
+                continue
+            # hang ups and errors are of interest to everybody
+            if mask & hup: mask |= pri | out | inp
+            # exceptional conditions
+            if mask & pri: self.invoke(index=self._exception, fd=fd)
+            # ready to write
+            if mask & out: self.invoke(index=self._write, fd=fd)
+            # ready to read
+            if mask & inp: self.invoke(index=self._read, fd=fd)
+        # all done
+        return
+
+
+    # implementation details
+    def register(self, index, fd, channel, call):
+        """
+        Add an event with {channel} and {call} to the pile for {fd} in {index}
+        """
+        # the kernel reports activity by descriptor number, so convert file objects
+        if not isinstance(fd, int): fd = fd.fileno()
+        # add it to the pile
+        index[fd].append(self._event(channel=channel, handler=call))
+        # and mark the descriptor for an update
+        self._dirty.add(fd)
+        # all done
+        return
+
+
+    def invoke(self, index, fd):
+        """
+        Invoke the handlers registered in {index} for {fd}
+        """
+        # grab the events; handlers may register new ones while they run, so take them out
+        # of the index before invoking them
+        events = index.pop(fd, None)
+        # if there aren't any, we are done
+        if not events: return
+        # invoke the event handlers and save the events whose handlers return {True}
+        survivors = [ event for event in events if event.handler(channel=event.channel) ]
+        # get any new events registered by the handlers
+        newcomers = index.pop(fd, [])
+        # if everybody asked to be rescheduled and there is nobody new
+        if len(survivors) == len(events) and not newcomers:
+            # put them back; the registration with the kernel is still valid
+            index[fd] = survivors
+            # all done
+            return
+        # otherwise, combine them
+        survivors.extend(newcomers)
+        # if there is anybody left
+        if survivors:
+            # reschedule them
+            index[fd] = survivors
+        # either way, the registration must be updated; note that handlers that declined to be
+        # rescheduled may have closed the descriptor, and its number may have been recycled by
+        # the time we get to update it
+        self._dirty.add(fd)
+        # all done
+        return
+
+
+    def update(self):
+        """
+        Adjust the registrations of the descriptors that have changed
+        """
+        # if i was inherited from another process
+        if self._pid != os.getpid():
+            # make a fresh kernel object and register everybody again
+            self.reset()
+        # get the descriptors that have changed
+        dirty = self._dirty
+        # if there aren't any, we are done
+        if not dirty: return
+        # get the kernel object
+        poller = self._poller
+        # get the event bits
+        pri, out, inp = self._PRI, self._OUT, self._IN
+        # and the flags that decorate the registrations
+        flags = select.EPOLLET if self.edge and self._epoll else 0
+        # go through them
+        for fd in dirty:
+            # compute the set of interesting events
+            mask = (
+                (inp if fd in self._read else 0) |
+                (out if fd in self._write else 0) |
+                (pri if fd in self._exception else 0))
+            # if there aren't any
+            if not mask:
+                # forget the descriptor
+                self._masks.pop(fd, None)
+                # attempt to
+                try:
+                    # remove it from the kernel object
+                    poller.unregister(fd)
+                # if it is not registered, or it has been closed already
+                except (KeyError, OSError):
+                    # no worries
+                    pass
+                # move on
+                continue
+            # decorate it
+            mask |= flags
+            # attempt to
+            try:
+                # modify the existing registration
+                poller.modify(fd, mask)
+            # if the descriptor is not registered with the kernel, either because it's new or
+            # because it was closed and then recycled
+            except FileNotFoundError:
+                # register it
+                poller.register(fd, mask)
+            # record the mask
+            self._masks[fd] = mask
+        # reset the pile
+        dirty.clear()
+        # all done
+        return
+
+
+    def reset(self):
+        """
+        Build a new kernel object and mark all descriptors for registration
+        """
+        # if i have a kernel object that can be closed
+        if self._poller is not None and hasattr(self._poller, "close"):
+            # close it
+            self._poller.close()
+        # build a new one
+        self._poller = self._epoll() if self._epoll else select.poll()
+        # i am not watching anything
+        self._masks = {}
+        # all descriptors with events need to be registered
+        self._dirty.update(self._read, self._write, self._exception)
+        # record the process that owns the kernel object
+        self._pid = os.getpid()
+        # all done
+        return
+
+
+    def wait(self, timeout):
+        """
+        Wait for at most {timeout} seconds for activity on any of the registered descriptors
+        """
+        # if i have {epoll}
+        if self._epoll:
+            # it takes the timeout in seconds, and -1 means forever
+            return self._poller.poll(-1 if timeout is None else timeout)
+        # otherwise, {poll} takes milliseconds, and {None} means forever
+        return self._poller.poll(None if timeout is None else 1000*timeout)
+
+
+    # meta methods
+    def __init__(self, **kwds):
+        # chain up
+        super().__init__(**kwds)
+
+        # my file descriptor event indices
+        self._read = collections.defaultdict(list)
+        self._write = collections.defaultdict(list)
+        self._exception = collections.defaultdict(list)
+        # the descriptors whose registrations must be updated
+        self._dirty = set()
+        # the event masks of the registered descriptors
+        self._masks = {}
+        # build the kernel object
+        self.reset()
+
+        # my debug aspect
+        import journal
+        self._debug = journal.debug('pyre.ipc.poller')
+
+        # all done
+        return
+
+
+    # private types
+    class _event:
+        """Encapsulate a channel and the associated call-back"""
+
+        def __init__(self, channel, handler):
+            self.channel = channel
+            self.handler = handler
+            return
+
+        __slots__ = ('channel', 'handler')
+
+
+    # constants; the {poll} and {epoll} event bits have the same values
+    _epoll = getattr(select, "epoll", None)
+    _IN = select.POLLIN
+    _OUT = select.POLLOUT
+    _PRI = select.POLLPRI
+    _HUP = select.POLLHUP | select.POLLERR
+    _NVAL = select.POLLNVAL
+
+    # private data
+    _pid = None # the process that owns the kernel object
+    _poller = None # the kernel object
+    _watching = True # controls whether to continue monitoring the event sources
+
+
+# end of file
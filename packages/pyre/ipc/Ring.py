@@ -0,0 +1,356 @@
+# -*- coding: utf-8 -*-
+#
+# michael a.g. aïvázis
+# orthologue
+# (c) 1998-2018 all rights reserved
+#
+
+
+# externals
+import os
+import mmap
+import select
+import struct
+
+from .Channel import Channel
+
+
+# declaration
+class Ring(Channel):
+    """
+    A channel between processes on the same host that moves data through ring buffers in
+    shared memory
+
+    A pair of rings is built by {open} on top of an anonymous shared memory map, and the two
+    end points are shared with another process by forking. Each direction has a ring buffer
+    and two doorbells, small pipes that carry byte counts: the writer copies data into the ring
+    and announces the total number of bytes it has written on the first doorbell, and the
+    reader copies data out of the ring and reports the total number of bytes it has consumed
+    on the second one. Since the counters travel through the kernel, the two processes see
+    each other's memory accesses in the right order without any further synchronization.
+
+    Payloads are copied into and out of the ring at memory bandwidth, and each write costs a
+    couple of system calls regardless of its size, rather than one per pipe buffer. The read
+    end of the data doorbell serves as my {inbound} end point, so rings can be watched by the
+    dispatchers: notifications are delivered for each write, so handlers must consume
+    everything that was written in one write before returning, as the marshalers do.
+    """
+
+
+    # public data
+    capacity = 8*1024*1024 # the default size of each ring buffer, in bytes
+    packing = "<Q" # the struct format of the doorbell counters
+    counterSize = struct.calcsize(packing)
+
+
+    # interface
+    # life cycle management
+    @classmethod
+    def open(cls, capacity=capacity, **kwds):
+        """
+        Build a pair of rings that are suitable for bidirectional communication between two
+        processes
+        """
+        # allocate the shared memory for both rings; anonymous maps are shared with children
+        memory = mmap.mmap(-1, 2*capacity)
+        # build the doorbells; one pipe to announce data and one to report freed space, for
+        # each direction
+        from_child, to_parent = os.pipe()
+        from_parent, to_child = os.pipe()
+        freed_by_child, child_frees = os.pipe()
+        freed_by_parent, parent_frees = os.pipe()
+        # nobody should ever block on the space reports: writers wait for them explicitly,
+        # and readers skip them when the pipe is full
+        for fd in (freed_by_child, child_frees, freed_by_parent, parent_frees):
+            os.set_blocking(fd, False)
+        # dress them up as {Ring} instances
+        parent = cls(
+            memory=memory, capacity=capacity, inbox=capacity, outbox=0,
+            infd=from_child, outfd=to_child, freedfd=freed_by_child, releasefd=parent_frees,
+            **kwds)
+        child = cls(
+            memory=memory, capacity=capacity, inbox=0, outbox=capacity,
+            infd=from_parent, outfd=to_parent, freedfd=freed_by_parent, releasefd=child_frees,
+            **kwds)
+        # and return them
+        return parent, child
+
+
+    def close(self):
+        """
+        Shut down this channel
+        """
+        # close my descriptors
+        os.close(self.infd)
+        os.close(self.outfd)
+        os.close(self.freedfd)
+        os.close(self.releasefd)
+        # release my views of the shared memory
+        self.inbox.release()
+        self.outbox.release()
+        # and return
+        return
+
+
+    # access to the individual channel end points
+    @property
+    def inbound(self):
+        """
+        Retrieve the channel end point that can be read
+        """
+        # easy enough
+        return self.infd
+
+
+    @property
+    def outbound(self):
+        """
+        Retrieve the channel end point that can be written
+        """
+        # easy enough
+        return self.outfd
+
+
+    # input/output
+    def read(self, minlen=0, maxlen=64*1024):
+        """
+        Read {count} bytes from my input channel
+        """
+        # adjust the inputs
+        if maxlen < minlen: maxlen = minlen
+        # make room
+        buffer = bytearray(maxlen)
+        # fill it
+        total = self.pull(views=[memoryview(buffer)], minlen=max(minlen, 1))
+        # trim it
+        del buffer[total:]
+        # and return it
+        return bytes(buffer)
+
+
+    def write(self, bstr):
+        """
+        Write the bytes in {bstr} to my output channel
+        """
+        # easy enough
+        return self.push(views=self.views([bstr]))
+
+
+    def readv(self, buffers):
+        """
+        Fill the writable {buffers} in order with bytes from my input channel
+        """
+        # get flat views of the buffers
+        views = self.views(buffers)
+        # fill them
+        return self.pull(views=views, minlen=sum(len(view) for view in views))
+
+
+    def writev(self, buffers):
+        """
+        Write the contents of {buffers} to my output channel, in order
+        """
+        # easy enough
+        return self.push(views=self.views(buffers))
+
+
+    # meta methods
+    def __init__(
+            self, memory, capacity, inbox, outbox, infd, outfd, freedfd, releasefd, **kwds):
+        # chain up
+        super().__init__(**kwds)
+        # my shared memory
+        self.memory = memory
+        self.capacity = capacity
+        # large writes are announced in pieces of this size, so the reader can drain the ring
+        # while it is being filled; freed space is reported in pieces of the same size
+        self.stride = max(capacity // 4, 1)
+        # my views of the two rings
+        self.inbox = memoryview(memory)[inbox:inbox+capacity]
+        self.outbox = memoryview(memory)[outbox:outbox+capacity]
+        # my doorbells
+        self.infd = infd
+        self.outfd = outfd
+        self.freedfd = freedfd
+        self.releasefd = releasefd
+        # the total number of bytes i have written, announced and know to have been consumed
+        self.head = 0
+        self.announced = 0
+        self.freed = 0
+        # the total number of bytes i have read, reported and know have been written
+        self.tail = 0
+        self.released = 0
+        self.known = 0
+        # for waiting on the space reports
+        self.waiter = select.poll()
+        self.waiter.register(freedfd, select.POLLIN)
+        # all done
+        return
+
+
+    def __str__(self):
+        return '{{ring: in={ring.infd}, out={ring.outfd}}}'.format(ring=self)
+
+
+    # implementation details
+    def pull(self, views, minlen):
+        """
+        Copy at least {minlen} bytes from the inbound ring into {views}, unless the channel
+        is closed; return the number of bytes copied
+        """
+        # get my ring and its size
+        ring, capacity = self.inbox, self.capacity
+        # reset the byte count
+        total = 0
+        # go through the views
+        for view in views:
+            # starting at the beginning
+            offset = 0
+            # until this one is full
+            while offset < len(view):
+                # if we have reached our goal, bail
+                if total >= minlen: return total
+                # if there is nothing known to be available
+                if self.tail == self.known:
+                    # wait for an announcement
+                    counter = os.read(self.infd, self.counterSize)
+                    # if we got nothing, the channel is closed; bail
+                    if not counter: return total
+                    # otherwise, update my knowledge of the amount of data written
+                    self.known, = struct.unpack(self.packing, counter)
+                # figure out how much to copy
+                count = min(len(view) - offset, self.known - self.tail)
+                # copy it, up to the end of the ring
+                start = self.tail % capacity
+                first = min(count, capacity - start)
+                view[offset:offset+first] = ring[start:start+first]
+                # and the rest from the beginning
+                view[offset+first:offset+count] = ring[:count-first]
+                # update the counters
+                offset += count
+                total += count
+                self.tail += count
+                # if we have consumed a large enough piece since the last report
+                if self.tail - self.released >= self.stride:
+                    # let the writer know there is room; this is enough to keep the writer
+                    # going: a writer that runs out of room has announced everything it has
+                    # written, so the reader eventually consumes a full ring
+                    self.release()
+        # all done
+        return total
+
+
+    def push(self, views):
+        """
+        Copy the contents of {views} into the outbound ring and announce them
+        """
+        # get my ring and its size
+        ring, capacity = self.outbox, self.capacity
+        # reset the byte count
+        total = 0
+        # go through the views
+        for view in views:
+            # starting at the beginning
+            offset = 0
+            # until this one is done
+            while offset < len(view):
+                # compute the available space
+                free = capacity - (self.head - self.freed)
+                # if there isn't any
+                if not free:
+                    # check for space reports
+                    self.reclaim(block=False)
+                    # if there is still no room
+                    if self.head - self.freed == capacity:
+                        # let the reader see what we have so far
+                        self.announce()
+                        # and wait for it to make some room
+                        self.reclaim(block=True)
+                    # try again
+                    continue
+                # figure out how much to copy
+                count = min(len(view) - offset, free)
+                # copy it, up to the end of the ring
+                start = self.head % capacity
+                first = min(count, capacity - start)
+                ring[start:start+first] = view[offset:offset+first]
+                # and the rest at the beginning
+                ring[:count-first] = view[offset+first:offset+count]
+                # update the counters
+                offset += count
+                total += count
+                self.head += count
+                # if a large enough piece has accumulated
+                if self.head - self.announced >= self.stride:
+                    # let the reader start working on it while i copy the rest
+                    self.announce()
+        # let the reader know
+        self.announce()
+        # and return the number of bytes written
+        return total
+
+
+    def announce(self):
+        """
+        Ring the data doorbell with the total number of bytes written so far
+        """
+        # if there is something new
+        if self.head > self.announced:
+            # ring; this may block if the reader is far behind, but it will catch up
+            os.write(self.outfd, struct.pack(self.packing, self.head))
+            # and remember
+            self.announced = self.head
+        # all done
+        return
+
+
+    def release(self):
+        """
+        Ring the space doorbell with the total number of bytes consumed so far
+        """
+        # attempt to
+        try:
+            # report
+            os.write(self.releasefd, struct.pack(self.packing, self.tail))
+        # if the doorbell is full, the writer has plenty of newer reports to read
+        except BlockingIOError:
+            # so skip this one
+            return
+        # remember
+        self.released = self.tail
+        # all done
+        return
+
+
+    def reclaim(self, block):
+        """
+        Collect the reports of consumed data, waiting for one if {block} is set
+        """
+        # if i'm supposed to block
+        if block:
+            # wait until there is a report
+            self.waiter.poll()
+        # attempt to
+        try:
+            # collect the pending reports
+            reports = os.read(self.freedfd, 512*self.counterSize)
+        # if there aren't any
+        except BlockingIOError:
+            # nothing to do
+            return
+        # if the doorbell is closed
+        if not reports:
+            # complain
+            raise BrokenPipeError("the reader has closed the channel")
+        # the reports are in increasing order, so the last one is the latest
+        self.freed, = struct.unpack_from(self.packing, reports, len(reports)-self.counterSize)
+        # all done
+        return
+
+
+    # private data
+    infd = None
+    outfd = None
+
+
+# end of file
@@ -8,8 +8,9 @@
 
 # externals
 import pyre
-import operator
-from time import time as now
+import heapq
+import itertools
+from time import monotonic as now
 
 
 # declaration
@@ -22,9 +23,11 @@ class Scheduler(pyre.component, family='pyre.ipc.dispatchers.scheduler'):
     to be a dimensional quantity with units of time.
 
     The current implementation converts the time interval before the alarm comes due into an
-    absolute time, and pairs it with the handler into an {_alarm} instance. The {_alarm} is
-    then stored into a list of such {_alarms}, and the list is sorted in reverse order,
-    i.e. with the alarm that is due next at the end of the list.
+    absolute time on the monotonic clock, and pairs it with the handler into an {_alarm}
+    instance. The {_alarm} is then pushed onto a heap, so that the alarm that is due next is
+    always at the front, and is handed back to the client, who may pass it to {cancel} to
+    prevent it from going off. Cancelled alarms are marked and left in the heap until they
+    make it to the front, unless they start to outnumber the live ones.
     """
 
 
@@ -41,14 +44,47 @@ class Scheduler(pyre.component, family='pyre.ipc.dispatchers.scheduler'):
         parameters:
            {call}: a function that takes the current time and returns a reschedule interval
            {interval}: a dimensional quantity from {pyre.units} with units of time
+
+        The return value is a handle that can be passed to {cancel}
         """
         # create a new alarm instance
-        alarm = self._alarm(time=now()+interval/self.second, handler=call)
-        # add it to my list
-        self._alarms.append(alarm)
-        # sort
-        self._alarms.sort(key=operator.attrgetter('time'), reverse=True)
-        # and return
+        alarm = self._alarm(
+            time=now()+interval/self.second, serial=next(self._serial), handler=call)
+        # add it to my heap
+        heapq.heappush(self._alarms, alarm)
+        # and return it
+        return alarm
+
+
+    @pyre.export
+    def cancel(self, alarm):
+        """
+        Prevent {alarm}, a handle returned by {alarm}, from going off; alarms that have already
+        been raised and not rescheduled are ignored
+        """
+        # if the alarm is not pending
+        if alarm.handler is None:
+            # there is nothing to do
+            return
+        # otherwise, mark it
+        alarm.handler = None
+        # alarms that are being raised, or are waiting to be rescheduled, are not in the heap
+        if not alarm.queued:
+            # so there is nothing else to do
+            return
+        # count it
+        self._cancelled += 1
+        # get my alarms
+        alarms = self._alarms
+        # if the cancelled alarms make up more than half of the heap
+        if 2*self._cancelled > len(alarms):
+            # get rid of them; do it in place, since {awaken} may be holding on to the heap
+            alarms[:] = [ entry for entry in alarms if entry.handler is not None ]
+            # restore the heap invariant
+            heapq.heapify(alarms)
+            # and reset the count
+            self._cancelled = 0
+        # all done
         return
 
 
@@ -60,21 +96,16 @@ class Scheduler(pyre.component, family='pyre.ipc.dispatchers.scheduler'):
         returns 0. This slightly strange logic is designed to satisfy the requirements for
         calling {select}.
         """
-        # the necessary information is in the last entry in my {_alarms}, since they are
-        # always in descending order
-        try:
-            # try to grab it
-            alarm = self._alarms[-1]
-        # if there is nothing there
-        except IndexError:
+        # get my alarms
+        alarms = self._alarms
+        # clear out the cancelled alarms at the front of the heap
+        self.purge()
+        # if there is nothing left
+        if not alarms:
             # we have no scheduled alarms
             return None
-        # if it succeeded
-        else:
-            # get the scheduled time
-            due = alarm.time
-        # return the number of seconds until it comes due, bound from below
-        return max(0, due - now())
+        # return the number of seconds until the next one comes due, bound from below
+        return max(0, alarms[0].time - now())
 
 
     def awaken(self):
@@ -89,27 +120,28 @@ class Scheduler(pyre.component, family='pyre.ipc.dispatchers.scheduler'):
         time = now()
 
         # iterate through my alarms
-        while 1:
-            # attempt
-            try:
-                # to grab one
-                alarm = alarms.pop()
-            # if none are left
-            except IndexError:
+        while True:
+            # clear out the cancelled alarms at the front of the heap
+            self.purge()
+            # if there is nothing left, or the next alarm is not due yet
+            if not alarms or time < alarms[0].time:
                 # we are all done raising alarms
                 break
-            # if this alarm is not due yet
-            if time < alarm.time:
-                # put it back at the end of the list
-                alarms.append(alarm)
-                # no need to look any further
-                break
-            # otherwise, this alarm is overdue; invoke the handler
+            # otherwise, this alarm is overdue; take it out of the heap
+            alarm = heapq.heappop(alarms)
+            # and mark it
+            alarm.queued = False
+            # invoke the handler
             delta = alarm.handler(timestamp=time)
-            # if the handler indicated that it wants to reschedule this alarm
-            if delta:
+            # if the handler indicated that it wants to reschedule this alarm, and did not
+            # cancel it while it was running
+            if delta and alarm.handler is not None:
                 # save it
-                reschedule.append((delta, alarm.handler))
+                reschedule.append((delta, alarm))
+            # otherwise
+            else:
+                # mark it as raised, so that attempts to cancel it are ignored
+                alarm.handler = None
 
         # if there is nothing to reschedule
         if not reschedule:
@@ -119,13 +151,18 @@ class Scheduler(pyre.component, family='pyre.ipc.dispatchers.scheduler'):
         # otherwise, get a fresh timestamp
         time = now()
         # go through the pile
-        for interval, call in reschedule:
-            # create a new alarm instance
-            alarm = self._alarm(time=time+interval/self.second, handler=call)
-            # add it to my list
-            self._alarms.append(alarm)
-        # sort
-        self._alarms.sort(key=operator.attrgetter('time'), reverse=True)
+        for interval, alarm in reschedule:
+            # if the alarm was cancelled by one of the handlers that ran after it
+            if alarm.handler is None:
+                # leave it out
+                continue
+            # update the alarm; reusing it keeps the handle held by the client valid
+            alarm.time = time + interval/self.second
+            alarm.serial = next(self._serial)
+            # put it back in the heap
+            heapq.heappush(alarms, alarm)
+            # and mark it
+            alarm.queued = True
 
         # all done
         return
@@ -135,30 +172,57 @@ class Scheduler(pyre.component, family='pyre.ipc.dispatchers.scheduler'):
     def __init__(self, **kwds):
         # chain up
         super().__init__(**kwds)
-        # the list of alarms; kept sorted in descending order by alarm time, i.e. with the next
-        # alarm to go off at the end of the list
+        # the heap of alarms, with the next alarm to go off at the front
         self._alarms = []
+        # the number of cancelled alarms still in the heap
+        self._cancelled = 0
+        # a source of tie breakers for alarms that are due at the same time, so they go off in
+        # the order they were scheduled
+        self._serial = itertools.count()
         # all done
         return
 
 
     # implementation details
+    def purge(self):
+        """
+        Remove the cancelled alarms from the front of the heap
+        """
+        # get my alarms
+        alarms = self._alarms
+        # as long as the alarm at the front has been cancelled
+        while alarms and alarms[0].handler is None:
+            # remove it
+            heapq.heappop(alarms).queued = False
+            # and adjust the count
+            self._cancelled = max(0, self._cancelled - 1)
+        # all done
+        return
+
+
     # private types
     class _alarm:
         """Encapsulate the time and event handler of an alarm"""
 
-        def __init__(self, time, handler):
+        def __init__(self, time, serial, handler):
             self.time = time
+            self.serial = serial
             self.handler = handler
+            self.queued = True # whether i am in the heap
             return
 
+        def __lt__(self, other):
+            return (self.time, self.serial) < (other.time, other.serial)
+
         def __str__(self): return "alarm: {.time}".format(self)
 
-        __slots__ = ('time', 'handler')
+        __slots__ = ('time', 'serial', 'handler', 'queued')
 
 
     # private data
     _alarms = None
+    _serial = None
+    _cancelled = 0
 
 
 # end of file
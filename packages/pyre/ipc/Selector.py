@@ -87,45 +87,43 @@ class Selector(Scheduler, family='pyre.ipc.dispatchers.selector', implements=dis
         debug = self._debug
         # until someone says otherwise
         while self._watching:
-            # show me
-            debug.line('watching:')
             # compute how long i am allowed to be asleep
-            debug.line('    computing the allowed sleep interval')
             timeout = self.poll()
-            debug.line('    max sleep: {}'.format(timeout))
-
             # construct the descriptor containers
-            debug.line('    collecting the event sources')
             iwtd = self._read.keys()
             owtd = self._write.keys()
             ewtd = self._exception.keys()
 
-            # if my debug channel is active
+            # if my debug channel is active; checking once per pass keeps a disabled channel
+            # out of the way
             if debug:
+                # show me
+                debug.line('watching:')
+                debug.line('    max sleep: {}', timeout)
+                debug.line('    event sources:')
                 # show me the channels that have data to read
                 if iwtd: debug.line('      read:')
                 for fd in iwtd:
                     for event in self._read[fd]:
-                        debug.line('        {}'.format(event.channel))
+                        debug.line('        {}', event.channel)
                 # show me the channels that are ready to be written
                 if owtd: debug.line('      write:')
                 for fd in owtd:
                     for event in self._write[fd]:
-                        debug.line('        {}'.format(event.channel))
+                        debug.line('        {}', event.channel)
                 # show me the channels with exceptions
                 if ewtd: debug.line('      exception:')
                 for channel in ewtd:
                     for event in self._exception[fd]:
-                        debug.line('        {}'.format(event.channel))
+                        debug.line('        {}', event.channel)
 
             # check for indefinite block
-            debug.line('    checking for indefinite block')
             if not iwtd and not owtd and not ewtd and timeout is None:
                 debug.log('** no registered handlers left; exiting')
                 return
 
             # show me
-            debug.log('    calling select; timeout={!r}'.format(timeout))
+            if debug: debug.log('    calling select; timeout={!r}', timeout)
             # wait for an event
             try:
                 reads, writes, excepts = select.select(iwtd, owtd, ewtd, timeout)
@@ -136,7 +134,7 @@ class Selector(Scheduler, family='pyre.ipc.dispatchers.selector', implements=dis
                 errno = error.errno
                 msg = error.strerror
                 # show me
-                debug.log('signal received: errno={}: {}'.format(errno, msg))
+                debug.log('signal received: errno={}: {}', errno, msg)
                 # keep going
                 continue
 
@@ -145,18 +143,18 @@ class Selector(Scheduler, family='pyre.ipc.dispatchers.selector', implements=dis
                 # show me
                 debug.line('activity detected:')
                 # some details
-                debug.line('      read clients: {}'.format(len(reads)))
-                debug.line('      write clients: {}'.format(len(writes)))
-                debug.line('      except clients: {}'.format(len(excepts)))
+                debug.line('      read clients: {}', len(reads))
+                debug.line('      write clients: {}', len(writes))
+                debug.line('      except clients: {}', len(excepts))
+                debug.line('    dispatching to handlers')
 
             # dispatch to the handlers of file events
-            debug.line('    dispatching to handlers')
             self.dispatch(index=self._exception, entities=excepts)
             self.dispatch(index=self._write, entities=writes)
             self.dispatch(index=self._read, entities=reads)
 
             # raise the overdue alarms
-            debug.log('    raising alarms')
+            if debug: debug.log('    raising alarms')
             self.awaken()
 
         # all done
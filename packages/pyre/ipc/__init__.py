@@ -29,6 +29,18 @@ def pipe(descriptors=None, **kwds):
     return Pipe.open(**kwds)
 
 
+def ring(**kwds):
+    """
+    Build a pair of channels suitable for bidirectional communication between two processes on
+    the same host, that move data through ring buffers in shared memory; the pair must be
+    shared with the other process by forking
+    """
+    # access the channel
+    from .Ring import Ring
+    # build the pair and return it
+    return Ring.open(**kwds)
+
+
 def tcp(address):
     """
     Builds a channel over a TCP connection to a server
@@ -68,6 +80,26 @@ from .Dispatcher import Dispatcher as dispatcher
 from .Marshaler import Marshaler as marshaler
 
 # my component foundries
+@foundry(implements=marshaler)
+def framer():
+    """
+    A marshaler that uses pickle protocol 5 to ship large binary payloads without copying them
+    """
+    # grab the component class record
+    from .Framer import Framer as framer
+    # and return it
+    return framer
+
+@foundry(implements=dispatcher)
+def loop():
+    """
+    A dispatcher that runs on top of an {asyncio} event loop
+    """
+    # grab the component class record
+    from .Loop import Loop as loop
+    # and return it
+    return loop
+
 @foundry(implements=marshaler)
 def pickler():
     """
@@ -88,6 +120,16 @@ def scheduler():
     # and return it
     return scheduler
 
+@foundry(implements=dispatcher)
+def poller():
+    """
+    A scheduler that can listen to large numbers of file objects
+    """
+    # grab the component class record
+    from .Poller import Poller as poller
+    # and return it
+    return poller
+
 @foundry
 def selector():
     """
@@ -100,6 +142,24 @@ def selector():
 
 
 # my component factories; use to build an actual instance
+def newFramer(**kwds):
+    """
+    A marshaler that uses pickle protocol 5 to ship large binary payloads without copying them
+    """
+    # grab the component class record
+    from .Framer import Framer as framer
+    # and return it
+    return framer(**kwds)
+
+def newLoop(**kwds):
+    """
+    A dispatcher that runs on top of an {asyncio} event loop
+    """
+    # grab the component class record
+    from .Loop import Loop as loop
+    # and return it
+    return loop(**kwds)
+
 def newPickler(**kwds):
     """
     A marshaler that uses native python services to serialize objects
@@ -109,6 +169,15 @@ def newPickler(**kwds):
     # and return it
     return pickler(**kwds)
 
+def newPoller(**kwds):
+    """
+    A scheduler that can listen to large numbers of file objects
+    """
+    # grab the component class record
+    from .Poller import Poller as poller
+    # and return it
+    return poller(**kwds)
+
 def newScheduler(**kwds):
     """
     A component that enables the construction of applications with event loops
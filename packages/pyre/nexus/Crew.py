@@ -96,8 +96,8 @@ class Crew(Peer, family="pyre.nexus.peers.crew"):
         # grab the report
         memberstatus, taskstatus, result = self.marshaler.recv(channel=channel)
         # show me on the debug channel
-        self.debug.log('{me.pid}: {member}, {task}, {result}'.format(
-            me=self, member=memberstatus, task=taskstatus, result=result))
+        self.debug.log('{me.pid}: {member}, {task}, {result}',
+            me=self, member=memberstatus, task=taskstatus, result=result)
 
         # first, let's figure out what to do with the task; if it failed due to some temporary
         # condition
@@ -131,7 +131,7 @@ class Crew(Peer, family="pyre.nexus.peers.crew"):
         # clean up
         self.resign()
         # leave a note
-        self.debug.log('{me.pid}: dismissed at {me.finish:.3f}'.format(me=self))
+        self.debug.log('{me.pid}: dismissed at {me.finish:.3f}', me=self)
         # all done
         return self
 
@@ -141,7 +141,7 @@ class Crew(Peer, family="pyre.nexus.peers.crew"):
         Report a task failure that can be reasonably expected to be temporary
         """
         # show me
-        self.debug.log('{me.pid}: recoverable error: {error}'.format(me=self, error=error))
+        self.debug.log('{me.pid}: recoverable error: {error}', me=self, error=error)
         # all done
         return
 
@@ -151,7 +151,7 @@ class Crew(Peer, family="pyre.nexus.peers.crew"):
         Report a permanent task failure
         """
         # show me
-        self.debug.log('{me.pid}: unrecoverable error: {error}'.format(me=self, error=error))
+        self.debug.log('{me.pid}: unrecoverable error: {error}', me=self, error=error)
         # all done
         return
 
@@ -188,7 +188,7 @@ class Crew(Peer, family="pyre.nexus.peers.crew"):
         # extract the task from the channel
         task = self.marshaler.recv(channel=channel)
         # leave a note
-        self.debug.log('{me.pid}: got {task}'.format(me=self, task=task))
+        self.debug.log('{me.pid}: got {task}', me=self, task=task)
         # if it's a quit marker
         if task is None:
             # we are all done
@@ -250,7 +250,7 @@ class Crew(Peer, family="pyre.nexus.peers.crew"):
         # make a report
         report = (crewstatus, taskstatus, result)
         # tell me
-        self.debug.log('{me.pid}: sending report {report}'.format(me=self, report=report))
+        self.debug.log('{me.pid}: sending report {report}', me=self, report=report)
         # serialize and send
         self.marshaler.send(channel=channel, item=report)
         # all done; don't reschedule
@@ -21,6 +21,15 @@ class Fork(pyre.component, family='pyre.nexus.recruiters.fork', implements=Recru
     """
 
 
+    # user configurable state
+    channel = pyre.properties.str(default='pipe')
+    channel.doc = "the type of channel between the team and its members: 'pipe' or 'ring'"
+    channel.validators = pyre.constraints.isMember('pipe', 'ring')
+
+    capacity = pyre.properties.int(default=8*1024*1024)
+    capacity.doc = "the size in bytes of the shared memory buffers of 'ring' channels"
+
+
     # protocol obligations
     @pyre.provides
     def recruit(self, team, **kwds):
@@ -42,8 +51,14 @@ class Fork(pyre.component, family='pyre.nexus.recruiters.fork', implements=Recru
         """
         Create a new {team} member using the {fork} system call
         """
-        # team members communicate with the manager using pipes
-        parent, child = pyre.ipc.pipe()
+        # team members communicate with the manager either using pipes
+        if self.channel == 'pipe':
+            # make a pair
+            parent, child = pyre.ipc.pipe()
+        # or ring buffers in shared memory
+        else:
+            # make a pair
+            parent, child = pyre.ipc.ring(capacity=self.capacity)
         # clone the current process
         pid = os.fork()
 
@@ -54,6 +69,8 @@ class Fork(pyre.component, family='pyre.nexus.recruiters.fork', implements=Recru
         if pid == 0:
             # make a team member
             crew = team.crew(pid=os.getpid(), channel=parent, **kwds)
+            # make sure it speaks the same language as its manager
+            crew.marshaler = team.marshaler
             # ask it to register with the team
             crew.register()
             # spin up and carry out tasks until there is nothing more to do
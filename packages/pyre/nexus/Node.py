@@ -37,7 +37,7 @@ class Node(Peer, family="pyre.nexus.servers.node", implements=Nexus):
         # go through my services
         for name, service in self.services.items():
             # show me
-            application.debug.log('{}: activating {!r}'.format(self, name))
+            application.debug.log('{}: activating {!r}', self, name)
             # and activate them
             service.activate(application=application, dispatcher=self.dispatcher)
         # all done
@@ -54,7 +54,7 @@ class Node(Peer, family="pyre.nexus.servers.node", implements=Nexus):
         # go through my services
         for name, service in self.services.items():
             # show me
-            application.debug.line('shutting down {!r}'.format(name))
+            application.debug.line('shutting down {!r}', name)
             # shut it down
             service.shutdown()
         # flush
@@ -47,24 +47,24 @@ class Pool(Peer, family='pyre.nexus.teams.pool', implements=Team):
         channel = self.debug
         # show me
         channel.line('executing the workplan')
-        channel.line('  current outstanding tasks: {}'.format(len(self.workplan)))
-        channel.line('  max team size: {}'.format(self.size))
-        channel.line('  current vacancies: {}'.format(self.vacancies()))
-        channel.line('  registered crew members: {}'.format(len(self.registered)))
-        channel.line('  active crew members: {}'.format(len(self.active)))
+        channel.line('  current outstanding tasks: {}', len(self.workplan))
+        channel.line('  max team size: {}', self.size)
+        channel.line(lambda: '  current vacancies: {}'.format(self.vacancies()))
+        channel.line('  registered crew members: {}', len(self.registered))
+        channel.line('  active crew members: {}', len(self.active))
 
         # add the new tasks to the workplan
         self.workplan |= workplan
         # tell me
         channel.line('extending the workplan')
-        channel.line('  current outstanding tasks: {}'.format(len(self.workplan)))
+        channel.line('  current outstanding tasks: {}', len(self.workplan))
 
         # if necessary, recruit some new crew members
         self.recruit()
         # tell me
         channel.line('recruited new crew members')
-        channel.line('  registered crew members: {}'.format(len(self.registered)))
-        channel.line('  active crew members: {}'.format(len(self.active)))
+        channel.line('  registered crew members: {}', len(self.registered))
+        channel.line('  active crew members: {}', len(self.active))
 
         # flush
         channel.log()
@@ -155,7 +155,7 @@ class Pool(Peer, family='pyre.nexus.teams.pool', implements=Team):
         # N.B.: {channel} is ready to write, because that's how we got here; so write away...
 
         # tell me
-        self.debug.log('sending a task to {.pid}'.format(crew))
+        self.debug.log('sending a task to {.pid}', crew)
         # get my workplan
         workplan = self.workplan
         # and my marshaler
@@ -8,6 +8,7 @@
 
 # externals
 import pyre
+import inspect
 import weakref
 # my protocol
 from .Service import Service
@@ -57,7 +58,7 @@ class Server(pyre.component, implements=Service):
         newChannel, peerAddress = channel.accept()
         # log the request
         self.application.debug.log(
-            "{}: received 'connection' request from {}".format(channel, peerAddress))
+            "{}: received 'connection' request from {}", channel, peerAddress)
 
         # if this is not a valid connection
         if not self.validate(channel=newChannel, address=peerAddress):
@@ -91,7 +92,14 @@ class Server(pyre.component, implements=Service):
 
         # get the dispatcher
         dispatcher = self.dispatcher
-        # place the channel on the read list
+        # if {process} is a coroutine
+        if inspect.iscoroutinefunction(self.process):
+            # it takes care of the conversation with the peer on its own; this requires a
+            # dispatcher that can run coroutines, such as {pyre.ipc.loop}
+            dispatcher.spawn(self.process(channel=channel))
+            # and keep accepting connections
+            return True
+        # otherwise, place the channel on the read list
         dispatcher.whenReadReady(channel=channel, call=self.process)
         # indicate that i would like to continue receiving connection requests from other peers
         return True
@@ -6,6 +6,11 @@
 #
 
 
+# externals
+import collections, csv, io, itertools, locale, operator, os, pickle, selectors, struct
+
+
+# declaration
 class CSV:
     """
     A reader and writer of records in csv format
@@ -16,6 +21,13 @@ class CSV:
     """
 
 
+    # constants
+    chunk = 2**14 # the number of rows converted at a time by the bulk reader
+    block = 2**22 # the number of bytes read at a time by the bulk reader workers
+    protocol = pickle.HIGHEST_PROTOCOL # for shipping converted rows between processes
+    framing = struct.Struct("<Q") # the size of each message from the bulk reader workers
+
+
     # record factories
     def immutable(self, layout, uri=None, stream=None, **kwds):
         """
@@ -41,7 +53,75 @@ class CSV:
         return
 
 
+    def bulk(self, layout, uri=None, stream=None, chunk=chunk, validate=True, workers=1,
+             encoding=None, **kwds):
+        """
+        Build immutable record instances from a csv formatted source in bulk
+
+        The rows are read and converted in chunks of {chunk} rows by the converter of {layout},
+        which processes one column at a time; see {pyre.records.Converter}. Each chunk is
+        returned as a list of records. The constraints of the fields are checked unless
+        {validate} is {False}; use the {verify} method of the converter of {layout} to check
+        them at a later time.
+
+        If {uri} is a local file and {workers} is larger than one, the file is split into byte
+        ranges that are converted in parallel by worker processes. Splitting assumes that no
+        record spans multiple lines, so it cannot be used with sources with quoted newlines.
+        The chunks are returned in the order of the rows in the file; the chunks of workers that
+        are ahead are held in memory until their predecessors are done. Use {encoding} to specify
+        the encoding of the file, if it is not the platform default.
+        """
+        # get the converter
+        converter = layout.pyre_converter(validate=validate)
+        # if the caller asked for help and i know how to provide it
+        if uri and workers > 1 and hasattr(os, 'fork'):
+            # go through the chunks converted by the workers
+            for rows in self.split(
+                    converter=converter, uri=uri, chunk=chunk, workers=workers,
+                    encoding=encoding, **kwds):
+                # and build records out of them
+                yield list(map(converter.record, rows))
+            # all done
+            return
+
+        # otherwise, check whether {uri} was provided
+        if uri:
+            # build the associated stream; it's mine, so make sure it gets closed
+            with open(uri, newline='', encoding=encoding) as stream:
+                # convert its contents
+                yield from self.chunks(converter=converter, stream=stream, chunk=chunk, **kwds)
+            # all done
+            return
+        # look for a valid stream
+        if not stream:
+            raise self.SourceSpecificationError()
+        # convert its contents; the stream belongs to the caller, so leave it open
+        yield from self.chunks(converter=converter, stream=stream, chunk=chunk, **kwds)
+        # all done
+        return
+
+
     # support
+    def chunks(self, converter, stream, chunk, **kwds):
+        """
+        Convert the rows of the csv formatted {stream} into records, in chunks of {chunk} rows
+        """
+        # build a reader
+        reader = csv.reader(stream, **kwds)
+        # get the headers
+        headers = next(reader)
+        # build a function that extracts the values of the measures from each row
+        select = self.selector(layout=converter.layout, headers=headers)
+        # select the values
+        rows = map(select, reader)
+        # go through the chunks
+        for batch in iter(lambda: list(itertools.islice(rows, chunk)), []):
+            # convert them and make them available
+            yield converter.records(rows=batch)
+        # all done
+        return
+
+
     def read(self, layout, uri=None, stream=None, **kwds):
         """
         Read lines from a csv formatted input source
@@ -60,8 +140,6 @@ class CSV:
         # look for a valid stream
         if not stream:
             raise self.SourceSpecificationError()
-        # access the package
-        import csv
         # build a reader
         reader = csv.reader(stream, **kwds)
         # get the headers
@@ -78,6 +156,245 @@ class CSV:
         return
 
 
+    def split(self, converter, uri, chunk, workers, encoding=None, **kwds):
+        """
+        Convert the rows of the csv file at {uri} in parallel, using {workers} processes that
+        handle contiguous byte ranges of the file
+        """
+        # open the file
+        with open(uri, 'rb') as raw:
+            # read the headers
+            headers = raw.readline()
+            # and record the location of the first row
+            start = raw.tell()
+        # decode the headers
+        encoding = encoding or locale.getpreferredencoding(False)
+        headers, = csv.reader([headers.decode(encoding)], **kwds)
+        # build a function that extracts the values of the measures from each row
+        select = self.selector(layout=converter.layout, headers=headers)
+        # get the size of the file
+        size = os.path.getsize(uri)
+        # divide it among the workers
+        bounds = [ start + (size - start) * worker // workers for worker in range(workers+1) ]
+
+        # the worker pids and the read ends of their channels
+        crew = []
+        # carefully
+        try:
+            # go through the ranges
+            for begin, end in zip(bounds, bounds[1:]):
+                # make a channel
+                fd, channel = os.pipe()
+                # clone the current process
+                pid = os.fork()
+                # in the worker process
+                if pid == 0:
+                    # close the read ends of the channels, including the ones of the other
+                    # workers, so they notice when the parent stops listening
+                    for descriptor in [fd] + [ other for _, other in crew ]: os.close(descriptor)
+                    # convert my range and terminate
+                    self.work(
+                        channel=channel, converter=converter, select=select, uri=uri,
+                        begin=begin, end=end, chunk=chunk, encoding=encoding, **kwds)
+                # in the parent, close the write end of the channel
+                os.close(channel)
+                # and record the worker
+                crew.append((pid, fd))
+
+            # harvest their results
+            yield from self.harvest(uri=uri, crew=crew)
+        # no matter what happens
+        finally:
+            # go through the workers
+            for pid, fd in crew:
+                # close the channel; workers that are still writing will fail and exit
+                os.close(fd)
+                # and wait for them to terminate
+                os.waitpid(pid, 0)
+
+        # all done
+        return
+
+
+    def harvest(self, uri, crew):
+        """
+        Collect the messages of the workers in {crew} as they arrive and make the converted rows
+        available in the order of the workers
+
+        All channels are drained concurrently, so that no worker ever blocks waiting for its
+        turn; the rows of the workers that are ahead are queued until their predecessors are done
+        """
+        # the bytes of partial messages, and the complete messages that have not been consumed yet
+        partial = { fd: bytearray() for _, fd in crew }
+        messages = { fd: collections.deque() for _, fd in crew }
+        # watch all the channels
+        selector = selectors.DefaultSelector()
+        for _, fd in crew: selector.register(fd, selectors.EVENT_READ)
+        # carefully
+        try:
+            # go through the workers in order
+            for pid, fd in crew:
+                # get their messages
+                queue = messages[fd]
+                # harvest their results
+                while True:
+                    # until this worker has something for me
+                    while not queue:
+                        # if its channel is closed, it died before it could finish its report
+                        if fd not in partial:
+                            # complain
+                            raise self.IngestionError(
+                                uri=uri, reason=f"worker {pid} terminated unexpectedly")
+                        # wait for any of the workers to say something
+                        for key, _ in selector.select():
+                            # and collect it
+                            self.drain(fd=key.fd, selector=selector, partial=partial,
+                                       queue=messages[key.fd])
+                    # get the message
+                    status, payload = queue.popleft()
+                    # if the worker is done, move on to the next one
+                    if status == 'done': break
+                    # if it failed
+                    if status == 'error':
+                        # complain
+                        raise self.IngestionError(uri=uri, reason=payload)
+                    # otherwise, the payload is a chunk of converted rows
+                    yield payload
+        # no matter what happens
+        finally:
+            # stop watching
+            selector.close()
+        # all done
+        return
+
+
+    def drain(self, fd, selector, partial, queue):
+        """
+        Read what is available in the worker channel {fd} and add the messages it completes to
+        {queue}
+        """
+        # read
+        data = os.read(fd, 2**20)
+        # if there is nothing, the worker has closed its end
+        if not data:
+            # stop watching the channel and discard any incomplete message
+            selector.unregister(fd)
+            del partial[fd]
+            # all done
+            return
+        # otherwise, get the bytes that were left over last time
+        buffer = partial[fd]
+        # add the new ones
+        buffer += data
+        # extract the complete messages
+        size = self.framing.size
+        while len(buffer) >= size:
+            # get the length of the next one
+            length, = self.framing.unpack_from(buffer)
+            # if it is not all here yet, wait for more
+            if len(buffer) < size + length: break
+            # otherwise, decode it
+            queue.append(pickle.loads(buffer[size:size+length]))
+            # and discard it
+            del buffer[:size+length]
+        # all done
+        return
+
+
+    def send(self, channel, message):
+        """
+        Ship {message} to the parent through {channel}, with the size of its pickle in front
+        """
+        # pickle the message
+        payload = pickle.dumps(message, self.protocol)
+        # and send it with its size
+        channel.write(self.framing.pack(len(payload)))
+        channel.write(payload)
+        # all done
+        return
+
+
+    def work(self, channel, converter, select, uri, begin, end, chunk, encoding=None, **kwds):
+        """
+        Convert the rows of the csv file at {uri} that start in the byte range [{begin}, {end})
+        and send them through {channel}; this runs in a worker process and never returns
+        """
+        # assume failure
+        status = 1
+        # carefully
+        try:
+            # open the channel
+            with open(channel, 'wb') as channel:
+                # attempt to
+                try:
+                    # go through the rows
+                    for rows in self.scan(
+                            uri=uri, begin=begin, end=end, chunk=chunk, encoding=encoding,
+                            select=select, **kwds):
+                        # convert them and send them off
+                        self.send(channel, ('rows', converter.convert(rows=rows)))
+                    # let the parent know we are done
+                    self.send(channel, ('done', None))
+                    # mark success
+                    status = 0
+                # if anything goes wrong
+                except Exception as error:
+                    # let the parent know
+                    self.send(channel, ('error', str(error)))
+        # no matter what
+        finally:
+            # terminate the worker without running any of the cleanup of the parent
+            os._exit(status)
+
+
+    def scan(self, uri, begin, end, chunk, select, encoding=None, **kwds):
+        """
+        Read the rows of the csv file at {uri} that start in the byte range [{begin}, {end}) and
+        make them available in chunks of {chunk} rows
+        """
+        # the encoding of the file
+        encoding = encoding or locale.getpreferredencoding(False)
+        # open the file
+        with open(uri, 'rb') as raw:
+            # skip the row that is in progress at the beginning of my range, since it belongs to
+            # my predecessor; the ranges start after the headers, so there is always a byte
+            # before {begin}, and if it is a newline my range starts on a row boundary
+            raw.seek(begin - 1)
+            raw.readline()
+            # go through my range in blocks
+            while raw.tell() < end:
+                # read a block, without going past the end of my range
+                block = raw.read(min(self.block, end - raw.tell()))
+                # and complete its last row
+                if not block.endswith(b'\n'): block += raw.readline()
+                # decode it, split it into rows and select the values of the measures
+                rows = map(select, csv.reader(
+                    io.StringIO(block.decode(encoding), newline=''), **kwds))
+                # go through the chunks
+                for batch in iter(lambda: list(itertools.islice(rows, chunk)), []):
+                    # and make them available
+                    yield batch
+        # all done
+        return
+
+
+    def selector(self, layout, headers):
+        """
+        Build a function that extracts the values of the measures of {layout} from a row with
+        the given {headers}
+        """
+        # build the name map
+        index = { name: offset for offset, name in enumerate(headers) }
+        # adjust the column specification
+        columns = tuple(layout.pyre_selectColumns(headers=index))
+        # if there is more than one column
+        if len(columns) > 1:
+            # get the standard library to do the work
+            return operator.itemgetter(*columns)
+        # otherwise, make sure the values come back in a tuple
+        return lambda row: tuple(row[column] for column in columns)
+
+
     def write(self, sheet, uri=None, stream=None, **kwds):
         """
         Read lines from a csv formatted input source
@@ -98,8 +415,6 @@ class CSV:
             # build the associated stream
             stream = open(uri, 'w', newline='')
 
-        # access the package
-        import csv
         # build a writer
         writer = csv.writer(stream, **kwds)
         # save the headers
@@ -114,7 +429,7 @@ class CSV:
 
 
     # exceptions
-    from .exceptions import SourceSpecificationError
+    from .exceptions import SourceSpecificationError, IngestionError
 
 
 # end of file
@@ -0,0 +1,219 @@
+# -*- coding: utf-8 -*-
+#
+# michael a.g. aïvázis
+# orthologue
+# (c) 1998-2018 all rights reserved
+#
+
+
+# externals
+import functools
+# support
+from .. import schemata
+
+
+# declaration
+class Converter:
+    """
+    A strategy for converting the raw values of record fields in bulk
+
+    The default value extraction strategies walk every value through the {process} method of
+    its field descriptor, one value at a time. When reading large data sets, this dispatch
+    dominates the cost of ingestion. {Converter} is built once per record layout, and converts
+    chunks of rows one column at a time: fields whose schema is a plain integer, float or string
+    with no custom converters or normalizers are handed to the corresponding python constructor
+    for the entire column, and the rest go through a specialized function that performs the same
+    steps as {process}. Columns that the fast path can't handle, e.g. because they contain
+    expressions or representations of {None}, fall back to the full conversion, so the results
+    are the same as the ones produced by the record constructors.
+
+    Constraint checking is performed after conversion, also one column at a time. It can be
+    skipped entirely, or deferred by converting without validation and calling {verify} on the
+    records at a more convenient time.
+    """
+
+
+    # public data
+    layout = None # the record layout
+    validate = True # whether to check the constraints of the measures
+
+
+    # interface
+    def convert(self, rows):
+        """
+        Convert a chunk of {rows}, each one a sequence of raw values for my measures, into a
+        list of tuples with the values of all the record fields
+        """
+        # if there is nothing to do
+        if not rows: return []
+        # split the rows into columns and convert them
+        columns = [
+            self.column(field=field, cast=cast, values=values)
+            for field, cast, values in zip(self.measures, self.casts, zip(*rows)) ]
+        # if i am supposed to check the constraints
+        if self.validate:
+            # do it
+            self.check(columns=columns)
+        # assemble the rows
+        values = zip(*columns)
+        # if there are no derivations, we are done
+        if not self.derivations: return list(values)
+        # otherwise, get the evaluator
+        evaluator = self.evaluator
+        # and my layout
+        layout = self.layout
+        # evaluate the derivations using the converted values of the measures
+        return [
+            tuple(evaluator(record=layout, source=iter(()), cache=dict(zip(self.measures, row))))
+            for row in values ]
+
+
+    def records(self, rows):
+        """
+        Convert a chunk of {rows} into immutable record instances
+        """
+        # easy enough
+        return list(map(self.record, self.convert(rows=rows)))
+
+
+    def verify(self, records):
+        """
+        Check the constraints of my measures against the values in {records}; this is useful
+        for deferring constraint checking until after the data has been ingested
+        """
+        # get the records in a list
+        records = list(records)
+        # if there is nothing to do
+        if not records: return self
+        # get the column index
+        index = self.layout.pyre_columns
+        # harvest the columns of my measures
+        columns = list(zip(*records))
+        # check them
+        self.check(columns=[columns[index[field]] for field in self.measures])
+        # all done
+        return self
+
+
+    # meta-methods
+    def __init__(self, layout, validate=validate, **kwds):
+        # chain up
+        super().__init__(**kwds)
+        # save my settings
+        self.layout = layout
+        self.validate = validate
+        # my measures
+        self.measures = layout.pyre_measures
+        # their fast casts
+        self.casts = tuple(self.fastCast(field=field) for field in self.measures)
+        # whether i have to evaluate derivations
+        self.derivations = bool(layout.pyre_derivations)
+        # the derivation evaluator
+        self.evaluator = layout.pyre_immutableTuple.pyre_extract
+        # and the record factory
+        self.record = functools.partial(tuple.__new__, layout.pyre_immutableTuple)
+        # all done
+        return
+
+
+    # implementation details
+    def column(self, field, cast, values):
+        """
+        Convert the {values} of the given {field}
+        """
+        # if the field has a fast cast
+        if cast is not None:
+            # attempt to
+            try:
+                # apply it
+                return cast(values)
+            # if anything goes wrong
+            except (TypeError, ValueError):
+                # fall through to the full conversion
+                pass
+        # convert one value at a time
+        return [ self.cast(field=field, value=value) for value in values ]
+
+
+    def check(self, columns):
+        """
+        Check the constraints of my measures against their converted {columns}
+        """
+        # go through the measures and their values
+        for field, values in zip(self.measures, columns):
+            # get the validators
+            validators = field.validators
+            # if there aren't any, move on
+            if not validators: continue
+            # otherwise, go through the values
+            for value in values:
+                # {None} is never checked
+                if value is None: continue
+                # run the value through the validators
+                for validator in validators: validator(value=value)
+        # all done
+        return self
+
+
+    def cast(self, field, value):
+        """
+        Walk {value} through the conversion steps of {field}, without validating it
+        """
+        # {None} is special; leave it alone
+        if value is None: return None
+        # so are string representations of {None}
+        if isinstance(value, str) and value.strip().lower() == "none": return None
+        # otherwise, convert
+        for converter in field.converters: value = converter(value=value)
+        # cast
+        value = field.coerce(value=value)
+        # normalize
+        for normalizer in field.normalizers: value = normalizer(value=value)
+        # and return the new value
+        return value
+
+
+    def fastCast(self, field):
+        """
+        Build a function that converts an entire column of values of {field} by handing them
+        to a python constructor, if possible
+        """
+        # fields with custom processing don't have one
+        if field.converters or field.normalizers: return None
+        # get the implementation of the coercion
+        coerce = getattr(type(field), 'coerce', None)
+        # integers and floats
+        for schema, factory in ((schemata.int, int), (schemata.float, float)):
+            # go straight to the constructor; it rejects representations of {None} and the
+            # expressions the schema would evaluate, which send the column to the full
+            # conversion
+            if coerce is schema.coerce: return functools.partial(self.build, factory)
+        # strings
+        if coerce is schemata.str.coerce: return self.strings
+        # everything else must go through the full conversion
+        return None
+
+
+    @staticmethod
+    def build(factory, values):
+        """
+        Convert the {values} using {factory}
+        """
+        # easy enough
+        return list(map(factory, values))
+
+
+    @staticmethod
+    def strings(values):
+        """
+        Pass string {values} through, provided none of them is a representation of {None}
+        """
+        # only strings can go through unchanged; this raises a {TypeError} otherwise
+        if "none" in map(str.lower, map(str.strip, values)):
+            # send the column to the full conversion
+            raise ValueError("the column contains representations of None")
+        # otherwise, make a copy
+        return list(values)
+
+
+# end of file
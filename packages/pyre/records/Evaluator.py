@@ -15,14 +15,17 @@ class Evaluator:
 
 
     # meta methods
-    def __call__(self, record, source, **kwds):
+    def __call__(self, record, source, cache=None, **kwds):
         """
         Pull values from {source}, perform the calculation encoded in the derivation expression
         graphs, walk values through coercions, and make the results available to the caller
+
+        Clients that have converted the values of some of the fields already can pass them in
+        {cache}, a map from fields to their values; these fields are not pulled from {source}
         """
         # in the presence of derivations, we must cache the values of fields that have been
-        # converted previously; set up a cache
-        cache = {}
+        # converted previously; set up a cache, unless the caller has supplied one
+        if cache is None: cache = {}
         # go through the fields in {record}
         for field in record.pyre_fields:
             # and ask it to dispatch to the appropriate field handler, which will perform all
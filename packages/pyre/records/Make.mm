@@ -15,6 +15,7 @@ EXPORT_PYTHON_MODULES = \
     CSV.py \
     Calculator.py \
     Compiler.py \
+    Converter.py \
     Evaluator.py \
     Extractor.py \
     Immutable.py \
@@ -61,6 +61,8 @@ class Record(Dashboard, metaclass=Templater):
     pyre_derivations = None # the tuple of fields whose values are computed on the fly
     # a map from field descriptors to their column index
     pyre_columns = None
+    # the bulk converters of my instances
+    pyre_converters = None
 
 
     # interface; patched by the metaclass
@@ -82,6 +84,28 @@ class Record(Dashboard, metaclass=Templater):
         return cls.pyre_mutableTuple(record=cls, data=data, **kwds)
 
 
+    @classmethod
+    def pyre_converter(cls, validate=True):
+        """
+        Retrieve the strategy that converts raw values into my immutable instances in bulk; the
+        constraints of my measures are checked only when {validate} is {True}
+        """
+        # attempt to
+        try:
+            # look up the converter
+            return cls.pyre_converters[validate]
+        # if there isn't one
+        except KeyError:
+            # no worries
+            pass
+        # make one
+        converter = cls.pyre_bulkConverter(layout=cls, validate=validate)
+        # cache it
+        cls.pyre_converters[validate] = converter
+        # and return it
+        return converter
+
+
     # support for readers that want to match their headers to my fields
     @classmethod
     def pyre_selectColumns(cls, headers):
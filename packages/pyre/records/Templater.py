@@ -38,6 +38,7 @@ class Templater(AttributeClassifier):
     from .Evaluator import Evaluator as pyre_evaluator # complex immutable tuples
     from .Calculator import Calculator as pyre_calculator # simple mutable tuples
     from .Compiler import Compiler as pyre_compiler # complex mutable tuples
+    from .Converter import Converter as pyre_bulkConverter # bulk immutable tuples
 
 
     # meta-methods
@@ -178,6 +179,8 @@ class Templater(AttributeClassifier):
         # and attach them
         self.pyre_mutableTuple = mutable
         self.pyre_immutableTuple = immutable
+        # and make room for the bulk converters
+        self.pyre_converters = {}
 
         # all done
         return
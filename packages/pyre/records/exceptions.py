@@ -33,4 +33,25 @@ class SourceSpecificationError(RecordError):
     description = "invalid input source specification"
 
 
+# a worker process failed while ingesting a data source
+class IngestionError(RecordError):
+    """
+    Exception raised when a worker process that is converting a portion of an input source
+    fails
+    """
+
+    # public data
+    description = "while ingesting {0.uri!r}: {0.reason}"
+
+    # meta-methods
+    def __init__(self, uri, reason, **kwds):
+        # chain up
+        super().__init__(**kwds)
+        # save the error info
+        self.uri = uri
+        self.reason = reason
+        # all done
+        return
+
+
 # end of file
@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+#
+# michael a.g. aïvázis
+# orthologue
+# (c) 1998-2018 all rights reserved
+#
+
+
+# superclass
+from ..patterns.AttributeClassifier import AttributeClassifier
+
+
+# declaration
+class Aggregator(AttributeClassifier):
+    """
+    Inspect pivot tables and harvest their dimensions and reductions
+    """
+
+
+    # types
+    from .Dimension import Dimension as pyre_dimension
+    from .Reduction import Reduction as pyre_reduction
+
+
+    # meta-methods
+    def __new__(cls, name, bases, attributes, **kwds):
+        """
+        Build a new pivot class record
+        """
+        # build the record
+        pivot = super().__new__(cls, name, bases, attributes, **kwds)
+
+        # harvest the locally declared dimensions
+        pivot.pyre_localDimensions = tuple(
+            dimension for _, dimension in cls.pyre_harvest(attributes, cls.pyre_dimension))
+        # and reductions
+        pivot.pyre_localReductions = tuple(
+            reduction for _, reduction in cls.pyre_harvest(attributes, cls.pyre_reduction))
+
+        # now scan ancestors and accumulate the entire set of dimensions and reductions
+        dimensions = []
+        reductions = []
+        # for each base class
+        for base in reversed(pivot.__mro__):
+            # skip the bases that are not pivots
+            if not isinstance(base, cls): continue
+            # add the locally declared dimensions and reductions to the piles
+            dimensions.extend(base.pyre_localDimensions)
+            reductions.extend(base.pyre_localReductions)
+        # attach them
+        pivot.pyre_dimensions = tuple(dimensions)
+        pivot.pyre_reductions = tuple(reductions)
+
+        # all done; return the pivot
+        return pivot
+
+
+# end of file
@@ -0,0 +1,219 @@
+# -*- coding: utf-8 -*-
+#
+# michael a.g. aïvázis
+# orthologue
+# (c) 1998-2018 all rights reserved
+#
+
+
+# externals
+import array, bisect, collections.abc
+
+
+# declaration
+class Bin(collections.abc.Set):
+    """
+    A set of sheet rows
+
+    Bins keep their rows in a sorted array of row numbers, used for iteration and membership
+    tests. The first time a bin takes part in an intersection, it also builds a bitmap with one
+    bit per row of the sheet and keeps it up to date from then on; the bitmap is converted to a
+    python integer on demand, so the intersection of any number of bins is a handful of bitwise
+    operations over machine words. Bins that are never intersected don't pay for a bitmap.
+
+    Rows must be added in increasing order, which is the natural order when binning a sheet.
+    """
+
+
+    # constants
+    # the offsets of the bits that are set in each possible byte value
+    offsets = tuple(
+        tuple(offset for offset in range(8) if value & (1 << offset))
+        for value in range(256))
+
+
+    # public data
+    @property
+    def mask(self):
+        """
+        Return my bitmap as an integer
+        """
+        # if it is out of date
+        if self._mask is None:
+            # get my bitmap
+            bits = self._bits
+            # if i don't have one
+            if bits is None:
+                # make one
+                bits = self._bits = bytearray((self.rows[-1] >> 3) + 1 if self.rows else 0)
+                # and set the bits of my rows
+                for row in self.rows: bits[row >> 3] |= 1 << (row & 7)
+            # convert it
+            self._mask = int.from_bytes(bits, 'little')
+        # and return it
+        return self._mask
+
+
+    # interface
+    def add(self, row):
+        """
+        Add {row} to my pile
+        """
+        # add it to my rows
+        self.rows.append(row)
+        # invalidate my integer bitmap
+        self._mask = None
+        # get my bitmap
+        bits = self._bits
+        # if i don't have one, we are done
+        if bits is None: return self
+        # otherwise, find the byte that holds the bit of {row}
+        byte = row >> 3
+        # if my bitmap is not big enough
+        if byte >= len(bits):
+            # grow it
+            bits.extend(bytes(byte - len(bits) + 1))
+        # set the bit
+        bits[byte] |= 1 << (row & 7)
+        # all done
+        return self
+
+
+    def extend(self, rows):
+        """
+        Add the {rows} to my pile; they must be sorted and follow the rows i have already
+        """
+        # add them to my rows
+        self.rows.extend(rows)
+        # invalidate my integer bitmap
+        self._mask = None
+        # get my bitmap
+        bits = self._bits
+        # if i don't have one, we are done
+        if bits is None or not rows: return self
+        # otherwise, make sure it is big enough for the last row
+        byte = rows[-1] >> 3
+        # if not
+        if byte >= len(bits):
+            # grow it
+            bits.extend(bytes(byte - len(bits) + 1))
+        # set the bits
+        for row in rows: bits[row >> 3] |= 1 << (row & 7)
+        # all done
+        return self
+
+
+    def intersection(self, *others):
+        """
+        Build a bin with the rows that are in me and all the {others}
+        """
+        # start with my bitmap
+        mask = self.mask
+        # go through the others
+        for other in others:
+            # restrict
+            mask &= other.mask
+        # build a bin out of the result
+        return type(self).fromMask(mask=mask)
+
+
+    @classmethod
+    def fromRows(cls, rows):
+        """
+        Build a bin out of the array {rows}, which must be sorted and free of duplicates
+        """
+        # make one
+        bin = cls()
+        # and hand it the rows
+        bin.rows = rows
+        # all done
+        return bin
+
+
+    @classmethod
+    def fromMask(cls, mask):
+        """
+        Build a bin out of the integer bitmap {mask}
+        """
+        # make one
+        bin = cls()
+        # convert the bitmap into bytes
+        bits = bytearray(mask.to_bytes((mask.bit_length() + 7) >> 3, 'little'))
+        # get the table of offsets
+        offsets = cls.offsets
+        # harvest the rows from the bytes that are not blank
+        bin.rows.extend(
+            (byte << 3) + offset
+            for byte, value in enumerate(bits) if value
+            for offset in offsets[value])
+        # attach the bitmap
+        bin._bits = bits
+        bin._mask = mask
+        # and return the bin
+        return bin
+
+
+    # meta-methods
+    def __init__(self, rows=(), **kwds):
+        # chain up
+        super().__init__(**kwds)
+        # my rows
+        self.rows = array.array('q')
+        # my bitmap, built on first use
+        self._bits = None
+        # and its integer representation
+        self._mask = None
+        # add the given rows, in order
+        for row in sorted(set(rows)): self.add(row)
+        # all done
+        return
+
+
+    def __contains__(self, row):
+        """
+        Check whether {row} is one of mine
+        """
+        # only integers can be mine
+        if not isinstance(row, int): return False
+        # get my rows
+        rows = self.rows
+        # look for the spot where {row} would go
+        spot = bisect.bisect_left(rows, row)
+        # and check whether it is there
+        return spot < len(rows) and rows[spot] == row
+
+
+    def __iter__(self):
+        """
+        Build an iterator over my rows, in increasing order
+        """
+        # easy enough
+        return iter(self.rows)
+
+
+    def __len__(self):
+        """
+        Compute the number of rows in my pile
+        """
+        # easy enough
+        return len(self.rows)
+
+
+    def __and__(self, other):
+        """
+        Intersect me with {other}
+        """
+        # if {other} is a bin
+        if isinstance(other, Bin):
+            # use the bitmaps
+            return self.intersection(other)
+        # otherwise, let my superclass handle it
+        return super().__and__(other)
+
+
+    def __repr__(self):
+        # render my rows
+        return "{}({})".format(type(self).__name__, list(self.rows))
+
+
+# end of file
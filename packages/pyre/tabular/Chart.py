@@ -42,9 +42,45 @@ class Chart(metaclass=Surveyor):
         restrict the data set
         """
         # identify the relevant bins
-        bins = (getattr(self, name)[value] for name, value in kwds.items())
+        first, *rest = (getattr(self, name)[value] for name, value in kwds.items())
         # build and return the restriction
-        return set.intersection(*bins)
+        return first.intersection(*rest)
+
+
+    def pyre_axis(self, dimension):
+        """
+        Retrieve the axis that bins the facts in my sheet along {dimension}
+
+        Axes are built the first time they are requested and cached; the sheet bins the rows
+        it acquires after that as they are added. Changes to the values of rows that have been
+        binned already are not detected; use {pyre_refresh} after modifying the sheet in place
+        """
+        # attempt to
+        try:
+            # look up the axis
+            return self.pyre_axes[dimension]
+        # if it's not there
+        except KeyError:
+            # no worries
+            pass
+        # build it
+        axis = dimension.axis(chart=self, dimension=dimension)
+        # ask my sheet to keep it up to date
+        self.sheet.pyre_attach(axis=axis)
+        # cache it
+        self.pyre_axes[dimension] = axis
+        # and return it
+        return axis
+
+
+    def pyre_refresh(self):
+        """
+        Discard my axes so they get rebuilt the next time they are requested
+        """
+        # easy enough
+        self.pyre_axes.clear()
+        # all done
+        return self
 
 
     # meta-methods
@@ -53,6 +89,8 @@ class Chart(metaclass=Surveyor):
         super().__init__(**kwds)
         # save the sheet i am bound to
         self.sheet = sheet
+        # initialize the map from dimensions to their axes
+        self.pyre_axes = {}
         # all done
         return
 
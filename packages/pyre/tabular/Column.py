@@ -35,10 +35,8 @@ class Column(records.selector):
         """
         Build an iterator over the values in this column
         """
-        # go through all the records
-        for record in self.sheet.pyre_data:
-            # yielding the values of my column
-            yield record[self.index]
+        # ask my sheet for the values in my column
+        yield from self.sheet.pyre_values(column=self.index)
         # all done
         return
 
@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+#
+# michael a.g. aïvázis
+# orthologue
+# (c) 1998-2018 all rights reserved
+#
+
+
+# externals
+import array, collections.abc, functools
+# exceptions
+from .exceptions import ColumnarMutabilityError
+
+
+# declaration
+class Columnar(collections.abc.Sequence):
+    """
+    Storage for the records of a sheet that keeps the values of each field in its own buffer
+
+    Fields whose schema has a native machine representation get a typed {array}, so their
+    values occupy eight bytes apiece in contiguous memory and column scans don't have to visit
+    every record; they also support the buffer protocol, so clients with access to {numpy} can
+    wrap them without copying. All other fields keep their values in a list. Records are
+    assembled on the fly whenever they are requested, so they are always immutable; sheets
+    with mutable records must use the row store.
+    """
+
+
+    # constants
+    # the typecodes of the schemata that have native representations
+    typecodes = {
+        'int': 'q',
+        'float': 'd',
+        }
+
+
+    # public data
+    columns = None # the value buffers, one per field
+
+
+    # interface
+    def append(self, record):
+        """
+        Add {record} to the pile
+        """
+        # mutable records can't be taken apart without losing their calculator nodes
+        if isinstance(record, self.layout.pyre_mutableTuple):
+            # so complain
+            raise ColumnarMutabilityError(sheet=self.layout)
+        # go through the columns and the values of the record
+        for index, (column, value) in enumerate(zip(self.columns, record)):
+            # attempt to
+            try:
+                # add the value to its column
+                column.append(value)
+            # if the value doesn't fit in a typed buffer, e.g. it is {None} or a very large int
+            except (TypeError, OverflowError):
+                # switch the column to a list
+                column = self.columns[index] = list(column)
+                # and try again
+                column.append(value)
+        # all done
+        return self
+
+
+    def extend(self, records):
+        """
+        Add {records} to the pile
+        """
+        # get the records in a list
+        records = list(records)
+        # if there aren't any, we are done
+        if not records: return self
+        # mutable records can't be taken apart without losing their calculator nodes
+        if any(isinstance(record, self.layout.pyre_mutableTuple) for record in records):
+            # so complain
+            raise ColumnarMutabilityError(sheet=self.layout)
+        # go through the columns and their new values
+        for index, (column, values) in enumerate(zip(self.columns, zip(*records))):
+            # save the length of the column
+            size = len(column)
+            # attempt to
+            try:
+                # add the values to the column
+                column.extend(values)
+            # if they don't fit in a typed buffer
+            except (TypeError, OverflowError):
+                # discard the values that made it in and switch the column to a list
+                column = self.columns[index] = list(column[:size])
+                # and try again
+                column.extend(values)
+        # all done
+        return self
+
+
+    def values(self, column, start=0):
+        """
+        Build an iterable over the values in {column}, starting with the row {start}
+        """
+        # get the buffer
+        buffer = self.columns[column]
+        # if the caller wants all the values, hand over the buffer; otherwise, copy the rows
+        # past {start}, which are usually just the few that were added since the last visit
+        return buffer if not start else buffer[start:]
+
+
+    # meta-methods
+    def __init__(self, layout, **kwds):
+        # chain up
+        super().__init__(**kwds)
+        # save the layout
+        self.layout = layout
+        # build the record factory
+        self.record = functools.partial(tuple.__new__, layout.pyre_immutableTuple)
+        # build the value buffers
+        self.columns = [
+            array.array(self.typecodes[field.typename])
+            if getattr(field, 'typename', None) in self.typecodes else []
+            for field in layout.pyre_fields ]
+        # all done
+        return
+
+
+    def __len__(self):
+        """
+        Compute the number of records in the pile
+        """
+        # all columns have the same length, so ask the first one
+        return len(self.columns[0]) if self.columns else 0
+
+
+    def __getitem__(self, row):
+        """
+        Assemble the record at {row}
+        """
+        # if {row} is a slice
+        if isinstance(row, slice):
+            # assemble the records in its range
+            return [ self.record(values) for values in zip(*(
+                column[row] for column in self.columns)) ]
+        # otherwise, collect the values of each field
+        return self.record(column[row] for column in self.columns)
+
+
+    def __iter__(self):
+        """
+        Build an iterator over the records in the pile
+        """
+        # assemble them one at a time
+        return map(self.record, zip(*self.columns))
+
+
+# end of file
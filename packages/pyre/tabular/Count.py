@@ -0,0 +1,29 @@
+# -*- coding: utf-8 -*-
+#
+# michael a.g. aïvázis
+# orthologue
+# (c) 1998-2018 all rights reserved
+#
+
+
+# superclass
+from .Reduction import Reduction
+
+
+# declaration
+class Count(Reduction):
+    """
+    A reduction that counts rows
+    """
+
+
+    # interface
+    def compute(self, values):
+        """
+        Count the {values}
+        """
+        # easy enough
+        return len(values)
+
+
+# end of file
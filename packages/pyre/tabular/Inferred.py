@@ -6,6 +6,8 @@
 #
 
 
+# externals
+import collections
 # superclass
 from .Dimension import Dimension
 
@@ -21,36 +23,64 @@ class Inferred(Dimension):
     def __get__(self, chart, cls):
         # if I am being accessed through an instance
         if chart:
-            # bin my measure over the chart and return it
-            return self.axis(chart=chart, dimension=self)
+            # ask it for my axis
+            return chart.pyre_axis(dimension=self)
         # otherwise, just return myself
         return self
 
 
     # implementation details
     class axis(dict):
+        """
+        The map from the distinct values in a column to the bins of rows that contain them
+        """
+
+        # types
+        from .Bin import Bin as bin
+
+        # interface
+        def update(self):
+            """
+            Bin the rows that were added to the sheet since the last update
+            """
+            # get the records
+            data = self.sheet.pyre_data
+            # collect the new rows in piles, one per distinct value
+            piles = collections.defaultdict(list)
+            # go through the rows i haven't seen
+            for row, value in enumerate(
+                    self.sheet.pyre_values(column=self.column, start=self.rows), start=self.rows):
+                # and add each one to the pile of its value
+                piles[value].append(row)
+            # go through the piles
+            for value, rows in piles.items():
+                # attempt to
+                try:
+                    # find the bin of rows that have the same value
+                    bin = self[value]
+                # if there isn't one
+                except KeyError:
+                    # make it
+                    bin = self[value] = self.bin()
+                # add the rows to it
+                bin.extend(rows)
+            # update the number of rows i have binned
+            self.rows = len(data)
+            # all done
+            return self
 
         # meta-methods
         def __init__(self, chart, dimension, **kwds):
             # chain up
             super().__init__(**kwds)
-
             # get the sheet
-            sheet = chart.sheet
-            # the measure
-            measure = dimension.measure
+            self.sheet = sheet = chart.sheet
             # and my column number
-            column = sheet.pyre_columns[measure]
-
-            # get the records
-            for row, record in enumerate(sheet.pyre_data):
-                # get the value of my column
-                value = record[column]
-                # get the set of rows that have the same value
-                rows = self.setdefault(value, set())
-                # add this one to the set
-                rows.add(row)
-
+            self.column = sheet.pyre_columns[dimension.measure]
+            # i haven't binned any rows yet
+            self.rows = 0
+            # bin the rows in the sheet
+            self.update()
             # all done
             return
 
@@ -22,8 +22,8 @@ class Interval(Dimension):
     def __get__(self, chart, cls):
         # if I am being accessed through an instance
         if chart:
-            # bin my measure over the chart and return it
-            return self.axis(chart=chart, dimension=self)
+            # ask it for my axis
+            return chart.pyre_axis(dimension=self)
         # otherwise, just return myself
         return self
 
@@ -41,6 +41,49 @@ class Interval(Dimension):
 
     # implementation details
     class axis:
+        """
+        The bins of rows whose values fall within each subdivision of an interval
+        """
+
+        # types
+        from .Bin import Bin as bin
+
+        # interface
+        def update(self):
+            """
+            Bin the rows that were added to the sheet since the last update
+            """
+            # get the records
+            data = self.sheet.pyre_data
+            # the geometry of my bins
+            start, width, subdivisions = self.start, self.width, len(self.bins)
+            # collect the new rows in piles, one per bin
+            piles = tuple([] for bin in range(subdivisions))
+            # and a pile for the rows that fall outside my interval
+            rejects = []
+            # go through the rows i haven't seen
+            for row, value in enumerate(
+                    self.sheet.pyre_values(column=self.column, start=self.rows), start=self.rows):
+                # bin the value of my measure
+                rank = int((value - start)/width)
+                # check whether it falls within my bounds
+                if 0 <= rank < subdivisions:
+                    # place it in its pile
+                    piles[rank].append(row)
+                # otherwise
+                else:
+                    # reject it
+                    rejects.append(row)
+            # go through the bins and the piles
+            for bin, rows in zip(self.bins, piles):
+                # transfer the rows
+                if rows: bin.extend(rows)
+            # record the rejects
+            self.rejects.extend(rejects)
+            # update the number of rows i have binned
+            self.rows = len(data)
+            # all done
+            return self
 
         # meta-methods
         def __init__(self, chart, dimension, **kwds):
@@ -48,36 +91,25 @@ class Interval(Dimension):
             super().__init__(**kwds)
 
             # get the sheet
-            sheet = chart.sheet
-            # the measure
-            measure = dimension.measure
+            self.sheet = sheet = chart.sheet
             # and my column number
-            column = sheet.pyre_columns[measure]
+            self.column = sheet.pyre_columns[dimension.measure]
 
             # the geometry of my bins
             start, end = dimension.interval
             subdivisions = dimension.subdivisions
-            width = (end - start) / subdivisions
+            # save it
+            self.start = start
+            self.width = (end - start) / subdivisions
 
             # build my bins
-            self.bins = tuple(set() for bin in range(subdivisions))
+            self.bins = tuple(self.bin() for bin in range(subdivisions))
             # and a list of records that were rejected because they are outside my interval
             self.rejects = []
-
-            # get the records
-            for row, record in enumerate(sheet.pyre_data):
-                # get the value of my measure
-                value = record[column]
-                # bin it
-                rank = int((value - start)/width)
-                # check whether it falls within my bounds
-                if 0 <= rank < subdivisions:
-                    # place it in its bin
-                    self.bins[rank].add(row)
-                # otherwise
-                else:
-                    # reject it
-                    self.rejects.append(row)
+            # i haven't binned any rows yet
+            self.rows = 0
+            # bin the rows in the sheet
+            self.update()
 
             # all done
             return
@@ -94,5 +126,12 @@ class Interval(Dimension):
             # also easy
             return self.bins[bin]
 
+        def items(self):
+            """
+            Build an iterable over the pairs of tick marks and their bins
+            """
+            # my tick marks are the bin numbers
+            return enumerate(self.bins)
+
 
 # end of file
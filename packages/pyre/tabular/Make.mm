@@ -11,17 +11,26 @@ include pyre.def
 PACKAGE = tabular
 # the python modules
 EXPORT_PYTHON_MODULES = \
+    Aggregator.py \
+    Bin.py \
     Chart.py \
     Column.py \
+    Columnar.py \
+    Count.py \
     Dimension.py \
     Inferred.py \
     Interval.py \
+    Maximum.py \
+    Mean.py \
     Measure.py \
+    Minimum.py \
     Pivot.py \
     Primary.py \
+    Quantile.py \
     Reduction.py \
     Selector.py \
     Sheet.py \
+    Sum.py \
     Surveyor.py \
     Tabulator.py \
     View.py \
@@ -0,0 +1,29 @@
+# -*- coding: utf-8 -*-
+#
+# michael a.g. aïvázis
+# orthologue
+# (c) 1998-2018 all rights reserved
+#
+
+
+# superclass
+from .Reduction import Reduction
+
+
+# declaration
+class Maximum(Reduction):
+    """
+    A reduction that computes the largest of the values of a measure
+    """
+
+
+    # interface
+    def compute(self, values):
+        """
+        Find the largest of the {values}; the maximum of an empty set is {None}
+        """
+        # easy enough
+        return max(values, default=None)
+
+
+# end of file
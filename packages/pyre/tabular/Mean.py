@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+#
+# michael a.g. aïvázis
+# orthologue
+# (c) 1998-2018 all rights reserved
+#
+
+
+# superclass
+from .Reduction import Reduction
+
+
+# declaration
+class Mean(Reduction):
+    """
+    A reduction that computes the average of the values of a measure
+    """
+
+
+    # interface
+    def compute(self, values):
+        """
+        Compute the average of the {values}; the average of an empty set is {None}
+        """
+        # if there are no values, there is no average
+        if not values: return None
+        # otherwise
+        return sum(values) / len(values)
+
+
+# end of file
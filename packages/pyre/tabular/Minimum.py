@@ -0,0 +1,29 @@
+# -*- coding: utf-8 -*-
+#
+# michael a.g. aïvázis
+# orthologue
+# (c) 1998-2018 all rights reserved
+#
+
+
+# superclass
+from .Reduction import Reduction
+
+
+# declaration
+class Minimum(Reduction):
+    """
+    A reduction that computes the smallest of the values of a measure
+    """
+
+
+    # interface
+    def compute(self, values):
+        """
+        Find the smallest of the {values}; the minimum of an empty set is {None}
+        """
+        # easy enough
+        return min(values, default=None)
+
+
+# end of file
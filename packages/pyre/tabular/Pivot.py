@@ -6,10 +6,214 @@
 #
 
 
-class Pivot:
+# externals
+import array, collections
+# metaclass
+from .Aggregator import Aggregator
+
+
+# declaration
+class Pivot(metaclass=Aggregator):
     """
     The base class for reorganizing the information content of tables
+
+    A pivot groups the facts in a sheet by the tick marks of one or more dimensions of a chart,
+    and computes a number of reductions for each group. For example, given a chart over a sales
+    table with dimensions {sku} and {date}, the pivot
+
+        class report(pyre.tabular.pivot):
+            # group by
+            sku = chart.sku
+            date = chart.date
+            # compute
+            total = pyre.tabular.sum(sales.sale)
+            transactions = pyre.tabular.count()
+
+    maps every combination of sku and date that occurs in the sheet to the total amount and
+    the number of sales. Instances are bound to a chart instance, e.g. {report(chart=cube)}.
+    Accessing a reduction through the pivot returns a map from the group keys, i.e. tuples with
+    one tick mark per dimension, to the value of the reduction over the rows in the group;
+    indexing the pivot with a group key returns the bin with the rows in the group.
+
+    The groups are formed in a single pass over the sheet using the bins of the chart axes, and
+    the values of each measure are gathered once per group and shared by all the reductions
+    that need them.
     """
 
 
+    # types
+    from .Bin import Bin as pyre_bin
+
+
+    # public data
+    pyre_dimensions = None # the complete list of my dimensions
+    pyre_localDimensions = None # the locally declared ones
+    pyre_reductions = None # the complete list of my reductions
+    pyre_localReductions = None # the locally declared ones
+
+
+    # interface
+    def pyre_reduce(self, reduction):
+        """
+        Build a map from my group keys to the values of {reduction} over the rows in each group
+        """
+        # attempt to
+        try:
+            # look up the values
+            return self.pyre_results[reduction]
+        # if they are not there
+        except KeyError:
+            # no worries
+            pass
+        # compute them
+        self.pyre_compute(reductions=(reduction,))
+        # and return them
+        return self.pyre_results[reduction]
+
+
+    def pyre_refresh(self):
+        """
+        Rebuild my groups and recompute my reductions; useful after the sheet acquires new rows
+        """
+        # regroup
+        self.pyre_groups = self.pyre_group()
+        # forget the old values
+        self.pyre_results = {}
+        # and compute my reductions
+        self.pyre_compute(reductions=self.pyre_reductions)
+        # all done
+        return self
+
+
+    # meta-methods
+    def __init__(self, chart, **kwds):
+        # chain up
+        super().__init__(**kwds)
+        # save the chart
+        self.chart = chart
+        # form my groups and compute my reductions
+        self.pyre_refresh()
+        # all done
+        return
+
+
+    def __len__(self):
+        """
+        Compute the number of groups
+        """
+        # easy enough
+        return len(self.pyre_groups)
+
+
+    def __iter__(self):
+        """
+        Build an iterator over the group keys
+        """
+        # easy enough
+        return iter(self.pyre_groups)
+
+
+    def __getitem__(self, key):
+        """
+        Retrieve the bin with the rows in the group with the given {key}
+        """
+        # easy enough
+        return self.pyre_groups[key]
+
+
+    # implementation details
+    def pyre_group(self):
+        """
+        Assign the rows of the sheet to groups
+        """
+        # get the chart
+        chart = self.chart
+        # its sheet
+        sheet = chart.sheet
+        # and the number of rows
+        rows = len(sheet)
+
+        # start out with a single group that contains all the rows
+        groups = { (): range(rows) }
+        # go through my dimensions
+        for index, dimension in enumerate(self.pyre_dimensions):
+            # get the tick marks and their bins
+            ticks = tuple(chart.pyre_axis(dimension=dimension).items())
+            # the bins of the first dimension are the groups
+            if index == 0:
+                # so just use them
+                groups = { (tick,): bin.rows for tick, bin in ticks if bin }
+                # and move on
+                continue
+            # otherwise, map each row to the position of its tick mark; rows that aren't in any
+            # of the bins are marked with -1
+            digits = [-1] * rows
+            # go through the bins
+            for digit, (_, bin) in enumerate(ticks):
+                # and their rows
+                for row in bin:
+                    # mark them
+                    digits[row] = digit
+            # split each group by tick mark
+            refined = {}
+            # go through the current groups
+            for key, group in groups.items():
+                # make a pile for each tick mark
+                piles = collections.defaultdict(list)
+                # go through the rows in the group
+                for row in group:
+                    # and place them in the pile of their tick mark
+                    piles[digits[row]].append(row)
+                # go through the piles
+                for digit, pile in piles.items():
+                    # skip the rows that don't have a tick mark
+                    if digit < 0: continue
+                    # extend the key and record the new group
+                    refined[key + (ticks[digit][0],)] = pile
+            # replace the groups
+            groups = refined
+
+        # build the bins; the rows in every group are in increasing order, since they were
+        # visited in order
+        return {
+            key: self.pyre_bin.fromRows(rows=array.array('q', group))
+            for key, group in groups.items() if group }
+
+
+    def pyre_compute(self, reductions):
+        """
+        Compute the given {reductions} for each one of my groups
+        """
+        # get the sheet
+        sheet = self.chart.sheet
+        # sort the reductions by the column of their measure, so the values of each column are
+        # gathered only once per group
+        columns = {}
+        # go through the reductions
+        for reduction in reductions:
+            # get the measure
+            measure = reduction.measure
+            # find its column; reductions without a measure operate on the row numbers
+            column = None if measure is None else sheet.pyre_columns[measure]
+            # add the reduction to the pile for this column
+            columns.setdefault(column, []).append(reduction)
+            # and make room for its values
+            self.pyre_results[reduction] = {}
+
+        # go through the columns
+        for column, clients in columns.items():
+            # get the values; reductions without a measure operate on the row numbers
+            fetch = None if column is None else sheet.pyre_column(column=column).__getitem__
+            # go through my groups
+            for key, bin in self.pyre_groups.items():
+                # gather the values in this group
+                values = list(bin.rows if fetch is None else map(fetch, bin.rows))
+                # go through the reductions that need them
+                for reduction in clients:
+                    # compute and record the value
+                    self.pyre_results[reduction][key] = reduction.compute(values=values)
+
+        # all done
+        return self
+
 # end of file
@@ -56,10 +56,8 @@ class Primary(Column):
         """
         # initialize the index
         index = {}
-        # go through all the rows in my sheet
-        for row, record in enumerate(self.sheet.pyre_data):
-            # get the value of my field
-            value = record[self.index]
+        # go through the values of my field
+        for row, value in enumerate(self.sheet.pyre_values(column=self.index)):
             # map the value to the row number
             index[value] = row
         # all done
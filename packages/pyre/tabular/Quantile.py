@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+#
+# michael a.g. aïvázis
+# orthologue
+# (c) 1998-2018 all rights reserved
+#
+
+
+# superclass
+from .Reduction import Reduction
+
+
+# declaration
+class Quantile(Reduction):
+    """
+    A reduction that computes a quantile of the values of a measure
+
+    The quantile is computed by linear interpolation between the two values that bracket the
+    requested {fraction} of the sorted values, so {fraction} set to 0.5 produces the median
+    """
+
+
+    # public data
+    fraction = .5 # the fraction of the values that are not larger than the quantile
+
+
+    # interface
+    def compute(self, values):
+        """
+        Compute the quantile of the {values}; the quantile of an empty set is {None}
+        """
+        # if there are no values, there is no quantile
+        if not values: return None
+        # sort the values
+        values = sorted(values)
+        # find the position of the quantile
+        position = self.fraction * (len(values) - 1)
+        # split it into the index of the value below it and the offset from there
+        index = int(position)
+        offset = position - index
+        # if the quantile falls on a value
+        if not offset:
+            # return it
+            return values[index]
+        # otherwise, interpolate
+        return values[index] + offset * (values[index+1] - values[index])
+
+
+    # meta-methods
+    def __init__(self, measure, fraction=fraction, **kwds):
+        # chain up
+        super().__init__(measure=measure, **kwds)
+        # check the fraction
+        if not 0 <= fraction <= 1:
+            # get the journal
+            import journal
+            # complain
+            raise journal.firewall('pyre.tabular').log(
+                "quantile fractions must be in [0, 1]; got {}".format(fraction))
+        # save it
+        self.fraction = fraction
+        # all done
+        return
+
+
+# end of file
@@ -10,7 +10,72 @@ class Reduction:
     """
     The base class for all record aggregators that compute a single value from a set of records
     from a given sheet
+
+    Reductions can be applied directly to a sheet, or to a set of its rows, such as a bin from a
+    chart axis or the result of a chart filter. They can also be declared in a pivot table, in
+    which case they are computed for every group of rows the pivot identifies; see
+    {pyre.tabular.Pivot} for the details.
+
+    Subclasses must implement {compute}, which receives a list with the values of my measure
+    in the rows being reduced, or the row numbers themselves when I don't have a measure.
     """
 
 
+    # public data
+    measure = None # the sheet descriptor with the values to reduce
+
+
+    # interface
+    def reduce(self, sheet, rows=None):
+        """
+        Compute my value over the given {rows} of {sheet}, or all of them if {rows} is {None}
+        """
+        # if i don't have a measure
+        if self.measure is None:
+            # i operate on the row numbers
+            values = list(range(len(sheet)) if rows is None else rows)
+        # otherwise
+        else:
+            # get the column of my measure
+            column = sheet.pyre_columns[self.measure]
+            # if i operate on the entire sheet
+            if rows is None:
+                # just harvest the column
+                values = list(sheet.pyre_values(column=column))
+            # otherwise
+            else:
+                # gather the values of the given rows
+                values = list(map(sheet.pyre_column(column=column).__getitem__, rows))
+        # compute and return the result
+        return self.compute(values=values)
+
+
+    def compute(self, values):
+        """
+        Compute my value from the given list of {values}
+        """
+        # must be overridden
+        raise NotImplementedError(
+            "class {.__name__!r} must implement 'compute'".format(type(self)))
+
+
+    # meta-methods
+    def __init__(self, measure=None, **kwds):
+        # chain up
+        super().__init__(**kwds)
+        # save my measure
+        self.measure = measure
+        # all done
+        return
+
+
+    def __get__(self, pivot, cls):
+        # if i am being accessed through an instance
+        if pivot is not None:
+            # ask it for my values
+            return pivot.pyre_reduce(reduction=self)
+        # otherwise, just return myself
+        return self
+
+
 # end of file
@@ -6,6 +6,8 @@
 #
 
 
+# externals
+import weakref
 # superclass
 from .. import records
 # metaclass
@@ -16,12 +18,23 @@ from .Tabulator import Tabulator
 class Sheet(records.record, metaclass=Tabulator):
     """
     The base class for pyre worksheets, collections of record instances
+
+    Sheets keep their records in a list by default. Sheets whose records are immutable can opt
+    for columnar storage instead, either by setting {pyre_columnar} in their declaration or by
+    passing {columnar=True} to the constructor; their data set keeps the values of each field
+    in its own buffer, which is much more compact and makes column scans much faster.
     """
 
 
+    # types
+    from .Columnar import Columnar as pyre_columnStore
+
+
     # public data
     pyre_name = None
     pyre_data = None # the list of records
+    pyre_columnar = False # whether my data set keeps its values in per-field buffers
+    pyre_axes = None # the chart axes that must be told about new records
 
 
     # interface
@@ -63,6 +76,65 @@ class Sheet(records.record, metaclass=Tabulator):
         dataset = self.pyre_data
         # add the record to the dataset
         dataset.append(row)
+        # if there are chart axes that bin my rows
+        if self.pyre_axes:
+            # go through them
+            for axis in self.pyre_axes.values():
+                # and let them bin the new row
+                axis.update()
+        # all done
+        return self
+
+
+    def pyre_extend(self, rows):
+        """
+        Add the given {rows} to my data set; they are assumed to be compatible with my layout
+        already, e.g. because they were built by my bulk converter
+        """
+        # add the records to the dataset
+        self.pyre_data.extend(rows)
+        # if there are chart axes that bin my rows
+        if self.pyre_axes:
+            # go through them
+            for axis in self.pyre_axes.values():
+                # and let them bin the new rows
+                axis.update()
+        # all done
+        return self
+
+
+    def pyre_values(self, column, start=0):
+        """
+        Build an iterable over the values in {column}, starting with the row {start}
+        """
+        # if my data set is columnar
+        if self.pyre_columnar:
+            # it can hand me the values directly
+            return self.pyre_data.values(column=column, start=start)
+        # otherwise, go through the records; index them, so the rows before {start} are
+        # skipped without visiting them
+        data = self.pyre_data
+        return (data[row][column] for row in range(start, len(data)))
+
+
+    def pyre_column(self, column):
+        """
+        Build a sequence with the values in {column} that supports random access by row number
+        """
+        # if my data set is columnar
+        if self.pyre_columnar:
+            # it has one already
+            return self.pyre_data.columns[column]
+        # otherwise, harvest the values
+        return list(self.pyre_values(column=column))
+
+
+    def pyre_attach(self, axis):
+        """
+        Register {axis} as a client that must be notified when rows are added to my data set
+        """
+        # add it to the pile; the chart owns the axis, so hold on to it weakly
+        self.pyre_axes[id(axis)] = axis
         # all done
         return self
 
@@ -89,13 +161,19 @@ class Sheet(records.record, metaclass=Tabulator):
 
 
     # meta-methods
-    def __init__(self, name, **kwds):
+    def __init__(self, name, columnar=None, **kwds):
         # chain up
         super().__init__(**kwds)
         # set my name
         self.pyre_name = name
+        # if the caller expressed a preference for the storage of my records
+        if columnar is not None:
+            # record it
+            self.pyre_columnar = columnar
         # initialize my data set
-        self.pyre_data = []
+        self.pyre_data = self.pyre_columnStore(layout=self) if self.pyre_columnar else []
+        # and the set of axes that bin it
+        self.pyre_axes = weakref.WeakValueDictionary()
         # all done
         return
 
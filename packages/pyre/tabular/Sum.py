@@ -0,0 +1,29 @@
+# -*- coding: utf-8 -*-
+#
+# michael a.g. aïvázis
+# orthologue
+# (c) 1998-2018 all rights reserved
+#
+
+
+# superclass
+from .Reduction import Reduction
+
+
+# declaration
+class Sum(Reduction):
+    """
+    A reduction that computes the sum of the values of a measure
+    """
+
+
+    # interface
+    def compute(self, values):
+        """
+        Add up the {values}
+        """
+        # easy enough
+        return sum(values)
+
+
+# end of file
@@ -46,6 +46,16 @@ from .Interval import Interval as interval
 # support for charts
 from .Chart import Chart as chart
 
+# reductions
+from .Count import Count as count
+from .Sum import Sum as sum
+from .Mean import Mean as mean
+from .Minimum import Minimum as min
+from .Maximum import Maximum as max
+from .Quantile import Quantile as quantile
+# support for pivot tables
+from .Pivot import Pivot as pivot
+
 # reading and writing
 # the records class
 record = records.record
@@ -56,6 +66,7 @@ csv = records.csv
 # the metaclasses
 from .Tabulator import Tabulator as tabulator
 from .Surveyor import Surveyor as surveyor
+from .Aggregator import Aggregator as aggregator
 
 
 # end of file
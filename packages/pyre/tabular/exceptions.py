@@ -22,4 +22,23 @@ class TabularError(FrameworkError):
     """
 
 
+# columnar storage
+class ColumnarMutabilityError(TabularError):
+    """
+    Exception raised when a mutable record is added to a sheet with columnar storage
+    """
+
+    # public data
+    description = "{0.sheet.pyre_name!r}: columnar sheets can only hold immutable records"
+
+    # meta-methods
+    def __init__(self, sheet, **kwds):
+        # chain up
+        super().__init__(**kwds)
+        # save the error info
+        self.sheet = sheet
+        # all done
+        return
+
+
 # end of file
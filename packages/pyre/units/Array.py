@@ -0,0 +1,415 @@
+# -*- coding: utf-8 -*-
+#
+# michael a.g. aïvázis
+# orthologue
+# (c) 1998-2018 all rights reserved
+#
+
+
+# externals
+import array, itertools, operator
+# superclass
+from .Dimensional import Dimensional
+
+
+# declaration
+class Array(Dimensional):
+    """
+    A collection of quantities that share their units
+
+    The magnitudes live in a single buffer, either a {numpy} array or an {array.array}, and the
+    units are represented by one derivation for the whole collection. Arithmetic, comparisons,
+    reductions and unit conversions operate on the entire buffer at once: with {numpy} they
+    are delegated to it, otherwise they are carried out by tight loops over the buffer that
+    produce arrays of doubles. Either way, no {Dimensional} instances are built for the
+    individual entries, unless they are retrieved explicitly by indexing or iteration
+    """
+
+
+    # numpy should leave binary operations with arrays of quantities to me
+    __array_ufunc__ = None
+
+
+    # interface
+    @staticmethod
+    def isBuffer(value):
+        """
+        Check whether {value} is a buffer that can hold my magnitudes
+        """
+        # easy enough
+        return isinstance(value, array.array) or hasattr(value, "__array_interface__")
+
+
+    def convert(self, unit):
+        """
+        Express my magnitudes as multiples of {unit}
+        """
+        # if {unit} is not compatible with me
+        if not self.isCompatible(unit):
+            # complain
+            raise self.CompatibilityError(operation="conversion", op1=self, op2=unit)
+        # otherwise, compute the magnitudes
+        return self._apply(operator.truediv, self.value, getattr(unit, "value", unit))
+
+
+    def sum(self):
+        """
+        Compute the sum of my entries
+        """
+        # delegate to the buffer, if it knows how; otherwise use the builtin
+        return self._scalar(self.value.sum() if self._vectorized else sum(self.value))
+
+
+    def min(self):
+        """
+        Find the smallest of my entries
+        """
+        # delegate to the buffer, if it knows how; otherwise use the builtin
+        return self._scalar(self.value.min() if self._vectorized else min(self.value))
+
+
+    def max(self):
+        """
+        Find the largest of my entries
+        """
+        # delegate to the buffer, if it knows how; otherwise use the builtin
+        return self._scalar(self.value.max() if self._vectorized else max(self.value))
+
+
+    def mean(self):
+        """
+        Compute the average of my entries
+        """
+        # delegate to the buffer, if it knows how; otherwise use the builtin
+        return self._scalar(
+            self.value.mean() if self._vectorized else sum(self.value) / len(self.value))
+
+
+    # meta methods
+    def __init__(self, value, derivation):
+        """
+        Constructor:
+            {value}: a buffer with the magnitudes, or an iterable that can fill one
+            {derivation}: a tuple with the exponents of the fundamental SI units
+        """
+        # if {value} is not a buffer, make one
+        if not self.isBuffer(value): value = array.array('d', value)
+        # chain up
+        super().__init__(value=value, derivation=derivation)
+        # check whether the buffer can do arithmetic on its own
+        self._vectorized = not isinstance(value, array.array)
+        # all done
+        return
+
+
+    def __len__(self):
+        """
+        Compute my number of entries
+        """
+        # easy enough
+        return len(self.value)
+
+
+    def __iter__(self):
+        """
+        Build an iterator over my entries
+        """
+        # get my derivation
+        derivation = self.derivation
+        # if i am dimensionless, just iterate over my magnitudes
+        if derivation == self.zero: return iter(self.value)
+        # otherwise, build a dimensional out of each one
+        return (Dimensional(value=value, derivation=derivation) for value in self.value)
+
+
+    def __getitem__(self, index):
+        """
+        Retrieve the entry, or the collection of entries, indicated by {index}
+        """
+        # get the magnitudes
+        value = self.value[index]
+        # if {index} selected more than one entry, build an array
+        if self.isBuffer(value): return Array(value=value, derivation=self.derivation)
+        # otherwise, build a scalar
+        return self._scalar(value)
+
+
+    # addition
+    def __add__(self, other):
+        """
+        Addition
+        """
+        # easy enough
+        return self._additive(operator.add, "addition", self, other)
+
+
+    def __radd__(self, other):
+        """
+        Right addition
+        """
+        # easy enough
+        return self._additive(operator.add, "addition", other, self)
+
+
+    # subtraction
+    def __sub__(self, other):
+        """
+        Subtraction
+        """
+        # easy enough
+        return self._additive(operator.sub, "subtraction", self, other)
+
+
+    def __rsub__(self, other):
+        """
+        Right subtraction
+        """
+        # easy enough
+        return self._additive(operator.sub, "subtraction", other, self)
+
+
+    # multiplication
+    def __mul__(self, other):
+        """
+        Multiplication
+        """
+        # easy enough
+        return self._multiplicative(operator.mul, operator.add, "multiplication", self, other)
+
+
+    def __rmul__(self, other):
+        """
+        Right multiplication
+        """
+        # easy enough
+        return self._multiplicative(operator.mul, operator.add, "multiplication", other, self)
+
+
+    # division
+    def __truediv__(self, other):
+        """
+        True division
+        """
+        # easy enough
+        return self._multiplicative(operator.truediv, operator.sub, "division", self, other)
+
+
+    def __rtruediv__(self, other):
+        """
+        Right division
+        """
+        # easy enough
+        return self._multiplicative(operator.truediv, operator.sub, "division", other, self)
+
+
+    # exponentiation
+    def __pow__(self, other):
+        """
+        Exponentiation
+        """
+        # compute the magnitudes
+        value = self._apply(operator.pow, self.value, other)
+        # compute the dimensions
+        derivation = tuple(other*exponent for exponent in self.derivation)
+        # build a new array and return it
+        return Array(value=value, derivation=derivation)
+
+
+    # unary minus
+    def __neg__(self):
+        """
+        Unary minus
+        """
+        # flip the signs of my magnitudes
+        value = self._apply(operator.mul, self.value, -1)
+        # build a new array and return it
+        return Array(value=value, derivation=self.derivation)
+
+
+    # absolute value
+    def __abs__(self):
+        """
+        Absolute value
+        """
+        # get my magnitudes
+        value = self.value
+        # compute their absolute values
+        value = abs(value) if self._vectorized else array.array('d', map(abs, value))
+        # build a new array and return it
+        return Array(value=value, derivation=self.derivation)
+
+
+    # ordering
+    def __lt__(self, other):
+        """
+        Ordering: less than
+        """
+        # easy enough
+        return self._compare(operator.lt, "<", other)
+
+
+    def __le__(self, other):
+        """
+        Ordering: less than or equal to
+        """
+        # easy enough
+        return self._compare(operator.le, "<=", other)
+
+
+    def __eq__(self, other):
+        """
+        Ordering: equality
+        """
+        # easy enough
+        return self._compare(operator.eq, "==", other)
+
+
+    def __ne__(self, other):
+        """
+        Ordering: not equal to
+        """
+        # easy enough
+        return self._compare(operator.ne, "!=", other)
+
+
+    def __gt__(self, other):
+        """
+        Ordering: greater than
+        """
+        # easy enough
+        return self._compare(operator.gt, ">", other)
+
+
+    def __ge__(self, other):
+        """
+        Ordering: greater than or equal to
+        """
+        # easy enough
+        return self._compare(operator.ge, ">=", other)
+
+
+    def __format__(self, code):
+        """
+        Formatting support; {code} is applied to each of my entries
+        """
+        # format my entries and assemble them
+        return "[" + ", ".join(format(entry, code) for entry in self) + "]"
+
+
+    # arrays of quantities are mutable containers
+    __hash__ = None
+
+
+    # implementation details
+    @staticmethod
+    def _apply(op, left, right, typecode='d'):
+        """
+        Apply {op} to the magnitudes in {left} and {right}, either of which may be a scalar;
+        when neither of them can do it on its own, the results are packed in an {array.array}
+        with the given {typecode}
+        """
+        # if neither of them is an {array.array}, let them sort it out
+        if not isinstance(left, array.array) and not isinstance(right, array.array):
+            # by applying the operator directly
+            return op(left, right)
+        # otherwise, if {left} is a scalar
+        if not isinstance(left, array.array):
+            # pair it up with every entry of {right}
+            left = itertools.repeat(left, len(right))
+        # if {right} is a scalar
+        elif not isinstance(right, array.array):
+            # pair it up with every entry of {left}
+            right = itertools.repeat(right, len(left))
+        # if they are both arrays, they must have the same length
+        elif len(left) != len(right):
+            # complain
+            raise ValueError(
+                "arrays of different lengths: {} and {}".format(len(left), len(right)))
+        # apply the operator
+        return array.array(typecode, map(op, left, right))
+
+
+    @classmethod
+    def _split(cls, operand):
+        """
+        Extract the magnitude and the derivation of {operand}
+        """
+        # attempt to
+        try:
+            # treat it as a dimensional quantity
+            return operand.value, operand.derivation
+        # if it isn't one
+        except AttributeError:
+            # it's a number, or a buffer of numbers
+            return operand, cls.zero
+
+
+    def _additive(self, op, operation, left, right):
+        """
+        Implementation of addition and subtraction
+        """
+        # if either operand is not dimensional
+        if not isinstance(left, Dimensional) or not isinstance(right, Dimensional):
+            # describe the error
+            msg = "unsupported operand types for {}: {.__name__!r} and {.__name__!r}".format(
+                operation, type(left), type(right))
+            # report it
+            raise TypeError(msg)
+        # if the two quantities are not compatible
+        if left.derivation != right.derivation:
+            # report an error
+            raise self.CompatibilityError(operation=operation, op1=left, op2=right)
+        # otherwise, compute the magnitudes
+        value = self._apply(op, left.value, right.value)
+        # build a new array and return it
+        return Array(value=value, derivation=self.derivation)
+
+
+    def _multiplicative(self, op, combine, operation, left, right):
+        """
+        Implementation of multiplication and division
+        """
+        # unpack the operands
+        leftValue, leftDerivation = self._split(left)
+        rightValue, rightDerivation = self._split(right)
+        # attempt to
+        try:
+            # compute the magnitudes
+            value = self._apply(op, leftValue, rightValue)
+        # if this fails
+        except TypeError:
+            # report an error
+            raise self.CompatibilityError(operation=operation, op1=left, op2=right)
+        # compute the units
+        derivation = tuple(map(combine, leftDerivation, rightDerivation))
+        # if they canceled, just return the magnitudes
+        if derivation == self.zero: return value
+        # otherwise, build a new array and return it
+        return Array(value=value, derivation=derivation)
+
+
+    def _compare(self, op, operation, other):
+        """
+        Implementation of the comparisons
+        """
+        # unpack {other}
+        value, derivation = self._split(other)
+        # if it is not compatible with me
+        if derivation != self.derivation:
+            # the operation is illegal
+            raise self.CompatibilityError(operation=operation, op1=self, op2=other)
+        # compute the truth values
+        return self._apply(op, self.value, value, typecode='b')
+
+
+    def _scalar(self, value):
+        """
+        Build a quantity with my units out of the magnitude {value}
+        """
+        # if i am dimensionless, just return the value
+        if self.derivation == self.zero: return value
+        # otherwise, build a dimensional
+        return Dimensional(value=value, derivation=self.derivation)
+
+
+# end of file
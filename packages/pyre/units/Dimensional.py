@@ -21,6 +21,10 @@ class Dimensional:
     from .exceptions import CompatibilityError, ConversionError
 
 
+    # numpy should leave binary operations with quantities to me
+    __array_ufunc__ = None
+
+
     # public data
     # representational choices
     fundamental = ('kg', 'm', 's', 'A', 'K', 'mol', 'cd') # the SI fundamental units
@@ -104,7 +108,11 @@ class Dimensional:
         """
         # if {other} is iterable
         if isinstance(other, collections.abc.Iterable):
-            # dispatch the operation to the individual entries
+            # if it is a buffer of magnitudes
+            if Array.isBuffer(other):
+                # let an array of quantities handle it
+                return self * Array(value=other, derivation=self.zero)
+            # otherwise, dispatch the operation to the individual entries
             return type(other)(self*entry for entry in other)
 
         # otherwise,  get my value
@@ -144,6 +152,10 @@ class Dimensional:
         try:
             value /= other.value
         except AttributeError:
+            # if {other} is a buffer of magnitudes
+            if Array.isBuffer(other):
+                # let an array of quantities handle it
+                return self / Array(value=other, derivation=self.zero)
             # the only legal alternative is that {other} is a numaric type
             try:
                 # divide
@@ -211,8 +223,12 @@ class Dimensional:
         """
         # if other is iterable
         if isinstance(other, collections.abc.Iterable):
-            # assume it is an iterable of numeric types; dispatch the operation to the
-            # individual entries
+            # if it is a buffer of magnitudes
+            if Array.isBuffer(other):
+                # let an array of quantities handle it
+                return Array(value=other, derivation=self.zero) * self
+            # otherwise, assume it is an iterable of numeric types; dispatch the operation to
+            # the individual entries
             return type(other)(entry*self for entry in other)
         # the only other thing i can do is interpret {other} as a numeric type
         value = self.value * other
@@ -227,8 +243,12 @@ class Dimensional:
         """
         # if other is iterable
         if isinstance(other, collections.abc.Iterable):
-            # assume it is an iterable of numeric types; dispatch the operation to the
-            # individual entries
+            # if it is a buffer of magnitudes
+            if Array.isBuffer(other):
+                # let an array of quantities handle it
+                return Array(value=other, derivation=self.zero) / self
+            # otherwise, assume it is an iterable of numeric types; dispatch the operation to
+            # the individual entries
             return type(other)(entry/self for entry in other)
         # interpret {other} as a numeric type
         value = other / self.value
@@ -471,9 +491,15 @@ class Dimensional:
             for label, exponent in zip(self.fundamental, self.derivation) if exponent)
 
 
+
 # instances
 zero = Dimensional(0, Dimensional.zero)
 one = dimensionless = Dimensional(1, Dimensional.zero)
 
 
+# arrays of quantities are dimensionals themselves, so they can only be imported after the
+# declaration of their superclass
+from .Array import Array
+
+
 # end of file
@@ -11,6 +11,7 @@ include pyre.def
 PACKAGE = units
 # the python modules
 EXPORT_PYTHON_MODULES = \
+    Array.py \
     Dimensional.py \
     Parser.py \
     SI.py \
@@ -22,6 +22,10 @@ support for units from other systems
 # quantities directly.
 from .Dimensional import Dimensional as dimensional, zero, one
 
+# arrays of quantities that share their units; the magnitudes are held in a {numpy} array, if
+# one is provided, or an {array.array}, and the arithmetic is carried out on all of them at once
+from .Array import Array as array
+
 
 # the unit parser converts string representations of dimensional quantities into instances of
 # Dimensional
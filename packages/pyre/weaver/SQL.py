@@ -25,6 +25,29 @@ class SQL(LineMill, Expression):
     languageMarker.doc = "the variant to use in the language marker"
 
 
+    # interface
+    def literal(self, value):
+        """
+        Render {value} as an SQL literal
+        """
+        # if it is already a string
+        if isinstance(value, str):
+            # just escape the single quotes
+            return "'{}'".format(value.replace("'", "''"))
+
+        # check whether
+        try:
+            # it knows how to render itself
+            return value.sql()
+        # otherwise
+        except AttributeError:
+            # no worries
+            pass
+
+        # last resort: render the value as a string
+        return str(value)
+
+
     # meta methods
     def __init__(self, **kwds):
         # chain up
@@ -47,24 +70,8 @@ class SQL(LineMill, Expression):
         """
         Render {node} as a literal
         """
-        # get the value of the node
-        value = node._value
-        # if it is already a string
-        if isinstance(value, str):
-            # just escape the single quotes
-            return "'{}'".format(value.replace("'", "''"))
-
-        # check whether
-        try:
-            # it knows how to render itself
-            return value.sql()
-        # otherwise
-        except AttributeError:
-            # no worries
-            pass
-
-        # last resort: render the value as a string
-        return str(value)
+        # render the value of the node
+        return self.literal(value=node._value)
 
 
     # private data
@@ -43,9 +43,21 @@ channels:
 	${PYTHON} ./error-activation.py --config=activation.pfg
 	${PYTHON} ./error-injection.py
 	${PYTHON} ./crosstalk.py
+	${PYTHON} ./deferred.py
+	${PYTHON} ./locator.py
 
 devices:
 	${PYTHON} ./debug-injection.py --journal.device=import:journal.console
 	${PYTHON} ./debug-injection.py --journal.device=import:journal.file --journal.device.log="journal.log"
+	${PYTHON} ./debug-injection.py --journal.device=import:journal.buffered --journal.device.log="journal.log"
+	${PYTHON} ./binary.py
+	${PYTHON} ./binary_threads.py
+	${PYTHON} ./binary_close.py
+	${PYTHON} ./buffered.py
+
+timings:
+	${PYTHON} ./binary_timing.py
+	${PYTHON} ./buffered_timing.py
+	${PYTHON} ./diagnostic_timing.py
 
 # end of file
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# michael a.g. aïvázis
+# orthologue
+# (c) 1998-2018 all rights reserved
+#
+
+
+"""
+Verify that the binary device records entries that can be read back, and merged with the logs
+of other processes
+"""
+
+# externals
+import os
+import sys
+
+
+def test():
+    # access the package
+    import journal
+    # get the journal
+    executive = journal.info.journal
+    # save the current device
+    device = executive.device
+
+    # build a binary device
+    binary = journal.binary()
+    # with a name of its own
+    binary.log = "binary"
+    # that has to grow a few times
+    binary.size = 64
+    # install it
+    executive.device = binary
+
+    # carefully
+    try:
+        # make some channels
+        info = journal.info("journal.test.binary")
+        warning = journal.warning("journal.test.binary")
+        # say something
+        info.log("hello"); line = sys._getframe().f_lineno
+        # say a few more things
+        for index in range(10): warning.log("entry {}", index)
+        # fork
+        pid = os.fork()
+        # in the child
+        if pid == 0:
+            # say something
+            info.log("from the child")
+            # and exit without closing the log, as if the process crashed
+            os._exit(0)
+        # in the parent, wait for the child
+        os.waitpid(pid, 0)
+        # say something else
+        info.line("goodbye")
+        info.log("cruel world")
+        # get the name of my log file
+        parent = binary.filename
+        # close it
+        binary.close()
+    # no matter what
+    finally:
+        # restore the device
+        executive.device = device
+
+    # read the parent log
+    entries = list(journal.reader(parent))
+    # check the number of entries
+    assert len(entries) == 12
+    # check the first one
+    page, meta = entries[0]
+    assert page == ["hello"]
+    assert meta["channel"] == "journal.test.binary"
+    assert meta["severity"] == "info"
+    assert meta["filename"] == __file__
+    assert meta["line"] == line
+    assert meta["function"] == "test"
+    assert meta["pid"] == os.getpid()
+    # check a warning
+    page, meta = entries[5]
+    assert page == ["entry 4"]
+    assert meta["severity"] == "warning"
+    # and the multi-line entry
+    page, meta = entries[-1]
+    assert page == ["goodbye", "cruel world"]
+
+    # build the name of the child log
+    child = parent.replace(str(os.getpid()), str(pid))
+    # check that it was not trimmed
+    with open(child, "rb") as log: assert log.read().endswith(bytes(binary.prefix.size))
+    # but its entry is readable
+    (page, meta), = journal.reader(child)
+    assert page == ["from the child"]
+    assert meta["pid"] == pid
+
+    # merge the two logs
+    merged = [ page for page, _ in journal.reader.merge([parent, child]) ]
+    # check that the child entry is in the right place
+    assert merged[11] == ["from the child"]
+    assert merged[12] == ["goodbye", "cruel world"]
+
+    # clean up
+    os.unlink(parent)
+    os.unlink(child)
+
+    # all done
+    return
+
+
+# main
+if __name__ == "__main__":
+    test()
+
+
+# end of file
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# michael a.g. aïvázis
+# orthologue
+# (c) 1998-2018 all rights reserved
+#
+
+
+"""
+Verify that entries recorded through the binary device after it was closed, e.g. by exit
+handlers that run late, are appended to the log instead of replacing it
+"""
+
+# externals
+import os
+
+
+def test():
+    # access the package
+    import journal
+    # get the journal
+    executive = journal.info.journal
+    # save the current device
+    device = executive.device
+
+    # build a binary device
+    binary = journal.binary()
+    # with a name of its own
+    binary.log = "binary_close"
+    # install it
+    executive.device = binary
+
+    # carefully
+    try:
+        # make a couple of channels
+        info = journal.info("journal.test.binary")
+        warning = journal.warning("journal.test.binary")
+        # say something
+        info.log("first")
+        # get the name of my log file
+        log = binary.filename
+        # close it, the way the exit handler does
+        binary.close()
+        # say something more, through a channel i have seen and one i haven't
+        info.log("second")
+        warning.log("third")
+        # check that i am writing to the same file
+        assert binary.filename == log
+        # and close it again
+        binary.close()
+    # no matter what
+    finally:
+        # restore the device
+        executive.device = device
+
+    # read the log
+    entries = list(journal.reader(log))
+    # check that everything is there
+    assert [ page for page, _ in entries ] == [["first"], ["second"], ["third"]]
+    # and attributed properly
+    assert [ meta["severity"] for _, meta in entries ] == ["info", "info", "warning"]
+    assert all(meta["channel"] == "journal.test.binary" for _, meta in entries)
+    assert all(meta["pid"] == os.getpid() for _, meta in entries)
+
+    # clean up
+    os.unlink(log)
+
+    # all done
+    return
+
+
+# main
+if __name__ == "__main__":
+    test()
+
+
+# end of file
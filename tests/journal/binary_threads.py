@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# michael a.g. aïvázis
+# orthologue
+# (c) 1998-2018 all rights reserved
+#
+
+
+"""
+Verify that threads that record entries through the binary device at the same time don't
+overwrite each other's records
+"""
+
+# externals
+import os
+import sys
+import threading
+
+
+def test(threads=8, entries=2000):
+    # access the package
+    import journal
+    # get the journal
+    executive = journal.info.journal
+    # save the current device
+    device = executive.device
+
+    # build a binary device
+    binary = journal.binary()
+    # with a name of its own
+    binary.log = "binary_threads"
+    # that has to grow many times
+    binary.size = 1024
+    # install it
+    executive.device = binary
+
+    # the work of each thread
+    def work(index):
+        # make a channel of its own
+        channel = journal.info("journal.test.binary.{}".format(index))
+        # and say many things
+        for entry in range(entries): channel.log("{}:{}".format(index, entry))
+        # all done
+        return
+
+    # make the threads switch often, so that they interleave in the middle of appends
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+
+    # carefully
+    try:
+        # make the threads
+        workers = [
+            threading.Thread(target=work, kwargs={"index": index}) for index in range(threads) ]
+        # start them
+        for worker in workers: worker.start()
+        # and wait for them to finish
+        for worker in workers: worker.join()
+        # get the name of my log file
+        log = binary.filename
+        # close it
+        binary.close()
+    # no matter what
+    finally:
+        # restore the device
+        executive.device = device
+        # and the switch interval
+        sys.setswitchinterval(interval)
+
+    # read the log
+    recorded = [ (meta["channel"], page[0]) for page, meta in journal.reader(log) ]
+    # check that every entry made it
+    assert len(recorded) == threads * entries
+    # exactly once, and with the right channel
+    assert sorted(recorded) == sorted(
+        ("journal.test.binary.{}".format(index), "{}:{}".format(index, entry))
+        for index in range(threads) for entry in range(entries))
+
+    # clean up
+    os.unlink(log)
+
+    # all done
+    return
+
+
+# main
+if __name__ == "__main__":
+    test()
+
+
+# end of file
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# michael a.g. aïvázis
+# orthologue
+# (c) 1998-2018 all rights reserved
+#
+
+
+"""
+Measure the cost of recording journal entries with the file device and the binary device
+"""
+
+# externals
+import os
+import time
+
+
+def run(device, entries):
+    """
+    Have {device} record {entries} journal entries, both directly and through a channel
+    """
+    # access the package
+    import journal
+    # make some meta data
+    metadata = {
+        "channel": "journal.timing", "severity": "info",
+        "filename": __file__, "line": 42, "function": "run",
+        }
+    # and a page
+    page = ["entry"]
+    # start the clock
+    start = time.perf_counter()
+    # record
+    for _ in range(entries): device.record(page=page, metadata=metadata)
+    # stop the clock
+    direct = time.perf_counter() - start
+
+    # get the journal
+    executive = journal.info.journal
+    # save the current device
+    saved = executive.device
+    # install mine
+    executive.device = device
+    # make a channel
+    info = journal.info("journal.timing")
+    # start the clock
+    start = time.perf_counter()
+    # record
+    for _ in range(entries): info.log("entry")
+    # stop the clock
+    channel = time.perf_counter() - start
+    # restore the device
+    executive.device = saved
+
+    # return the times
+    return direct, channel
+
+
+def test(entries=100000):
+    # access the package
+    import journal
+
+    # build a file device
+    file = journal.file()
+    # point it to the log file
+    file.log = "journal.log"
+    # build a binary device
+    binary = journal.binary()
+
+    # time the file device
+    fileDirect, fileChannel = run(file, entries=entries)
+    # and the binary one
+    binaryDirect, binaryChannel = run(binary, entries=entries)
+    # get the name of the binary log
+    log = binary.filename
+    # close it
+    binary.close()
+    # measure it
+    size = os.stat(log).st_size
+    # and clean up
+    os.unlink(log)
+
+    # show me
+    print("journal devices: {} entries".format(entries))
+    print("  record:")
+    print("    file: {:.1f} us/entry".format(1e6*fileDirect/entries))
+    print("    binary: {:.1f} us/entry, speedup: {:.2f}".format(
+        1e6*binaryDirect/entries, fileDirect/binaryDirect))
+    print("  info.log:")
+    print("    file: {:.1f} us/entry".format(1e6*fileChannel/entries))
+    print("    binary: {:.1f} us/entry, speedup: {:.2f}".format(
+        1e6*binaryChannel/entries, fileChannel/binaryChannel))
+    print("  binary log: {:.1f} bytes/entry".format(size / (2*entries)))
+
+    # all done
+    return
+
+
+# main
+if __name__ == "__main__":
+    # do...
+    test()
+
+
+# end of file
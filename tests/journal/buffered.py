@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# michael a.g. aïvázis
+# orthologue
+# (c) 1998-2018 all rights reserved
+#
+
+
+"""
+Verify that the buffered device batches entries, writes out urgent ones immediately, and
+drops entries when it falls behind
+"""
+
+# externals
+import io
+import sys
+import threading
+
+
+# a stream that blocks its writer until it is released
+class Gate(io.StringIO):
+
+    def write(self, text):
+        # let the test know the writer is here
+        self.busy.set()
+        # wait until the test is ready
+        self.open.wait()
+        # and write
+        return super().write(text)
+
+    def __init__(self, **kwds):
+        super().__init__(**kwds)
+        self.busy = threading.Event()
+        self.open = threading.Event()
+        return
+
+
+def test():
+    # access the packages
+    import journal
+    from pyre.units.SI import second
+
+    # get the journal
+    executive = journal.info.journal
+    # save the current device
+    device = executive.device
+
+    # build a buffered device
+    buffered = journal.buffered()
+    # that writes into a string
+    buffered.log = io.StringIO()
+    # and waits for a long time before writing
+    buffered.interval = 60*second
+    # install it
+    executive.device = buffered
+
+    # carefully
+    try:
+        # make an info channel
+        info = journal.info("journal.test.buffered")
+        # say something
+        info.log("hello")
+        # verify that nothing was written yet
+        assert buffered.log.getvalue() == ""
+        # flush
+        buffered.flush()
+        # and check that the entry was written
+        assert "hello" in buffered.log.getvalue()
+
+        # record some more
+        info.log("more")
+        # verify that it's waiting
+        assert "more" not in buffered.log.getvalue()
+        # now, an error
+        error = journal.error("journal.test.buffered")
+        # say something
+        error.log("error")
+        # check that both the error and the pending entry were written
+        assert "more" in buffered.log.getvalue()
+        assert "error" in buffered.log.getvalue()
+
+        # build another device that drops entries when it falls behind
+        dropper = journal.buffered()
+        # make it write immediately into a stream that lets us hold the writer
+        dropper.log = Gate()
+        dropper.size = 1
+        # make its queue small
+        dropper.capacity = 2
+        # and set the policy
+        dropper.policy = "drop"
+        # install it
+        executive.device = dropper
+
+        # say something
+        info.log("first")
+        # wait until the writer is holding
+        dropper.log.busy.wait()
+        # say a few more things: two of these fit in the queue, the rest are dropped
+        for index in range(5): info.log("entry {}".format(index))
+        # check the count
+        assert dropper.dropped == 3
+        # let the writer go
+        dropper.log.open.set()
+        # flush
+        dropper.flush()
+        # get the text
+        text = dropper.log.getvalue()
+        # check that the entries that fit made it
+        assert "entry 0" in text and "entry 1" in text
+        # that the rest didn't
+        assert "entry 2" not in text
+        # and that there is a note about them
+        assert "dropped 3 entries" in text
+
+        # build another dropper
+        dropper = journal.buffered()
+        # with a small queue, whose writer we can hold
+        dropper.log = Gate()
+        dropper.size = 1
+        dropper.capacity = 2
+        dropper.policy = "drop"
+        # install it
+        executive.device = dropper
+        # say something
+        info.log("first")
+        # wait until the writer is holding
+        dropper.log.busy.wait()
+        # fill the queue
+        for index in range(3): info.log("entry {}".format(index))
+        # an error now has to wait for room, so say it from another thread
+        urgent = threading.Thread(target=lambda: error.log("urgent"))
+        urgent.start()
+        # let the writer go
+        dropper.log.open.set()
+        # wait for the error to be written
+        urgent.join()
+        # check that it wasn't dropped along with the entry that didn't fit
+        assert dropper.dropped == 1
+        assert "urgent" in dropper.log.getvalue()
+
+        # build one more device
+        racer = journal.buffered()
+        racer.log = io.StringIO()
+        # install it
+        executive.device = racer
+        # count the writers
+        writers = sum(thread.name == "journal" for thread in threading.enumerate())
+        # make the threads switch often, and line them up so their first entries race
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        barrier = threading.Barrier(8)
+        def race(index):
+            barrier.wait()
+            info.log("racer {}".format(index))
+        # carefully
+        try:
+            # run them
+            racers = [ threading.Thread(target=race, args=(index,)) for index in range(8) ]
+            for thread in racers: thread.start()
+            for thread in racers: thread.join()
+        # no matter what
+        finally:
+            # restore the switch interval
+            sys.setswitchinterval(interval)
+        # check that only one writer was started
+        assert sum(thread.name == "journal" for thread in threading.enumerate()) == writers + 1
+        # and that all the entries made it
+        racer.flush()
+        assert all("racer {}".format(index) in racer.log.getvalue() for index in range(8))
+
+    # no matter what
+    finally:
+        # restore the device
+        executive.device = device
+
+    # all done
+    return
+
+
+# main
+if __name__ == "__main__":
+    test()
+
+
+# end of file
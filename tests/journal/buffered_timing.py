@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# michael a.g. aïvázis
+# orthologue
+# (c) 1998-2018 all rights reserved
+#
+
+
+"""
+Measure the cost of recording journal entries with the file device and the buffered device
+"""
+
+# externals
+import time
+
+
+def run(device, entries):
+    """
+    Record {entries} journal entries through {device}
+    """
+    # access the package
+    import journal
+    # get the journal
+    executive = journal.info.journal
+    # save the current device
+    saved = executive.device
+    # install mine
+    executive.device = device
+    # make a channel
+    info = journal.info("journal.timing")
+    # start the clock
+    start = time.perf_counter()
+    # record
+    for index in range(entries): info.log("entry {}".format(index))
+    # stop the clock
+    elapsed = time.perf_counter() - start
+    # make sure everything is written out
+    device.log.flush()
+    # restore the device
+    executive.device = saved
+    # and return the time
+    return elapsed
+
+
+def test(entries=20000):
+    # access the package
+    import journal
+
+    # build a file device
+    file = journal.file()
+    # point it to the log file
+    file.log = "journal.log"
+    # build a buffered device
+    buffered = journal.buffered()
+    # point it to the same file
+    buffered.log = file.log
+
+    # time the file device
+    direct = run(file, entries=entries)
+    # and the buffered one
+    batched = run(buffered, entries=entries)
+    # and the time it takes to write everything out
+    start = time.perf_counter()
+    buffered.flush()
+    drained = time.perf_counter() - start
+
+    # show me
+    print("journal devices: {} entries".format(entries))
+    print("    file: {:.3f} sec, {:.1f} us/entry".format(direct, 1e6*direct/entries))
+    print("    buffered: {:.3f} sec, {:.1f} us/entry, speedup: {:.2f}".format(
+        batched, 1e6*batched/entries, direct/batched))
+    print("      plus {:.3f} sec to drain the pending entries".format(drained))
+
+    # all done
+    return
+
+
+# main
+if __name__ == "__main__":
+    # do...
+    test()
+
+
+# end of file
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# michael a.g. aïvázis
+# orthologue
+# (c) 1998-2018 all rights reserved
+#
+
+
+"""
+Verify that channels format their messages only when they are active
+"""
+
+# externals
+import io
+import sys
+import warnings
+
+
+# a value that counts the number of times it gets formatted
+class Expensive:
+
+    def __format__(self, spec):
+        # count the visit
+        self.formatted += 1
+        # and render
+        return "expensive"
+
+    def __init__(self):
+        self.formatted = 0
+        return
+
+
+def test():
+    # access the package
+    import journal
+    # get the journal
+    executive = journal.info.journal
+    # save the current device
+    device = executive.device
+    # make a device that writes into a string
+    executive.device = journal.file()
+    executive.device.log = io.StringIO()
+
+    # carefully
+    try:
+        # build a debug channel; it is off by default
+        debug = journal.debug("journal.test.deferred")
+        # make a value
+        value = Expensive()
+        # a callable that should never be invoked
+        def never():
+            assert False, "unreachable"
+        # say things
+        debug.line("template: {}", value)
+        debug.line(never)
+        debug.log("template: {value}", value=value)
+        # verify that nothing was formatted
+        assert value.formatted == 0
+
+        # now, build an info channel; it is on by default
+        info = journal.info("journal.test.deferred")
+        # say things
+        info.line("template: {}", value)
+        info.line(lambda n: "callable: {}".format(n), 2)
+        info.line("verbatim: {}")
+        info.log("keywords: {value}", value=value)
+        # verify that the value was formatted twice
+        assert value.formatted == 2
+
+        # a lone integer that the message has no use for is the stack depth of the old signature
+        def helper():
+            # report on behalf of my caller
+            info.log("on behalf of my caller", 1)
+        # so, carefully
+        with warnings.catch_warnings(record=True) as caught:
+            # make sure the warning is not filtered out
+            warnings.simplefilter("always")
+            # call the helper
+            helper(); line = sys._getframe().f_lineno
+        # check that the entry was attributed to me
+        assert info.locator.line == line
+        assert info.locator.function == "test"
+        # and that the old signature was flagged
+        assert [ warning.category for warning in caught ] == [DeprecationWarning]
+        # if the message has a placeholder, the integer is formatted
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            info.log("count: {}", 1)
+        # without complaints
+        assert not caught
+        # get the text
+        text = executive.device.log.getvalue()
+    # no matter what
+    finally:
+        # restore the device
+        executive.device = device
+
+    # check the text
+    assert "template: expensive" in text
+    assert "callable: 2" in text
+    assert "verbatim: {}" in text
+    assert "keywords: expensive" in text
+    assert "count: 1" in text
+
+    # all done
+    return
+
+
+# main
+if __name__ == "__main__":
+    test()
+
+
+# end of file
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# michael a.g. aïvázis
+# orthologue
+# (c) 1998-2018 all rights reserved
+#
+
+
+"""
+Measure the rate at which active channels record journal entries, and the cost of the call site
+capture compared to walking the stack with {traceback}
+"""
+
+# externals
+import time
+import traceback
+import pyre
+import journal
+from journal.protocols import device
+
+
+# a device that discards its entries, so that only the cost of the channel is measured
+class Null(pyre.component, family="journal.devices.null", implements=device):
+
+    renderer = device.Renderer()
+
+    @pyre.export
+    def record(self, page, metadata):
+        # nothing to do
+        return self
+
+
+def test(entries=100000):
+    # get the journal
+    executive = journal.info.journal
+    # save the current device
+    device = executive.device
+    # install mine
+    executive.device = Null()
+
+    # carefully
+    try:
+        # make a channel
+        info = journal.info("journal.timing")
+        # start the clock
+        start = time.perf_counter()
+        # record
+        for _ in range(entries): info.log("entry")
+        # stop the clock
+        channel = time.perf_counter() - start
+    # no matter what
+    finally:
+        # restore the device
+        executive.device = device
+
+    # the call site capture used to be a full stack walk that also retrieved the source text
+    start = time.perf_counter()
+    for _ in range(entries): traceback.extract_stack(limit=2)
+    stack = time.perf_counter() - start
+    # compared to climbing straight to the frame
+    start = time.perf_counter()
+    for _ in range(entries): journal.info.frame(depth=1)
+    frame = time.perf_counter() - start
+
+    # show me
+    print("journal channels: {} entries".format(entries))
+    print("    info: {:.3f} sec, {:.1f} us/entry, {:.0f} entries/sec".format(
+        channel, 1e6*channel/entries, entries/channel))
+    print("  call site capture:")
+    print("    traceback: {:.1f} us/entry".format(1e6*stack/entries))
+    print("    frame: {:.1f} us/entry, speedup: {:.2f}".format(1e6*frame/entries, stack/frame))
+
+    # all done
+    return
+
+
+# main
+if __name__ == "__main__":
+    # do...
+    test()
+
+
+# end of file
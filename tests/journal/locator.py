@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# michael a.g. aïvázis
+# orthologue
+# (c) 1998-2018 all rights reserved
+#
+
+
+"""
+Verify that channels record the location of their clients
+"""
+
+# externals
+import io
+import sys
+
+
+def test():
+    # access the package
+    import journal
+    # get the journal
+    executive = journal.info.journal
+    # save the current device
+    device = executive.device
+    # make a device that writes into a string
+    executive.device = journal.file()
+    executive.device.log = io.StringIO()
+
+    # carefully
+    try:
+        # build an info channel
+        info = journal.info("journal.test.locator")
+        # before it says anything, it doesn't have a location
+        assert info.locator is None
+        # make it say something
+        info.log("hello world!"); line = sys._getframe().f_lineno
+    # no matter what
+    finally:
+        # restore the device
+        executive.device = device
+
+    # get the meta data
+    meta = info.meta
+    # check the location
+    assert meta["filename"] == __file__
+    assert meta["line"] == line
+    assert meta["function"] == "test"
+    # and the source text, which is looked up only now
+    assert "source" not in meta
+    assert meta["source"] == meta.get("source")
+    assert meta["source"].startswith('info.log("hello world!")')
+    # check the locator
+    assert info.locator.source == __file__
+    assert info.locator.line == line
+    assert info.locator.function == "test"
+
+    # all done
+    return
+
+
+# main
+if __name__ == "__main__":
+    test()
+
+
+# end of file
@@ -24,6 +24,7 @@ pyrepg:
 	${PYTHON} ./pyrepg_connect.py
 	${PYTHON} ./pyrepg_execute.py
 	${PYTHON} ./pyrepg_execute_badCommand.py
+	${PYTHON} ./pyrepg_query.py
 	${PYTHON} ./pyrepg_submit.py
 
 components:
@@ -33,6 +34,10 @@ components:
 	${PYTHON} ./postgres_table.py
 	${PYTHON} ./postgres_reserved.py
 	${PYTHON} ./postgres_references.py
+	${PYTHON} ./postgres_select.py
+	${PYTHON} ./postgres_submit.py
+	${PYTHON} ./postgres_load.py
+	${PYTHON} ./postgres_prepared.py
 	${PYTHON} ./postgres_database_drop.py
 
 
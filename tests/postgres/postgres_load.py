@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# michael a.g. aïvázis
+# orthologue
+# (c) 1998-2018 all rights reserved
+#
+
+
+"""
+Load records in bulk, through prepared statements and COPY
+"""
+
+
+import pyre.db
+
+class Weather(pyre.db.table, id="weather"):
+
+    city = pyre.db.str()
+    city.doc = "the city name"
+
+    date = pyre.db.date()
+    date.doc = "the date of the measurement"
+
+    low = pyre.db.decimal(precision=5, scale=2)
+    low.doc = "the temperature low"
+
+    high = pyre.db.float().setDefault(100)
+    high.doc = "the temperature high"
+
+
+def test():
+    # build a database component and connect to the database specified in the local
+    # configuration file
+    db = pyre.db.postgres(name="test").attach()
+
+    # in a transaction block
+    with db:
+        # create the table
+        db.createTable(Weather)
+        # make some records
+        records = [
+            Weather.pyre_immutable(
+                city="pasadena", date="2018-03-{:02}".format(day), low=40+day/4, high=60+day)
+            for day in range(1, 29) ]
+        # with a few special ones
+        records += [
+            # with embedded quotes
+            Weather.pyre_immutable(city="o'hare", date="2018-03-01", low="30.25", high=45),
+            # a {NULL}
+            Weather.pyre_immutable(city="boston", date="2018-03-01", low=Weather.null, high=40),
+            # one with characters that must be escaped when streamed
+            Weather.pyre_immutable(city="new\tyork\\", date="2018-03-01", low="35", high=50),
+            # and a {DEFAULT}
+            Weather.pyre_immutable(
+                city="austin", date="2018-03-01", low="50.5", high=Weather.default),
+            ]
+        # load them through a prepared statement
+        db.load(*records)
+        # and again by streaming them
+        db.streaming = 1
+        db.load(*records)
+
+        # read them back
+        sql = "SELECT city, date, low, high FROM weather ORDER BY city, date"
+        headers, *rows = db.execute(sql)
+        # check the count
+        assert len(rows) == 2*len(records)
+        # the {DEFAULT}
+        assert rows[0] == rows[1] == ("austin", "2018-03-01", "50.50", "100")
+        # the {NULL}
+        assert rows[2][2] is pyre.db.null
+        # the city with the special characters
+        assert rows[4] == rows[5] == ("new\tyork\\", "2018-03-01", "35.00", "50")
+        # the city with the quote
+        assert rows[6] == rows[7] == ("o'hare", "2018-03-01", "30.25", "45")
+        # and some of the regular ones
+        assert rows[8] == rows[9] == ("pasadena", "2018-03-01", "40.25", "61")
+
+        # drop the table
+        db.dropTable(Weather)
+
+    # and return the connection and the table
+    return db, Weather
+
+
+# main
+if __name__ == "__main__":
+    test()
+
+
+# end of file
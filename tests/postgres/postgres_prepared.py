@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# michael a.g. aïvázis
+# orthologue
+# (c) 1998-2018 all rights reserved
+#
+
+
+"""
+Verify that statement templates are executed as prepared statements that are shared by
+templates with the same text and released when there are too many of them
+"""
+
+
+import pyre.db
+
+class Weather(pyre.db.table, id="weather"):
+
+    city = pyre.db.str()
+    city.doc = "the city name"
+
+    low = pyre.db.int()
+    low.doc = "the temperature low"
+
+    high = pyre.db.int()
+    high.doc = "the temperature high"
+
+
+def test():
+    # build a database component and connect to the database specified in the local
+    # configuration file
+    db = pyre.db.postgres(name="test").attach()
+    # keep only a few prepared statements around
+    db.preparations = 2
+    # the query that counts them
+    count = "SELECT COUNT(*) FROM pg_prepared_statements WHERE name LIKE 'pyre_statement_%'"
+
+    # in a transaction block
+    with db:
+        # create the table
+        db.createTable(Weather)
+        # populate it
+        db.insert(*(
+            Weather.pyre_immutable(city="pasadena", low=low, high=low+20)
+            for low in range(40, 60)))
+
+        # delete with a condition that has a literal operation; the parameter types must be
+        # supplied, since the server has nothing to infer them from
+        two = pyre.db.field.literal(value=2)
+        db.delete(table=Weather, condition=(two * 21 > Weather.low))
+        # verify the right rows are gone
+        assert db.execute("SELECT COUNT(*) FROM weather") == (('count',), ('18',))
+        # this is the only prepared statement so far
+        assert db.execute(count)[1] == ('1',)
+
+        # make more shapes than there is room for
+        db.delete(table=Weather, condition=(Weather.low < 0))
+        db.delete(table=Weather, condition=(Weather.high < 0))
+        db.delete(table=Weather, condition=(Weather.city == "boston"))
+        # verify that the server only holds as many as allowed
+        assert len(db.statements) == 2
+        assert db.execute(count)[1] == ('2',)
+
+        # throw the cached templates away
+        db.sql.statements.clear()
+        # verify that rebuilt templates reuse their prepared statement
+        names = dict(db.statements)
+        db.delete(table=Weather, condition=(Weather.city == "austin"))
+        assert db.statements == names
+
+        # drop the table
+        db.dropTable(Weather)
+
+    # and return the connection and the table
+    return db, Weather
+
+
+# main
+if __name__ == "__main__":
+    test()
+
+
+# end of file
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# michael a.g. aïvázis
+# orthologue
+# (c) 1998-2018 all rights reserved
+#
+
+
+"""
+Submit queries for asynchronous execution and harvest their results through a dispatcher
+"""
+
+
+def test():
+    # access the packages
+    import pyre.db
+    import pyre.ipc
+
+    # build a database component and connect to the database specified in the local
+    # configuration file
+    db = pyre.db.postgres(name="test").attach()
+    # make a dispatcher
+    dispatcher = pyre.ipc.newSelector()
+
+    # the results, in the order they were delivered
+    results = []
+    # the handler
+    def harvest(result, error):
+        # save the outcome
+        results.append((result, error))
+        # all done
+        return
+
+    # submit a few commands
+    db.submit("SELECT datname FROM pg_database WHERE datname='postgres'",
+              dispatcher=dispatcher, call=harvest)
+    db.submit("SELECT no_such_column FROM pg_database", dispatcher=dispatcher, call=harvest)
+    db.submit("SELECT 1 AS one;", "SELECT 2 AS two;", dispatcher=dispatcher, call=harvest)
+    # nothing has been delivered yet
+    assert results == []
+
+    # process the events
+    dispatcher.watch()
+
+    # check that all commands were processed in order
+    assert len(results) == 3
+    # the first one succeeded
+    assert results[0] == ((('datname',), ('postgres',)), None)
+    # the second one failed
+    result, error = results[1]
+    assert isinstance(error, db.exceptions.ProgrammingError)
+    # and the last one returned the result of its last statement
+    assert results[2] == ((('two',), ('2',)), None)
+
+    # and return the connection
+    return db
+
+
+# main
+if __name__ == "__main__":
+    test()
+
+
+# end of file
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# michael a.g. aïvázis
+# orthologue
+# (c) 1998-2018 all rights reserved
+#
+
+
+"""
+Verify that the binary results of queries are decoded into native python objects
+"""
+
+
+def test():
+    # externals
+    import datetime, decimal
+    # import journal
+    # journal.debug("postgres.init").active = True
+    # journal.debug("postgres.connection").active = True
+    # journal.debug("postgres.execution").active = True
+    # journal.debug("postgres.conversions").active = True
+
+    from pyre.extensions import postgres as pyrepg
+    # initialize the module exceptions
+    import pyre.db.exceptions as exceptions
+    pyrepg.registerExceptions(exceptions)
+
+    # make a connection
+    connection = pyrepg.connect("dbname=postgres")
+    # build a query that exercises the supported types
+    command = """
+    SELECT
+        true AS yes,
+        (-7)::int2 AS small,
+        123456::int4 AS regular,
+        (-5000000000)::int8 AS big,
+        1.5::float4 AS single,
+        -2.25::float8 AS double,
+        -12345.678::numeric(10,3) AS amount,
+        0.00012::numeric AS tiny,
+        'hello'::varchar AS greeting,
+        '\\x0102'::bytea AS raw,
+        '2018-03-01'::date AS day,
+        '13:45:07.25'::time AS moment,
+        '2018-03-01 13:45:07.25'::timestamp AS stamp,
+        NULL::int4 AS nothing
+    """
+    # execute it
+    headers, row = pyrepg.query(connection, command)
+    # check the headers
+    assert headers == (
+        'yes', 'small', 'regular', 'big', 'single', 'double', 'amount', 'tiny', 'greeting',
+        'raw', 'day', 'moment', 'stamp', 'nothing')
+    # and the values
+    assert row == (
+        True, -7, 123456, -5000000000, 1.5, -2.25,
+        decimal.Decimal('-12345.678'), decimal.Decimal('0.00012'),
+        'hello', b'\x01\x02',
+        datetime.date(2018, 3, 1),
+        datetime.time(13, 45, 7, 250000),
+        datetime.datetime(2018, 3, 1, 13, 45, 7, 250000),
+        None)
+
+    # now, the special values
+    command = """
+    SELECT
+        'infinity'::date AS late,
+        '-infinity'::date AS early,
+        '10000-01-01'::date AS future,
+        '0044-03-15 BC'::date AS ides,
+        'infinity'::timestamp AS forever,
+        '-infinity'::timestamptz AS never,
+        '10000-01-01 12:30:00.5'::timestamp AS later,
+        'NaN'::numeric AS unknown,
+        'Infinity'::numeric AS huge,
+        '-Infinity'::numeric AS negative
+    """
+    # execute it
+    headers, special = pyrepg.query(connection, command)
+    # infinities map onto the extreme values of the python types
+    assert special[0] == datetime.date.max
+    assert special[1] == datetime.date.min
+    assert special[4] == datetime.datetime.max
+    assert special[5] == datetime.datetime.min.replace(tzinfo=datetime.timezone.utc)
+    # values that are out of the range of the python types come back as text
+    assert special[2] == '10000-01-01'
+    assert special[3] == '0044-03-15 BC'
+    assert special[6] == '10000-01-01 12:30:00.5'
+    # the special numeric values have decimal representations
+    assert special[7].is_nan()
+    assert special[8] == decimal.Decimal('Infinity')
+    assert special[9] == decimal.Decimal('-Infinity')
+
+    # types whose binary form is converted to the text the server would have sent
+    command = """
+    SELECT
+        'a0eebc99-9c0b-4ef8-bb6d-6bb9bd380a11'::uuid AS id,
+        '{"a": [1, 2]}'::jsonb AS document,
+        '<a>b</a>'::xml AS markup,
+        1259::oid AS catalog
+    """
+    headers, known = pyrepg.query(connection, command)
+    assert known == (
+        'a0eebc99-9c0b-4ef8-bb6d-6bb9bd380a11', '{"a": [1, 2]}', '<a>b</a>', 1259)
+    # asking for binary explicitly makes no difference
+    assert pyrepg.query(connection, command, True)[1] == known
+
+    # types without a binary decoder make the whole result set travel as text
+    command = """
+    SELECT
+        42::int4 AS answer,
+        '1 day 02:00:00'::interval AS span,
+        '10.0.0.1/8'::inet AS network,
+        ARRAY[1, 2, 3] AS numbers
+    """
+    headers, unknown = pyrepg.query(connection, command)
+    assert unknown == ('42', '1 day 02:00:00', '10.0.0.1/8', '{1,2,3}')
+    # asking for binary results is an error, rather than a source of raw bytes
+    try:
+        pyrepg.query(connection, command, True)
+        assert False, "unreachable"
+    except TypeError:
+        pass
+
+    # cursors can be checked before their rows are fetched
+    pyrepg.execute(connection, "BEGIN")
+    pyrepg.execute(connection, "DECLARE known CURSOR FOR SELECT 1::int4, 'a'::text")
+    pyrepg.execute(connection, "DECLARE unknown CURSOR FOR SELECT 1::int4, '1 day'::interval")
+    assert pyrepg.decodable(connection, "known") is True
+    assert pyrepg.decodable(connection, "unknown") is False
+    pyrepg.execute(connection, "ROLLBACK")
+
+    # and return the connection and the resulting tuple
+    return connection, row
+
+
+# main
+if __name__ == "__main__":
+    test()
+
+
+# end of file
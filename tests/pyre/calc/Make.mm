@@ -57,6 +57,9 @@ memo:
 	${PYTHON} ./memo_model.py
 	${PYTHON} ./memo_expression.py
 	${PYTHON} ./memo_interpolation.py
+	${PYTHON} ./memo_batch.py
+	${PYTHON} ./observers.py
+	${PYTHON} ./plan.py
 
 hierarchical:
 	${PYTHON} ./hierarchical.py
@@ -64,6 +67,7 @@ hierarchical:
 	${PYTHON} ./hierarchical_alias.py
 	${PYTHON} ./hierarchical_group.py
 	${PYTHON} ./hierarchical_contains.py
+	${PYTHON} ./hierarchical_hash.py
 
 model:
 	${PYTHON} ./model.py
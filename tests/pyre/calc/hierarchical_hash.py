@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# michael a.g. aïvázis
+# orthologue
+# (c) 1998-2018 all rights reserved
+#
+
+
+"""
+Verify that the cache of name keys stays consistent with aliases
+"""
+
+
+def test():
+    import pyre.calc
+
+    # create a model
+    model = pyre.calc.model()
+
+    # hashing the same name twice gives the same key
+    key = model.hash("user.name")
+    assert model.hash("user.name") is key
+    # and the same key as walking the name hash one level at a time
+    assert model.hash(("user", "name")) is key
+
+    # make {author} an alternate name for {user}
+    model.alias(alias="author", target="user")
+    # hash a name through the alias
+    assert model.hash("author.name") is key
+    # and one that doesn't exist yet
+    email = model.hash("author.email")
+    assert model.hash("user.email") is email
+
+    # now, alias {user.email} deep inside the alias
+    model.alias(base="user", alias="email", target="contact.email")
+    # both the canonical name and the name through the outer alias must see the change
+    assert model.hash("user.email") is model.hash("contact.email")
+    assert model.hash("author.email") is model.hash("contact.email")
+    assert model.hash("author.email") is not email
+
+    # all done
+    return
+
+
+# main
+if __name__ == "__main__":
+    # skip pyre initialization since we don't rely on the executive
+    pyre_noboot = True
+    # run the test
+    test()
+
+
+# end of file
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# michael a.g. aïvázis
+# orthologue
+# (c) 1998-2018 all rights reserved
+#
+
+
+"""
+Verify that change notifications visit each node once, in order, and can be batched
+"""
+
+
+def test():
+    # access the package
+    import pyre.calc
+    # get the base class
+    from pyre.calc.Probe import Probe
+
+    # make a probe that counts the notifications it receives
+    class probe(Probe):
+
+        def flush(self, observable):
+            self.count += 1
+            self.values.append(observable.value)
+            return self
+
+        def __init__(self, **kwds):
+            super().__init__(**kwds)
+            self.count = 0
+            self.values = []
+            return
+
+    # build a diamond
+    v = pyre.calc.var(value=1)
+    a = v + 1
+    b = v * 2
+    s = a + b
+    # compute
+    assert s.value == 4
+    # watch the bottom of the diamond
+    p = probe()
+    p.observe(observables=[s])
+
+    # change the top of the diamond
+    v.value = 2
+    # the probe must have been notified exactly once, after both paths were invalidated
+    assert p.count == 1
+    assert p.values == [7]
+
+    # now, make a batch of changes
+    with pyre.calc.batch():
+        # change the value a few times
+        v.value = 3
+        v.value = 4
+        v.value = 5
+        # no notifications should have been delivered yet
+        assert p.count == 1
+    # but once the batch is over, there should be exactly one more
+    assert p.count == 2
+    assert p.values == [7, 16]
+
+    # build a chain that is much taller than the interpreter stack
+    nodes = [v]
+    for _ in range(5000):
+        nodes.append(nodes[-1] + 1)
+    # compute the value at the bottom; this is iterative enough
+    for node in nodes: node.value
+    assert nodes[-1].value == 5005
+    # change the top
+    v.value = 0
+    # and verify that the notification made it all the way down
+    assert nodes[-1].dirty is True
+    # recompute
+    for node in nodes: node.value
+    assert nodes[-1].value == 5000
+
+    # all done
+    return
+
+
+# main
+if __name__ == "__main__":
+    # request debugging support for the pyre.calc package
+    pyre_debug = { "pyre.calc" }
+    # skip pyre initialization since we don't rely on the executive
+    pyre_noboot = True
+    # do...
+    test()
+    # verify reference counts
+    from pyre.calc.Node import Node
+    # print(tuple(Node._pyre_extent))
+    assert tuple(Node._pyre_extent) == ()
+
+
+# end of file
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# michael a.g. aïvázis
+# orthologue
+# (c) 1998-2018 all rights reserved
+#
+
+
+"""
+Verify that dead observers are pruned in place when a node delivers notifications
+"""
+
+
+def test():
+    # for the collector
+    import gc
+    # access the package
+    import pyre.calc
+
+    # make a variable
+    v = pyre.calc.var(value=1)
+    # and a couple of observers
+    a = v + 1
+    b = v * 2
+    # compute
+    assert a.value == 2
+    assert b.value == 2
+    # grab the pile of observers
+    pile = v._observers
+    # check it
+    assert set(v.observers) == {a, b}
+
+    # kill one of the observers
+    del b
+    gc.collect()
+    # make a change
+    v.value = 2
+    # the notification should not have replaced the pile
+    assert v._observers is pile
+    # but it should have pruned the dead observer from it
+    assert len(pile) == 1
+    # and the live one must still see the change
+    assert a.value == 3
+
+    # all done
+    return
+
+
+# main
+if __name__ == "__main__":
+    # request debugging support for the pyre.calc package
+    pyre_debug = { "pyre.calc" }
+    # skip pyre initialization since we don't rely on the executive
+    pyre_noboot = True
+    # do...
+    test()
+    # verify reference counts
+    from pyre.calc.Node import Node
+    # print(tuple(Node._pyre_extent))
+    assert tuple(Node._pyre_extent) == ()
+
+
+# end of file
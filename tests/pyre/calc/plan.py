@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# michael a.g. aïvázis
+# orthologue
+# (c) 1998-2018 all rights reserved
+#
+
+
+"""
+Verify that evaluation plans compute the same values as the nodes they flatten
+"""
+
+
+def test():
+    # access the package
+    import pyre.calc
+
+    # set up the model
+    model = pyre.calc.model()
+    # the nodes
+    p = 80.
+    s = .25*80
+    # register the nodes
+    model["production"] = p
+    model["shipping"] = s
+    model["cost"] = model.expression("{production}+{shipping}")
+    model["price"] = model.expression("2*{cost}")
+    model["margin"] = model.retrieve("price") - model.retrieve("cost")
+    model["label"] = model.interpolation("price: {price}")
+
+    # make plans
+    price = pyre.calc.plan(model.retrieve("price"))
+    margin = pyre.calc.plan(model.retrieve("margin"))
+    label = pyre.calc.plan(model.retrieve("label"))
+
+    # check the values
+    assert price.value == 2*(p+s)
+    assert margin.value == p+s
+    assert label.value == "price: {}".format(2*(p+s))
+    # evaluating the plans refreshes the node caches
+    assert model.retrieve("cost").dirty == False
+    assert model.retrieve("price").dirty == False
+
+    # sweep over a parameter
+    production = model.retrieve("production")
+    for p in range(10):
+        # set the value
+        production.value = p
+        # verify that the plan notices
+        assert margin.value == p+s
+        # and agrees with the model
+        assert model["margin"] == p+s
+
+    # change the structure of the graph by replacing a node
+    s = 10.
+    model["shipping"] = s
+    # check
+    assert price.value == 2*(p+s)
+    assert margin.value == p+s
+    assert model["price"] == 2*(p+s)
+
+    # errors are reported the same way
+    model["cost"] = model.expression("{production}/0")
+    try:
+        price.value
+        assert False, "unreachable"
+    except model.EvaluationError as error:
+        assert isinstance(error.error, ZeroDivisionError)
+
+    # unresolved nodes too
+    model["cost"] = model.expression("{tax}")
+    try:
+        price.value
+        assert False, "unreachable"
+    except model.UnresolvedNodeError as error:
+        assert error.name == "tax"
+
+    # all done
+    return
+
+
+# main
+if __name__ == "__main__":
+    # skip pyre initialization since we don't rely on the executive
+    pyre_noboot = True
+    # do...
+    test()
+
+
+# end of file
@@ -28,6 +28,7 @@ tables:
 	${PYTHON} ./table_instantiation.py
 	${PYTHON} ./table_insert.py
 	${PYTHON} ./table_update.py
+	${PYTHON} ./table_load.py
 
 queries:
 	${PYTHON} ./query_star.py
@@ -39,6 +40,8 @@ queries:
 	${PYTHON} ./query_collation_explicit.py
 	${PYTHON} ./query_collation_expression.py
 	${PYTHON} ./query_inheritance.py
+	${PYTHON} ./query_cursor.py
+	${PYTHON} ./query_template.py
 
 persistence:
 	${PYTHON} ./persistent_declaration.py
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# michael a.g. aïvázis
+# orthologue
+# (c) 1998-2018 all rights reserved
+#
+
+
+"""
+Exercise the generation of the statements that manage server side cursors
+"""
+
+
+def test():
+    # access to the package
+    import pyre.db
+
+    # declare a simple table
+    class Weather(pyre.db.table, id="weather"):
+        """
+        The sample table from the postgres tutorial
+        """
+        # the fields
+        city = pyre.db.str()
+        date = pyre.db.date()
+        low = pyre.db.int()
+        high = pyre.db.int()
+        precipitation = pyre.db.float()
+
+    # and a simple query
+    class measurements(pyre.db.query, weather=Weather):
+        # the fields
+        city = weather.city
+        date = weather.date
+
+    # get a server
+    server = pyre.db.server()
+    # generate the SQL statement that declares the cursor
+    stmt = tuple(server.sql.declare(cursor="scan", query=measurements))
+    # print('\n'.join(stmt))
+    assert stmt == (
+        "DECLARE scan NO SCROLL CURSOR FOR",
+        "SELECT",
+        "    weather.city AS city,",
+        "    weather.date AS date",
+        "  FROM",
+        "    weather;"
+        )
+    # the one that fetches rows
+    assert tuple(server.sql.fetch(cursor="scan", count=100)) == (
+        "FETCH FORWARD 100 FROM scan;",
+        )
+    # and the one that releases it
+    assert tuple(server.sql.close(cursor="scan")) == ("CLOSE scan;",)
+
+    # all done
+    return Weather
+
+
+# main
+if __name__ == "__main__":
+    test()
+
+
+# end of file
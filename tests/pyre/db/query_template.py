@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# michael a.g. aïvázis
+# orthologue
+# (c) 1998-2018 all rights reserved
+#
+
+
+"""
+Verify that the SQL generator caches statement templates by the shape of their descriptions
+"""
+
+
+def test():
+    # access to the package
+    import pyre.db
+
+    # declare a simple table
+    class Weather(pyre.db.table, id="weather"):
+        """
+        The sample table from the postgres tutorial
+        """
+        # the fields
+        city = pyre.db.str()
+        date = pyre.db.date()
+        low = pyre.db.int()
+        high = pyre.db.int()
+        precipitation = pyre.db.float()
+
+    # and a simple query
+    class measurements(pyre.db.query, weather=Weather):
+        # the fields
+        city = weather.city
+        date = weather.date
+        # the restriction
+        where = (city == "Chicago") & (weather.low > 40)
+
+    # get a server
+    server = pyre.db.server()
+    # and its generator
+    sql = server.sql
+
+    # build the template
+    statement, values = sql.selectStatement(query=measurements)
+    # check the values
+    assert values == ["Chicago", 40]
+    # check the text, with numbered placeholders
+    markers = ("${}".format(index) for index in range(1, 3))
+    assert statement.text(markers=markers) == "\n".join((
+        "SELECT",
+        "    weather.city AS city,",
+        "    weather.date AS date",
+        "  FROM",
+        "    weather",
+        "  WHERE",
+        "    (((weather.city) = ($1)) AND ((weather.low) > ($2)));"
+        ))
+    # and the parameters
+    assert sql.bind(statement=statement, values=values) == ("Chicago", "40")
+
+    # change the literals
+    measurements.where = (measurements.city == "Pasadena") & (measurements.weather.low > 60)
+    # build the template again
+    again, values = sql.selectStatement(query=measurements)
+    # verify it came from the cache
+    assert again is statement
+    # with the new values
+    assert values == ["Pasadena", 60]
+    # and that the rendered statement has them in place
+    assert tuple(sql.select(query=measurements))[-1] == (
+        "    (((weather.city) = ('Pasadena')) AND ((weather.low) > (60)));")
+
+    # change the shape of the restriction
+    measurements.where = (measurements.city == "Pasadena")
+    # this is a different statement
+    other, values = sql.selectStatement(query=measurements)
+    assert other is not statement
+    assert values == ["Pasadena"]
+
+    # updates
+    template = pyre.db.template(Weather)
+    template.low = 10
+    template.precipitation = Weather.null
+    # build the statement
+    update, values = sql.updateStatement(template=template, condition=(Weather.city == "Boston"))
+    # the special values are rendered in place, the rest are parameters
+    assert values == [10, "Boston"]
+    low, literal = update.fields
+    assert low.name == "low" and literal is None
+    assert tuple(sql.inline(statement=update, values=values)) == (
+        "UPDATE weather",
+        "  SET",
+        "    (low, precipitation) = (10, NULL)",
+        "  WHERE ((city) = ('Boston'));"
+        )
+    # and cached
+    template.low = 12
+    assert sql.updateStatement(template=template, condition=(Weather.city == "Miami"))[0] is update
+
+    # deletions
+    delete, values = sql.deleteStatement(table=Weather, condition=(Weather.high < 0))
+    assert values == [0]
+    assert delete.text(markers=["?"]) == "DELETE FROM weather\n  WHERE ((high) < (?));"
+    # are cached as well
+    assert sql.deleteStatement(table=Weather, condition=(Weather.high < 100))[0] is delete
+
+    # all done
+    return sql
+
+
+# main
+if __name__ == "__main__":
+    test()
+
+
+# end of file
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# michael a.g. aïvázis
+# orthologue
+# (c) 1998-2018 all rights reserved
+#
+
+
+"""
+Exercise the statements that load records in bulk
+"""
+
+
+def test():
+    # access the package
+    import pyre.db
+
+    # declare the person table
+    class Person(pyre.db.table, id='persons'):
+
+        id = pyre.db.int().primary()
+        name = pyre.db.str().notNull()
+        phone = pyre.db.str(maxlen=10).notNull()
+        weight = pyre.db.float().notNull()
+        member = pyre.db.bool()
+        joined = pyre.db.date()
+
+    # get a server
+    server = pyre.db.server(name="test")
+
+    # generate the parameterized insert statement
+    stmt = tuple(server.sql.insertTemplate(table=Person, markers=("?",)*6))
+    # print('\n'.join(stmt))
+    assert stmt == (
+        "INSERT INTO persons",
+        "    (id, name, phone, weight, member, joined)",
+        "  VALUES",
+        "    (?, ?, ?, ?, ?, ?);",
+        )
+
+    # generate a statement that inserts more than one record
+    markers = ("${}".format(index) for index in range(1, 13))
+    stmt = tuple(server.sql.insertTemplate(table=Person, markers=markers, rows=2))
+    # print('\n'.join(stmt))
+    assert stmt == (
+        "INSERT INTO persons",
+        "    (id, name, phone, weight, member, joined)",
+        "  VALUES",
+        "    ($1, $2, $3, $4, $5, $6),",
+        "    ($7, $8, $9, $10, $11, $12);",
+        )
+
+    # generate the statement that streams records
+    stmt = tuple(server.sql.copyRecords(table=Person))
+    # print('\n'.join(stmt))
+    assert stmt == (
+        "COPY persons (id, name, phone, weight, member, joined) FROM STDIN;",
+        )
+
+    # make a record
+    person = Person.pyre_immutable(
+        id=107, name="Bit 'Twiddle'", phone="+1 800 555 1114", weight=185, member=True,
+        joined="2018-03-01")
+    # verify the text rendering of its values does not quote them
+    assert tuple(field.text(value=value) for field, value in zip(Person.pyre_fields, person)) == (
+        "107", "Bit 'Twiddle'", "+1 800 555 1114", "185.0", "true", "2018-03-01")
+
+    return
+
+
+# main
+if __name__ == "__main__":
+    test()
+
+
+# end of file
@@ -10,7 +10,7 @@ PROJECT = pyre
 
 all: test clean
 
-test: sanity slots nameserver fileserver registrar linker externals executive
+test: sanity slots nameserver fileserver registrar linker externals executive cache
 
 sanity:
 	${PYTHON} ./sanity.py
@@ -39,6 +39,7 @@ linker:
 	${PYTHON} ./linker.py
 	${PYTHON} ./linker_codecs.py
 	${PYTHON} ./linker_shelves.py
+	${PYTHON} ./linker_resolutions.py
 
 externals:
 	${PYTHON} ./externals.py
@@ -51,5 +52,11 @@ executive:
 	${PYTHON} ./executive_resolve_badImport.py
 	${PYTHON} ./executive_resolve_syntaxError.py
 
+cache:
+	${PYTHON} ./cache.py
+
+timings:
+	${PYTHON} ./nameserver_timing.py
+
 
 # end of file
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# michael a.g. aïvázis
+# orthologue
+# (c) 1998-2018 all rights reserved
+#
+
+
+"""
+Verify that the startup cache remembers configuration events and missing shelves, notices
+when they go stale, and stays within its bounds
+"""
+
+
+def test():
+    # externals
+    import os, shutil, tempfile
+    # the journal
+    import journal
+    # access the framework parts
+    from pyre.framework.Cache import Cache
+    from pyre.config.pml.PML import PML as codec
+
+    # unless the user asked for it, the executive doesn't build a cache at all
+    if not os.environ.get("PYRE_CACHE"):
+        import pyre
+        assert pyre.executive.cache is None
+
+    # make a scratch area
+    scratch = tempfile.mkdtemp()
+    # carefully
+    try:
+        # put a copy of the sample configuration file there
+        sample = os.path.join(scratch, "sample.pml")
+        shutil.copyfile("sample.pml", sample)
+        # and pick a location for the store
+        store = os.path.join(scratch, "cache", "startup.pickle")
+
+        # make a cache
+        cache = Cache(uri=store)
+        # decode the sample
+        with open(sample) as source:
+            events = cache.decode(codec=codec, uri=sample, source=source, locator=None)
+        # verify we harvested the bindings
+        assert len(events) == 5
+        # that it was a miss
+        assert (cache.hits, cache.misses) == (0, 1)
+        # save the cache
+        cache.save()
+        # and verify the store was created
+        assert os.path.isfile(store)
+
+        # make another cache that uses the same store
+        cache = Cache(uri=store).load()
+        # decode the sample again
+        with open(sample) as source:
+            cached = cache.decode(codec=codec, uri=sample, source=source, locator=None)
+        # verify this was a hit
+        assert (cache.hits, cache.misses) == (1, 0)
+        # and that we got the same events back
+        assert [(event.key, event.value) for event in cached] == [
+            (event.key, event.value) for event in events]
+
+        # modify the sample
+        with open(sample, "a") as stream:
+            stream.write("\n")
+        # decode once more
+        with open(sample) as source:
+            cache.decode(codec=codec, uri=sample, source=source, locator=None)
+        # verify the stale entry was rebuilt
+        assert (cache.hits, cache.misses) == (1, 1)
+
+        # now, record a missing shelf
+        folders = (scratch,)
+        cache.recordMissing(uri="import:bogus", folders=folders)
+        # verify we remember it
+        assert cache.missing(uri="import:bogus", folders=folders)
+        # but only for the same folders
+        assert not cache.missing(uri="import:bogus", folders=(scratch, store))
+        # adding a file to the folder
+        open(os.path.join(scratch, "bogus.py"), "w").close()
+        # invalidates it
+        assert not cache.missing(uri="import:bogus", folders=folders)
+
+        # an entry that can't be pickled
+        cache.store(key=("events", "bogus"), stamp=None, value=lambda: None)
+        # makes the save fail
+        warning = journal.warning("pyre.framework.cache")
+        warning.active = False
+        cache.save()
+        warning.active = True
+        # but doesn't disturb the store
+        assert os.path.isfile(store)
+        assert not os.path.exists("{}.{}".format(store, os.getpid()))
+
+        # a store that others can write to
+        os.chmod(store, 0o666)
+        # is not trusted
+        assert Cache(uri=store).load().entries == {}
+        # unless it is private
+        os.chmod(store, 0o600)
+        assert Cache(uri=store).load().entries != {}
+
+        # entries expire
+        cache = Cache(uri=store)
+        cache.lifetime = 0
+        # so loading them
+        cache.load()
+        # leaves nothing behind
+        assert cache.entries == {}
+        # and the store is marked for rewriting
+        assert cache.modified
+
+        # a small cache
+        cache = Cache(uri=store)
+        cache.capacity = 2
+        # holding a few entries
+        for index in range(4):
+            cache.recordMissing(uri="import:bogus{}".format(index), folders=folders)
+        # keeps the latest ones only
+        assert len(cache.entries) == 2
+        assert cache.missing(uri="import:bogus3", folders=folders)
+        assert not cache.missing(uri="import:bogus0", folders=folders)
+
+        # finally, a disabled cache
+        cache = Cache(uri=store, disabled=True).load()
+        # knows nothing
+        assert cache.entries == {}
+        assert not cache.missing(uri="import:bogus", folders=folders)
+    # no matter what
+    finally:
+        # clean up
+        shutil.rmtree(scratch)
+
+    # all done
+    return cache
+
+
+# main
+if __name__ == "__main__":
+    # do...
+    test()
+
+
+# end of file
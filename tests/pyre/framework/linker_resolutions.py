@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# michael a.g. aïvázis
+# orthologue
+# (c) 1998-2018 all rights reserved
+#
+
+
+"""
+Verify that the linker remembers the outcomes of resolution requests
+"""
+
+
+def test():
+    # framework
+    import pyre
+    # and its parts
+    executive = pyre.executive
+    linker = executive.linker
+    fileserver = executive.fileserver
+
+    # resolve a component descriptor from a file
+    uri = "vfs:{}/sample.py/d1".format(fileserver.STARTUP_DIR)
+    # record the state of the counters
+    requests, hits, probes = linker.requests, linker.hits, linker.probes
+    # resolve
+    d1, *_ = executive.resolve(uri=uri)
+    # verify the request was counted
+    assert linker.requests == requests + 1
+    # and that the search probed at least one candidate
+    assert linker.probes > probes
+    # save the number of probes
+    probes = linker.probes
+
+    # do it again
+    again, *_ = executive.resolve(uri=uri)
+    # verify we got the same descriptor
+    assert again is d1
+    # that the outcome was replayed
+    assert linker.hits == hits + 1
+    # without probing anything
+    assert linker.probes == probes
+
+    # now for a request that can't be satisfied
+    assert tuple(executive.resolve(uri="import:nomodule.nosymbol")) == ()
+    # save the number of probes
+    probes = linker.probes
+    # try again
+    assert tuple(executive.resolve(uri="import:nomodule.nosymbol")) == ()
+    # verify the miss was remembered
+    assert linker.probes == probes
+
+    # changing the structure of the virtual filesystem
+    fileserver["/linker/resolutions"] = fileserver.folder()
+    # invalidates the outcomes
+    assert tuple(executive.resolve(uri="import:nomodule.nosymbol")) == ()
+    assert linker.probes > probes
+
+    # all done
+    return executive
+
+
+# main
+if __name__ == "__main__":
+    test()
+
+
+# end of file
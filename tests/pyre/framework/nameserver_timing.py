@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# michael a.g. aïvázis
+# orthologue
+# (c) 1998-2018 all rights reserved
+#
+
+
+"""
+Measure the cost of name lookups and insertions in the nameserver, with and without the cache
+of name keys
+"""
+
+
+def test(count=5000, passes=10):
+    # access the package
+    import pyre
+    # and the nameserver
+    nameserver = pyre.executive.nameserver
+    # get the priority of explicit assignments
+    priority = nameserver.priority.explicit()
+    # and make a locator
+    locator = pyre.tracking.here()
+
+    # make some names with a realistic number of levels
+    names = tuple("timing.app.component{}.trait{}".format(i // 10, i % 10) for i in range(count))
+    # register them
+    for name in names: nameserver[name] = name
+
+    # make a timer
+    timer = pyre.executive.newTimer(name="nameserver.timing")
+
+    # time lookups without the cache
+    timer.reset().start()
+    for _ in range(passes):
+        for name in names:
+            # forget all keys
+            nameserver.purgeKeys()
+            # and look up the value
+            nameserver[name]
+    cold = timer.stop().read()
+
+    # time lookups with the cache
+    timer.reset().start()
+    for _ in range(passes):
+        for name in names:
+            # look up the value
+            nameserver[name]
+    warm = timer.stop().read()
+
+    # show me
+    print("nameserver[name]: {} lookups".format(count*passes))
+    print("    cold: {:.3f} sec".format(cold))
+    print("    warm: {:.3f} sec".format(warm))
+    print("    speedup: {:.2f}".format(cold/warm))
+
+    # time insertions without the cache
+    timer.reset().start()
+    for _ in range(passes):
+        for name in names:
+            # forget all keys
+            nameserver.purgeKeys()
+            # and update the value
+            nameserver.insert(name=name, value=name, priority=priority, locator=locator)
+    cold = timer.stop().read()
+
+    # time insertions with the cache
+    timer.reset().start()
+    for _ in range(passes):
+        for name in names:
+            # update the value
+            nameserver.insert(name=name, value=name, priority=priority, locator=locator)
+    warm = timer.stop().read()
+
+    # show me
+    print("nameserver.insert: {} insertions".format(count*passes))
+    print("    cold: {:.3f} sec".format(cold))
+    print("    warm: {:.3f} sec".format(warm))
+    print("    speedup: {:.2f}".format(cold/warm))
+
+    # all done
+    return nameserver
+
+
+# main
+if __name__ == "__main__":
+    test()
+
+
+# end of file
@@ -12,22 +12,28 @@ include pyre.def
 
 all: test
 
-test: sanity channels scheduler selector clean
+test: sanity channels scheduler selector poller loop clean
 
 sanity:
 	${PYTHON} ./sanity.py
 	${PYTHON} ./pickler.py
+	${PYTHON} ./framer.py
 	${PYTHON} ./pipe.py
+	${PYTHON} ./pipe_vectors.py
+	${PYTHON} ./ring.py
 	${PYTHON} ./tcp.py
 
 channels:
 	${PYTHON} ./pickler_over_pipe.py
 	${PYTHON} ./pickler_over_tcp.py
+	${PYTHON} ./framer_over_pipe.py
+	${PYTHON} ./framer_over_tcp.py
 
 scheduler:
 	${PYTHON} ./scheduler.py
 	${PYTHON} ./scheduler_instantiation.py
 	${PYTHON} ./scheduler_alarms.py
+	${PYTHON} ./scheduler_cancel.py
 
 selector:
 	${PYTHON} ./selector.py
@@ -36,5 +42,27 @@ selector:
 	${PYTHON} ./selector_pickler_over_pipe.py
 	${PYTHON} ./selector_pickler_over_tcp.py
 
+poller:
+	${PYTHON} ./poller.py
+	${PYTHON} ./poller_instantiation.py
+	${PYTHON} ./poller_alarms.py
+	${PYTHON} ./poller_events.py
+	${PYTHON} ./poller_pickler_over_pipe.py
+	${PYTHON} ./poller_pickler_over_tcp.py
+
+loop:
+	${PYTHON} ./loop.py
+	${PYTHON} ./loop_instantiation.py
+	${PYTHON} ./loop_alarms.py
+	${PYTHON} ./loop_coroutines.py
+	${PYTHON} ./loop_pickler_over_pipe.py
+
+timings:
+	${PYTHON} ./framer_timing.py
+	${PYTHON} ./poller_timing.py
+	${PYTHON} ./ring_timing.py
+	${PYTHON} ./scheduler_timing.py
+	${PYTHON} ./selector_timing.py
+
 
 # end of file
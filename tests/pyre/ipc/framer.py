@@ -0,0 +1,27 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# michael a.g. aïvázis
+# orthologue
+# (c) 1998-2018 all rights reserved
+#
+
+
+"""
+Sanity check: verify that the framer factory is accessible
+"""
+
+
+def test():
+    # access the package
+    import pyre.ipc
+    # make a framer
+    return pyre.ipc.framer()
+
+
+# main
+if __name__ == "__main__":
+    test()
+
+
+# end of file
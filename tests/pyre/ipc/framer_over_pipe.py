@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# michael a.g. aïvázis
+# orthologue
+# (c) 1998-2018 all rights reserved
+#
+
+
+"""
+Exercise the framer by shipping large binary payloads between two processes over a pipe
+"""
+
+# externals
+import os
+import pickle
+import pyre.ipc
+
+
+# the payload; a mix of small objects that stay in the pickle and large buffers that travel out
+# of band
+def payload(size):
+    # build a recognizable byte pattern
+    pattern = bytes(range(256)) * (size // 256)
+    # objects that expose their buffers for out of band transfer need python 3.8 or newer
+    buffer = bytearray(pattern[::-1])
+    if hasattr(pickle, "PickleBuffer"): buffer = pickle.PickleBuffer(buffer)
+    # assemble the payload
+    return {
+        "name": "payload",
+        "small": b"tiny",
+        "bytes": pattern,
+        "bytearray": bytearray(pattern),
+        "buffer": buffer,
+        "nested": [ pattern[:1024*n] for n in range(1, 4) ],
+    }
+
+
+def test(size=4*1024*1024):
+    # make a framer
+    m = pyre.ipc.newFramer()
+    # frame the payload
+    header, body, *buffers = m.frame(item=payload(size=size))
+    # verify that the three large buffers were set aside
+    assert len(buffers) == 3
+    # and that the rest is small
+    assert len(body) < m.threshold
+
+    # make the communication channels
+    parent, child = pyre.ipc.pipe()
+
+    # fork
+    pid = os.fork()
+    # in the parent process
+    if pid > 0:
+        # send the payload
+        m.send(item=payload(size=size), channel=child)
+        # get the response
+        response = m.recv(channel=child)
+        # wait for the child to finish
+        _, status = os.waitpid(pid, 0)
+        # check that the child was happy
+        assert status == 0
+        # check the response
+        assert response == "ok"
+        # all done
+        return
+
+    # in the child process; carefully
+    try:
+        # get the payload
+        item = m.recv(channel=parent)
+        # build the expected one
+        expected = payload(size=size)
+        # check the small stuff
+        assert item["name"] == expected["name"]
+        assert item["small"] == expected["small"]
+        # check the large buffers and their types
+        assert type(item["bytes"]) is bytes
+        assert item["bytes"] == expected["bytes"]
+        assert type(item["bytearray"]) is bytearray
+        assert item["bytearray"] == expected["bytearray"]
+        assert bytes(item["buffer"]) == bytes(expected["buffer"])
+        assert item["nested"] == expected["nested"]
+        # send a response
+        m.send(item="ok", channel=parent)
+    # if anything goes wrong
+    except BaseException:
+        # show me
+        import traceback
+        traceback.print_exc()
+        # and report failure
+        os._exit(1)
+    # otherwise, exit without running the parent's cleanup
+    os._exit(0)
+
+
+# main
+if __name__ == "__main__":
+    test()
+
+
+# end of file
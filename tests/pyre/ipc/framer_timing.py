@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# michael a.g. aïvázis
+# orthologue
+# (c) 1998-2018 all rights reserved
+#
+
+
+"""
+Measure the cost of shipping large binary payloads to another process, for both the {pickle}
+based marshaler and the framer that sends the payload out of band
+"""
+
+
+# externals
+import os
+import time
+import pyre.ipc
+
+
+def run(marshaler, payload, rounds):
+    """
+    Send {payload} to a child process {rounds} times, and wait for an acknowledgment each time
+    """
+    # make the communication channels
+    parent, child = pyre.ipc.pipe()
+    # fork
+    pid = os.fork()
+    # in the child process
+    if pid == 0:
+        # receive the payloads
+        for _ in range(rounds):
+            # get one
+            item = marshaler.recv(channel=parent)
+            # and acknowledge it
+            marshaler.send(item=len(item), channel=parent)
+        # and exit without running the parent's cleanup
+        os._exit(0)
+
+    # in the parent, start the clock
+    start = time.perf_counter()
+    # send the payloads
+    for _ in range(rounds):
+        # ship one
+        marshaler.send(item=payload, channel=child)
+        # and check the acknowledgment
+        assert marshaler.recv(channel=child) == len(payload)
+    # stop the clock
+    elapsed = time.perf_counter() - start
+    # wait for the child
+    os.waitpid(pid, 0)
+    # clean up
+    parent.close()
+    child.close()
+    # and return the elapsed time
+    return elapsed
+
+
+def test(size=64*1024*1024, rounds=20):
+    # make the payload
+    payload = bytearray(os.urandom(1024)) * (size // 1024)
+    # time the pickler
+    pickler = run(pyre.ipc.newPickler(), payload=payload, rounds=rounds)
+    # and the framer
+    framer = run(pyre.ipc.newFramer(), payload=payload, rounds=rounds)
+
+    # compute the volume of data
+    volume = size * rounds / 2**20
+    # show me
+    print("marshalers: {} payloads of {} MiB".format(rounds, size // 2**20))
+    print("    pickler: {:.3f} sec, {:.0f} MiB/sec".format(pickler, volume/pickler))
+    print("    framer: {:.3f} sec, {:.0f} MiB/sec, speedup: {:.2f}".format(
+        framer, volume/framer, pickler/framer))
+
+    # all done
+    return
+
+
+# main
+if __name__ == "__main__":
+    # skip pyre initialization since we don't rely on the executive
+    pyre_noboot = True
+    # do...
+    test()
+
+
+# end of file
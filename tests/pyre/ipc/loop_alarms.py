@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# michael a.g. aïvázis
+# orthologue
+# (c) 1998-2018 all rights reserved
+#
+
+
+"""
+Verify the loop can raise, reschedule and cancel alarms
+"""
+
+
+def test():
+    # if necessary
+    # import journal
+    # journal.debug("pyre.ipc.loop").active = True
+    # access the package
+    import pyre.ipc
+    # instantiate a loop
+    s = pyre.ipc.newLoop()
+
+    # get the units of time
+    from pyre.units.SI import second
+    # build a counter
+    import itertools
+    counter = itertools.count()
+    # build a handler
+    def handler(timestamp):
+        n = next(counter)
+        # print("n={}, time={}".format(n, timestamp))
+        return
+
+    # setup some alarms
+    s.alarm(interval=0*second, call=handler)
+    s.alarm(interval=0.1*second, call=handler)
+    s.alarm(interval=0.05*second, call=handler)
+    s.alarm(interval=0.025*second, call=handler)
+    s.alarm(interval=0.075*second, call=handler)
+    # and one that never goes off
+    late = s.alarm(interval=10*second, call=handler)
+    # how many?
+    alarms = len(s._alarms) - 1
+
+    # build a handler that reschedules itself a few times
+    ticks = []
+    def ticker(timestamp):
+        # record the time
+        ticks.append(timestamp)
+        # the last time through
+        if len(ticks) == 3:
+            # cancel the late alarm, so the loop can exit
+            s.cancel(late)
+            # and don't reschedule
+            return
+        # otherwise, go again
+        return 0.05*second
+    # schedule it
+    s.alarm(interval=0.05*second, call=ticker)
+
+    # invoke the loop
+    s.watch()
+    # verify that all alarms fired
+    assert next(counter) == alarms
+    # the ticker went off three times
+    assert len(ticks) == 3
+    # in order
+    assert ticks == sorted(ticks)
+    # and there is nothing left to do
+    assert s.idle()
+    # cancelling an alarm that is no longer pending is harmless
+    s.cancel(late)
+
+    # and return the loop
+    return s
+
+
+# main
+if __name__ == "__main__":
+    test()
+
+
+# end of file
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# michael a.g. aïvázis
+# orthologue
+# (c) 1998-2018 all rights reserved
+#
+
+
+"""
+Exercise coroutines that talk over a pipe through the awaitable channel operations of the loop
+"""
+
+
+def test():
+    # access the package
+    import pyre.ipc
+    # instantiate a loop
+    s = pyre.ipc.newLoop()
+    # make a pair of pipes
+    parent, child = pyre.ipc.pipe()
+
+    # the messages
+    messages = [ "message {}".format(index).encode() for index in range(10) ]
+    # the transcript of the receiver
+    received = []
+
+    # the sender
+    async def send(channel):
+        # go through the messages
+        for message in messages:
+            # send each one with its length
+            await s.write(channel=channel, bstr=bytes([len(message)]) + message)
+        # all done
+        return
+
+    # the receiver
+    async def receive(channel):
+        # go through the messages
+        for _ in messages:
+            # get the length of the next one
+            size, = await s.read(channel=channel, minlen=1, maxlen=1)
+            # and the message itself
+            received.append(await s.read(channel=channel, minlen=size, maxlen=size))
+        # all done
+        return
+
+    # run them
+    s.spawn(receive(channel=child))
+    s.spawn(send(channel=parent))
+    # invoke the loop
+    s.watch()
+    # check that everything made it across
+    assert received == messages
+    # and there is nothing left to do
+    assert s.idle()
+
+    # exceptions raised by coroutines are propagated to the caller of {watch}
+    async def fail():
+        # wait until the pipe can be written
+        await s.writable(channel=parent)
+        # and complain
+        raise ValueError("failed")
+    # run it
+    s.spawn(fail())
+    # carefully
+    try:
+        # invoke the loop
+        s.watch()
+        # this should be unreachable
+        assert False, "unreachable"
+    # if it raised the expected exception
+    except ValueError:
+        # no problem
+        pass
+
+    # clean up
+    parent.close()
+    child.close()
+    # and return the loop
+    return s
+
+
+# main
+if __name__ == "__main__":
+    test()
+
+
+# end of file
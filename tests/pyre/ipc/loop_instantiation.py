@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# michael a.g. aïvázis
+# orthologue
+# (c) 1998-2018 all rights reserved
+#
+
+
+"""
+Sanity check: verify that loops can be instantiated, and accept exception handlers
+"""
+
+
+def test():
+    # access the package
+    import pyre.ipc
+    # access the journal
+    import journal
+    # instantiate a loop
+    s = pyre.ipc.loop()
+
+    # quiet down the warning about exception handlers
+    journal.warning("pyre.ipc.loop").active = False
+    # make an instance
+    loop = pyre.ipc.newLoop()
+    # and a channel
+    channel = pyre.ipc.pipe()
+    # registering an exception handler is harmless
+    loop.whenException(channel=channel, call=lambda channel: False)
+    # and doesn't give the loop anything to do
+    assert loop.idle()
+
+    # and return it
+    return s
+
+
+# main
+if __name__ == "__main__":
+    test()
+
+
+# end of file
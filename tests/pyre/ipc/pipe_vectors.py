@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# michael a.g. aïvázis
+# orthologue
+# (c) 1998-2018 all rights reserved
+#
+
+
+"""
+Verify that scatter/gather transfers over pipes handle more buffers than the system allows in a
+single call
+"""
+
+
+def test():
+    # get the package
+    import pyre.ipc
+    # make a pair of pipes
+    parent, child = pyre.ipc.pipe()
+    # the system limit is at least 16, so lower it to make sure the transfers are split
+    parent.iovmax = child.iovmax = 2
+
+    # a few small buffers
+    outgoing = [ bytes([index]) * (index + 1) for index in range(5) ]
+    # send them
+    assert child.writev(buffers=outgoing) == 15
+    # make room for them
+    incoming = [ bytearray(len(buffer)) for buffer in outgoing ]
+    # receive them
+    assert parent.readv(buffers=incoming) == 15
+    # and check
+    assert incoming == outgoing
+
+    # all done
+    return parent, child
+
+
+# main
+if __name__ == "__main__":
+    test()
+
+
+# end of file
@@ -0,0 +1,25 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# michael a.g. aïvázis
+# orthologue
+# (c) 1998-2018 all rights reserved
+#
+
+
+"""
+Sanity check: verify that the poller factory is accessible
+"""
+
+
+def test():
+    from pyre.ipc import poller
+    return
+
+
+# main
+if __name__ == "__main__":
+    test()
+
+
+# end of file
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# michael a.g. aïvázis
+# orthologue
+# (c) 1998-2018 all rights reserved
+#
+
+
+"""
+Exercise a poller watching over a large number of channels
+"""
+
+
+# externals
+import os
+import resource
+import pyre.ipc
+from pyre.units.SI import second
+
+
+def test():
+    # check the delivery of events
+    busy()
+    # the handling of descriptors that get closed and recycled
+    recycle()
+    # and edge triggered notifications
+    edge()
+    # all done
+    return
+
+
+def busy():
+    """
+    Watch many channels, a few of which are active
+    """
+    # figure out how many descriptors i can open; use enough of them to go past the limit of
+    # {select} if i am allowed to
+    soft, _ = resource.getrlimit(resource.RLIMIT_NOFILE)
+    count = min(768, (soft - 64) // 2)
+    # make a pile of loopback channels
+    channels = [ pyre.ipc.pipe(descriptors=os.pipe()) for _ in range(count) ]
+    # pick the active ones
+    active = channels[::16]
+    # build a poller
+    poller = pyre.ipc.newPoller()
+    # the channels whose handlers were invoked
+    seen = []
+
+    # the handler
+    def receive(channel):
+        # get the data
+        data = channel.read(maxlen=1)
+        # record the visit
+        seen.append((channel, data))
+        # if this was the first byte
+        if data == b'1':
+            # ask to be notified when the second one arrives; this happens while the poller is
+            # dispatching to the handlers of this channel
+            poller.whenReadReady(channel=channel, call=receive)
+            # and send it
+            channel.write(b'2')
+        # if everybody has been heard from twice
+        if len(seen) == 2*len(active):
+            # stop
+            poller.stop()
+        # either way, don't reschedule this handler
+        return False
+
+    # register all of them
+    for channel in channels: poller.whenReadReady(channel=channel, call=receive)
+    # put some data in the active ones
+    for channel in active: channel.write(b'1')
+    # watch
+    poller.watch()
+
+    # verify that only the active channels were heard from
+    assert set(channel for channel, _ in seen) == set(active)
+    # each of them twice, in the right order
+    for channel in active:
+        assert [ data for peer, data in seen if peer is channel ] == [b'1', b'2']
+
+    # clean up
+    for channel in channels: channel.close()
+    # all done
+    return poller
+
+
+def recycle():
+    """
+    Close channels from within their handlers and reuse their descriptors
+    """
+    # build a poller
+    poller = pyre.ipc.newPoller()
+    # a channel
+    first = pyre.ipc.pipe(descriptors=os.pipe())
+    # the handlers that were invoked
+    seen = []
+
+    # the handler of the new channel
+    def second(channel):
+        # record the visit
+        seen.append(channel.read(maxlen=1))
+        # clean up
+        channel.close()
+        # and stop
+        return False
+
+    # the handler of the first channel
+    def done(channel):
+        # record the visit
+        seen.append(channel.read(maxlen=1))
+        # close the channel
+        channel.close()
+        # make a new one; its descriptors are the ones just released
+        fresh = pyre.ipc.pipe(descriptors=os.pipe())
+        # verify
+        assert fresh.inbound == channel.inbound
+        # register it
+        poller.whenReadReady(channel=fresh, call=second)
+        # and put something in it
+        fresh.write(b'b')
+        # don't reschedule
+        return False
+
+    # register the first channel
+    poller.whenReadReady(channel=first, call=done)
+    # put something in it
+    first.write(b'a')
+    # watch; the poller exits when there is nothing left to watch
+    poller.watch()
+    # verify that both handlers were invoked
+    assert seen == [b'a', b'b']
+    # all done
+    return poller
+
+
+def edge():
+    """
+    Verify that edge triggered pollers only report new activity
+    """
+    # build a poller
+    poller = pyre.ipc.newPoller()
+    # if the platform doesn't support edge triggered notifications, there is nothing to check
+    if not poller._epoll: return poller
+    # otherwise, ask for them
+    poller.edge = True
+    # make a channel
+    channel = pyre.ipc.pipe(descriptors=os.pipe())
+    # the number of visits
+    visits = []
+
+    # the handler
+    def receive(channel):
+        # read one byte only, leaving the rest in the channel
+        visits.append(channel.read(maxlen=1))
+        # and keep watching
+        return True
+
+    # the alarms
+    def more(timestamp):
+        # send some more data
+        channel.write(b'c')
+        # all done
+        return
+    def stop(timestamp):
+        # stop watching
+        poller.stop()
+        # all done
+        return
+
+    # register the channel
+    poller.whenReadReady(channel=channel, call=receive)
+    # write a couple of bytes
+    channel.write(b'ab')
+    # schedule more data
+    poller.alarm(interval=0.1*second, call=more)
+    # and the end of the test
+    poller.alarm(interval=0.2*second, call=stop)
+    # watch
+    poller.watch()
+    # verify that there was only one notification for each write, even though there was
+    # unread data in the channel
+    assert visits == [b'a', b'b'], visits
+    # clean up
+    channel.close()
+    # all done
+    return poller
+
+
+# main
+if __name__ == "__main__":
+    test()
+
+
+# end of file
@@ -0,0 +1,29 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# michael a.g. aïvázis
+# orthologue
+# (c) 1998-2018 all rights reserved
+#
+
+
+"""
+Sanity check: verify that pollers can be instantiated
+"""
+
+
+def test():
+    # access the package
+    import pyre.ipc
+    # instantiate a poller
+    s = pyre.ipc.poller()
+    # and return it
+    return s
+
+
+# main
+if __name__ == "__main__":
+    test()
+
+
+# end of file
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# michael a.g. aïvázis
+# orthologue
+# (c) 1998-2018 all rights reserved
+#
+
+
+"""
+Measure the cost of an event loop pass with a few active channels among many idle ones, for
+both the {select} and {epoll} based dispatchers
+"""
+
+
+# externals
+import os
+import resource
+import time
+import pyre.ipc
+
+
+def run(dispatcher, channels, rounds):
+    """
+    Bounce a byte through one of {channels} {rounds} times while the rest sit idle
+    """
+    # the idle handler
+    def idle(channel):
+        # never called
+        assert False, "unreachable"
+    # register all the channels but the last one
+    for channel in channels[:-1]: dispatcher.whenReadReady(channel=channel, call=idle)
+    # the active channel
+    active = channels[-1]
+    # the count of visits
+    visits = [0]
+    # its handler
+    def bounce(channel):
+        # get the byte
+        channel.read(maxlen=1)
+        # count the visit
+        visits[0] += 1
+        # if we are done
+        if visits[0] == rounds:
+            # stop
+            dispatcher.stop()
+            # and don't reschedule
+            return False
+        # otherwise, send it again
+        channel.write(b'x')
+        # and keep watching
+        return True
+    # register it
+    dispatcher.whenReadReady(channel=active, call=bounce)
+    # prime it
+    active.write(b'x')
+    # start the clock
+    start = time.perf_counter()
+    # watch
+    dispatcher.watch()
+    # and return the elapsed time
+    return time.perf_counter() - start
+
+
+def test(rounds=20000):
+    # figure out how many descriptors i can open
+    soft, _ = resource.getrlimit(resource.RLIMIT_NOFILE)
+    # {select} can't watch descriptors past 1024, so keep the comparison within that range
+    small = 480
+    # but let the poller go further, if possible
+    large = max(small, min(10000, (soft - 64) // 2))
+
+    # make the channels
+    channels = [ pyre.ipc.pipe(descriptors=os.pipe()) for _ in range(large) ]
+    # carefully
+    try:
+        # time the selector with the small set
+        selector = run(pyre.ipc.newSelector(), channels=channels[:small], rounds=rounds)
+        # the poller with the small set
+        poller = run(pyre.ipc.newPoller(), channels=channels[:small], rounds=rounds)
+        # and the poller with the large set
+        many = run(pyre.ipc.newPoller(), channels=channels, rounds=rounds)
+    # no matter what
+    finally:
+        # clean up
+        for channel in channels: channel.close()
+
+    # show me
+    print("dispatchers: {} events".format(rounds))
+    print("    selector, {} channels: {:.3f} sec, {:.1f} us/event".format(
+        small, selector, 1e6*selector/rounds))
+    print("    poller, {} channels: {:.3f} sec, {:.1f} us/event, speedup: {:.2f}".format(
+        small, poller, 1e6*poller/rounds, selector/poller))
+    print("    poller, {} channels: {:.3f} sec, {:.1f} us/event".format(
+        large, many, 1e6*many/rounds))
+
+    # all done
+    return
+
+
+# main
+if __name__ == "__main__":
+    # skip pyre initialization since we don't rely on the executive
+    pyre_noboot = True
+    # do...
+    test()
+
+
+# end of file
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# michael a.g. aïvázis
+# orthologue
+# (c) 1998-2018 all rights reserved
+#
+
+
+"""
+Exercise the shared memory channels: wrap around, payloads larger than the rings, and data
+exchange with another process
+"""
+
+# externals
+import os
+import pyre.ipc
+
+
+def test():
+    # make a pair of small rings, so that the payloads wrap around
+    parent, child = pyre.ipc.ring(capacity=1024)
+
+    # a few small messages within the same process
+    for index in range(100):
+        # make a message
+        message = "message {}".format(index).encode() * 10
+        # send it
+        parent.write(bstr=message)
+        # get it and check it
+        assert child.read(minlen=len(message)) == message
+    # and the other way
+    child.writev(buffers=[b"hello", b" ", bytearray(b"world")])
+    # make room for the response
+    head, tail = bytearray(6), bytearray(5)
+    # get it
+    assert parent.readv(buffers=[head, tail]) == 11
+    # and check it
+    assert head == b"hello " and tail == b"world"
+
+    # now, a payload that is much larger than the ring
+    payload = bytes(range(256)) * 1000
+    # fork
+    pid = os.fork()
+    # in the child
+    if pid == 0:
+        # get the payload
+        received = bytearray(len(payload))
+        # check it made it across
+        status = child.readv(buffers=[received]) == len(payload) and received == payload
+        # send it back
+        child.write(bstr=received)
+        # and exit
+        os._exit(0 if status else 1)
+
+    # in the parent, send the payload
+    parent.write(bstr=payload)
+    # get the echo
+    echo = parent.read(minlen=len(payload), maxlen=len(payload))
+    # wait for the child
+    _, status = os.waitpid(pid, 0)
+    # check that it was happy
+    assert status == 0
+    # and that the echo is correct
+    assert echo == payload
+
+    # clean up
+    parent.close()
+    child.close()
+    # all done
+    return
+
+
+# main
+if __name__ == "__main__":
+    test()
+
+
+# end of file
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# michael a.g. aïvázis
+# orthologue
+# (c) 1998-2018 all rights reserved
+#
+
+
+"""
+Measure the cost of exchanging small and large payloads with another process, over pipes and
+over the shared memory channels
+"""
+
+
+# externals
+import os
+import time
+import pyre.ipc
+
+
+def run(channels, payload, rounds):
+    """
+    Bounce {payload} off a child process {rounds} times over the pair of {channels}
+    """
+    # unpack the channels
+    parent, child = channels
+    # make a marshaler that keeps large payloads out of the pickle
+    marshaler = pyre.ipc.newFramer()
+    # fork
+    pid = os.fork()
+    # in the child process
+    if pid == 0:
+        # bounce the payloads
+        for _ in range(rounds):
+            # get one and send it back
+            marshaler.send(item=marshaler.recv(channel=parent), channel=parent)
+        # and exit without running the parent's cleanup
+        os._exit(0)
+
+    # in the parent, start the clock
+    start = time.perf_counter()
+    # send the payloads
+    for _ in range(rounds):
+        # ship one
+        marshaler.send(item=payload, channel=child)
+        # and get it back
+        marshaler.recv(channel=child)
+    # stop the clock
+    elapsed = time.perf_counter() - start
+    # wait for the child
+    os.waitpid(pid, 0)
+    # clean up
+    parent.close()
+    child.close()
+    # and return the elapsed time
+    return elapsed
+
+
+def test():
+    # the sizes of the payloads, and the number of round trips
+    runs = [ (4*1024, 20000), (256*1024, 2000), (4*1024*1024, 200), (64*1024*1024, 20) ]
+
+    # show me
+    print("channels:")
+    # go through them
+    for size, rounds in runs:
+        # make the payload
+        payload = bytearray(os.urandom(1024)) * (size // 1024)
+        # time the pipes
+        pipe = run(pyre.ipc.pipe(), payload=payload, rounds=rounds)
+        # and the rings
+        ring = run(pyre.ipc.ring(), payload=payload, rounds=rounds)
+        # compute the volume of data
+        volume = 2 * size * rounds / 2**20
+        # show me
+        print("  {} round trips of {} KiB:".format(rounds, size // 1024))
+        print("    pipe: {:.3f} sec, {:.1f} us/trip, {:.0f} MiB/sec".format(
+            pipe, 1e6*pipe/rounds, volume/pipe))
+        print("    ring: {:.3f} sec, {:.1f} us/trip, {:.0f} MiB/sec, speedup: {:.2f}".format(
+            ring, 1e6*ring/rounds, volume/ring, pipe/ring))
+
+    # all done
+    return
+
+
+# main
+if __name__ == "__main__":
+    # skip pyre initialization since we don't rely on the executive
+    pyre_noboot = True
+    # do...
+    test()
+
+
+# end of file
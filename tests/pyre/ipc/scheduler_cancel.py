@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# michael a.g. aïvázis
+# orthologue
+# (c) 1998-2018 all rights reserved
+#
+
+
+"""
+Verify that alarms can be cancelled
+"""
+
+
+def test():
+    # externals
+    import time
+    # access the package
+    import pyre.ipc
+    # get the units of time
+    from pyre.units.SI import second
+    # instantiate a scheduler
+    s = pyre.ipc.newScheduler()
+
+    # the log of raised alarms
+    log = []
+    # build a handler factory
+    def handler(tag, reschedule=None):
+        # the handler
+        def raised(timestamp):
+            # record the event
+            log.append(tag)
+            # and ask to be rescheduled, if necessary
+            return reschedule
+        # return it
+        return raised
+
+    # alarms that are due at the same time go off in the order they were scheduled
+    first = s.alarm(interval=0*second, call=handler("first"))
+    middle = s.alarm(interval=0*second, call=handler("second"))
+    third = s.alarm(interval=0*second, call=handler("third"))
+    # cancel one of them
+    s.cancel(middle)
+    # raise them
+    s.awaken()
+    # check
+    assert log == ["first", "third"]
+    # cancelling alarms that have gone off is harmless
+    s.cancel(first)
+    # and there is nothing left
+    assert s.poll() is None
+
+    # reset the log
+    log.clear()
+    # schedule an alarm that reschedules itself
+    repeating = s.alarm(interval=0*second, call=handler("repeating", reschedule=0*second))
+    # raise it a couple of times
+    s.awaken()
+    s.awaken()
+    # check
+    assert log == ["repeating", "repeating"]
+    # cancel it using the original handle
+    s.cancel(repeating)
+    # and verify it doesn't go off again
+    s.awaken()
+    assert log == ["repeating", "repeating"]
+    assert s.poll() is None
+
+    # reset the log
+    log.clear()
+    # schedule an alarm that reschedules itself
+    periodic = s.alarm(interval=0*second, call=handler("periodic", reschedule=0*second))
+    # one whose handler cancels a few others
+    def canceller(timestamp):
+        # record the event
+        log.append("canceller")
+        # cancel the victims; this compacts the heap while {awaken} is working on it
+        for victim in victims: s.cancel(victim)
+        # and cancel itself, even though it is being raised
+        s.cancel(killer)
+        # no rescheduling
+        return
+    killer = s.alarm(interval=0*second, call=canceller)
+    # and the victims
+    victims = [ s.alarm(interval=0*second, call=handler("victim")) for _ in range(4) ]
+    # raise them
+    s.awaken()
+    # verify that the victims did not go off
+    assert log == ["periodic", "canceller"]
+    # that the alarm that is being raised was not counted as part of the heap
+    assert s._cancelled == 0
+    # and that the periodic alarm survived the compaction
+    assert s._alarms == [periodic]
+    # cancel it
+    s.cancel(periodic)
+    assert s.poll() is None
+
+    # make lots of alarms
+    alarms = [ s.alarm(interval=(1+i)*second, call=handler(i)) for i in range(1000) ]
+    # cancel all but the last one
+    for alarm in alarms[:-1]: s.cancel(alarm)
+    # verify the heap was compacted
+    assert len(s._alarms) < 10
+    # and the next alarm is the last one
+    assert 999 < s.poll() <= 1000
+
+    # all done
+    return s
+
+
+# main
+if __name__ == "__main__":
+    test()
+
+
+# end of file
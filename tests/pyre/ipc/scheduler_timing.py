@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# michael a.g. aïvázis
+# orthologue
+# (c) 1998-2018 all rights reserved
+#
+
+
+"""
+Measure the cost of scheduling, cancelling and raising large numbers of alarms, and compare it
+with keeping the alarms in a list that is sorted after every insertion
+"""
+
+
+# externals
+import operator
+import random
+import time
+import pyre.ipc
+from pyre.units.SI import second
+
+
+def sorted_list(intervals):
+    """
+    Schedule alarms the way {Scheduler} used to: append and sort
+    """
+    # the alarms
+    alarms = []
+    # the sort key
+    key = operator.attrgetter('time')
+    # the alarm record
+    class alarm:
+        __slots__ = ('time', 'handler')
+        def __init__(self, time, handler):
+            self.time = time
+            self.handler = handler
+    # go through the intervals
+    for interval in intervals:
+        # make an alarm
+        alarms.append(alarm(time=time.time()+interval, handler=None))
+        # and sort
+        alarms.sort(key=key, reverse=True)
+    # all done
+    return alarms
+
+
+def test(count=10000):
+    # make a reproducible set of intervals
+    rng = random.Random(0)
+    intervals = [ rng.uniform(1, 100) for _ in range(count) ]
+    # a handler
+    def handler(timestamp): return
+
+    # time the old approach
+    start = time.perf_counter()
+    sorted_list(intervals)
+    reference = time.perf_counter() - start
+
+    # make a scheduler
+    scheduler = pyre.ipc.newScheduler()
+    # time the scheduling
+    start = time.perf_counter()
+    alarms = [ scheduler.alarm(interval=interval*second, call=handler) for interval in intervals ]
+    schedule = time.perf_counter() - start
+    # time the cancellation of half of them
+    start = time.perf_counter()
+    for alarm in alarms[::2]: scheduler.cancel(alarm)
+    cancel = time.perf_counter() - start
+    # time the computation of the timeout
+    start = time.perf_counter()
+    scheduler.poll()
+    poll = time.perf_counter() - start
+
+    # show me
+    print("scheduler: {} alarms".format(count))
+    print("    sorted list: {:.3f} sec".format(reference))
+    print("    heap: {:.3f} sec, speedup: {:.2f}".format(schedule, reference/schedule))
+    print("    cancelling {}: {:.3f} sec".format(count//2, cancel))
+    print("    poll: {:.6f} sec".format(poll))
+
+    # all done
+    return scheduler
+
+
+# main
+if __name__ == "__main__":
+    # skip pyre initialization since we don't rely on the executive
+    pyre_noboot = True
+    # do...
+    test()
+
+
+# end of file
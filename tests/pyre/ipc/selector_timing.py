@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# michael a.g. aïvázis
+# orthologue
+# (c) 1998-2018 all rights reserved
+#
+
+
+"""
+Measure the overhead of a pass through the {select} based event loop with its debug channel
+off, and the cost of disabled diagnostics that format their messages eagerly and lazily
+"""
+
+
+# externals
+import os
+import time
+import journal
+import pyre.ipc
+
+
+def run(rounds):
+    """
+    Bounce a byte through a pipe {rounds} times
+    """
+    # make a selector
+    dispatcher = pyre.ipc.newSelector()
+    # and a pipe
+    channel = pyre.ipc.pipe(descriptors=os.pipe())
+    # the count of visits
+    visits = [0]
+    # the handler
+    def bounce(channel):
+        # get the byte
+        channel.read(maxlen=1)
+        # count the visit
+        visits[0] += 1
+        # if we are done
+        if visits[0] == rounds:
+            # stop
+            dispatcher.stop()
+            # and don't reschedule
+            return False
+        # otherwise, send it again
+        channel.write(b'x')
+        # and keep watching
+        return True
+    # register it
+    dispatcher.whenReadReady(channel=channel, call=bounce)
+    # prime it
+    channel.write(b'x')
+    # start the clock
+    start = time.perf_counter()
+    # watch
+    dispatcher.watch()
+    # stop the clock
+    elapsed = time.perf_counter() - start
+    # clean up
+    channel.close()
+    # and return the elapsed time
+    return elapsed
+
+
+def test(rounds=50000):
+    # make sure the selector debug channel is off
+    debug = journal.debug("pyre.ipc.selector")
+    debug.active = False
+
+    # time the event loop
+    loop = run(rounds=rounds)
+
+    # time a disabled diagnostic that formats its message before checking the channel
+    start = time.perf_counter()
+    for timeout in range(rounds): debug.line('    max sleep: {}'.format(timeout))
+    eager = time.perf_counter() - start
+    # and one that leaves the formatting to the channel
+    start = time.perf_counter()
+    for timeout in range(rounds): debug.line('    max sleep: {}', timeout)
+    lazy = time.perf_counter() - start
+
+    # show me
+    print("selector: {} passes with debug off".format(rounds))
+    print("    loop: {:.3f} sec, {:.1f} us/pass".format(loop, 1e6*loop/rounds))
+    print("  disabled diagnostics:")
+    print("    eager: {:.3f} us/line".format(1e6*eager/rounds))
+    print("    lazy: {:.3f} us/line, speedup: {:.2f}".format(1e6*lazy/rounds, eager/lazy))
+
+    # all done
+    return
+
+
+# main
+if __name__ == "__main__":
+    # do...
+    test()
+
+
+# end of file
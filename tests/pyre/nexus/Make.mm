@@ -11,7 +11,7 @@ include pyre.def
 
 all: test
 
-test: sanity nodes teams clean
+test: sanity nodes servers teams clean
 
 sanity:
 	${PYTHON} ./sanity.py
@@ -21,8 +21,13 @@ nodes:
 	${PYTHON} ./node_instantiation.py
 	${PYTHON} ./node_signals.py
 
+servers:
+	${PYTHON} ./server_coroutine.py
+
 teams:
 	${PYTHON} ./pool.py
 	${PYTHON} ./pool.py --tasks=4 --team.size=2
+	${PYTHON} ./pool.py --tasks=4 --team.size=2 --team.marshaler=framer
+	${PYTHON} ./pool.py --tasks=4 --team.size=2 --team.recruiter.channel=ring
 
 # end of file
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# michael a.g. aïvázis
+# orthologue
+# (c) 1998-2018 all rights reserved
+#
+
+
+"""
+Verify that servers whose {process} is a coroutine get a conversation per connection when
+running on top of the {asyncio} dispatcher
+"""
+
+# externals
+import pyre
+import journal
+
+
+# an echo server written as a coroutine
+class Echo(pyre.nexus.server, family='pyre.nexus.servers.echo'):
+    """
+    Send back whatever the peer says
+    """
+
+    # behaviors
+    @pyre.export
+    async def process(self, channel):
+        """
+        Talk to the peer until it hangs up
+        """
+        # get the dispatcher
+        dispatcher = self.dispatcher
+        # for as long as the peer has something to say
+        while True:
+            # get it
+            message = await dispatcher.read(channel=channel)
+            # if the peer hung up, we are done
+            if not message: break
+            # otherwise, send it back
+            await dispatcher.write(channel=channel, bstr=message)
+        # clean up
+        channel.close()
+        # and stop listening for connections
+        dispatcher.stop()
+        # all done
+        return
+
+
+# a stand in for the application that hosts the server
+class Host:
+    """
+    Provide the application services the server needs
+    """
+    debug = journal.debug("pyre.nexus.echo")
+
+
+def test():
+    # build a dispatcher
+    dispatcher = pyre.ipc.newLoop()
+    # the host
+    host = Host()
+    # and the server
+    server = Echo(name="echo")
+    # on an ephemeral port on this host
+    server.address = "localhost:0"
+    # activate it
+    server.activate(application=host, dispatcher=dispatcher)
+
+    # the transcript of the client
+    transcript = []
+    # the client
+    async def client():
+        # connect to the server
+        channel = pyre.ipc.tcp(address=server.address)
+        # say a few things
+        for message in (b"hello", b"world"):
+            # send the message
+            await dispatcher.write(channel=channel, bstr=message)
+            # and record the response
+            transcript.append(await dispatcher.read(channel=channel, minlen=len(message)))
+        # hang up
+        channel.close()
+        # all done
+        return
+
+    # run it
+    dispatcher.spawn(client())
+    # invoke the loop
+    dispatcher.watch()
+    # check the responses
+    assert transcript == [b"hello", b"world"]
+
+    # all done
+    return server
+
+
+# main
+if __name__ == "__main__":
+    test()
+
+
+# end of file
@@ -65,6 +65,8 @@ csv:
 	${PYTHON} ./csv_read_mutable.py
 	${PYTHON} ./csv_read_complex.py
 	${PYTHON} ./csv_bad_source.py
+	${PYTHON} ./csv_read_bulk.py
+	${PYTHON} ./csv_read_bulk_concurrent.py
 
 
 # end of file
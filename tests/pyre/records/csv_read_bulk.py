@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# michael a.g. aïvázis
+# orthologue
+# (c) 1998-2018 all rights reserved
+#
+
+
+"""
+Verify that bulk reads produce the same records as the regular ones
+"""
+
+
+def test():
+    # externals
+    import os, tempfile
+    # access the packages
+    import pyre.records
+    import pyre.constraints
+
+    # layout the record
+    class item(pyre.records.record):
+        # the fields
+        sku = pyre.records.str()
+        description = pyre.records.str()
+        production = pyre.records.float()
+        overhead = pyre.records.int()
+        shipping = pyre.records.float()
+        margin = pyre.records.float()
+        # a derived quantity
+        price = production*(1 + overhead/100 + margin/100) + shipping
+
+    # create the reader
+    csv = pyre.records.csv()
+    # read the csv data the regular way
+    target = list(csv.immutable(layout=item, uri="vegetables.csv"))
+
+    # read it in bulk
+    chunks = list(csv.bulk(layout=item, uri="vegetables.csv", chunk=4))
+    # check the chunking
+    assert list(map(len, chunks)) == [4, 2]
+    # and the records
+    assert sum(chunks, []) == target
+    # verify the records are accessible by name
+    assert chunks[0][1].description == "peppers"
+
+    # make a scratch file with enough rows to keep a few workers busy, and some values that
+    # can't go through the fast path
+    scratch = tempfile.NamedTemporaryFile(mode="w", suffix=".csv", delete=False)
+    # carefully
+    try:
+        # fill it
+        with scratch as stream:
+            # with the headers
+            stream.write("sku,description,production,overhead,shipping,margin\n")
+            # and a bunch of rows
+            for row in range(1000):
+                # some with expressions and representations of {None}
+                description = "None" if row % 11 == 0 else "item{}".format(row)
+                overhead = "2*3" if row % 7 == 0 else str(row % 20)
+                stream.write("{},{},{},{},.5,{}\n".format(
+                    row, description, row/10, overhead, row % 50))
+        # read it the regular way
+        target = list(csv.immutable(layout=item, uri=scratch.name))
+        # in bulk
+        assert sum(csv.bulk(layout=item, uri=scratch.name, chunk=64), []) == target
+        # and with the help of workers
+        for workers in (2, 3, 7):
+            # verify we get the same records in the same order
+            assert sum(
+                csv.bulk(layout=item, uri=scratch.name, chunk=64, workers=workers), []) == target
+
+        # now add a constraint that is violated by one of the rows
+        item.margin.validators = [pyre.constraints.isLess(value=49)]
+        # verify that the violation is caught
+        try:
+            list(csv.bulk(layout=item, uri=scratch.name))
+            assert False, "unreachable"
+        except item.ConstraintViolationError as error:
+            assert error.value == 49
+        # also when the work is done by workers
+        try:
+            list(csv.bulk(layout=item, uri=scratch.name, workers=2))
+            assert False, "unreachable"
+        except pyre.records.exceptions.IngestionError as error:
+            assert error.uri == scratch.name
+        # workers that die without reporting
+        csv.work = lambda **kwds: os._exit(1)
+        # are caught as well
+        try:
+            list(csv.bulk(layout=item, uri=scratch.name, workers=2))
+            assert False, "unreachable"
+        except pyre.records.exceptions.IngestionError as error:
+            assert error.uri == scratch.name
+        # restore the workers
+        del csv.work
+        # unless validation is turned off
+        records = sum(csv.bulk(layout=item, uri=scratch.name, validate=False), [])
+        assert records == target
+        # in which case it can be performed later
+        try:
+            item.pyre_converter().verify(records=records)
+            assert False, "unreachable"
+        except item.ConstraintViolationError as error:
+            assert error.value == 49
+    # no matter what
+    finally:
+        # clean up
+        os.remove(scratch.name)
+
+    # all done
+    return item
+
+
+# main
+if __name__ == "__main__":
+    # skip pyre initialization since we don't rely on the executive
+    pyre_noboot = True
+    # do...
+    test()
+
+
+# end of file
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# michael a.g. aïvázis
+# orthologue
+# (c) 1998-2018 all rights reserved
+#
+
+
+"""
+Verify that the bulk reader collects the output of all its workers concurrently, so that
+workers don't wait for their predecessors to finish before they can deliver their rows
+"""
+
+
+def test(rows=20000, patience=10):
+    # externals
+    import os, tempfile, time
+    # access the packages
+    import pyre.records
+
+    # layout the record
+    class item(pyre.records.record):
+        # the fields
+        sku = pyre.records.str()
+        production = pyre.records.float()
+        overhead = pyre.records.int()
+
+    # create the reader
+    csv = pyre.records.csv()
+
+    # make a scratch file whose halves don't fit in a pipe once converted
+    scratch = tempfile.NamedTemporaryFile(mode="w", suffix=".csv", delete=False)
+    # the headers
+    headers = "sku,production,overhead\n"
+    # the file the last worker creates when it is done
+    marker = scratch.name + ".done"
+
+    # the workers find out their place by looking at their byte range
+    scan = csv.scan
+    def placed(begin, end, **kwds):
+        # in the worker process, remember whether i am the first or the last
+        csv.first = begin == len(headers)
+        csv.last = end == os.path.getsize(scratch.name)
+        # and do the work
+        return scan(begin=begin, end=end, **kwds)
+
+    # the first worker holds on to its rows until the last one is done
+    send = csv.send
+    def ordered(channel, message):
+        # if i am the first worker
+        if csv.first:
+            # wait for the last one
+            deadline = time.monotonic() + patience
+            while not os.path.exists(marker):
+                # but not forever
+                if time.monotonic() > deadline:
+                    raise RuntimeError("the last worker never finished")
+                time.sleep(0.01)
+        # send the message
+        send(channel, message)
+        # if i am the last worker and i'm done, let the first one know
+        if csv.last and message[0] == 'done': open(marker, "w").close()
+        # all done
+        return
+
+    # carefully
+    try:
+        # fill the file
+        with scratch as stream:
+            # with the headers
+            stream.write(headers)
+            # and a bunch of rows
+            for row in range(rows): stream.write("{},{},{}\n".format(row, row/10, row % 20))
+        # read it the regular way
+        target = list(csv.immutable(layout=item, uri=scratch.name))
+        # install the instrumentation
+        csv.scan, csv.send = placed, ordered
+        # read it with two workers
+        records = sum(csv.bulk(layout=item, uri=scratch.name, chunk=256, workers=2), [])
+        # verify we got the same records in the same order
+        assert records == target
+    # no matter what
+    finally:
+        # clean up
+        for name in (scratch.name, marker):
+            if os.path.exists(name): os.remove(name)
+
+    # all done
+    return
+
+
+# main
+if __name__ == "__main__":
+    # skip pyre initialization since we don't rely on the executive
+    pyre_noboot = True
+    # do...
+    test()
+
+
+# end of file
@@ -30,6 +30,7 @@ sheets:
 	${PYTHON} ./sheet_columns.py
 	${PYTHON} ./sheet_index.py
 	${PYTHON} ./sheet_updates.py
+	${PYTHON} ./sheet_columnar.py
 
 views:
 	${PYTHON} ./view.py
@@ -44,10 +45,15 @@ charts:
 	${PYTHON} ./chart_interval.py
 	${PYTHON} ./chart_filter.py
 	${PYTHON} ./chart_sales.py
+	${PYTHON} ./chart_axes.py
 
 pivots:
 	${PYTHON} ./pivot.py
 
+timings:
+	${PYTHON} ./pivot_timing.py
+	${PYTHON} ./csv_timing.py
+
 csv:
 	${PYTHON} ./csv_instance.py
 	${PYTHON} ./csv_read.py
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# michael a.g. aïvázis
+# orthologue
+# (c) 1998-2018 all rights reserved
+#
+
+
+"""
+Verify that chart axes are cached and kept up to date as rows are added to the sheet
+"""
+
+
+def test():
+    # get the package
+    import pyre.tabular
+
+    # make a sheet
+    class sales(pyre.tabular.sheet):
+        """The transaction data"""
+        # layout
+        date = pyre.tabular.str()
+        time = pyre.tabular.str()
+        sku = pyre.tabular.str()
+        quantity = pyre.tabular.float()
+        discount = pyre.tabular.float()
+        sale = pyre.tabular.float()
+
+    # make a chart
+    class chart(pyre.tabular.chart, sheet=sales):
+        """
+        Aggregate the information in the {sales} table
+        """
+        sku = pyre.tabular.inferred(sales.sku)
+        date = pyre.tabular.inferred(sales.date)
+        quantity = pyre.tabular.interval(measure=sales.quantity, interval=(0, 20), subdivisions=4)
+
+
+    # make a csv reader
+    csv = pyre.tabular.csv()
+    # build a dataset
+    data = [tuple(row) for row in csv.read(layout=sales, uri='sales.csv')]
+    # make a sheet out of the first few records
+    transactions = sales(name="sales").pyre_immutable(data[:5])
+
+    # build a chart
+    cube = chart(sheet=transactions)
+    # get the axes
+    skus = cube.sku
+    quantities = cube.quantity
+    # verify they are cached
+    assert cube.sku is skus
+    assert cube.quantity is quantities
+    # check the contents
+    assert skus["4000"] == {0}
+    assert len(transactions) == sum(len(bin) for bin in quantities)
+
+    # add the rest of the records
+    transactions.pyre_immutable(data[5:])
+    # verify that the axes are still the same
+    assert cube.sku is skus
+    # but that the new rows were binned
+    assert skus["4000"] == {
+        row for row, record in enumerate(transactions) if record.sku == "4000"}
+    assert len(transactions) == sum(len(bin) for bin in skus.values())
+    assert len(transactions) == sum(len(bin) for bin in quantities)
+    # verify that the rows are in order
+    for bin in skus.values():
+        assert list(bin) == sorted(bin)
+
+    # select the records the match a given sku and date
+    assert cube.pyre_filter(date="2010/11/01", sku="4000") == {0, 5, 6}
+    # mix in an interval
+    assert cube.pyre_filter(date="2010/11/01", sku="4000", quantity=0) == {5, 6}
+    # and check the bin operators
+    assert skus["4000"] & quantities[1] == {0, 13, 20, 28, 36}
+    assert skus["4000"] & {0, 1, 5} == {0, 5}
+    assert 5 in skus["4000"]
+    assert 1 not in skus["4000"]
+
+    # forget the axes
+    cube.pyre_refresh()
+    # verify they get rebuilt
+    assert cube.sku is not skus
+    assert cube.sku == skus
+
+    # and return the chart and the sheet
+    return cube, transactions
+
+
+# main
+if __name__ == "__main__":
+    # skip pyre initialization since we don't rely on the executive
+    pyre_noboot = True
+    # do...
+    test()
+
+
+# end of file
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# michael a.g. aïvázis
+# orthologue
+# (c) 1998-2018 all rights reserved
+#
+
+
+"""
+Measure the cost of loading a large csv file into a sheet, with and without the bulk reader
+"""
+
+
+def test(count=2*10**5, workers=4):
+    # externals
+    import os, random, tempfile, time
+    # get the package
+    import pyre.tabular
+
+    # make a sheet
+    class sales(pyre.tabular.sheet):
+        """The transaction data"""
+        # layout
+        date = pyre.tabular.str()
+        time = pyre.tabular.str()
+        sku = pyre.tabular.str()
+        quantity = pyre.tabular.int()
+        discount = pyre.tabular.float()
+        sale = pyre.tabular.float()
+
+    # make a reader
+    csv = pyre.tabular.csv()
+    # and a reproducible data set
+    rng = random.Random(0)
+    # in a scratch file
+    scratch = tempfile.NamedTemporaryFile(mode="w", suffix=".csv", delete=False)
+    # carefully
+    try:
+        # fill it
+        with scratch as stream:
+            # with the headers
+            stream.write("date,time,sku,quantity,discount,sale\n")
+            # and the transactions
+            for _ in range(count):
+                stream.write("2010/11/{:02},{:02}:{:02}:{:02},{},{},{:.2f},{:.2f}\n".format(
+                    rng.randint(1, 30), rng.randrange(24), rng.randrange(60), rng.randrange(60),
+                    rng.randint(4000, 4099), rng.randint(1, 10), rng.random()/4,
+                    rng.uniform(1, 50)))
+
+        # time the regular reader
+        start = time.perf_counter()
+        regular = sales(name="regular").pyre_immutable(csv.read(layout=sales, uri=scratch.name))
+        elapsed = time.perf_counter() - start
+
+        # time the bulk reader
+        start = time.perf_counter()
+        bulk = sales(name="bulk")
+        for chunk in csv.bulk(layout=sales, uri=scratch.name): bulk.pyre_extend(rows=chunk)
+        fast = time.perf_counter() - start
+
+        # time the bulk reader without validation, with workers, into a columnar sheet
+        start = time.perf_counter()
+        parallel = sales(name="parallel", columnar=True)
+        for chunk in csv.bulk(layout=sales, uri=scratch.name, validate=False, workers=workers):
+            parallel.pyre_extend(rows=chunk)
+        split = time.perf_counter() - start
+    # no matter what
+    finally:
+        # clean up
+        os.remove(scratch.name)
+
+    # check that we got the same records
+    assert list(regular) == list(bulk) == list(parallel)
+
+    # show me
+    print("csv: {} rows".format(count))
+    print("    regular: {:.3f} sec".format(elapsed))
+    print("    bulk: {:.3f} sec, speedup: {:.2f}".format(fast, elapsed/fast))
+    print("    {} workers: {:.3f} sec, speedup: {:.2f}".format(workers, split, elapsed/split))
+
+    # all done
+    return bulk
+
+
+# main
+if __name__ == "__main__":
+    # skip pyre initialization since we don't rely on the executive
+    pyre_noboot = True
+    # do...
+    test()
+
+
+# end of file
@@ -50,10 +50,83 @@ def test():
     prices = cost(name="vegetables").pyre_immutable(vegetables)
     activity = sales(name="sales").pyre_immutable(transactions)
 
-    # NYI: pivot, pivot
+    # build a chart
+    class chart(pyre.tabular.chart, sheet=sales):
+        """
+        Aggregate the information in the {sales} table
+        """
+        date = pyre.tabular.inferred(sales.date)
+        sku = pyre.tabular.inferred(sales.sku)
+
+    # and a pivot table
+    class daily(pyre.tabular.pivot):
+        """
+        Compute daily statistics for each sku
+        """
+        # group by
+        sku = chart.sku
+        date = chart.date
+        # compute
+        transactions = pyre.tabular.count()
+        revenue = pyre.tabular.sum(sales.sale)
+        average = pyre.tabular.mean(sales.sale)
+        smallest = pyre.tabular.min(sales.quantity)
+        largest = pyre.tabular.max(sales.quantity)
+        median = pyre.tabular.quantile(sales.sale, fraction=.5)
+
+    # bind it to the data
+    cube = chart(sheet=activity)
+    report = daily(chart=cube)
+
+    # compute the groups the hard way
+    groups = {}
+    for rank, record in enumerate(activity):
+        groups.setdefault((record.sku, record.date), []).append(rank)
+
+    # verify the groups
+    assert set(report) == set(groups)
+    # go through them
+    for key, rows in groups.items():
+        # check the rows
+        assert list(report[key]) == rows
+        # get the records
+        records = [activity[rank] for rank in rows]
+        # and check the reductions
+        assert report.transactions[key] == len(rows)
+        assert report.revenue[key] == sum(record.sale for record in records)
+        assert report.average[key] == report.revenue[key] / len(rows)
+        assert report.smallest[key] == min(record.quantity for record in records)
+        assert report.largest[key] == max(record.quantity for record in records)
+        # the median
+        values = sorted(record.sale for record in records)
+        middle = len(values) // 2
+        median = values[middle] if len(values) % 2 else (values[middle-1] + values[middle]) / 2
+        assert abs(report.median[key] - median) < 1e-12
+
+    # reductions also work on entire sheets
+    assert pyre.tabular.count().reduce(sheet=activity) == len(activity)
+    # and arbitrary sets of rows
+    tomatoes = cube.pyre_filter(sku="4000")
+    assert pyre.tabular.sum(sales.sale).reduce(sheet=activity, rows=tomatoes) == sum(
+        activity[rank].sale for rank in tomatoes)
+    # empty ones too
+    assert pyre.tabular.mean(sales.sale).reduce(sheet=activity, rows=()) is None
+
+    # reductions that are not part of the declaration can be computed on demand
+    total = pyre.tabular.sum(sales.quantity)
+    assert report.pyre_reduce(reduction=total) == {
+        key: sum(activity[rank].quantity for rank in rows) for key, rows in groups.items()}
+
+    # a sheet with columnar storage
+    columns = sales(name="columns", columnar=True).pyre_immutable(activity)
+    # produces the same report
+    copy = daily(chart=chart(sheet=columns))
+    assert set(copy) == set(report)
+    assert copy.revenue == report.revenue
+    assert copy.median == report.median
 
     # and return them
-    return vegetables, sales
+    return report, prices
 
 
 # main
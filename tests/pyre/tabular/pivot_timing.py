@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# michael a.g. aïvázis
+# orthologue
+# (c) 1998-2018 all rights reserved
+#
+
+
+"""
+Measure the cost of aggregating a large synthetic sales sheet with a pivot table, and compare
+it with a straightforward traversal of the records
+"""
+
+
+def test(count=10**6, columnar=True):
+    # externals
+    import random, time
+    # get the package
+    import pyre.tabular
+
+    # make a sheet
+    class sales(pyre.tabular.sheet):
+        """The transaction data"""
+        # layout
+        day = pyre.tabular.int()
+        sku = pyre.tabular.str()
+        quantity = pyre.tabular.int()
+        sale = pyre.tabular.float()
+
+    # build a chart
+    class chart(pyre.tabular.chart, sheet=sales):
+        """
+        Aggregate the information in the {sales} table
+        """
+        sku = pyre.tabular.inferred(sales.sku)
+        week = pyre.tabular.interval(measure=sales.day, interval=(0, 364), subdivisions=52)
+
+    # and a pivot table
+    class weekly(pyre.tabular.pivot):
+        """
+        Compute weekly statistics for each sku
+        """
+        # group by
+        sku = chart.sku
+        week = chart.week
+        # compute
+        transactions = pyre.tabular.count()
+        revenue = pyre.tabular.sum(sales.sale)
+        average = pyre.tabular.mean(sales.sale)
+        largest = pyre.tabular.max(sales.quantity)
+        median = pyre.tabular.quantile(sales.sale, fraction=.5)
+
+    # make a reproducible data set
+    rng = random.Random(0)
+    skus = tuple(str(4000 + sku) for sku in range(100))
+    # make a sheet
+    activity = sales(name="sales", columnar=columnar)
+    # get the record factory; the values are generated with the correct types, so skip the
+    # conversions to keep the setup cost down
+    record = sales.pyre_immutableTuple
+    # populate it
+    for _ in range(count):
+        # make up a transaction
+        quantity = rng.randint(1, 10)
+        values = (rng.randrange(364), rng.choice(skus), quantity, quantity * rng.uniform(1, 5))
+        # and add it to the sheet
+        activity.pyre_append(row=tuple.__new__(record, values))
+
+    # time the construction of the chart axes; they are built once and kept up to date as
+    # rows are added to the sheet, so they are not part of the cost of the pivot
+    start = time.perf_counter()
+    cube = chart(sheet=activity)
+    cube.sku, cube.week
+    axes = time.perf_counter() - start
+
+    # time the pivot table
+    start = time.perf_counter()
+    report = weekly(chart=cube)
+    pivot = time.perf_counter() - start
+
+    # time a traversal of the records
+    start = time.perf_counter()
+    groups = {}
+    for row in activity:
+        key = (row.sku, int(row.day / 7))
+        try:
+            groups[key].append(row)
+        except KeyError:
+            groups[key] = [row]
+    results = {}
+    for key, rows in groups.items():
+        values = sorted(row.sale for row in rows)
+        results[key] = (
+            len(rows), sum(values), sum(values)/len(rows), max(row.quantity for row in rows),
+            values[len(values)//2])
+    traversal = time.perf_counter() - start
+
+    # check that we got the same groups
+    assert len(report) == len(results)
+
+    # show me
+    print("pivot: {} rows, {} groups, {} storage".format(
+        count, len(report), "columnar" if columnar else "row"))
+    print("    axes: {:.3f} sec".format(axes))
+    print("    pivot: {:.3f} sec".format(pivot))
+    print("    traversal: {:.3f} sec".format(traversal))
+    print("    speedup: {:.2f}".format(traversal/pivot))
+
+    # all done
+    return report
+
+
+# main
+if __name__ == "__main__":
+    # skip pyre initialization since we don't rely on the executive
+    pyre_noboot = True
+    # do...
+    test()
+    test(columnar=False)
+
+
+# end of file
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# michael a.g. aïvázis
+# orthologue
+# (c) 1998-2018 all rights reserved
+#
+
+
+"""
+Verify that sheets with columnar storage behave like the ones that store records
+"""
+
+
+def test():
+    # externals
+    import array
+    # get the package
+    import pyre.tabular
+    # and the exception we expect to see
+    from pyre.tabular.exceptions import ColumnarMutabilityError
+
+    # make a sheet
+    class pricing(pyre.tabular.sheet):
+        """
+        The sheet layout
+        """
+        # layout
+        sku = pyre.tabular.str().primary()
+        description = pyre.tabular.str()
+        production = pyre.tabular.float()
+        shipping = pyre.tabular.float()
+        margin = pyre.tabular.float()
+        overhead = pyre.tabular.int()
+
+        msrp = (production*(1+margin/100) + shipping)*(1+overhead/100)
+
+    # our data set
+    data = [
+        ("4000", "tomatoes", "2.95", "5", ".2", "50"),
+        ("4001", "peppers", "0.35", "15", ".1", "25"),
+        ("4002", "grapes", "1.65", "15", ".15", "15"),
+        ("4003", "kiwis", "0.95", "7", ".15", "75"),
+        ("4004", "lemons", "0.50", "4", ".25", "50"),
+        ("4005", "oranges", "0.50", "4", ".25", "50"),
+        ]
+
+    # make a sheet that stores records
+    rows = pricing(name="rows").pyre_immutable(data)
+    # and one that stores columns
+    columns = pricing(name="columns", columnar=True).pyre_immutable(data)
+
+    # verify the numeric measures got typed buffers
+    assert [type(buffer) for buffer in columns.pyre_data.columns] == [
+        list, list, array.array, array.array, array.array, array.array, list]
+
+    # check the sizes
+    assert len(columns) == len(rows) == len(data)
+    # iteration
+    assert list(columns) == list(rows)
+    # indexing
+    for row in range(-len(data), len(data)):
+        # get the records
+        record = columns[row]
+        # check that they match
+        assert record == rows[row]
+        # and that the accessors work
+        assert record.sku == rows[row].sku
+        assert abs(record.msrp - rows[row].msrp) < 1e-9
+    # slicing
+    assert columns.pyre_data[1:3] == rows.pyre_data[1:3]
+    # columns
+    assert tuple(columns.overhead) == tuple(rows.overhead) == (50, 25, 15, 75, 50, 50)
+    # primary keys
+    assert columns.sku["4003"] == rows.sku["4003"]
+    # and partial scans
+    assert list(columns.pyre_values(column=5, start=4)) == [50, 50]
+
+    # values that don't fit in a typed buffer
+    columns.pyre_append(row=("4006", "melons", 1.0, 2.0, .1, 2**70, None))
+    # are accommodated
+    assert columns[-1].overhead == 2**70
+    # by switching their column to a list
+    assert type(columns.pyre_data.columns[5]) is list
+    # while the rest of the typed buffers are unaffected
+    assert type(columns.pyre_data.columns[2]) is array.array
+
+    # mutable records can't be stored in columnar sheets
+    try:
+        pricing(name="mutable", columnar=True).pyre_mutable(data)
+        assert False, "unreachable"
+    except ColumnarMutabilityError as error:
+        assert str(error) == "'mutable': columnar sheets can only hold immutable records"
+
+    # all done
+    return columns
+
+
+# main
+if __name__ == "__main__":
+    # skip pyre initialization since we don't rely on the executive
+    pyre_noboot = True
+    # do...
+    test()
+
+
+# end of file
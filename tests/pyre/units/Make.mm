@@ -24,10 +24,14 @@ sanity:
 units:
 	${PYTHON} ./one.py
 	${PYTHON} ./algebra.py
+	${PYTHON} ./arrays.py
 
 misc:
 	${PYTHON} ./parser.py
 	${PYTHON} ./formatting.py
 
+timings:
+	${PYTHON} ./arrays_timing.py
+
 
 # end of file
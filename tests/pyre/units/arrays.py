@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# michael a.g. aïvázis
+# orthologue
+# (c) 1998-2018 all rights reserved
+#
+
+
+"""
+Verify that arrays of quantities support the algebra of their scalar counterparts
+"""
+
+
+def test():
+    # externals
+    import array
+    # access the package
+    import pyre.units
+    # get the units
+    from pyre.units.SI import meter, second, kilogram
+    from pyre.units.length import km
+
+    # build an array of lengths out of a buffer
+    x = array.array('d', [1, 2, 3, 4]) * meter
+    # check its type
+    assert isinstance(x, pyre.units.array)
+    assert len(x) == 4
+    assert x.derivation == meter.derivation
+    # and out of a list
+    y = pyre.units.array(value=[1, 2], derivation=meter.derivation)
+    assert list(y) == [meter, 2*meter]
+    # an array of times
+    t = second * array.array('d', [1, 2, 4, 8])
+
+    # indexing
+    assert x[0] == meter
+    assert list(x[1:3]) == [2*meter, 3*meter]
+    # addition and subtraction
+    assert list((x + x).value) == [2, 4, 6, 8]
+    assert list((x - meter).value) == [0, 1, 2, 3]
+    assert list((2*meter - x).value) == [1, 0, -1, -2]
+    # multiplication and division by numbers
+    assert list((2*x).value) == [2, 4, 6, 8]
+    assert list((x/2).value) == [.5, 1, 1.5, 2]
+    # by quantities
+    v = x / t
+    assert v.derivation == (meter/second).derivation
+    assert list(v.value) == [1, 1, .75, .5]
+    assert (x * x).derivation == (meter**2).derivation
+    # and by themselves, in which case the units cancel
+    assert list(x / x) == [1, 1, 1, 1]
+    # right division
+    f = 1 / t
+    assert f.derivation == (1/second).derivation
+    assert list(f.value) == [1, .5, .25, .125]
+    # powers
+    assert list((x**2).value) == [1, 4, 9, 16]
+    assert (x**2).derivation == (meter**2).derivation
+    # unary operators
+    assert list((-x).value) == [-1, -2, -3, -4]
+    assert list(abs(-x).value) == [1, 2, 3, 4]
+
+    # comparisons produce masks
+    assert list(x < 3*meter) == [1, 1, 0, 0]
+    assert list(x >= 2*meter) == [0, 1, 1, 1]
+    assert list(x == x) == [1, 1, 1, 1]
+    # reductions
+    assert x.sum() == 10*meter
+    assert x.min() == meter
+    assert x.max() == 4*meter
+    assert x.mean() == 2.5*meter
+    # conversions
+    assert list(x.convert(meter/1000)) == [1000, 2000, 3000, 4000]
+    assert list((1000*x).convert(km)) == [1, 2, 3, 4]
+    # formatting
+    assert "{}".format(x) == "[1.0*m, 2.0*m, 3.0*m, 4.0*m]"
+    assert "{:value=.1f,base=km,label=km}".format(1000*x) == "[1.0 km, 2.0 km, 3.0 km, 4.0 km]"
+
+    # negative tests
+    # addition of incompatible quantities
+    try:
+        x + t
+        assert False
+    except x.CompatibilityError:
+        pass
+    # addition of numbers
+    try:
+        x + 1
+        assert False
+    except TypeError:
+        pass
+    # comparison of incompatible quantities
+    try:
+        x < kilogram
+        assert False
+    except x.CompatibilityError:
+        pass
+    # conversion to incompatible units
+    try:
+        x.convert(second)
+        assert False
+    except x.CompatibilityError:
+        pass
+    # arrays of different lengths
+    try:
+        x + x[1:]
+        assert False
+    except ValueError:
+        pass
+
+    # if numpy is available
+    try:
+        import numpy
+    # if not
+    except ImportError:
+        # we are done
+        return
+    # build an array of lengths out of a numpy array
+    y = numpy.arange(4.) * meter
+    # check that numpy left the operation to us
+    assert isinstance(y, pyre.units.array)
+    assert isinstance(y.value, numpy.ndarray)
+    assert (meter * numpy.arange(4.)).derivation == meter.derivation
+    # check that the results are numpy arrays
+    assert isinstance((y/second).value, numpy.ndarray)
+    assert isinstance(y < meter, numpy.ndarray)
+    assert (y.convert(km) == y.value / 1000).all()
+    assert y.sum() == 6*meter
+
+    # all done
+    return
+
+
+# main
+if __name__ == "__main__":
+    test()
+
+
+# end of file
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# michael a.g. aïvázis
+# orthologue
+# (c) 1998-2018 all rights reserved
+#
+
+
+"""
+Measure the cost of manipulating a collection of quantities one entry at a time, and as an array
+of quantities
+"""
+
+# externals
+import array
+import time
+
+
+def run(lengths, times, meter, second):
+    """
+    Compute speeds, find the ones above a threshold, and express them in km/hour
+    """
+    # access the units
+    from pyre.units.length import km
+    from pyre.units.time import hour
+    # set the threshold
+    limit = 0.5 * meter/second
+    # compute the speeds
+    v = lengths / times
+    # find the fast ones
+    fast = v > limit
+    # and convert
+    kmh = v.convert(km/hour)
+    # return the results
+    return v, fast, kmh
+
+
+def test(samples=10**6):
+    # get the units
+    from pyre.units.SI import meter, second
+    from pyre.units.length import km
+    from pyre.units.time import hour
+
+    # make some magnitudes
+    l = array.array('d', (index % 100 for index in range(samples)))
+    t = array.array('d', (1 + index % 7 for index in range(samples)))
+
+    # start the clock
+    start = time.perf_counter()
+    # build the quantities one by one
+    lengths = [ value*meter for value in l ]
+    times = [ value*second for value in t ]
+    # the threshold
+    limit = 0.5 * meter/second
+    # compute the speeds
+    v = [ length/duration for length, duration in zip(lengths, times) ]
+    # find the fast ones
+    fast = [ speed > limit for speed in v ]
+    # and convert
+    kmh = [ speed/(km/hour) for speed in v ]
+    # stop the clock
+    scalar = time.perf_counter() - start
+
+    # start the clock
+    start = time.perf_counter()
+    # do the same with arrays of quantities
+    av, afast, akmh = run(lengths=l*meter, times=t*second, meter=meter, second=second)
+    # stop the clock
+    vector = time.perf_counter() - start
+
+    # check that they agree
+    assert list(afast) == fast
+    assert list(akmh) == kmh
+
+    # if numpy is available
+    try:
+        import numpy
+    # if not
+    except ImportError:
+        # no numpy timing
+        numeric = None
+    # otherwise
+    else:
+        # convert the magnitudes
+        nl = numpy.array(l)
+        nt = numpy.array(t)
+        # start the clock
+        start = time.perf_counter()
+        # do the same with arrays of quantities backed by numpy
+        run(lengths=nl*meter, times=nt*second, meter=meter, second=second)
+        # stop the clock
+        numeric = time.perf_counter() - start
+
+    # show me
+    print("pyre.units: {} samples".format(samples))
+    print("  dimensional: {:.3f} s".format(scalar))
+    print("  array: {:.3f} s, speedup: {:.1f}".format(vector, scalar/vector))
+    # if numpy is available
+    if numeric is not None:
+        # show me
+        print("  numpy: {:.3f} s, speedup: {:.1f}".format(numeric, scalar/numeric))
+
+    # all done
+    return
+
+
+# main
+if __name__ == "__main__":
+    # do...
+    test()
+
+
+# end of file
@@ -24,6 +24,13 @@ components:
 	${PYTHON} ./sqlite_attach.py
 	${PYTHON} ./sqlite_table.py
 	${PYTHON} ./sqlite_references.py
+	${PYTHON} ./sqlite_select.py
+	${PYTHON} ./sqlite_load.py
+	${PYTHON} ./sqlite_pool.py
+	${PYTHON} ./sqlite_template.py
+
+timings:
+	${PYTHON} ./sqlite_pool_timing.py
 
 
 # end of file
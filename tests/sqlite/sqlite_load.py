@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# michael a.g. aïvázis
+# orthologue
+# (c) 1998-2018 all rights reserved
+#
+
+
+"""
+Load records in bulk
+"""
+
+
+import pyre.db
+
+class Weather(pyre.db.table, id="weather"):
+
+    city = pyre.db.str()
+    city.doc = "the city name"
+
+    date = pyre.db.date()
+    date.doc = "the date of the measurement"
+
+    low = pyre.db.decimal(precision=5, scale=2)
+    low.doc = "the temperature low"
+
+    high = pyre.db.float()
+    high.doc = "the temperature high"
+
+
+class Station(pyre.db.table, id="stations"):
+
+    city = pyre.db.str()
+    city.doc = "the city name"
+
+
+def test():
+    # build a database component and connect to an in-memory database
+    db = pyre.db.sqlite(name="loader").attach()
+
+    # in a transaction block
+    with db:
+        # create the table
+        db.createTable(Weather)
+        # make some records
+        records = [
+            Weather.pyre_immutable(
+                city="pasadena", date="2018-03-{:02}".format(day), low=40+day/4, high=60+day)
+            for day in range(1, 29) ]
+        # with a few special ones
+        records += [
+            # with embedded quotes
+            Weather.pyre_immutable(city="o'hare", date="2018-03-01", low="30.25", high=45),
+            # and a {NULL}
+            Weather.pyre_immutable(city="boston", date="2018-03-01", low=Weather.null, high=40),
+            ]
+        # load them
+        db.load(*records)
+
+        # read them back
+        rows = list(db.execute("SELECT city, date, low, high FROM weather ORDER BY city, date"))
+        # check the count
+        assert len(rows) == len(records)
+        # the {NULL}
+        assert rows[0][2] is None
+        # the city with the special character
+        assert rows[1] == ("o'hare", "2018-03-01", 30.25, 45)
+        # and some of the regular ones
+        assert rows[2] == ("pasadena", "2018-03-01", 40.25, 61)
+        assert rows[-1] == ("pasadena", "2018-03-28", 47, 88)
+
+        # now, interleave records from two tables
+        db.createTable(Station)
+        records = [
+            Station.pyre_immutable(city="pasadena"),
+            Weather.pyre_immutable(city="pasadena", date="2018-04-01", low=41, high=62),
+            Station.pyre_immutable(city="boston"),
+            ]
+        # keep track of the batches
+        batches = []
+        # by intercepting them on their way to the loader
+        loadRecords = db.loadRecords
+        db.loadRecords = lambda table, records: (
+            batches.append((table, len(records))), loadRecords(table=table, records=records))
+        # load them
+        db.load(*records)
+        # verify the records of each table were loaded in a single batch
+        assert batches == [(Station, 2), (Weather, 1)]
+        # and that they all made it
+        assert len(list(db.execute("SELECT city FROM stations"))) == 2
+
+        # drop the tables
+        db.dropTable(Station)
+        db.dropTable(Weather)
+
+    # and return the connection and the table
+    return db, Weather
+
+
+# main
+if __name__ == "__main__":
+    test()
+
+
+# end of file
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# michael a.g. aïvázis
+# orthologue
+# (c) 1998-2018 all rights reserved
+#
+
+
+"""
+Exercise a pool of connections to a sqlite database
+"""
+
+
+def test():
+    # externals
+    import os, tempfile, threading, time
+    # access the package
+    import pyre.db
+
+    # declare a table
+    class Counter(pyre.db.table, id="counters"):
+        # the fields
+        worker = pyre.db.int()
+        step = pyre.db.int()
+
+    # make a scratch database, since each connection to an in-memory database gets a database
+    # of its own
+    handle, path = tempfile.mkstemp(suffix=".sql")
+    os.close(handle)
+    # carefully
+    try:
+        # build the prototype of the connections; they will be used by many threads
+        prototype = pyre.db.sqlite(name="pooled")
+        prototype.database = path
+        prototype.shared = True
+        # and the pool
+        pool = pyre.db.pool(name="pool")
+        pool.server = prototype
+        pool.minimum = 1
+        pool.maximum = 3
+        pool.timeout = 1*pool.second
+        # open the minimum number of connections
+        pool.attach()
+        assert pool.population == 1
+
+        # create the table
+        with pool.lease() as db, db:
+            db.createTable(Counter)
+
+        # the work
+        def work(worker):
+            # do a few steps
+            for step in range(20):
+                # each with a leased connection
+                with pool.lease() as db, db:
+                    # record the step
+                    db.insert(Counter.pyre_immutable(worker=worker, step=step))
+            # all done
+            return
+        # make some workers
+        workers = [ threading.Thread(target=work, args=(worker,)) for worker in range(6) ]
+        # run them
+        for thread in workers: thread.start()
+        for thread in workers: thread.join()
+
+        # the pool never exceeded its maximum size
+        assert 1 <= pool.population <= pool.maximum
+        # and all the work got done
+        assert pool.execute("SELECT COUNT(*) FROM counters") == ((120,),)
+
+        # lease all the connections
+        leases = [ pool.lease() for _ in range(pool.maximum) ]
+        servers = [ lease.__enter__() for lease in leases ]
+        # they are all different
+        assert len(set(map(id, servers))) == pool.maximum
+        # verify that the next client times out
+        pool.timeout = 0.1*pool.second
+        try:
+            pool.acquire()
+            assert False, "unreachable"
+        except pool.exceptions.OperationalError:
+            pass
+        # return them
+        for lease in leases: lease.__exit__(None, None, None)
+
+        # now, break one of the idle connections
+        broken = pool.available[-1][0]
+        broken.detach()
+        broken.connection = broken.cursor = None
+        # verify the health check catches it and the pool hands out a good one
+        with pool.lease() as db:
+            assert db is not broken
+            assert tuple(db.execute("SELECT COUNT(*) FROM counters")) == ((120,),)
+        # the broken one is gone
+        assert broken not in (server for server, _ in pool.available)
+
+        # make all idle connections expire
+        pool.idle = 0*pool.second
+        pool.evict()
+        # the pool keeps its minimum
+        assert pool.population == pool.minimum == len(pool.available)
+
+        # close the pool
+        pool.detach()
+        assert pool.population == 0
+    # no matter what
+    finally:
+        # clean up
+        os.remove(path)
+
+    # all done
+    return pool
+
+
+# main
+if __name__ == "__main__":
+    test()
+
+
+# end of file
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# michael a.g. aïvázis
+# orthologue
+# (c) 1998-2018 all rights reserved
+#
+
+
+"""
+Measure the throughput of short transactions against a local sqlite database, with a fresh
+connection per transaction and with connections leased from a pool, both sequentially and
+by a few threads
+"""
+
+
+def test(transactions=2000, workers=4):
+    # externals
+    import os, tempfile, threading, time
+    # access the package
+    import pyre.db
+
+    # declare a table
+    class Event(pyre.db.table, id="events"):
+        # the fields
+        worker = pyre.db.int()
+        serial = pyre.db.int()
+
+    # make a scratch database
+    handle, path = tempfile.mkstemp(suffix=".sql")
+    os.close(handle)
+
+    # the connection factory for the unpooled case
+    def connect(name):
+        # make a connection
+        server = pyre.db.sqlite(name=name)
+        # to the scratch database
+        server.database = path
+        # and open it
+        return server.attach()
+
+    # the work
+    def run(transaction, workers=1):
+        # split the transactions among the workers
+        def work(worker):
+            # do my share
+            for serial in range(transactions // workers):
+                # with a transaction
+                transaction(worker=worker, serial=serial)
+            # all done
+            return
+        # make the workers
+        threads = [
+            threading.Thread(target=work, args=(worker,)) for worker in range(workers) ]
+        # start the clock
+        start = time.perf_counter()
+        # do the work
+        for thread in threads: thread.start()
+        for thread in threads: thread.join()
+        # and return the elapsed time
+        return time.perf_counter() - start
+
+    # carefully
+    try:
+        # create the table
+        with connect(name="setup") as db:
+            db.createTable(Event)
+
+        # a fresh connection per transaction
+        def unpooled(worker, serial):
+            # connect
+            db = connect(name="unpooled-{}-{}".format(worker, serial))
+            # do the work
+            with db:
+                db.insert(Event.pyre_immutable(worker=worker, serial=serial))
+                tuple(db.execute("SELECT COUNT(*) FROM events WHERE worker={}".format(worker)))
+            # and disconnect
+            db.detach()
+            # all done
+            return
+
+        # build the pool
+        prototype = pyre.db.sqlite(name="prototype")
+        prototype.database = path
+        prototype.shared = True
+        pool = pyre.db.pool(name="pool")
+        pool.server = prototype
+        pool.maximum = workers
+        pool.attach()
+
+        # a leased connection per transaction
+        def pooled(worker, serial):
+            # lease a connection and do the work
+            with pool.lease() as db, db:
+                db.insert(Event.pyre_immutable(worker=worker, serial=serial))
+                tuple(db.execute("SELECT COUNT(*) FROM events WHERE worker={}".format(worker)))
+            # all done
+            return
+
+        # time them; making components is not thread safe, so the unpooled case runs in a
+        # single thread
+        slow = run(unpooled)
+        fast = run(pooled)
+        threaded = run(pooled, workers=workers)
+        # close the pool
+        pool.detach()
+    # no matter what
+    finally:
+        # clean up
+        os.remove(path)
+
+    # show me
+    print("sqlite: {} transactions".format(transactions))
+    print("    unpooled: {:.3f} sec, {:.0f} tx/sec".format(slow, transactions/slow))
+    print("    pooled: {:.3f} sec, {:.0f} tx/sec, speedup: {:.2f}".format(
+        fast, transactions/fast, slow/fast))
+    print("    pooled, {} workers: {:.3f} sec, {:.0f} tx/sec, speedup: {:.2f}".format(
+        workers, threaded, transactions/threaded, slow/threaded))
+
+    # all done
+    return pool
+
+
+# main
+if __name__ == "__main__":
+    # do...
+    test()
+
+
+# end of file
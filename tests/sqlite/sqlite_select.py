@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# michael a.g. aïvázis
+# orthologue
+# (c) 1998-2018 all rights reserved
+#
+
+
+"""
+Verify that query results are streamed from the database in chunks
+"""
+
+
+import pyre.db
+
+class Weather(pyre.db.table, id="weather"):
+
+    city = pyre.db.str()
+    city.doc = "the city name"
+
+    day = pyre.db.int()
+    day.doc = "the day of the measurement"
+
+    low = pyre.db.float()
+    low.doc = "the temperature low"
+
+    high = pyre.db.float()
+    high.doc = "the temperature high"
+
+
+class measurements(pyre.db.query, weather=Weather):
+    """
+    Select a few fields from the {weather} table
+    """
+    day = weather.day
+    high = weather.high
+    where = weather.city == "pasadena"
+    order = weather.day
+
+
+def test():
+    # build a database component and connect to an in-memory database
+    db = pyre.db.sqlite(name="streaming").attach()
+
+    # in a transaction block
+    with db:
+        # create the table
+        db.createTable(Weather)
+        # populate it
+        db.insert(*(
+            Weather.pyre_immutable(city=city, day=day, low=40+day%10, high=60+day%20)
+            for city in ("pasadena", "boston") for day in range(100)))
+
+        # select in small chunks
+        rows = db.select(measurements, batch=7)
+        # grab the first few records
+        first = [ next(rows) for _ in range(3) ]
+        # verify they are records
+        assert first[1].day == 1
+        assert first[1].high == 61
+        # while the result set is open, the connection is still usable
+        assert tuple(db.execute("SELECT COUNT(*) FROM weather")) == ((200,),)
+        # get the rest
+        rest = list(rows)
+        # check
+        assert len(first) + len(rest) == 100
+        assert [record.day for record in first + rest] == list(range(100))
+
+        # verify that the size of the chunks doesn't change the results
+        assert list(db.select(measurements, batch=1000)) == first + rest
+        # the default comes from the component configuration
+        assert db.batch == 2**10
+        assert list(db.select(measurements)) == first + rest
+
+        # verify the chunking
+        chunks = list(db.fetch(*db.sql.select(query=measurements), batch=30))
+        assert list(map(len, chunks)) == [30, 30, 30, 10]
+
+        # drop the table
+        db.dropTable(Weather)
+
+    # and return the connection and the table
+    return db, Weather
+
+
+# main
+if __name__ == "__main__":
+    test()
+
+
+# end of file
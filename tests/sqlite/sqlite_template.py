@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# michael a.g. aïvázis
+# orthologue
+# (c) 1998-2018 all rights reserved
+#
+
+
+"""
+Execute cached statement templates with bound parameters
+"""
+
+
+import pyre.db
+
+class Weather(pyre.db.table, id="weather"):
+
+    city = pyre.db.str()
+    city.doc = "the city name"
+
+    date = pyre.db.date()
+    date.doc = "the date of the measurement"
+
+    low = pyre.db.int()
+    low.doc = "the temperature low"
+
+    high = pyre.db.int()
+    high.doc = "the temperature high"
+
+
+class Cold(pyre.db.query, weather=Weather):
+
+    city = weather.city
+    low = weather.low
+
+    where = (weather.low < 0)
+    order = weather.city
+
+
+def test():
+    # build a database component and connect to an in-memory database
+    db = pyre.db.sqlite(name="templates").attach()
+
+    # in a transaction block
+    with db:
+        # create the table
+        db.createTable(Weather)
+        # load some records, including one whose city requires quoting
+        db.load(*(
+            Weather.pyre_immutable(city=city, date="2018-01-01", low=low, high=low+10)
+            for city, low in (("o'hare", -5), ("boston", -10), ("pasadena", 10))))
+
+        # retrieve the cold ones
+        assert tuple(tuple(row) for row in db.select(Cold)) == (("boston", -10), ("o'hare", -5))
+        # change the threshold
+        Cold.where = (Cold.weather.low < -7)
+        # and try again
+        assert tuple(tuple(row) for row in db.select(Cold)) == (("boston", -10),)
+
+        # update a record
+        template = pyre.db.template(Weather)
+        template.low = -20
+        db.update((template, Weather.city == "o'hare"))
+        # and another one with the same statement
+        template.low = 15
+        db.update((template, Weather.city == "pasadena"))
+        # check
+        rows = tuple(db.execute("SELECT city, low FROM weather ORDER BY city"))
+        assert rows == (("boston", -10), ("o'hare", -20), ("pasadena", 15))
+
+        # delete some
+        db.delete(Weather, Weather.low > 0)
+        # check
+        rows = tuple(db.execute("SELECT city FROM weather ORDER BY city"))
+        assert rows == (("boston",), ("o'hare",))
+
+        # drop the table
+        db.dropTable(Weather)
+
+    # and return the connection
+    return db
+
+
+# main
+if __name__ == "__main__":
+    test()
+
+
+# end of file